@@ -25,30 +25,17 @@ from ..lib import historyLifecycle
 
 try:
     from ..lib.axisCatalog import (
-        axis_catalog as _axis_catalog_impl,
+        axis_catalog,
         get_static_prompt_axes,
         get_static_prompt_profile,
+        invalidate_axis_catalog,
         static_prompt_catalog,
         static_prompt_description_overrides,
     )
 
-    # Module-level cache for help canvases to prevent repeated axis_catalog() allocations.
-    # Per ADR 0082: axis_catalog() creates new dictionaries on every call even though
-    # _axis_config_map() is cached. Help surfaces refresh frequently (hover, focus, polls),
-    # so caching the full catalog result eliminates 50ms+ of allocation per refresh.
-    _help_axis_catalog_cache: dict[str, object] | None = None
-
-    def axis_catalog():
-        """Cached axis catalog for help surfaces. Reuses result across refreshes."""
-        global _help_axis_catalog_cache
-        if _help_axis_catalog_cache is None:
-            _help_axis_catalog_cache = _axis_catalog_impl()
-        return _help_axis_catalog_cache
-
     def invalidate_help_axis_catalog():
-        """Force reload on next axis_catalog() call. Used for hot reload during development."""
-        global _help_axis_catalog_cache
-        _help_axis_catalog_cache = None
+        """Force a catalog rebuild on next axis_catalog() call (hot reload during development)."""
+        invalidate_axis_catalog()
 
 except ImportError:  # Talon may have a stale runtime without axisCatalog
     AXIS_KEY_TO_VALUE: dict[str, dict[str, str]] = {}
@@ -182,6 +169,13 @@ from ..lib.modelTypes import GPTSystemPrompt
 from ..lib.promptPipeline import PromptPipeline, PromptResult
 from ..lib.promptSession import PromptSession
 from ..lib.recursiveOrchestrator import RecursiveOrchestrator
+from ..lib.requestAsync import start_async
+from ..lib.sequenceRunner import (
+    SequenceCheckpointStore,
+    SequenceRunner,
+    default_checkpoint_directory,
+    snapshot_source,
+)
 from ..lib.modelPatternGUI import (
     DIRECTIONAL_MAP as _DIRECTIONAL_MAP,
     _axis_value_from_token,
@@ -208,6 +202,7 @@ from ..lib.suggestionCoordinator import (
 DIRECTIONAL_MAP = _DIRECTIONAL_MAP
 from ..lib.requestState import RequestPhase
 from ..lib.requestGating import request_is_in_flight, try_begin_request
+from ..lib.requestTracing import trace_span
 from ..lib.requestBus import (
     emit_begin_send,
     emit_cancel,
@@ -705,6 +700,7 @@ _refresh_persona_intent_lists()
 
 _prompt_pipeline = PromptPipeline()
 _recursive_orchestrator = RecursiveOrchestrator(_prompt_pipeline)
+_sequence_runner: Optional[SequenceRunner] = None
 ASYNC_BLOCKING_SETTING = "user.model_async_blocking"
 _last_inflight_warning_request_id = None
 _suppress_inflight_notify_request_id = None
@@ -859,6 +855,36 @@ def _await_handle_and_insert(handle, destination: str) -> None:
     threading.Thread(target=_runner, daemon=True).start()
 
 
+def _get_sequence_runner() -> SequenceRunner:
+    # Built lazily so the checkpoint directory follows the settings in effect
+    # when a sequence is first run.
+    global _sequence_runner
+    if _sequence_runner is None:
+        _sequence_runner = SequenceRunner(
+            _prompt_pipeline, SequenceCheckpointStore(default_checkpoint_directory())
+        )
+    return _sequence_runner
+
+
+def _run_sequence_in_background(run, destination) -> None:
+    """Run a sequence start/resume off the main thread and insert its output."""
+
+    def _runner():
+        checkpoint = run()
+        if checkpoint.status == "awaiting_input":
+            notify(
+                f"GPT: Sequence '{checkpoint.sequence}' paused after step "
+                f"{checkpoint.next_step}; resume it when ready"
+            )
+        elif checkpoint.status == "complete":
+            notify(f"GPT: Sequence '{checkpoint.sequence}' complete")
+        return checkpoint.result()
+
+    raw_block = settings.get(ASYNC_BLOCKING_SETTING, False)
+    block = False if raw_block is None else bool(raw_block)
+    _handle_async_result(start_async(_runner), destination, block=block)
+
+
 def _handle_async_result(handle, destination: str, block: bool = True) -> None:
     """Insert async result, either blocking or via background wait."""
     if block:
@@ -1927,6 +1953,41 @@ class UserActions:
         # Non-blocking async path returns early; insertion handled in background.
         return ""
 
+    def gpt_run_sequence(
+        sequence_name: str,
+        source: ModelSource,
+        destination: ModelDestination = Default(),
+    ) -> None:
+        """Run a named workflow sequence, pausing at steps that need user input"""
+
+        if _reject_if_request_in_flight():
+            return
+        runner = _get_sequence_runner()
+        # Read the selection/clipboard now, before the run leaves this thread.
+        subject = snapshot_source(source)
+        _run_sequence_in_background(
+            lambda: runner.start(sequence_name, subject, destination), destination
+        )
+
+    def gpt_resume_sequence(
+        user_input: str = "", destination: ModelDestination = Default()
+    ) -> None:
+        """Resume the most recent paused or failed workflow sequence"""
+
+        if _reject_if_request_in_flight():
+            return
+        runner = _get_sequence_runner()
+        checkpoint = runner.store.latest_resumable()
+        if checkpoint is None:
+            notify("GPT: No workflow sequence to resume")
+            return
+        _run_sequence_in_background(
+            lambda: runner.resume(
+                checkpoint.run_id, destination, user_input=user_input
+            ),
+            destination,
+        )
+
     def gpt_analyze_prompt(destination: ModelDestination = ModelDestination()):
         """Explain why we got the results we did"""
         PROMPT = "Analyze the provided prompt and response. Explain how the prompt was understood to generate the given response. Provide only the explanation."
@@ -3093,7 +3154,12 @@ class UserActions:
             print("[canvas-flow] skip_confirmation_close canvas already showing")
         if not canvas_showing:
             actions.user.confirmation_gui_close()
-        destination.insert(gpt_result)
+        with trace_span(
+            "destination_insert",
+            getattr(GPTState, "last_request_id", None) or None,
+            destination=dest_kind or type(destination).__name__,
+        ):
+            destination.insert(gpt_result)
 
     def gpt_get_source_text(spoken_text: str) -> str:
         """Get the source text that is will have the prompt applied to it"""
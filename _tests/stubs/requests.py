@@ -20,3 +20,23 @@ exceptions = _Exceptions()
 
 def post(*_args, **_kwargs):
     raise NotImplementedError("requests.post is not stubbed for tests")
+
+
+class Session:
+    """Stub pooled session that delegates to the module-level helpers.
+
+    Tests patch `requests.post`; routing through the module globals keeps those
+    patches effective when callers use a pooled session.
+    """
+
+    def __init__(self):
+        self.closed = False
+
+    def post(self, *args, **kwargs):
+        return post(*args, **kwargs)
+
+    def head(self, *args, **kwargs):
+        return Response(status_code=200)
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,75 @@
+import unittest
+from typing import TYPE_CHECKING
+from unittest import mock
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:  # Talon runtime
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import axisCatalog
+
+    class AxisCatalogSnapshotTests(unittest.TestCase):
+        def tearDown(self) -> None:
+            axisCatalog.invalidate_axis_catalog()
+
+        def test_default_catalog_is_shared_snapshot(self) -> None:
+            first = axisCatalog.axis_catalog()
+            generation = axisCatalog.axis_catalog_generation()
+            for _ in range(5):
+                self.assertIs(axisCatalog.axis_catalog(), first)
+            self.assertEqual(axisCatalog.axis_catalog_generation(), generation)
+
+        def test_snapshot_matches_fresh_build(self) -> None:
+            snapshot = axisCatalog.axis_catalog()
+            fresh = axisCatalog._build_axis_catalog()
+            self.assertEqual(snapshot, fresh)
+            self.assertIsNot(snapshot, fresh)
+
+        def test_token_sets_mirror_axes(self) -> None:
+            catalog = axisCatalog.axis_catalog()
+            for axis, tokens in catalog["axes"].items():
+                with self.subTest(axis=axis):
+                    token_set = catalog["axis_token_sets"][axis]
+                    self.assertIsInstance(token_set, frozenset)
+                    self.assertEqual(token_set, frozenset(tokens))
+                    self.assertIs(axisCatalog.axis_token_set(axis), token_set)
+            self.assertEqual(axisCatalog.axis_token_set("missing"), frozenset())
+
+        def test_invalidate_rebuilds_and_bumps_generation(self) -> None:
+            first = axisCatalog.axis_catalog()
+            generation = axisCatalog.axis_catalog_generation()
+            axisCatalog.invalidate_axis_catalog()
+            second = axisCatalog.axis_catalog()
+            self.assertIsNot(first, second)
+            self.assertEqual(axisCatalog.axis_catalog_generation(), generation + 1)
+
+        def test_source_change_rebuilds_after_recheck_interval(self) -> None:
+            first = axisCatalog.axis_catalog()
+            generation = axisCatalog.axis_catalog_generation()
+            with mock.patch.object(
+                axisCatalog, "_catalog_source_signature", return_value=("changed",)
+            ):
+                # Within the recheck window the snapshot is reused untouched.
+                self.assertIs(axisCatalog.axis_catalog(), first)
+                axisCatalog._catalog_checked_at = None
+                second = axisCatalog.axis_catalog()
+            self.assertIsNot(second, first)
+            self.assertEqual(axisCatalog.axis_catalog_generation(), generation + 1)
+
+        def test_lists_dir_builds_fresh_catalog(self) -> None:
+            snapshot = axisCatalog.axis_catalog()
+            with_lists = axisCatalog.axis_catalog(lists_dir="/nonexistent-lists")
+            self.assertIsNot(with_lists, snapshot)
+            self.assertEqual(with_lists["axes"], snapshot["axes"])
+
+else:
+    if not TYPE_CHECKING:
+
+        class AxisCatalogSnapshotTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -0,0 +1,124 @@
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import axisCatalog, axisMappings, talonSettings
+    from talon_user.lib.axisTokenIndex import AxisTokenIndex
+
+    PRIORITY = ("completeness", "scope", "method", "form")
+
+    def _index(incompatibilities=None, caps=None) -> AxisTokenIndex:
+        return AxisTokenIndex(
+            PRIORITY,
+            {
+                "completeness": {"full": "full", "gist": "gist"},
+                "scope": {"focus": "focus", "shared": "shared"},
+                "method": {"steps": "steps", "shared": "shared", "rigor": "rigor"},
+                "form": {"table": "table", "bullets": "bullets"},
+            },
+            {"scope": {"focus", "shared", "extra"}, "channel": {"slack"}},
+            caps or {"form": 1, "method": 2},
+            incompatibilities or {},
+        )
+
+    class AxisTokenIndexTests(unittest.TestCase):
+        def test_bare_tokens_resolve_to_highest_priority_axis(self) -> None:
+            index = _index()
+            self.assertEqual(index.resolve("shared"), ("scope", "shared"))
+            self.assertEqual(index.resolve(" steps "), ("method", "steps"))
+            self.assertEqual(index.resolve("mystery", "form"), ("form", "mystery"))
+            self.assertEqual(index.resolve("mystery"), (None, None))
+            self.assertEqual(index.resolve("  "), (None, None))
+
+        def test_prefixed_tokens_pin_the_axis(self) -> None:
+            index = _index()
+            self.assertEqual(index.resolve("method:shared"), ("method", "shared"))
+            self.assertEqual(index.resolve("Method : shared"), ("method", "shared"))
+            self.assertEqual(index.resolve("form:custom"), ("form", "custom"))
+            # Unknown prefixes fall back to bare-token resolution.
+            self.assertEqual(index.resolve("bogus:steps", "form"), ("form", "bogus:steps"))
+
+        def test_conflicts_use_last_wins(self) -> None:
+            index = _index(
+                incompatibilities={"form": {"table": {"bullets"}, "bullets": {"table"}}},
+                caps={},
+            )
+            self.assertEqual(index.dedupe("form", ["table", "bullets"]), ["bullets"])
+            self.assertEqual(
+                index.dedupe("form", ["bullets", "x", "table", "x", "bullets"]),
+                ["x", "bullets"],
+            )
+
+        def test_canonicalise_applies_soft_cap_and_sorts(self) -> None:
+            index = _index()
+            self.assertEqual(
+                index.canonicalise("method", ["steps", "rigor", "shared", "steps"]),
+                ["rigor", "shared"],
+            )
+            self.assertEqual(index.canonicalise("form", ["table", "bullets"]), ["bullets"])
+            self.assertEqual(index.canonicalise("scope", ["", " "]), [])
+
+        def test_known_tokens_merge_maps_and_catalog(self) -> None:
+            index = _index()
+            self.assertTrue(index.is_mapped("scope", "focus"))
+            self.assertFalse(index.is_mapped("scope", "extra"))
+            self.assertTrue(index.is_known("scope", "extra"))
+            self.assertTrue(index.is_known("channel", "slack"))
+            self.assertEqual(index.recipe_axis("shared"), "scope")
+            self.assertIsNone(index.recipe_axis("steps"))
+
+    class TalonSettingsAxisTokenIndexTests(unittest.TestCase):
+        def tearDown(self) -> None:
+            axisCatalog.invalidate_axis_catalog()
+
+        def test_index_is_reused_until_catalog_generation_changes(self) -> None:
+            first = talonSettings._axis_token_index()
+            self.assertIs(talonSettings._axis_token_index(), first)
+            axisCatalog.invalidate_axis_catalog()
+            self.assertIsNot(talonSettings._axis_token_index(), first)
+
+        def test_index_rebuilds_when_value_maps_change(self) -> None:
+            scope_map = axisMappings.AXIS_VALUE_TO_KEY_MAPS["scope"]
+            self.assertEqual(
+                talonSettings._resolve_axis_for_token("zzsentinel"), (None, None)
+            )
+            scope_map["zzsentinel"] = "zzsentinel"
+            axisCatalog.invalidate_axis_catalog()
+            try:
+                self.assertEqual(
+                    talonSettings._resolve_axis_for_token("zzsentinel"),
+                    ("scope", "zzsentinel"),
+                )
+            finally:
+                scope_map.pop("zzsentinel", None)
+                axisCatalog.invalidate_axis_catalog()
+            self.assertEqual(
+                talonSettings._resolve_axis_for_token("zzsentinel"), (None, None)
+            )
+
+        def test_index_matches_value_map_scan(self) -> None:
+            index = talonSettings._axis_token_index()
+            for axis in talonSettings.axis_priority():
+                for token in axisMappings.AXIS_VALUE_TO_KEY_MAPS.get(axis, {}):
+                    expected = None
+                    for candidate in talonSettings.axis_priority():
+                        if token in axisMappings.AXIS_VALUE_TO_KEY_MAPS.get(candidate, {}):
+                            expected = candidate
+                            break
+                    with self.subTest(axis=axis, token=token):
+                        self.assertEqual(index.resolve(token)[0], expected)
+
+else:
+    if not TYPE_CHECKING:
+
+        class AxisTokenIndexTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
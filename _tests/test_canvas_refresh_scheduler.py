@@ -0,0 +1,186 @@
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:  # Talon runtime
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import canvasRefreshScheduler
+    from talon_user.lib.canvasRefreshScheduler import CanvasRefreshScheduler
+
+    class _Clock:
+        def __init__(self) -> None:
+            self.now = 10.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    class _Dispatcher:
+        """Queue UI work instead of running it, like a busy Talon main thread."""
+
+        def __init__(self) -> None:
+            self.queued: list[tuple[object, int]] = []
+
+        def __call__(self, fn, delay_ms=0) -> None:
+            self.queued.append((fn, delay_ms))
+
+        def run_all(self) -> None:
+            queued, self.queued = self.queued, []
+            for fn, _delay in queued:
+                fn()
+
+    class CanvasRefreshSchedulerTests(unittest.TestCase):
+        def setUp(self) -> None:
+            self.clock = _Clock()
+            self.dispatcher = _Dispatcher()
+            self.draws: list[float] = []
+            self.draw_cost = 0.0
+            self.requested: list[dict] = []
+            self.executed: list[dict] = []
+
+        def _refresh(self) -> None:
+            self.draws.append(self.clock.now)
+            self.clock.now += self.draw_cost
+
+        def _scheduler(self, **kwargs) -> CanvasRefreshScheduler:
+            return CanvasRefreshScheduler(
+                self._refresh,
+                dispatch=self.dispatcher,
+                clock=self.clock,
+                on_requested=lambda **kw: self.requested.append(kw),
+                on_executed=lambda **kw: self.executed.append(kw),
+                **kwargs,
+            )
+
+        def test_requests_coalesce_while_refresh_pending(self) -> None:
+            scheduler = self._scheduler()
+            for _ in range(20):
+                scheduler.request()
+                self.clock.now += 0.001
+
+            self.assertEqual(len(self.dispatcher.queued), 1)
+            self.dispatcher.run_all()
+            self.assertEqual(len(self.draws), 1)
+            stats = scheduler.stats()
+            self.assertEqual(stats["requests"], 20)
+            self.assertEqual(stats["coalesced"], 19)
+            self.assertEqual(
+                [e["reason"] for e in self.requested].count("coalesced"), 19
+            )
+
+        def test_interval_tracks_draw_cost(self) -> None:
+            scheduler = self._scheduler()
+            self.assertEqual(
+                scheduler.interval_ms(), canvasRefreshScheduler.MIN_REFRESH_INTERVAL_MS
+            )
+            self.draw_cost = 0.1  # 100ms redraws
+            scheduler.request()
+            self.dispatcher.run_all()
+            self.assertAlmostEqual(
+                scheduler.interval_ms(), 100.0 * canvasRefreshScheduler.DRAW_BUDGET_FACTOR
+            )
+
+            self.clock.now += 0.01
+            scheduler.request()
+            self.clock.now += 0.01
+            scheduler.request()
+            (_fn, delay_ms), = self.dispatcher.queued
+            self.assertGreater(delay_ms, 300)
+
+        def test_interval_is_capped(self) -> None:
+            scheduler = self._scheduler(max_interval_ms=500)
+            self.draw_cost = 2.0
+            scheduler.request()
+            self.dispatcher.run_all()
+            self.assertEqual(scheduler.interval_ms(), 500)
+
+        def test_slow_chunks_draw_immediately(self) -> None:
+            scheduler = self._scheduler()
+            for _ in range(3):
+                scheduler.request()
+                self.dispatcher.run_all()
+                self.clock.now += 0.5
+            scheduler.request()
+            (_fn, delay_ms), = self.dispatcher.queued
+            self.assertEqual(delay_ms, 0)
+
+        def test_flush_supersedes_delayed_refresh(self) -> None:
+            scheduler = self._scheduler()
+            self.draw_cost = 0.05
+            scheduler.request()
+            self.dispatcher.run_all()
+            for _ in range(3):
+                self.clock.now += 0.005
+                scheduler.request()
+            self.assertTrue(scheduler.flush())
+            self.assertEqual(self.dispatcher.queued[-1][1], 0)
+
+            self.dispatcher.run_all()
+            self.assertEqual(len(self.draws), 2)
+            self.assertEqual(self.requested[-1]["reason"], "final_flush")
+            self.assertEqual(scheduler.stats()["superseded"], 1)
+
+        def test_flush_skips_when_nothing_changed(self) -> None:
+            scheduler = self._scheduler()
+            scheduler.request()
+            self.dispatcher.run_all()
+            self.assertFalse(scheduler.flush())
+            self.assertEqual(self.dispatcher.queued, [])
+
+        def test_request_during_draw_schedules_follow_up(self) -> None:
+            scheduler = self._scheduler()
+
+            def refresh() -> None:
+                self.draws.append(self.clock.now)
+                if len(self.draws) == 1:
+                    scheduler.request()
+
+            scheduler._refresh = refresh
+            scheduler.request()
+            self.dispatcher.run_all()
+            self.assertEqual(len(self.dispatcher.queued), 1)
+            self.dispatcher.run_all()
+            self.assertEqual(len(self.draws), 2)
+
+        def test_should_refresh_gate_and_errors_are_reported(self) -> None:
+            allowed = {"value": False}
+            scheduler = self._scheduler(should_refresh=lambda: allowed["value"])
+            scheduler.request()
+            self.assertEqual(self.dispatcher.queued, [])
+
+            allowed["value"] = True
+
+            def failing_refresh() -> None:
+                raise RuntimeError("boom")
+
+            scheduler._refresh = failing_refresh
+            scheduler.request()
+            self.dispatcher.run_all()
+            self.assertFalse(self.executed[-1]["success"])
+            self.assertEqual(self.executed[-1]["error"], "boom")
+            self.assertEqual(scheduler.stats()["draw_errors"], 1)
+
+        def test_fallback_dispatch_defers_instead_of_sleeping(self) -> None:
+            scheduler = self._scheduler()
+            scheduler.request()
+            self.dispatcher.run_all()
+            with patch.object(
+                canvasRefreshScheduler, "ui_dispatch_fallback_active", return_value=True
+            ):
+                self.clock.now += 0.001
+                scheduler.request()
+            self.assertEqual(self.dispatcher.queued, [])
+            self.assertTrue(scheduler.flush())
+
+else:
+    if not TYPE_CHECKING:
+
+        class CanvasRefreshSchedulerTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
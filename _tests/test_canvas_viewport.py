@@ -0,0 +1,87 @@
+import random
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib.canvasViewport import RowHeightIndex, UniformRowIndex
+
+    def _linear_visible(heights, scroll_y, viewport_height):
+        """Reference scan: rows whose bottom is below the top edge and whose
+        top is at or above the bottom edge."""
+        visible = []
+        top = 0.0
+        for index, height in enumerate(heights):
+            if top + height > scroll_y and top <= scroll_y + viewport_height:
+                visible.append((index, top - scroll_y))
+            top += height
+        return visible
+
+    class RowHeightIndexTests(unittest.TestCase):
+        def test_prefix_sums_and_total(self) -> None:
+            index = RowHeightIndex([10, 20, 30])
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index.total_height, 60)
+            self.assertEqual(index.row_top(2), 30)
+            self.assertEqual(index.row_height(1), 20)
+
+        def test_first_visible_binary_search(self) -> None:
+            index = RowHeightIndex([10, 20, 30])
+            self.assertEqual(index.first_visible(-5), 0)
+            self.assertEqual(index.first_visible(0), 0)
+            self.assertEqual(index.first_visible(9.9), 0)
+            self.assertEqual(index.first_visible(10), 1)
+            self.assertEqual(index.first_visible(59), 2)
+            self.assertEqual(index.first_visible(60), 3)
+
+        def test_visible_rows_match_linear_scan(self) -> None:
+            rng = random.Random(3)
+            heights = [rng.randint(5, 80) for _ in range(200)]
+            index = RowHeightIndex(heights)
+            for _ in range(200):
+                scroll_y = rng.uniform(-50, index.total_height + 50)
+                viewport = rng.uniform(0, 400)
+                self.assertEqual(
+                    list(index.visible_rows(scroll_y, viewport)),
+                    _linear_visible(heights, scroll_y, viewport),
+                )
+
+        def test_empty_index(self) -> None:
+            index = RowHeightIndex([])
+            self.assertEqual(index.total_height, 0)
+            self.assertEqual(list(index.visible_rows(0, 100)), [])
+
+    class UniformRowIndexTests(unittest.TestCase):
+        def test_matches_variable_index_with_equal_heights(self) -> None:
+            uniform = UniformRowIndex(50, 18)
+            variable = RowHeightIndex([18] * 50)
+            self.assertEqual(uniform.total_height, variable.total_height)
+            for scroll_y in (0, 5, 18, 100, 17 * 18, 900, 1000):
+                for viewport in (0, 18, 200, 1000):
+                    self.assertEqual(
+                        list(uniform.visible_rows(scroll_y, viewport)),
+                        list(variable.visible_rows(scroll_y, viewport)),
+                        (scroll_y, viewport),
+                    )
+
+        def test_scroll_cost_independent_of_row_count(self) -> None:
+            small = UniformRowIndex(10, 20)
+            large = UniformRowIndex(100_000, 20)
+            self.assertEqual(
+                len(list(small.visible_rows(0, 100))),
+                len(list(large.visible_rows(500_000, 100))),
+            )
+
+else:
+    if not TYPE_CHECKING:
+
+        class RowHeightIndexTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -1366,6 +1366,9 @@ def test_cheat_sheet_task_guidance_uses_metadata_definition(monkeypatch):
             }
         },
     )
+    # Force the shared catalog snapshot to rebuild with the patched metadata;
+    # monkeypatch restores the original snapshot afterwards.
+    monkeypatch.setattr(axisCatalog, "_catalog_snapshot", None)
 
     lines = helpHub._axis_guidance_lines()
 
@@ -0,0 +1,184 @@
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    import datetime
+
+    from talon_user.lib import requestLog
+    from talon_user.lib.historySearch import (
+        HistorySearchIndex,
+        HistorySearchQuery,
+        entry_facets,
+    )
+    from talon_user.lib.requestHistory import RequestLogEntry
+
+    def _ms(day: str) -> int:
+        moment = datetime.datetime.combine(
+            datetime.date.fromisoformat(day), datetime.time(12)
+        )
+        return int(moment.timestamp() * 1000)
+
+    def _entry(request_id: str, prompt: str, **overrides) -> RequestLogEntry:
+        payload = dict(
+            request_id=request_id,
+            prompt=prompt,
+            response="",
+            meta="",
+            recipe="describe · full · fog",
+            started_at_ms=_ms("2025-01-10"),
+            axes={"scope": ["act"], "directional": ["fog"]},
+            provider_id="openai",
+            persona={"persona_voice": "as teacher", "intent_preset_key": "teach"},
+        )
+        payload.update(overrides)
+        return RequestLogEntry(**payload)
+
+    class HistorySearchQueryTests(unittest.TestCase):
+        def test_parse_splits_facets_dates_and_text(self) -> None:
+            query = HistorySearchQuery.parse(
+                "retry Budget provider:Gemini scope:act since:2025-01-01 note:x"
+            )
+            self.assertEqual(query.text, "retry Budget note:x")
+            self.assertEqual(query.facets, {"provider": "gemini", "scope": "act"})
+            self.assertIsNotNone(query.since_ms)
+            self.assertIsNone(query.until_ms)
+
+        def test_entry_facets_cover_static_axes_persona_provider(self) -> None:
+            facets = entry_facets(_entry("r1", "p"))
+            self.assertIn(("static", "describe"), facets)
+            self.assertIn(("provider", "openai"), facets)
+            self.assertIn(("scope", "act"), facets)
+            self.assertIn(("directional", "fog"), facets)
+            self.assertIn(("voice", "as teacher"), facets)
+            self.assertIn(("intent", "teach"), facets)
+
+    class HistorySearchIndexTests(unittest.TestCase):
+        def _index(self) -> HistorySearchIndex:
+            index = HistorySearchIndex()
+            index.rebuild(
+                [
+                    _entry("r0", "retry budget for the gateway"),
+                    _entry(
+                        "r1",
+                        "retry retry retry",
+                        provider_id="gemini",
+                        started_at_ms=_ms("2025-02-01"),
+                    ),
+                    _entry("r2", "unrelated summary", recipe="todo · gist · fog"),
+                    _entry("r3", "budget review", axes={"scope": ["system"]}),
+                ]
+            )
+            return index
+
+        def test_text_matches_rank_and_carry_offsets(self) -> None:
+            page = self._index().search("retry")
+            self.assertEqual([hit.entry.request_id for hit in page.hits], ["r1", "r0"])
+            self.assertEqual([hit.offset for hit in page.hits], [2, 3])
+            self.assertEqual(page.total, 2)
+
+        def test_all_terms_and_facets_must_match(self) -> None:
+            index = self._index()
+            self.assertEqual(
+                [h.entry.request_id for h in index.search("retry budget").hits], ["r0"]
+            )
+            self.assertEqual(
+                [h.entry.request_id for h in index.search("budget scope:system").hits],
+                ["r3"],
+            )
+            self.assertEqual(index.search("static:todo").hits[0].entry.request_id, "r2")
+            self.assertEqual(index.search("provider:anthropic").total, 0)
+
+        def test_filter_only_queries_list_newest_first(self) -> None:
+            page = self._index().search("provider:openai")
+            self.assertEqual([h.entry.request_id for h in page.hits], ["r3", "r2", "r0"])
+            self.assertEqual(
+                dict(page.facet_counts["static"]), {"describe": 2, "todo": 1}
+            )
+
+        def test_date_range_filters(self) -> None:
+            index = self._index()
+            self.assertEqual(
+                [h.entry.request_id for h in index.search("since:2025-01-20").hits],
+                ["r1"],
+            )
+            self.assertEqual(index.search("retry until:2025-01-15").total, 1)
+
+        def test_pagination(self) -> None:
+            index = self._index()
+            first = index.search("fog", limit=3)
+            second = index.search("fog", limit=3, offset=3)
+            self.assertEqual(first.total, 4)
+            self.assertEqual(len(first.hits), 3)
+            self.assertEqual(len(second.hits), 1)
+            seen = {h.entry.request_id for h in first.hits + second.hits}
+            self.assertEqual(seen, {"r0", "r1", "r2", "r3"})
+
+        def test_trim_to_drops_oldest_postings(self) -> None:
+            index = self._index()
+            index.trim_to(2)
+            self.assertEqual(len(index), 2)
+            self.assertEqual(index.search("retry").total, 0)
+            self.assertEqual(index.search("budget").hits[0].offset, 0)
+            index.add(_entry("r4", "retry again"))
+            self.assertEqual(index.search("retry").hits[0].entry.request_id, "r4")
+
+    class RequestLogSearchTests(unittest.TestCase):
+        def setUp(self) -> None:
+            requestLog.clear_history()
+
+        def tearDown(self) -> None:
+            requestLog.clear_history()
+
+        def _append(self, request_id: str, prompt: str, **kwargs) -> None:
+            requestLog.append_entry(
+                request_id,
+                prompt,
+                "response",
+                axes={"directional": ["fog"], **kwargs.pop("axes", {})},
+                **kwargs,
+            )
+
+        def test_search_follows_appends_and_offsets_match_history(self) -> None:
+            self._append("a", "alpha release notes")
+            self._append("b", "beta rollout")
+            page = requestLog.search_history("alpha")
+            self.assertEqual([h.entry.request_id for h in page.hits], ["a"])
+            self._append("c", "alpha follow up")
+            page = requestLog.search_history("alpha")
+            self.assertEqual({h.entry.request_id for h in page.hits}, {"a", "c"})
+            for hit in page.hits:
+                self.assertEqual(
+                    requestLog.nth_from_latest(hit.offset).request_id,  # type: ignore[union-attr]
+                    hit.entry.request_id,
+                )
+
+        def test_search_drops_evicted_entries(self) -> None:
+            self._append("old", "needle")
+            requestLog.search_history("needle")
+            for index in range(25):
+                self._append(f"n{index}", "filler")
+            self.assertEqual(requestLog.search_history("needle").total, 0)
+            page = requestLog.search_history("filler", limit=1)
+            self.assertEqual(page.total, len(requestLog.all_entries()))
+            self.assertEqual(page.hits[0].offset, 0)
+
+        def test_search_reset_by_clear(self) -> None:
+            self._append("a", "alpha")
+            self.assertEqual(requestLog.search_history("alpha").total, 1)
+            requestLog.clear_history()
+            self.assertEqual(requestLog.search_history("alpha").total, 0)
+
+else:
+    if not TYPE_CHECKING:
+
+        class HistorySearchIndexTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
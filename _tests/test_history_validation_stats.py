@@ -0,0 +1,111 @@
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import axisCatalog, requestLog
+    from talon_user.lib.requestHistory import RequestLogEntry
+
+    PERSONA = {
+        "persona_preset_key": "mentor",
+        "persona_preset_spoken": "mentor",
+        "intent_preset_key": "inform",
+        "intent_display": "Inform",
+    }
+
+    class HistoryValidationStatsTests(unittest.TestCase):
+        def setUp(self) -> None:
+            requestLog.clear_history()
+
+        def tearDown(self) -> None:
+            requestLog.clear_history()
+
+        def _append(self, request_id: str, **kwargs) -> None:
+            # Store entries directly so guardrail failures reach history.
+            kwargs.setdefault("axes", {"directional": ["fog"]})
+            requestLog.append_history_entry(
+                RequestLogEntry(request_id, "prompt", "response", **kwargs)
+            )
+
+        def _rescan(self) -> dict:
+            tracker = requestLog._HistoryValidationTracker(0)
+            for entry in requestLog.all_entries():
+                tracker.add(entry)
+            return tracker.stats()
+
+        def test_stats_update_on_append_without_rescanning(self) -> None:
+            self._append("r1")
+            stats = requestLog.history_validation_stats()
+            self.assertEqual(stats["total_entries"], 1)
+
+            with patch.object(
+                requestLog, "_validate_history_entry", wraps=requestLog._validate_history_entry
+            ) as validate:
+                self._append("r2", persona=PERSONA)
+                self._append("r3", axes={"scope": ["focus"]})
+                stats = requestLog.history_validation_stats()
+                requestLog.history_validation_stats()
+            self.assertEqual(validate.call_count, 2)
+            self.assertEqual(stats["total_entries"], 3)
+            self.assertEqual(stats["entries_with_persona_snapshot"], 1)
+            self.assertEqual(stats["entries_missing_directional"], 1)
+            self.assertEqual(stats["persona_alias_pairs"], {"mentor": {"mentor": 1}})
+            self.assertEqual(stats["intent_display_pairs"], {"inform": {"Inform": 1}})
+            for key, value in self._rescan().items():
+                self.assertEqual(stats[key], value, key)
+
+        def test_evicted_entries_leave_the_totals(self) -> None:
+            self._append("persona", persona=PERSONA)
+            requestLog.history_validation_stats()
+            for index in range(25):
+                self._append(f"r{index}")
+            stats = requestLog.history_validation_stats()
+            self.assertEqual(stats["total_entries"], len(requestLog.all_entries()))
+            self.assertEqual(stats["entries_with_persona_snapshot"], 0)
+            self.assertEqual(stats["persona_alias_pairs"], {})
+
+        def test_validate_raises_oldest_failure(self) -> None:
+            self._append("ok")
+            requestLog.validate_history_axes()
+            self._append("bad-1", axes={"scope": ["focus"]})
+            self._append("bad-2", axes={"scope": ["focus"]})
+            with self.assertRaisesRegex(ValueError, "bad-1"):
+                requestLog.validate_history_axes()
+
+        def test_tracker_keeps_only_the_newest_entry(self) -> None:
+            tracker = requestLog._HistoryValidationTracker(0)
+            entries = [
+                RequestLogEntry(f"r{index}", "prompt", "response", started_at_ms=index)
+                for index in range(3)
+            ]
+            for entry in entries:
+                tracker.add(entry)
+            self.assertIs(tracker.latest(), entries[-1])
+            self.assertEqual([row[:2] for row in tracker._entries], [("r0", 0), ("r1", 1), ("r2", 2)])
+            self.assertFalse(
+                any(item is entry for row in tracker._entries for item in row for entry in entries)
+            )
+            tracker.trim_to(0)
+            self.assertIsNone(tracker.latest())
+
+        def test_catalog_generation_change_rebuilds(self) -> None:
+            self._append("r1")
+            first = requestLog._history_validation_tracker()
+            self.assertIs(requestLog._history_validation_tracker(), first)
+            axisCatalog.invalidate_axis_catalog()
+            self.assertIsNot(requestLog._history_validation_tracker(), first)
+
+else:
+    if not TYPE_CHECKING:
+
+        class HistoryValidationStatsTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -0,0 +1,113 @@
+import os
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers
+    from talon_user.lib.modelHelpers import GPTRequestError
+    from talon_user.lib.modelState import GPTState
+    from scripts.tools.mock_openai_sse import (
+        MockResponseConfig,
+        MockSSEServer,
+        filler_text,
+        http_post,
+        response_text,
+        split_chunks,
+    )
+
+    REQUEST = {
+        "model": "gpt-test",
+        "messages": [{"role": "user", "content": [{"type": "text", "text": "hi"}]}],
+        "stream": True,
+    }
+
+    class MockResponseShapeTests(unittest.TestCase):
+        def test_filler_is_deterministic_and_exact_length(self) -> None:
+            for size in (0, 1, 37, 1024):
+                self.assertEqual(len(filler_text(size)), size)
+            self.assertEqual(filler_text(500), filler_text(500))
+
+        def test_meta_section_and_chunking(self) -> None:
+            config = MockResponseConfig(text="answer", meta="## Model interpretation\nx")
+            text = response_text(config)
+            self.assertEqual(text, "answer\n\n## Model interpretation\nx")
+            self.assertEqual("".join(split_chunks(text, 4)), text)
+            self.assertEqual(len(split_chunks(text, 4)[0]), 4)
+
+    class MockServerStreamingTests(unittest.TestCase):
+        def setUp(self) -> None:
+            os.environ["OPENAI_API_KEY"] = "test-key"
+            GPTState.text_to_confirm = ""
+            GPTState.last_streaming_events = []
+            self.server = MockSSEServer(
+                MockResponseConfig(total_chars=300, chunk_chars=16)
+            ).start()
+            self.addCleanup(self.server.stop)
+
+        def _send(self, request_id: str, request=None) -> str:
+            def fake_get(key, default=None):
+                if key == "user.model_endpoint":
+                    return self.server.url
+                if key == "user.model_request_timeout_seconds":
+                    return 10
+                return default
+
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=fake_get),
+                patch.object(modelHelpers.requests, "post", side_effect=http_post),
+                patch.object(
+                    modelHelpers, "_should_show_response_canvas", return_value=False
+                ),
+            ):
+                return modelHelpers._send_request_streaming(
+                    dict(request or REQUEST), request_id
+                )
+
+        def _chunk_events(self, request_id: str):
+            return [
+                e
+                for e in GPTState.last_streaming_events
+                if e.get("request_id") == request_id and e.get("kind") == "chunk"
+            ]
+
+        def test_streams_chunks_with_meta_section(self) -> None:
+            text = self._send("mock-stream")
+            self.assertEqual(text, response_text(self.server.config))
+            self.assertIn("## Model interpretation", text)
+            self.assertEqual(
+                len(self._chunk_events("mock-stream")),
+                len(split_chunks(text, 16)),
+            )
+            self.assertTrue(self.server.requests[-1].get("stream"))
+
+        def test_json_fallback_when_stream_flag_is_ignored(self) -> None:
+            self.server.configure(json_fallback=True, meta=None, text="whole body")
+            self.assertEqual(self._send("mock-json"), "whole body")
+
+        def test_http_error_status_raises(self) -> None:
+            self.server.configure(status=429)
+            with self.assertRaises(GPTRequestError) as ctx:
+                self._send("mock-error")
+            self.assertEqual(ctx.exception.status_code, 429)
+
+        def test_aborted_stream_raises(self) -> None:
+            self.server.configure(abort_after_chunks=3)
+            with self.assertRaises(Exception):
+                self._send("mock-abort")
+            self.assertEqual(len(self._chunk_events("mock-abort")), 3)
+
+else:
+    if not TYPE_CHECKING:
+
+        class MockServerStreamingTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
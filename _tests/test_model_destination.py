@@ -23,6 +23,7 @@ if bootstrap is not None:
         render_for_destination,
     )
     from talon_user.lib.promptPipeline import PromptResult
+    from talon_user.lib.modelLog import recent_log_records, reset_log_buffer
     from talon_user.lib.modelState import GPTState
     from talon_user.lib.personaConfig import persona_intent_maps_reset
 
@@ -150,16 +151,16 @@ if bootstrap is not None:
             self.assertIn("inside_textarea=False", message)
             self.assertIn("focused element lookup failed", message)
 
-        @patch("talon_user.lib.modelHelpers.print")
-        def test_build_request_logs_textarea_check_when_debug(self, mock_helpers_print):
+        def test_build_request_logs_textarea_check_when_debug(self):
             GPTState.debug_enabled = True
             self.addCleanup(lambda: setattr(GPTState, "debug_enabled", False))
+            reset_log_buffer()
+            self.addCleanup(reset_log_buffer)
 
             build_request(model_destination_module.Above())
 
             messages = [
-                " ".join(str(arg) for arg in call.args)
-                for call in mock_helpers_print.call_args_list
+                record["message"] for record in recent_log_records(name="modelHelpers")
             ]
             self.assertTrue(
                 any("inside_textarea check" in message for message in messages),
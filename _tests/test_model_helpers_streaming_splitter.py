@@ -0,0 +1,136 @@
+import random
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers
+    from talon_user.lib.modelHelpers import (
+        StreamingAnswerMetaSplitter,
+        split_answer_and_meta,
+    )
+    from talon_user.lib.modelState import GPTState
+
+    SAMPLES = [
+        "",
+        "   \n  ",
+        "Plain answer with no meta.",
+        "Body\n## Model interpretation\nMeta content\n",
+        "Body\n  ###   Model interpretation- Intended intent: something\nMeta\n",
+        "📷✨🌱\n📷✨🌱## Model interpretation- Approach: explain.\nMeta body.\n",
+        "Model interpretations are not headings\nstill answer\n",
+        "A supermodel interpretation appears inline, then more text.",
+        "Answer\n\n\n#### model INTERPRETATION\n- point\n- point two\n",
+        "First model interpretations\nthen ## Model interpretation\nmeta",
+    ]
+
+    class StreamingAnswerMetaSplitterTests(unittest.TestCase):
+        def _assert_matches_full_split(self, text: str, chunks: list[str]) -> None:
+            splitter = StreamingAnswerMetaSplitter()
+            fed = ""
+            for chunk in chunks:
+                splitter.feed(chunk)
+                fed += chunk
+                self.assertEqual(
+                    splitter.split(),
+                    split_answer_and_meta(fed),
+                    f"mismatch after {fed!r}",
+                )
+            self.assertEqual(splitter.text, text)
+
+        def test_single_chunk_matches_full_split(self) -> None:
+            for text in SAMPLES:
+                with self.subTest(text=text):
+                    self._assert_matches_full_split(text, [text] if text else [])
+
+        def test_character_chunks_match_full_split(self) -> None:
+            for text in SAMPLES:
+                with self.subTest(text=text):
+                    self._assert_matches_full_split(text, list(text))
+
+        def test_random_chunks_match_full_split(self) -> None:
+            rng = random.Random(1234)
+            for text in SAMPLES:
+                for _ in range(20):
+                    chunks: list[str] = []
+                    index = 0
+                    while index < len(text):
+                        size = rng.randint(1, 12)
+                        chunks.append(text[index : index + size])
+                        index += size
+                    with self.subTest(text=text, chunks=chunks):
+                        self._assert_matches_full_split(text, chunks)
+
+        def test_feed_defers_joining_until_text_is_read(self) -> None:
+            splitter = StreamingAnswerMetaSplitter()
+            for _ in range(100):
+                splitter.feed("lorem ipsum ")
+            self.assertEqual(len(splitter._text._pending), 100)
+            self.assertLessEqual(
+                len(splitter._tail), modelHelpers._META_HEADING_CORE_LEN
+            )
+            self.assertEqual(splitter.text, "lorem ipsum " * 100)
+            self.assertEqual(splitter._text._pending, [])
+
+        def test_split_appends_only_new_chunks_to_the_answer(self) -> None:
+            splitter = StreamingAnswerMetaSplitter()
+            chunks = ["lorem ipsum "] * 50
+            answer, _ = splitter.sync(chunks).split()
+            # Nothing new arrived: the same string comes back, no re-join.
+            self.assertIs(splitter.split()[0], answer)
+            chunks.append("dolor ")
+            self.assertEqual(splitter.sync(chunks)._text._pending, ["dolor "])
+            answer, meta = splitter.split()
+            self.assertEqual(answer, "lorem ipsum " * 50 + "dolor ")
+            self.assertEqual(meta, "")
+
+            chunks.extend(["\n## Model interpretation\n", "why"])
+            answer, meta = splitter.sync(chunks).split()
+            self.assertIs(splitter.split()[1], meta)
+            chunks.append(" now")
+            self.assertEqual(
+                splitter.sync(chunks).split(),
+                (answer, "## Model interpretation\nwhy now"),
+            )
+
+        def test_sync_consumes_only_new_chunks(self) -> None:
+            splitter = StreamingAnswerMetaSplitter()
+            chunks = ["Body\n", "## Model interpretation"]
+            splitter.sync(chunks)
+            self.assertFalse(splitter.split_found)
+            chunks.extend(["\n", "meta line"])
+            splitter.sync(chunks)
+            splitter.sync(chunks)
+            self.assertEqual(
+                splitter.split(), ("Body", "## Model interpretation\nmeta line")
+            )
+            self.assertEqual(splitter.text, "".join(chunks))
+
+        def test_update_stream_state_from_splitter_sets_answer_and_meta(self) -> None:
+            GPTState.text_to_confirm = ""
+            GPTState.last_meta = ""
+            GPTState.last_streaming_snapshot = {"text": ""}
+            splitter = StreamingAnswerMetaSplitter()
+            chunks = ["Answer body\n", "## Model interpretation\n", "why"]
+
+            modelHelpers._update_stream_state_from_splitter(splitter, chunks)
+
+            self.assertEqual(GPTState.text_to_confirm, "Answer body")
+            self.assertEqual(GPTState.last_meta, "## Model interpretation\nwhy")
+            self.assertEqual(
+                GPTState.last_streaming_snapshot.get("text"), "Answer body"
+            )
+
+else:
+    if not TYPE_CHECKING:
+
+        class StreamingAnswerMetaSplitterTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
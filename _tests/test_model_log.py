@@ -0,0 +1,144 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon import settings
+
+    from talon_user.lib import modelLog
+    from talon_user.lib.modelLog import (
+        DEBUG,
+        INFO,
+        WARNING,
+        configure_logging,
+        get_logger,
+        log_stats,
+        recent_log_records,
+        reset_log_buffer,
+    )
+    from talon_user.lib.requestHistory import RequestHistory, RequestLogEntry
+    from talon_user.lib.telemetryExport import snapshot_telemetry
+
+    class _Exploding:
+        def __str__(self) -> str:
+            raise AssertionError("disabled log records must not be formatted")
+
+        __repr__ = __str__
+
+    class ModelLogTests(unittest.TestCase):
+        def setUp(self) -> None:
+            configure_logging(console_level="info", buffer_level="debug", buffer_size=1000)
+            reset_log_buffer()
+            self.addCleanup(reset_log_buffer)
+            self.addCleanup(
+                configure_logging,
+                console_level="info",
+                buffer_level="info",
+                buffer_size=1000,
+            )
+            self.log = get_logger("test")
+
+        def test_disabled_levels_skip_formatting_and_buffering(self) -> None:
+            configure_logging(console_level="warning", buffer_level="warning")
+            with patch("builtins.print") as mock_print:
+                self.log.debug("value=%s", _Exploding())
+                self.log.info("value=%s", _Exploding())
+            mock_print.assert_not_called()
+            self.assertEqual(recent_log_records(), [])
+            self.assertFalse(self.log.enabled_for(INFO))
+            self.assertTrue(self.log.enabled_for(WARNING))
+
+        def test_default_levels_drop_debug_before_building_a_record(self) -> None:
+            with patch.object(
+                settings, "get", side_effect=lambda _key, default=None: default
+            ):
+                modelLog._load_settings()
+            self.assertEqual(log_stats()["buffer_level"], "info")
+            with patch.object(
+                modelLog, "LogRecord", side_effect=AssertionError("record built")
+            ):
+                self.log.debug("value=%s", _Exploding())
+            self.assertEqual(recent_log_records(), [])
+
+        def test_debug_records_are_buffered_but_not_printed(self) -> None:
+            with patch("builtins.print") as mock_print:
+                self.log.debug("answer_len=%d", 42)
+            mock_print.assert_not_called()
+            records = recent_log_records()
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]["message"], "answer_len=42")
+            self.assertEqual(records[0]["level"], "debug")
+            self.assertEqual(records[0]["name"], "test")
+
+        def test_console_threshold_prefixes_warnings(self) -> None:
+            with patch("builtins.print") as mock_print:
+                self.log.info("hello %s", "world")
+                self.log.warning("failed: %s", "boom")
+            printed = [call.args[0] for call in mock_print.call_args_list]
+            self.assertEqual(printed, ["[test] hello world", "[test] WARNING: failed: boom"])
+
+        def test_ring_buffer_is_bounded_and_filterable(self) -> None:
+            configure_logging(buffer_size=5)
+            other = get_logger("other")
+            for index in range(8):
+                self.log.debug("event %d", index)
+            other.warning("kept")
+            records = recent_log_records()
+            self.assertEqual(len(records), 5)
+            self.assertEqual(records[-1]["message"], "kept")
+            self.assertEqual(records[0]["message"], "event 4")
+            self.assertEqual(
+                [r["message"] for r in recent_log_records(min_level=WARNING)], ["kept"]
+            )
+            self.assertEqual(len(recent_log_records(2, name="test")), 2)
+            stats = log_stats()
+            self.assertEqual(stats["debug"], 8)
+            self.assertEqual(stats["buffered"], 5)
+            self.assertEqual(stats["buffer_size"], 5)
+
+        def test_bad_format_args_do_not_raise(self) -> None:
+            self.log.debug("count=%d", "not-a-number")
+            self.assertIn("not-a-number", recent_log_records()[0]["message"])
+
+        def test_history_reads_do_not_print(self) -> None:
+            history = RequestHistory(max_entries=3)
+            with patch("builtins.print") as mock_print:
+                history.append(RequestLogEntry(request_id="r1", prompt="p", response="a"))
+                history.all()
+            mock_print.assert_not_called()
+            messages = [r["message"] for r in recent_log_records(name="requestHistory")]
+            self.assertEqual(len(messages), 2)
+            self.assertIn("newest_id=r1", messages[0])
+
+        def test_level_parsing(self) -> None:
+            self.assertEqual(modelLog.parse_level("DEBUG", INFO), DEBUG)
+            self.assertEqual(modelLog.parse_level("bogus", INFO), INFO)
+            self.assertEqual(modelLog.parse_level(None, WARNING), WARNING)
+
+        def test_telemetry_export_includes_log(self) -> None:
+            self.log.warning("exported %s", "record")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output = snapshot_telemetry(output_dir=tmpdir)
+                records = json.loads(Path(output["log"]).read_text())
+                telemetry = json.loads(Path(output["telemetry"]).read_text())
+            self.assertIn("exported record", [r["message"] for r in records])
+            self.assertEqual(telemetry["log"]["warning"], 1)
+            self.assertEqual(telemetry["log"]["console_level"], "info")
+
+else:
+    if not TYPE_CHECKING:
+
+        class ModelLogTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -0,0 +1,79 @@
+import random
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib.modelResponseCanvas import (
+        AnswerLineLayout,
+        _format_answer_lines,
+    )
+
+    _SAMPLE = (
+        "Intro paragraph that is long enough to wrap across several display "
+        "lines when the canvas is narrow.\r\n\r\n\n"
+        "- first bullet with quite a lot of trailing content to force wrapping\n"
+        "  * nested bullet\n"
+        "\n\n\n"
+        "Averyveryverylongwordwithoutanyspacesthatmustbehardwrappedbythelayout"
+        "\rfinal line after a bare carriage return\n"
+    )
+
+    class AnswerLineLayoutTests(unittest.TestCase):
+        def test_scroll_redraw_reuses_layout(self) -> None:
+            layout = AnswerLineLayout()
+            lines, mode = layout.layout(_SAMPLE, 40)
+            self.assertEqual(mode, "full")
+            again, mode = layout.layout(_SAMPLE, 40)
+            self.assertEqual(mode, "hit")
+            self.assertIs(again, lines)
+
+        def test_width_or_metrics_change_relayouts(self) -> None:
+            layout = AnswerLineLayout()
+            layout.layout(_SAMPLE, 40, (8,))
+            lines, mode = layout.layout(_SAMPLE, 60, (8,))
+            self.assertEqual(mode, "full")
+            self.assertEqual(lines, _format_answer_lines(_SAMPLE, 60))
+            _lines, mode = layout.layout(_SAMPLE, 60, (7,))
+            self.assertEqual(mode, "full")
+
+        def test_appended_text_matches_full_layout(self) -> None:
+            rng = random.Random(7)
+            for max_chars in (20, 40, 96):
+                layout = AnswerLineLayout()
+                cut = 0
+                while cut < len(_SAMPLE):
+                    cut = min(len(_SAMPLE), cut + rng.randint(1, 12))
+                    text = _SAMPLE[:cut]
+                    lines, mode = layout.layout(text, max_chars)
+                    self.assertEqual(
+                        lines, _format_answer_lines(text, max_chars), (max_chars, cut)
+                    )
+                self.assertEqual(mode, "append")
+
+        def test_rewritten_text_falls_back_to_full_layout(self) -> None:
+            layout = AnswerLineLayout()
+            layout.layout("alpha\nbeta", 40)
+            lines, mode = layout.layout("gamma", 40)
+            self.assertEqual(mode, "full")
+            self.assertEqual(lines, ["gamma"])
+
+        def test_empty_text_matches_formatter(self) -> None:
+            layout = AnswerLineLayout()
+            for text in ("", "\n\n", "   "):
+                lines, _mode = layout.layout(text, 40)
+                self.assertEqual(lines, _format_answer_lines(text, 40))
+
+else:
+    if not TYPE_CHECKING:
+
+        class AnswerLineLayoutTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
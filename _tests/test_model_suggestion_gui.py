@@ -208,6 +208,37 @@ if bootstrap is not None:
             # clamp_scroll should cap at the computed max_scroll of 640.
             self.assertEqual(SuggestionCanvasState.scroll_y, 640.0)
 
+        def test_scroll_reuses_measured_row_heights(self):
+            class RectStub:
+                def __init__(self):
+                    self.x = 0
+                    self.y = 0
+                    self.width = 800
+                    self.height = 200
+
+            class CanvasStub:
+                rect = RectStub()
+
+            SuggestionGUIState.suggestions = [
+                modelSuggestionGUI.Suggestion(name="One", recipe="describe · fog"),
+                modelSuggestionGUI.Suggestion(name="Two", recipe="describe · fog"),
+            ]
+            modelSuggestionGUI._suggestion_canvas = CanvasStub()
+            modelSuggestionGUI._row_index_cache = None
+
+            with patch.object(
+                modelSuggestionGUI, "_measure_suggestion_height", return_value=200
+            ) as measure:
+                _scroll_suggestions(raw_delta=-1.0)
+                _scroll_suggestions(raw_delta=-1.0)
+                self.assertEqual(measure.call_count, 2)
+
+                SuggestionGUIState.suggestions = [
+                    modelSuggestionGUI.Suggestion(name="Three", recipe="describe · fog")
+                ]
+                _scroll_suggestions(raw_delta=-1.0)
+                self.assertEqual(measure.call_count, 3)
+
         def test_persona_stance_display_includes_long_form_axes(self):
             suggestion = modelSuggestionGUI.Suggestion(
                 name="With persona preset",
@@ -13,6 +13,7 @@ if bootstrap is not None:
     from talon import settings
     from talon_user.lib.axisMappings import axis_key_to_value_map_for
     from talon_user.lib.axisConfig import axis_key_to_kanji_map
+    from talon_user.lib import axisCatalog, modelTypes
     from talon_user.lib.modelTypes import GPTSystemPrompt
 
     class GPTSystemPromptDefaultsTests(unittest.TestCase):
@@ -202,6 +203,82 @@ if bootstrap is not None:
                 "PROMPT_REFERENCE_KEY task must not use self-immunizing authority assertion",
             )
 
+    class GPTSystemPromptCacheTests(unittest.TestCase):
+        def setUp(self):
+            modelTypes.reset_system_prompt_cache()
+
+        def tearDown(self):
+            modelTypes.reset_system_prompt_cache()
+
+        def test_repeated_stance_reuses_rendered_lines(self):
+            first = GPTSystemPrompt(scope="struct", method="plan").format_as_array()
+            second = GPTSystemPrompt(scope="struct", method="plan").format_as_array()
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+            stats = modelTypes.system_prompt_cache_stats()
+            self.assertEqual(stats["misses"], 1)
+            self.assertEqual(stats["hits"], 1)
+
+            # Callers may mutate the returned list without poisoning the cache.
+            second.append("extra")
+            third = GPTSystemPrompt(scope="struct", method="plan").format_as_array()
+            self.assertEqual(third, first)
+
+        def test_different_axes_miss(self):
+            GPTSystemPrompt(scope="struct").format_as_array()
+            GPTSystemPrompt(scope="narrow").format_as_array()
+            self.assertEqual(modelTypes.system_prompt_cache_stats()["misses"], 2)
+
+        def test_explicit_completeness_is_part_of_the_key(self):
+            settings.set("user.model_default_completeness", "full")
+            implicit = GPTSystemPrompt(form="code").format_as_array()
+            explicit = GPTSystemPrompt(form="code", completeness="full").format_as_array()
+            self.assertEqual(modelTypes.system_prompt_cache_stats()["hits"], 0)
+            self.assertEqual(len(implicit), len(explicit))
+
+        def test_catalog_generation_change_misses(self):
+            GPTSystemPrompt(scope="struct").format_as_array()
+            axisCatalog.invalidate_axis_catalog()
+            GPTSystemPrompt(scope="struct").format_as_array()
+            stats = modelTypes.system_prompt_cache_stats()
+            self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+
+        def test_meta_prompt_config_reload_misses(self):
+            import importlib
+
+            from talon_user.lib import metaPromptConfig
+
+            GPTSystemPrompt(scope="struct").format_as_array()
+            generation = axisCatalog.axis_catalog_generation()
+            importlib.reload(metaPromptConfig)
+            # The reload alone does not touch the catalog; the next signature
+            # recheck notices the new config object.
+            self.assertEqual(axisCatalog.axis_catalog_generation(), generation)
+            axisCatalog._catalog_checked_at = None
+            GPTSystemPrompt(scope="struct").format_as_array()
+            stats = modelTypes.system_prompt_cache_stats()
+            self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+
+        def test_importing_config_modules_keeps_cached_prompts(self):
+            import importlib
+
+            GPTSystemPrompt(scope="struct").format_as_array()
+            importlib.import_module("talon_user.lib.personaConfig")
+            importlib.import_module("talon_user.lib.metaPromptConfig")
+            axisCatalog._catalog_checked_at = None
+            GPTSystemPrompt(scope="struct").format_as_array()
+            stats = modelTypes.system_prompt_cache_stats()
+            self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+        def test_cache_is_bounded(self):
+            cache = modelTypes._SystemPromptCache(max_entries=2)
+            for key in ("a", "b", "c"):
+                cache.put(key, (key,))
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("c"), ("c",))
+            self.assertEqual(cache.stats()["evictions"], 1)
+            self.assertEqual(cache.stats()["entries"], 2)
+
 else:
     if not TYPE_CHECKING:
 
@@ -71,6 +71,19 @@ if bootstrap is not None:
             self.session.prepare_prompt.assert_called_once_with("prompt", source, None)
             self.session.execute.assert_called_once()
 
+        def test_detached_run_snapshots_then_sends(self):
+            source = _StaticSource("input")
+            self.session.execute_detached.return_value = format_message("detached")
+
+            session = self.pipeline.prepare_detached("prompt", source, "paste")
+            self.session.prepare_prompt.assert_called_once_with("prompt", source, None)
+            self.session.detach.assert_called_once()
+
+            result = self.pipeline.complete_detached(session)
+            self.assertEqual(result.text, "detached")
+            self.session.execute.assert_not_called()
+            self.session.append_thread.assert_not_called()
+
 else:
     if not TYPE_CHECKING:
         class PromptPipelineTests(unittest.TestCase):
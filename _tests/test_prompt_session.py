@@ -16,7 +16,11 @@ if bootstrap is not None:
     from talon_user.lib.promptSession import PromptSession
     from talon_user.lib.modelSource import ModelSource
     from talon_user.lib import promptSession as prompt_session_module
-    from talon_user.lib.modelHelpers import MAX_TOTAL_CALLS, format_message
+    from talon_user.lib.modelHelpers import (
+        MAX_TOTAL_CALLS,
+        apply_prompt_cache_layout,
+        format_message,
+    )
 
     class _StaticSource(ModelSource):
         def __init__(self, text: str):
@@ -88,6 +92,23 @@ if bootstrap is not None:
             self.assertIs(handle, mock_handle)
             mock_send_request_async.assert_called_once()
 
+        @patch.object(prompt_session_module, "send_request_detached")
+        def test_execute_detached_sends_snapshot_taken_at_detach(self, mock_send):
+            mock_send.return_value = format_message("detached")
+            first = PromptSession(destination="paste")
+            first.prepare_prompt("first", _StaticSource("one"))
+            first.detach()
+            second = PromptSession(destination="paste")
+            second.prepare_prompt("second", _StaticSource("two"))
+
+            result = first.execute_detached()
+
+            self.assertEqual(result["text"], "detached")
+            sent = mock_send.call_args.args[0]
+            self.assertIsNot(sent, GPTState.request)
+            self.assertIn("one", str(sent["messages"]))
+            self.assertNotIn("two", str(sent["messages"]))
+
         def test_begin_reuse_existing_skips_build(self):
             GPTState.request = {
                 "messages": [],
@@ -195,6 +216,87 @@ if bootstrap is not None:
                 "Channel: The response formats the answer for Slack using appropriate Markdown, mentions, and code blocks while avoiding channel-irrelevant decoration.",
                 hydrated,
             )
+
+    class PromptCacheLayoutTests(unittest.TestCase):
+        def setUp(self):
+            GPTState.reset_all()
+            GPTState.system_prompt = GPTSystemPrompt(voice="v", audience="a")
+            GPTState.thread_enabled = False
+            settings.set("user.openai_model", "gpt-test")
+            actions.user.gpt_tools = lambda: "[]"  # type: ignore[attr-defined]
+            actions.user.gpt_additional_user_context = lambda: []  # type: ignore[attr-defined]
+            self._active_context = "app: Editor"
+            actions.user.talon_get_active_context = lambda: self._active_context  # type: ignore[attr-defined]
+
+        def tearDown(self):
+            settings.set("user.model_prompt_cache_layout", 0)
+
+        def _prepared_messages(self, prompt: str):
+            session = PromptSession(destination="paste")
+            session.prepare_prompt(prompt, _StaticSource("input"))
+            apply_prompt_cache_layout()
+            return GPTState.request["messages"]
+
+        def test_legacy_layout_leads_with_volatile_context(self):
+            settings.set("user.model_prompt_cache_layout", 0)
+            messages = self._prepared_messages("run")
+            self.assertIn("app: Editor", messages[0]["content"])
+            self.assertEqual(GPTState.request_prompt_prefix, {})
+
+        def test_stable_layout_puts_volatile_context_before_user_turn(self):
+            settings.set("user.model_prompt_cache_layout", 1)
+            messages = self._prepared_messages("run")
+            roles = [m["role"] for m in messages]
+            self.assertEqual(roles, ["system", "system", "user"])
+            self.assertIsInstance(messages[0]["content"], list)
+            self.assertIn("app: Editor", messages[1]["content"])
+            self.assertEqual(GPTState.request_prompt_prefix["messages"], 1)
+
+        def test_prefix_hash_ignores_volatile_context(self):
+            settings.set("user.model_prompt_cache_layout", 1)
+            self._prepared_messages("first")
+            first_hash = GPTState.request_prompt_prefix["hash"]
+            self._active_context = "app: Browser"
+            self._prepared_messages("second")
+            self.assertEqual(GPTState.request_prompt_prefix["hash"], first_hash)
+
+            GPTState.system_prompt = GPTSystemPrompt(voice="v", audience="b")
+            self._prepared_messages("first")
+            self.assertNotEqual(GPTState.request_prompt_prefix["hash"], first_hash)
+
+        def test_disabling_layout_after_build_keeps_volatile_context(self):
+            settings.set("user.model_prompt_cache_layout", 1)
+            session = PromptSession(destination="paste")
+            session.prepare_prompt("run", _StaticSource("input"))
+            settings.set("user.model_prompt_cache_layout", 0)
+            apply_prompt_cache_layout()
+            messages = GPTState.request["messages"]
+            self.assertIn("app: Editor", messages[0]["content"])
+            self.assertEqual(GPTState.request_volatile_context, [])
+            self.assertEqual(GPTState.request_prompt_prefix, {})
+
+        def test_detach_snapshot_keeps_held_back_context(self):
+            settings.set("user.model_prompt_cache_layout", 1)
+            session = PromptSession(destination="paste")
+            session.prepare_prompt("run", _StaticSource("input"))
+            session.detach()
+            PromptSession(destination="paste").prepare_prompt(
+                "other", _StaticSource("other")
+            )
+            with patch.object(
+                prompt_session_module, "send_request_detached"
+            ) as send:
+                session.execute_detached(timeout_seconds=5)
+            sent = send.call_args.args[0]
+            self.assertIn("app: Editor", sent["messages"][-2]["content"])
+            self.assertEqual(send.call_args.kwargs, {"timeout_seconds": 5})
+
+        def test_layout_applies_once_per_build(self):
+            settings.set("user.model_prompt_cache_layout", 1)
+            messages = self._prepared_messages("run")
+            apply_prompt_cache_layout()
+            self.assertEqual(GPTState.request["messages"], messages)
+
 else:
     if not TYPE_CHECKING:
 
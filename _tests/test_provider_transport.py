@@ -0,0 +1,209 @@
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:  # Talon runtime
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers, providerTransport
+    from talon_user.lib.providerTransport import ProviderTransport, transport_key
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.posts: list[tuple[str, dict]] = []
+            self.heads: list[tuple[str, dict]] = []
+            self.closed = False
+
+        def post(self, url, **kwargs):
+            self.posts.append((url, kwargs))
+            return {"url": url}
+
+        def head(self, url, **kwargs):
+            self.heads.append((url, kwargs))
+            return Mock()
+
+        def close(self) -> None:
+            self.closed = True
+
+    class _Clock:
+        def __init__(self) -> None:
+            self.now = 100.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    class ProviderTransportTests(unittest.TestCase):
+        def setUp(self) -> None:
+            self.sessions: list[_FakeSession] = []
+            self.clock = _Clock()
+
+        def _factory(self) -> _FakeSession:
+            session = _FakeSession()
+            self.sessions.append(session)
+            return session
+
+        def _transport(self, idle: float = 30.0) -> ProviderTransport:
+            return ProviderTransport(
+                idle_timeout_seconds=idle,
+                session_factory=self._factory,
+                clock=self.clock,
+            )
+
+        def test_transport_key_uses_endpoint_origin(self) -> None:
+            self.assertEqual(
+                transport_key("openai", "https://API.openai.com/v1/chat/completions"),
+                ("openai", "https://api.openai.com"),
+            )
+
+        def test_back_to_back_posts_reuse_session(self) -> None:
+            transport = self._transport()
+            url = "https://api.openai.com/v1/chat/completions"
+            transport.post("openai", url, json={"a": 1}, timeout=5)
+            transport.post("openai", url, json={"a": 2}, timeout=5)
+
+            self.assertEqual(len(self.sessions), 1)
+            self.assertEqual(len(self.sessions[0].posts), 2)
+            stats = transport.stats()
+            self.assertEqual(stats["sessions_created"], 1)
+            self.assertEqual(stats["sessions_reused"], 1)
+            self.assertEqual(stats["requests_sent"], 2)
+            self.assertEqual(stats["active_sessions"], 1)
+            self.assertEqual(stats["pools"][0]["requests_served"], 2)
+
+        def test_providers_get_separate_sessions(self) -> None:
+            transport = self._transport()
+            transport.post("openai", "https://api.openai.com/v1/chat/completions")
+            transport.post(
+                "gemini",
+                "https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
+            )
+            self.assertEqual(len(self.sessions), 2)
+
+        def test_idle_sessions_are_reaped(self) -> None:
+            transport = self._transport(idle=30.0)
+            url = "https://api.openai.com/v1/chat/completions"
+            transport.post("openai", url)
+            self.clock.now += 31
+            self.assertEqual(transport.reap_idle(), 1)
+            self.assertTrue(self.sessions[0].closed)
+
+            transport.post("openai", url)
+            self.assertEqual(len(self.sessions), 2)
+            self.assertEqual(transport.stats()["sessions_reaped"], 1)
+
+        def test_streaming_sessions_are_not_reaped_until_released(self) -> None:
+            transport = self._transport(idle=30.0)
+            url = "https://api.openai.com/v1/chat/completions"
+            transport.post("openai", url, stream=True)
+            self.clock.now += 120
+            self.assertEqual(transport.reap_idle(), 0)
+
+            transport.release("openai", url)
+            self.clock.now += 31
+            self.assertEqual(transport.reap_idle(), 1)
+
+        def test_failed_post_counts_error_and_releases(self) -> None:
+            class _FailingSession(_FakeSession):
+                def post(self, url, **kwargs):
+                    raise RuntimeError("boom")
+
+            transport = ProviderTransport(
+                idle_timeout_seconds=30.0,
+                session_factory=_FailingSession,
+                clock=self.clock,
+            )
+            with self.assertRaises(RuntimeError):
+                transport.post("openai", "https://api.openai.com/v1", stream=True)
+            stats = transport.stats()
+            self.assertEqual(stats["request_errors"], 1)
+            self.assertEqual(stats["pools"][0]["in_flight"], 0)
+
+        def test_zero_idle_timeout_bypasses_pool(self) -> None:
+            transport = self._transport(idle=0)
+            with patch.object(
+                providerTransport.requests, "post", return_value="direct"
+            ) as direct_post:
+                result = transport.post("openai", "https://api.openai.com/v1")
+            self.assertEqual(result, "direct")
+            direct_post.assert_called_once()
+            self.assertEqual(self.sessions, [])
+            self.assertEqual(transport.stats()["requests_unpooled"], 1)
+
+        def test_close_all_closes_sessions(self) -> None:
+            transport = self._transport()
+            transport.post("openai", "https://api.openai.com/v1")
+            transport.close_all()
+            self.assertTrue(self.sessions[0].closed)
+            stats = transport.stats()
+            self.assertEqual(stats["active_sessions"], 0)
+            self.assertEqual(stats["sessions_closed"], 1)
+
+        def test_warm_opens_pooled_connection_for_later_post(self) -> None:
+            transport = self._transport()
+            url = "https://api.openai.com/v1/chat/completions"
+            self.assertTrue(transport.warm("openai", url))
+            transport.post("openai", url)
+
+            self.assertEqual(len(self.sessions), 1)
+            self.assertEqual(len(self.sessions[0].heads), 1)
+            stats = transport.stats()
+            self.assertEqual(stats["warmups"], 1)
+            self.assertEqual(stats["sessions_reused"], 1)
+            self.assertEqual(stats["pools"][0]["in_flight"], 0)
+
+        def test_warm_skips_recently_used_connection(self) -> None:
+            transport = self._transport()
+            url = "https://api.openai.com/v1/chat/completions"
+            transport.post("openai", url)
+            self.assertFalse(transport.warm("openai", url))
+            self.assertEqual(transport.stats()["warmups_skipped"], 1)
+
+            self.clock.now += providerTransport.WARM_FRESH_SECONDS + 1
+            self.assertTrue(transport.warm("openai", url))
+
+        def test_prewarm_runs_in_background_thread(self) -> None:
+            transport = self._transport()
+            thread = transport.prewarm("openai", "https://api.openai.com/v1")
+            self.assertIsNotNone(thread)
+            thread.join(timeout=2)
+            self.assertEqual(transport.stats()["warmups"], 1)
+
+        def test_prewarm_provider_connection_is_opt_in(self) -> None:
+            transport = self._transport()
+
+            def fake_get(key, default=None):
+                if key == "user.model_http_prewarm":
+                    return settings_value["prewarm"]
+                if key == "user.model_endpoint":
+                    return "https://api.openai.com/v1/chat/completions"
+                return default
+
+            settings_value = {"prewarm": 0}
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=fake_get),
+                patch.object(
+                    modelHelpers, "provider_transport", return_value=transport
+                ),
+                patch.object(transport, "prewarm", return_value=Mock()) as prewarm,
+            ):
+                self.assertFalse(modelHelpers.prewarm_provider_connection())
+                prewarm.assert_not_called()
+
+                settings_value["prewarm"] = 1
+                self.assertTrue(modelHelpers.prewarm_provider_connection())
+                prewarm.assert_called_once_with(
+                    "openai", "https://api.openai.com/v1/chat/completions"
+                )
+
+else:
+    if not TYPE_CHECKING:
+
+        class ProviderTransportTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -1,4 +1,5 @@
 import json
+import time
 import unittest
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
@@ -96,6 +97,71 @@ if bootstrap is not None:
                 None,
             )
 
+        def _fan_out_pipeline(self, directive, delays):
+            controller_result = PromptResult.from_messages(
+                [format_message(json.dumps(directive))]
+            )
+            self.pipeline.run.side_effect = [
+                controller_result,
+                PromptResult.from_messages([format_message("merged answer")]),
+            ]
+            self.pipeline.prepare_detached.side_effect = (
+                lambda prompt, source, destination, additional: prompt
+            )
+
+            self.delegate_timeouts = {}
+
+            def complete(prompt, timeout_seconds=None):
+                self.delegate_timeouts[prompt] = timeout_seconds
+                time.sleep(delays.get(prompt, 0.0))
+                if prompt == "broken":
+                    raise RuntimeError("boom")
+                return PromptResult.from_messages([format_message(f"{prompt} answer")])
+
+            self.pipeline.complete_detached.side_effect = complete
+
+        def test_fan_out_runs_delegates_concurrently_in_order(self):
+            directive = {"action": "delegate", "delegates": ["a", "b", "c"]}
+            self._fan_out_pipeline(directive, {"a": 0.3, "b": 0.2, "c": 0.1})
+
+            started = time.monotonic()
+            result = self.orchestrator.run("controller", self.source, destination="paste")
+            elapsed = time.monotonic() - started
+
+            self.assertLess(elapsed, 0.55)
+            self.assertEqual(self.pipeline.run.call_count, 1)
+            text = result.text
+            self.assertLess(text.index("a answer"), text.index("b answer"))
+            self.assertLess(text.index("b answer"), text.index("c answer"))
+            self.assertIn("## Delegate 2: b", text)
+
+        def test_fan_out_merges_and_reports_timeouts_and_failures(self):
+            directive = {
+                "action": "delegate",
+                "delegates": [
+                    {"prompt": "fast"},
+                    {"prompt": "slow", "timeout_seconds": 0.05},
+                    "broken",
+                ],
+                "merge": {"prompt": "Combine these", "response_destination": "window"},
+            }
+            self._fan_out_pipeline(directive, {"slow": 0.5})
+
+            result = self.orchestrator.run("controller", self.source, destination="paste")
+
+            self.assertEqual(result.text, "merged answer")
+            merge_prompt, _source, merge_destination, _extra = (
+                self.pipeline.run.call_args.args
+            )
+            self.assertEqual(merge_destination, "window")
+            self.assertTrue(merge_prompt.startswith("Combine these"))
+            self.assertIn("fast answer", merge_prompt)
+            self.assertIn("(delegate 2 timed out after 0.05s)", merge_prompt)
+            self.assertIn("(delegate 3 failed: boom)", merge_prompt)
+            # The delegate timeout also bounds the HTTP call itself.
+            self.assertEqual(self.delegate_timeouts["slow"], 0.05)
+            self.assertIsNone(self.delegate_timeouts["fast"])
+
 else:
     if not TYPE_CHECKING:
         class RecursiveOrchestratorTests(unittest.TestCase):
@@ -45,6 +45,14 @@ if bootstrap is not None:
             ids = [entry.request_id for entry in hist.all()]
             self.assertEqual(ids, ["r1", "r2", "r3"])
 
+        def test_recent_returns_newest_first_pages(self):
+            hist = RequestHistory(max_entries=5)
+            for index in range(4):
+                hist.append(RequestLogEntry(f"r{index}", "p", "resp"))
+            self.assertEqual([e.request_id for e in hist.recent(2)], ["r3", "r2"])
+            self.assertEqual([e.request_id for e in hist.recent(5, 2)], ["r1", "r0"])
+            self.assertEqual(hist.recent(0), [])
+
         def test_append_entry_from_request_captures_provider(self):
             history_lifecycle.clear_history()
             request = {
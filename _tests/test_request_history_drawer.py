@@ -35,6 +35,7 @@ if bootstrap is not None:
             clear_history()
             HistoryDrawerState.showing = False
             HistoryDrawerState.entries = []
+            HistoryDrawerState.search_query = ""
 
         def test_open_close_drawer(self):
             DrawerActions.request_history_drawer_open()
@@ -83,6 +84,34 @@ if bootstrap is not None:
             DrawerActions.request_history_drawer_prev_entry()
             self.assertEqual(HistoryDrawerState.selected_index, 0)
 
+        def test_search_mode_filters_and_opens_matching_offset(self):
+            from talon import actions
+
+            append_entry("rid-1", "alpha notes", "r", "m", axes={"directional": ["fog"]})
+            append_entry("rid-2", "beta notes", "r", "m", axes={"directional": ["fog"]})
+            append_entry("rid-3", "gamma", "r", "m", axes={"directional": ["fog"]})
+            with patch.object(
+                actions.user,
+                "request_history_drawer_open",
+                create=True,
+                side_effect=DrawerActions.request_history_drawer_open,
+            ):
+                DrawerActions.request_history_drawer_search("alpha")
+            self.assertEqual(HistoryDrawerState.search_total, 1)
+            self.assertEqual(len(HistoryDrawerState.entries), 1)
+            self.assertTrue(HistoryDrawerState.entries[0][0].startswith("rid-1"))
+            with patch.object(
+                actions.user, "gpt_request_history_show_previous", create=True
+            ) as show_previous:
+                DrawerActions.request_history_drawer_open_selected()
+            show_previous.assert_called_once_with(2)
+
+            DrawerActions.request_history_drawer_clear_search()
+            self.assertEqual(len(HistoryDrawerState.entries), 3)
+            self.assertIsNone(HistoryDrawerState.entry_offsets)
+            DrawerActions.request_history_drawer_close()
+            self.assertEqual(HistoryDrawerState.search_query, "")
+
         def test_history_drawer_entries_from_matches_label_and_body(self):
             class DummyEntry:
                 def __init__(self):
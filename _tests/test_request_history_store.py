@@ -0,0 +1,303 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon import settings
+    from talon_user.lib import requestLog
+    from talon_user.lib import requestHistoryStore
+    from talon_user.lib.requestHistory import LazyRequestLogEntry, RequestLogEntry
+    from talon_user.lib.requestHistoryStore import (
+        SQLiteRequestHistory,
+        compress_body,
+        decompress_body,
+        train_body_dictionary,
+    )
+
+    def _entry(index: int, **overrides) -> RequestLogEntry:
+        payload = dict(
+            request_id=f"r{index}",
+            prompt=f"prompt {index}",
+            response=f"response {index}",
+            meta=f"meta {index}",
+            recipe="describe · full · fog",
+            started_at_ms=1000 + index,
+            duration_ms=index,
+            axes={"method": ["flow"], "directional": ["fog"]},
+            provider_id="openai",
+            persona={"voice": "as teacher"},
+        )
+        payload.update(overrides)
+        return RequestLogEntry(**payload)
+
+    class SQLiteRequestHistoryTests(unittest.TestCase):
+        def setUp(self) -> None:
+            self._tmp = tempfile.TemporaryDirectory()
+            self.path = os.path.join(self._tmp.name, "history.sqlite3")
+
+        def tearDown(self) -> None:
+            self._tmp.cleanup()
+
+        def _store(self, max_entries: int = 100) -> SQLiteRequestHistory:
+            store = SQLiteRequestHistory(self.path, max_entries=max_entries)
+            self.addCleanup(store.close)
+            return store
+
+        def test_round_trips_entries(self) -> None:
+            store = self._store()
+            self.assertIsNone(store.latest())
+            store.append(_entry(1))
+            store.append(_entry(2, provider_id="gemini"))
+            self.assertEqual(len(store), 2)
+            self.assertEqual(store.latest(), _entry(2, provider_id="gemini"))
+            self.assertEqual(store.nth_from_latest(1), _entry(1))
+            self.assertIsNone(store.nth_from_latest(2))
+            self.assertIsNone(store.nth_from_latest(-1))
+            self.assertEqual([e.request_id for e in store.all()], ["r1", "r2"])
+
+        def test_survives_reopen(self) -> None:
+            store = self._store()
+            for index in range(3):
+                store.append(_entry(index))
+            store.close()
+
+            reopened = self._store()
+            self.assertEqual(len(reopened), 3)
+            self.assertEqual(reopened.latest(), _entry(2))
+            reopened.append(_entry(3))
+            self.assertEqual(reopened.nth_from_latest(0).request_id, "r3")  # type: ignore[union-attr]
+
+        def test_retention_trims_oldest(self) -> None:
+            store = self._store(max_entries=3)
+            for index in range(5):
+                store.append(_entry(index))
+            self.assertEqual(len(store), 3)
+            self.assertEqual([e.request_id for e in store.all()], ["r2", "r3", "r4"])
+            self.assertIsNone(store.nth_from_latest(3))
+            self.assertEqual(store.entries_with_axis_token("method", "flow")[-1].request_id, "r2")
+
+        def test_recent_pages_newest_first(self) -> None:
+            store = self._store()
+            for index in range(6):
+                store.append(_entry(index))
+            self.assertEqual([e.request_id for e in store.recent(2)], ["r5", "r4"])
+            self.assertEqual([e.request_id for e in store.recent(3, 4)], ["r1", "r0"])
+            self.assertEqual(store.recent(3, 10), [])
+
+        def test_indexed_lookups(self) -> None:
+            store = self._store()
+            store.append(_entry(1, axes={"scope": ["act"], "directional": ["fog"]}))
+            store.append(_entry(2, provider_id="gemini"))
+            store.append(_entry(3))
+            self.assertEqual(store.find("r2").provider_id, "gemini")  # type: ignore[union-attr]
+            self.assertIsNone(store.find("missing"))
+            self.assertEqual(
+                [e.request_id for e in store.entries_for_provider("openai")], ["r3", "r1"]
+            )
+            self.assertEqual(
+                [e.request_id for e in store.entries_between(1002, 1003)], ["r3", "r2"]
+            )
+            self.assertEqual(
+                [e.request_id for e in store.entries_with_axis_token("scope", "act")],
+                ["r1"],
+            )
+
+        def test_search_ranks_filters_and_pages_in_sqlite(self) -> None:
+            store = self._store()
+            store.append(_entry(1, prompt="retry budget for the gateway"))
+            store.append(_entry(2, prompt="retry retry retry", provider_id="gemini"))
+            store.append(_entry(3, prompt="unrelated", recipe="todo · gist · fog"))
+            store.append(_entry(4, prompt="budget review", axes={"scope": ["system"]}))
+
+            page = store.search("retry")
+            self.assertEqual([h.entry.request_id for h in page.hits], ["r2", "r1"])
+            self.assertEqual([h.offset for h in page.hits], [2, 3])
+            self.assertEqual(
+                [h.entry.request_id for h in store.search("budget scope:system").hits],
+                ["r4"],
+            )
+            self.assertEqual(store.search("static:todo").hits[0].entry.request_id, "r3")
+            page = store.search("provider:openai", limit=2)
+            self.assertEqual(page.total, 3)
+            self.assertEqual([h.entry.request_id for h in page.hits], ["r4", "r3"])
+            self.assertEqual(dict(page.facet_counts["static"]), {"describe": 2, "todo": 1})
+            self.assertEqual(store.search("fog since:2025-01-01").total, 0)
+
+        def test_search_follows_retention_and_reopen_without_decoding(self) -> None:
+            store = self._store(max_entries=3)
+            store.append(_entry(1, prompt="needle"))
+            for index in range(2, 6):
+                store.append(_entry(index, prompt="filler"))
+            self.assertEqual(store.search("needle").total, 0)
+            self.assertEqual(store.search("filler").total, 3)
+            store.close()
+
+            reopened = self._store(max_entries=3)
+            page = reopened.search("filler", limit=1)
+            self.assertEqual(page.total, 3)
+            self.assertEqual(page.hits[0].entry.request_id, "r5")
+            self.assertNotIn("prompt", page.hits[0].entry.__dict__)
+
+        def test_search_backfills_files_written_before_the_index(self) -> None:
+            import sqlite3
+
+            store = self._store()
+            store.append(_entry(1, prompt="legacy needle"))
+            store.close()
+            conn = sqlite3.connect(self.path)
+            conn.execute("DROP TABLE entries_fts")
+            conn.execute("DELETE FROM entry_axes WHERE axis = 'provider'")
+            conn.execute("PRAGMA user_version = 0")
+            conn.commit()
+            conn.close()
+
+            reopened = self._store()
+            self.assertEqual(reopened.search("needle provider:openai").total, 1)
+
+        def test_replace_and_clear(self) -> None:
+            store = self._store()
+            for index in range(3):
+                store.append(_entry(index))
+            store.replace([_entry(9)])
+            self.assertEqual([e.request_id for e in store.all()], ["r9"])
+            store.clear()
+            self.assertEqual(len(store), 0)
+            store.append(_entry(4))
+            self.assertEqual(store.latest().request_id, "r4")  # type: ignore[union-attr]
+
+        def test_large_bodies_are_compressed_and_decoded_lazily(self) -> None:
+            store = self._store()
+            big = "## Context\n" + "the same scaffolding line\n" * 200
+            store.append(_entry(1, prompt="short prompt line\n" + big, response=big))
+            store.close()
+
+            reopened = self._store()
+            stats = reopened.storage_stats()
+            self.assertEqual(stats["compressed_bodies"], 2)
+            self.assertLess(stats["body_bytes"], len(big))
+            entry = reopened.latest()
+            self.assertIsInstance(entry, LazyRequestLogEntry)
+            self.assertEqual(entry.prompt_preview, "short prompt line")  # type: ignore[union-attr]
+            self.assertNotIn("response", entry.__dict__)  # type: ignore[union-attr]
+            self.assertEqual(entry.response, big)  # type: ignore[union-attr]
+            self.assertEqual(
+                entry, _entry(1, prompt="short prompt line\n" + big, response=big)
+            )
+
+        def test_dictionary_trained_after_enough_entries(self) -> None:
+            store = self._store()
+            shared = "".join(f"shared system line {i:03d}\n" for i in range(40))
+            for index in range(requestHistoryStore.DICTIONARY_TRAIN_ENTRIES + 2):
+                store.append(
+                    _entry(index, prompt=f"{shared}unique {index}", response=shared)
+                )
+            self.assertNotEqual(store.storage_stats()["dictionary_id"], 0)
+            store.close()
+            reopened = self._store()
+            last = requestHistoryStore.DICTIONARY_TRAIN_ENTRIES + 1
+            self.assertEqual(reopened.latest().prompt, f"{shared}unique {last}")  # type: ignore[union-attr]
+            self.assertEqual(reopened.nth_from_latest(last).response, shared)  # type: ignore[union-attr]
+
+        def test_failed_dictionary_training_is_not_retried_every_append(self) -> None:
+            store = self._store()
+            limit = requestHistoryStore.DICTIONARY_TRAIN_ENTRIES
+            with unittest.mock.patch.object(
+                requestHistoryStore, "train_body_dictionary", return_value=b""
+            ) as train:
+                for index in range(limit + 5):
+                    store.append(_entry(index))
+                self.assertEqual(train.call_count, 1)
+                for index in range(limit):
+                    store.append(_entry(limit + 5 + index))
+                self.assertEqual(train.call_count, 2)
+            self.assertEqual(store.storage_stats()["dictionary_id"], 0)
+
+        def test_body_codec_round_trip(self) -> None:
+            self.assertEqual(compress_body("tiny"), "tiny")
+            text = "lorem ipsum dolor sit amet " * 40
+            zdict = train_body_dictionary([text, text])
+            self.assertTrue(zdict)
+            for dictionary in (None, zdict):
+                blob = compress_body(text, dictionary)
+                self.assertIsInstance(blob, bytes)
+                self.assertEqual(decompress_body(blob, dictionary), text)
+
+        def test_opens_stores_without_compression_columns(self) -> None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path)
+            conn.execute(
+                "CREATE TABLE entries (seq INTEGER PRIMARY KEY, request_id TEXT NOT NULL, "
+                "started_at_ms INTEGER, duration_ms INTEGER, provider_id TEXT NOT NULL "
+                "DEFAULT '', recipe TEXT NOT NULL DEFAULT '', prompt TEXT NOT NULL "
+                "DEFAULT '', response TEXT NOT NULL DEFAULT '', meta TEXT NOT NULL "
+                "DEFAULT '', axes TEXT NOT NULL DEFAULT '{}', persona TEXT NOT NULL "
+                "DEFAULT '{}')"
+            )
+            conn.execute(
+                "INSERT INTO entries (seq, request_id, prompt, response) "
+                "VALUES (1, 'legacy', 'old prompt', 'old response')"
+            )
+            conn.commit()
+            conn.close()
+
+            store = self._store()
+            legacy = store.latest()
+            self.assertEqual(legacy.prompt_preview, "old prompt")  # type: ignore[union-attr]
+            self.assertEqual(legacy.response, "old response")  # type: ignore[union-attr]
+            store.append(_entry(2))
+            self.assertEqual(len(store), 2)
+
+    class RequestLogPersistenceTests(unittest.TestCase):
+        def setUp(self) -> None:
+            self._tmp = tempfile.TemporaryDirectory()
+            self._original_dir = settings.get("user.model_source_save_directory")
+            requestLog.clear_history()
+
+        def tearDown(self) -> None:
+            settings.set("user.model_request_history_persist", 0)
+            settings.set("user.model_source_save_directory", self._original_dir)
+            requestLog.clear_history()
+            self._tmp.cleanup()
+
+        def test_setting_switches_to_persistent_store(self) -> None:
+            requestLog.append_entry(
+                "mem-1", "p", "r", axes={"directional": ["fog"]}
+            )
+            settings.set("user.model_source_save_directory", self._tmp.name)
+            settings.set("user.model_request_history_persist", 1)
+
+            self.assertEqual(requestLog.latest().request_id, "mem-1")  # type: ignore[union-attr]
+            self.assertIsInstance(requestLog._history, SQLiteRequestHistory)
+            requestLog.append_entry(
+                "disk-1", "p", "r", axes={"directional": ["fog"]}
+            )
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(self._tmp.name, requestLog.HISTORY_STORE_FILENAME)
+                )
+            )
+            self.assertEqual(
+                [e.request_id for e in requestLog.recent_entries(5)],
+                ["disk-1", "mem-1"],
+            )
+
+            settings.set("user.model_request_history_persist", 0)
+            self.assertIsNone(requestLog.latest())
+
+else:
+    if not TYPE_CHECKING:
+
+        class SQLiteRequestHistoryTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -357,6 +357,54 @@ if bootstrap is not None:
                 self.assertIsInstance(GPTState.last_lifecycle, RequestLifecycleState)
                 self.assertEqual(GPTState.last_lifecycle.status, "errored")
 
+        def test_detached_send_leaves_gpt_state_and_closes_on_cancel(self) -> None:
+            sentinel_request = {"messages": []}
+            sentinel_response = {"choices": []}
+            GPTState.last_raw_request = sentinel_request
+            GPTState.last_raw_response = sentinel_response
+            posted = {}
+
+            class FakeResponse:
+                status_code = 200
+                closed = False
+
+                def json(self):
+                    # A cancel arriving while the body is read closes it.
+                    modelHelpers.cancel_active_request()
+                    return {
+                        "choices": [{"message": {"content": "delegate answer"}}]
+                    }
+
+                def close(self):
+                    self.closed = True
+
+            response = FakeResponse()
+
+            def fake_post(*_args, **kwargs):
+                posted.update(kwargs)
+                return response
+
+            def fake_get(key, default=None):
+                if key == "user.model_endpoint":
+                    return "http://example.com"
+                return default
+
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=fake_get),
+                patch.object(modelHelpers.requests, "post", side_effect=fake_post),
+                patch.object(modelHelpers, "notify"),
+            ):
+                result = modelHelpers.send_request_detached(
+                    {"messages": [], "tools": []}, timeout_seconds=7
+                )
+
+            self.assertEqual(result["text"], "delegate answer")
+            self.assertEqual(posted["timeout"], 7)
+            self.assertTrue(response.closed)
+            self.assertEqual(modelHelpers._detached_responses, set())
+            self.assertIs(GPTState.last_raw_request, sentinel_request)
+            self.assertIs(GPTState.last_raw_response, sentinel_response)
+
         def test_non_stream_run_clears_previous_snapshot(self) -> None:
             """Non-stream runs should clear any stale streaming snapshot."""
 
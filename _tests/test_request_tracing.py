@@ -0,0 +1,183 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon import settings
+    from talon_user.lib import modelHelpers, requestTracing
+    from talon_user.lib.modelState import GPTState
+    from talon_user.lib.requestTracing import (
+        RequestTracer,
+        export_chrome_trace,
+        request_trace,
+        start_span,
+        trace_event,
+        trace_span,
+    )
+    from talon_user.lib.telemetryExport import snapshot_telemetry
+    from scripts.tools.mock_openai_sse import (
+        MockResponseConfig,
+        MockSSEServer,
+        http_post,
+    )
+
+    class RequestTracerTests(unittest.TestCase):
+        def test_pending_spans_bind_to_request(self) -> None:
+            tracer = RequestTracer()
+            tracer.start("prompt_resolution", None, {})
+            tracer.event("first_token", "r1", {"chars": 3})
+            self.assertEqual(tracer.bind_pending("r1"), 1)
+            names = [span["name"] for span in tracer.trace("r1")]
+            self.assertEqual(names, ["prompt_resolution", "first_token"])
+            self.assertEqual(tracer.stats()["pending"], 0)
+
+        def test_bounds_drop_spans_and_evict_old_requests(self) -> None:
+            tracer = RequestTracer(max_requests=2, max_spans=2)
+            for request_id in ("a", "b", "c"):
+                for _ in range(3):
+                    tracer.event("tick", request_id, {})
+            stats = tracer.stats()
+            self.assertEqual(stats["requests"], 2)
+            self.assertEqual(stats["evicted_requests"], 1)
+            self.assertEqual(stats["dropped_spans"], 3)
+            self.assertEqual(tracer.trace("a"), [])
+
+        def test_discard_pending_drops_unbound_spans(self) -> None:
+            tracer = RequestTracer()
+            tracer.start("build_request", None, {})
+            self.assertEqual(tracer.discard_pending(), 1)
+            self.assertEqual(tracer.bind_pending("r1"), 0)
+            self.assertEqual(tracer.stats()["dropped_spans"], 1)
+
+    class RequestTracingSettingTests(unittest.TestCase):
+        def setUp(self) -> None:
+            requestTracing.reset_request_traces()
+            self.addCleanup(requestTracing.reset_request_traces)
+            self.addCleanup(settings.set, "user.model_request_tracing", 0)
+
+        def test_disabled_tracing_records_nothing(self) -> None:
+            settings.set("user.model_request_tracing", 0)
+            self.assertIsNone(start_span("connect", "r1"))
+            with trace_span("connect", "r1") as span:
+                self.assertIsNone(span)
+            trace_event("first_byte", "r1")
+            self.assertEqual(requestTracing.request_tracing_stats()["spans"], 0)
+
+        def test_setting_listener_keeps_flag_current(self) -> None:
+            settings.set("user.model_request_tracing", 1)
+            with patch.object(settings, "get", side_effect=AssertionError) as get:
+                self.assertTrue(requestTracing.tracing_enabled())
+                settings.set("user.model_request_tracing", 0)
+                self.assertFalse(requestTracing.tracing_enabled())
+            get.assert_not_called()
+
+        def test_prompt_preparation_discards_stale_pending_spans(self) -> None:
+            from talon import actions
+            from talon_user.lib.modelSource import ModelSource
+            from talon_user.lib.modelTypes import GPTSystemPrompt
+            from talon_user.lib.promptSession import PromptSession
+
+            class _Source(ModelSource):
+                def get_text(self):  # type: ignore[override]
+                    return "input"
+
+            settings.set("user.model_request_tracing", 1)
+            GPTState.reset_all()
+            GPTState.system_prompt = GPTSystemPrompt(voice="v", audience="a")
+            actions.user.gpt_tools = lambda: "[]"  # type: ignore[attr-defined]
+            actions.user.gpt_additional_user_context = lambda: []  # type: ignore[attr-defined]
+            start_span("build_request", stale=True)
+
+            PromptSession(destination="paste").prepare_prompt("run", _Source())
+            requestTracing.bind_pending_spans("r-fresh")
+
+            spans = request_trace("r-fresh")
+            self.assertIn("prompt_resolution", [span["name"] for span in spans])
+            self.assertFalse(any(span["attrs"].get("stale") for span in spans))
+
+        def test_span_records_duration_and_errors(self) -> None:
+            settings.set("user.model_request_tracing", 1)
+            with self.assertRaises(ValueError):
+                with trace_span("connect", "r1", stream=True):
+                    raise ValueError("boom")
+            trace_event("first_byte", "r1")
+            spans = request_trace("r1")
+            self.assertEqual(spans[0]["attrs"], {"stream": True, "error": "ValueError"})
+            self.assertGreaterEqual(spans[0]["duration_ms"], 0.0)
+            self.assertTrue(spans[1]["instant"])
+
+            chrome = export_chrome_trace()["traceEvents"]
+            phases = [(e["name"], e["ph"]) for e in chrome]
+            self.assertEqual(
+                phases, [("thread_name", "M"), ("connect", "X"), ("first_byte", "i")]
+            )
+            self.assertEqual(chrome[1]["args"]["request_id"], "r1")
+
+        def test_streaming_request_records_lifecycle_spans(self) -> None:
+            settings.set("user.model_request_tracing", 1)
+            os.environ["OPENAI_API_KEY"] = "test-key"
+            GPTState.request = {
+                "model": "gpt-test",
+                "messages": [{"role": "user", "content": [{"type": "text", "text": "hi"}]}],
+            }
+            GPTState.text_to_confirm = ""
+            with trace_span("prompt_resolution"):
+                pass
+            with MockSSEServer(MockResponseConfig(total_chars=200, chunk_chars=50)) as server:
+                self.addCleanup(
+                    settings.set,
+                    "user.model_endpoint",
+                    settings.get("user.model_endpoint"),
+                )
+                settings.set("user.model_endpoint", server.url)
+                with (
+                    patch.object(modelHelpers.requests, "post", side_effect=http_post),
+                    patch.object(
+                        modelHelpers, "_should_show_response_canvas", return_value=False
+                    ),
+                ):
+                    modelHelpers.send_request(max_attempts=1)
+
+            names = [span["name"] for span in request_trace(GPTState.last_request_id)]
+            self.assertEqual(names[0], "prompt_resolution")
+            for expected in (
+                "connect",
+                "first_byte",
+                "first_token",
+                "stream_complete",
+                "history_append",
+            ):
+                self.assertIn(expected, names)
+            self.assertLess(names.index("connect"), names.index("first_byte"))
+            self.assertLess(names.index("first_byte"), names.index("first_token"))
+
+        def test_telemetry_export_writes_trace_files(self) -> None:
+            settings.set("user.model_request_tracing", 1)
+            trace_event("first_token", "r-export")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output = snapshot_telemetry(output_dir=tmpdir)
+                traces = json.loads(Path(output["traces"]).read_text())
+                chrome = json.loads(Path(output["chrome_trace"]).read_text())
+                telemetry = json.loads(Path(output["telemetry"]).read_text())
+            self.assertEqual(traces["traces"]["r-export"][0]["name"], "first_token")
+            self.assertIn("traceEvents", chrome)
+            self.assertEqual(telemetry["request_tracing"]["spans"], 1)
+
+else:
+    if not TYPE_CHECKING:
+
+        class RequestTracerTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
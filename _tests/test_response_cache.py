@@ -0,0 +1,167 @@
+import json
+import os
+import unittest
+from typing import TYPE_CHECKING
+from types import SimpleNamespace
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers, responseCache
+    from talon_user.lib.modelState import GPTState
+    from talon_user.lib.responseCache import ResponseCache, response_cache_key
+
+    REQUEST = {
+        "model": "gpt-test",
+        "messages": [{"role": "user", "content": [{"type": "text", "text": "hi"}]}],
+        "reasoning_effort": "low",
+    }
+
+    class ResponseCacheTests(unittest.TestCase):
+        def test_key_is_canonical_and_ignores_transport_fields(self) -> None:
+            reordered = {
+                "reasoning_effort": "low",
+                "messages": REQUEST["messages"],
+                "model": "gpt-test",
+                "stream": True,
+            }
+            self.assertEqual(
+                response_cache_key("openai", REQUEST),
+                response_cache_key("openai", reordered),
+            )
+            self.assertNotEqual(
+                response_cache_key("openai", REQUEST),
+                response_cache_key("gemini", REQUEST),
+            )
+            self.assertNotEqual(
+                response_cache_key("openai", REQUEST),
+                response_cache_key("openai", {**REQUEST, "verbosity": "high"}),
+            )
+
+        def test_ttl_and_lru_eviction(self) -> None:
+            now = [0.0]
+            cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+            cache.put("a", ("A",))
+            cache.put("b", ("B",))
+            self.assertEqual(cache.get("a"), ("A",))
+            cache.put("c", ("C",))
+            self.assertIsNone(cache.get("b"))
+            now[0] = 11.0
+            self.assertIsNone(cache.get("a"))
+            stats = cache.stats()
+            self.assertEqual(stats["evictions"], 1)
+            self.assertEqual(stats["expirations"], 1)
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(stats["entries"], 1)
+
+        def test_empty_responses_are_not_stored(self) -> None:
+            cache = ResponseCache()
+            cache.put("a", ("",))
+            self.assertEqual(cache.stats()["entries"], 0)
+
+        def test_settings_gate_providers(self) -> None:
+            values = {
+                "user.model_response_cache": 1,
+                "user.model_response_cache_providers": "openai",
+            }
+
+            def fake_get(key, default=None):
+                return values.get(key, default)
+
+            openai = SimpleNamespace(id="openai", features={})
+            gemini = SimpleNamespace(id="gemini", features={})
+            opted_out = SimpleNamespace(id="openai", features={"response_cache": False})
+            with patch.object(modelHelpers.settings, "get", side_effect=fake_get):
+                self.assertIsNotNone(responseCache.response_cache_key_for(openai, REQUEST))
+                self.assertIsNone(responseCache.response_cache_key_for(gemini, REQUEST))
+                self.assertIsNone(responseCache.response_cache_key_for(opted_out, REQUEST))
+                values["user.model_response_cache"] = 0
+                self.assertIsNone(responseCache.response_cache_key_for(openai, REQUEST))
+
+    class ResponseCacheReplayTests(unittest.TestCase):
+        def setUp(self) -> None:
+            responseCache.reset_response_cache()
+            os.environ["OPENAI_API_KEY"] = "test-key"
+            GPTState.request = dict(REQUEST)
+            GPTState.text_to_confirm = ""
+            GPTState.last_streaming_events = []
+
+        def tearDown(self) -> None:
+            responseCache.reset_response_cache()
+
+        def _fake_get(self, key, default=None):
+            if key == "user.model_response_cache":
+                return 1
+            if key == "user.model_endpoint":
+                return "http://example.com"
+            if key == "user.model_request_timeout_seconds":
+                return 120
+            return default
+
+        def test_cache_hit_replays_chunks_without_network(self) -> None:
+            class FakeResponse:
+                status_code = 200
+                headers = {"content-type": "text/event-stream"}
+
+                def iter_lines(self):
+                    for piece in ("Hello ", "world"):
+                        payload = {"choices": [{"delta": {"content": piece}}]}
+                        yield f"data: {json.dumps(payload)}".encode("utf-8")
+                    yield b"data: [DONE]"
+
+                def close(self):
+                    pass
+
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=self._fake_get),
+                patch.object(
+                    modelHelpers.requests, "post", return_value=FakeResponse()
+                ),
+                patch.object(
+                    modelHelpers, "_should_show_response_canvas", return_value=False
+                ),
+            ):
+                first = modelHelpers._send_request_streaming(GPTState.request, "req-1")
+
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=self._fake_get),
+                patch.object(
+                    modelHelpers.requests,
+                    "post",
+                    side_effect=AssertionError("cache hit must not hit the network"),
+                ),
+                patch.object(
+                    modelHelpers, "_should_show_response_canvas", return_value=False
+                ),
+            ):
+                second = modelHelpers._send_request_streaming(
+                    GPTState.request, "req-2"
+                )
+
+            self.assertEqual(first, "Hello world")
+            self.assertEqual(second, first)
+            self.assertEqual(GPTState.text_to_confirm, "Hello world")
+            events = [
+                e for e in GPTState.last_streaming_events if e.get("request_id") == "req-2"
+            ]
+            kinds = [e.get("kind") for e in events]
+            self.assertIn("response_cache_hit", kinds)
+            self.assertEqual(kinds.count("chunk"), 2)
+            self.assertIn("complete", kinds)
+            stats = responseCache.response_cache_stats()
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(stats["stores"], 1)
+
+else:
+    if not TYPE_CHECKING:
+
+        class ResponseCacheTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
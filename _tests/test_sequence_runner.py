@@ -0,0 +1,206 @@
+import os
+import tempfile
+import threading
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib.modelHelpers import format_message
+    from talon_user.lib.modelSource import ModelSource
+    from talon_user.lib.modelState import GPTState
+    from talon_user.lib.promptPipeline import PromptResult
+    from talon_user.lib.sequenceConfig import SEQUENCES
+    from talon_user.lib.sequenceRunner import (
+        SequenceCheckpointStore,
+        SequenceRunner,
+        resolve_step_recipe,
+    )
+
+    class _Source(ModelSource):
+        def __init__(self, text: str):
+            self._text = text
+
+        def get_text(self):  # type: ignore[override]
+            return self._text
+
+    class SequenceRunnerTests(unittest.TestCase):
+        def setUp(self):
+            GPTState.reset_all()
+            self.addCleanup(GPTState.reset_all)
+            self.pipeline = MagicMock()
+            self.inputs = []
+            self.system_prompts = []
+
+            def run(prompt, source, destination, additional_source):
+                step_input = source.get_text()
+                self.inputs.append((step_input, additional_source))
+                self.system_prompts.append(GPTState.system_prompt)
+                number = len(self.inputs)
+                return PromptResult.from_messages(
+                    [format_message(f"out{number}<{step_input}>")]
+                )
+
+            self.pipeline.run.side_effect = run
+            self.tmpdir = tempfile.TemporaryDirectory()
+            self.addCleanup(self.tmpdir.cleanup)
+            self.runner = SequenceRunner(
+                self.pipeline, SequenceCheckpointStore(self.tmpdir.name)
+            )
+
+        def test_autonomous_sequence_chains_outputs(self):
+            caller_prompt = GPTState.system_prompt
+            caller_form = caller_prompt.form
+            checkpoint = self.runner.start(
+                "make-and-review", _Source("subject"), destination="paste"
+            )
+
+            self.assertEqual(checkpoint.status, "complete")
+            self.assertEqual(self.pipeline.run.call_count, 2)
+            self.assertEqual(self.inputs[0], ("subject", None))
+            second_input, additional = self.inputs[1]
+            self.assertEqual(second_input, "out1<subject>")
+            self.assertEqual(additional.get_text(), "subject")
+            self.assertEqual(checkpoint.result().text, "out2<out1<subject>>")
+            first_prompt = self.pipeline.run.call_args_list[0].args[0]
+            second_prompt = self.pipeline.run.call_args_list[1].args[0]
+            self.assertNotIn("Apply:", first_prompt + second_prompt)
+            self.assertIn("Task:\n  The response creates new content", first_prompt)
+            self.assertIn("Task:\n  The response evaluates the subject", second_prompt)
+            self.assertIn("Form:", second_prompt)
+            self.assertIn("Topology:", second_prompt)
+            self.assertEqual(self.system_prompts[1].form, "vet")
+            # The caller's system prompt is untouched by the steps.
+            self.assertIsNot(self.system_prompts[1], caller_prompt)
+            self.assertIs(GPTState.system_prompt, caller_prompt)
+            self.assertEqual(caller_prompt.form, caller_form)
+
+        def test_recipe_tokens_resolve_to_prompts_and_axes(self):
+            recipe = resolve_step_recipe("make form:prep verify audit")
+            self.assertEqual(recipe.static_prompt, "make")
+            self.assertEqual(
+                recipe.axes,
+                {"form": ["prep"], "method": ["verify"], "topology": ["audit"]},
+            )
+
+            recipe = resolve_step_recipe(
+                "task:probe intent:orient as-future-historian fly-ong mystery"
+            )
+            self.assertEqual(recipe.static_prompt, "probe")
+            self.assertEqual(
+                recipe.persona, {"intent": "orient", "voice": "as future historian"}
+            )
+            self.assertEqual(recipe.directional, "fly ong")
+            self.assertEqual(recipe.unresolved, ["mystery"])
+
+            # Older sequences put static prompts behind the method prefix.
+            self.assertEqual(resolve_step_recipe("method:plan").static_prompt, "plan")
+
+        def test_pauses_after_interactive_step_and_resumes_with_notes(self):
+            checkpoint = self.runner.start(
+                "debug-cycle", _Source("500s"), destination="paste"
+            )
+            self.assertEqual(checkpoint.status, "awaiting_input")
+            self.assertEqual(checkpoint.next_step, 1)
+            self.assertEqual(self.pipeline.run.call_count, 1)
+
+            checkpoint = self.runner.resume(
+                checkpoint.run_id, "paste", user_input="tried restarting"
+            )
+
+            self.assertEqual(checkpoint.status, "complete")
+            self.assertEqual(self.pipeline.run.call_count, 3)
+            self.assertIn("## User notes\ntried restarting", self.inputs[1][0])
+            # Notes are consumed once; the last step sees only the fix output.
+            self.assertEqual(self.inputs[2][0], checkpoint.outputs[1])
+            self.assertEqual(checkpoint.pending_input, "")
+
+        def test_action_step_takes_user_results_as_output(self):
+            checkpoint = self.runner.start(
+                "experiment-cycle", _Source("cache idea"), destination="paste"
+            )
+            self.assertEqual(checkpoint.status, "awaiting_input")
+            self.assertEqual(checkpoint.next_step, 1)
+
+            checkpoint = self.runner.resume(
+                checkpoint.run_id, "paste", user_input="p95 dropped to 150ms"
+            )
+
+            self.assertEqual(checkpoint.status, "complete")
+            self.assertEqual(checkpoint.outputs[1], "p95 dropped to 150ms")
+            self.assertEqual(self.inputs[-1][0], "p95 dropped to 150ms")
+
+        def test_resume_after_failure_skips_completed_steps(self):
+            run = self.pipeline.run.side_effect
+            calls = []
+
+            def flaky(*args):
+                calls.append(args[0])
+                if len(calls) == 2:
+                    raise RuntimeError("network down")
+                return run(*args)
+
+            self.pipeline.run.side_effect = flaky
+            with self.assertRaises(RuntimeError):
+                self.runner.start(
+                    "check-and-rewrite", _Source("doc"), destination="paste", run_id="r1"
+                )
+
+            # A fresh runner over the same directory simulates a restart.
+            restarted = SequenceRunner(
+                self.pipeline, SequenceCheckpointStore(self.tmpdir.name)
+            )
+            stored = restarted.store.latest_resumable()
+            self.assertEqual((stored.run_id, stored.status), ("r1", "failed"))
+            self.assertEqual(stored.outputs, ["out1<doc>"])
+
+            checkpoint = restarted.resume("r1", "paste")
+
+            self.assertEqual(checkpoint.status, "complete")
+            self.assertEqual(len(calls), 3)
+            self.assertEqual(checkpoint.outputs[1], "out2<out1<doc>>")
+            self.assertIsNone(restarted.store.latest_resumable())
+
+        def test_completed_runs_leave_no_checkpoint_file(self):
+            checkpoint = self.runner.start(
+                "debug-cycle", _Source("500s"), destination="paste", run_id="r1"
+            )
+            self.assertEqual(os.listdir(self.tmpdir.name), ["r1.json"])
+
+            self.runner.resume(checkpoint.run_id, "paste", user_input="notes")
+
+            self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+        def test_start_async_reads_the_source_on_the_calling_thread(self):
+            readers = []
+
+            class _ThreadSource(_Source):
+                def get_text(self):  # type: ignore[override]
+                    readers.append(threading.current_thread())
+                    return super().get_text()
+
+            handle = self.runner.start_async(
+                "make-and-review", _ThreadSource("subject"), "paste"
+            )
+            handle.wait(5)
+
+            self.assertEqual(readers, [threading.current_thread()])
+            self.assertEqual(self.inputs[0][0], "subject")
+
+        def test_unknown_sequence_raises(self):
+            with self.assertRaises(KeyError):
+                self.runner.start("no-such-sequence", _Source("x"), destination="paste")
+
+else:
+    if not TYPE_CHECKING:
+        class SequenceRunnerTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self):
+                pass
@@ -0,0 +1,66 @@
+import unittest
+from typing import TYPE_CHECKING
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from scripts.tools.mock_openai_sse import MockSSEServer
+    from scripts.tools.streaming_benchmark import (
+        ChunkProfile,
+        compare_to_baseline,
+        run_case,
+        splitter_per_chunk_us,
+    )
+
+    class StreamingBenchmarkTests(unittest.TestCase):
+        def test_run_case_reports_latency_cpu_and_canvas_metrics(self) -> None:
+            with MockSSEServer() as server:
+                row = run_case(server, 1024, ChunkProfile("burst", 64, 0.0), repeats=1)
+            self.assertEqual(row["case"], "burst-1024")
+            self.assertGreater(row["chunks"], 1024 // 64)
+            self.assertGreaterEqual(row["ttft_ms"], 0.0)
+            self.assertGreaterEqual(row["total_ms"], row["ttft_ms"])
+            self.assertEqual(row["cpu_ms"]["_append_text"]["calls"], row["chunks"])
+            self.assertIn("record_streaming_snapshot", row["cpu_ms"])
+            self.assertIn("split_answer_and_meta", row["cpu_ms"])
+            self.assertGreater(row["alloc_peak_kib"], 0.0)
+            self.assertGreater(row["canvas"]["draws"], 0)
+            self.assertGreater(row["canvas"]["refresh_requested"], 0)
+
+        def test_splitter_per_chunk_cost_is_measured(self) -> None:
+            self.assertGreater(splitter_per_chunk_us(4096, samples=20), 0.0)
+
+        def test_compare_flags_only_material_regressions(self) -> None:
+            baseline = {
+                "results": [
+                    {"case": "burst-1024", "ttft_ms": 10.0, "total_ms": 100.0},
+                    {"case": "fine-1024", "ttft_ms": 1.0, "total_ms": 50.0},
+                ]
+            }
+            current = {
+                "results": [
+                    {"case": "burst-1024", "ttft_ms": 20.0, "total_ms": 110.0},
+                    # Doubling a 1 ms TTFT stays under the absolute floor.
+                    {"case": "fine-1024", "ttft_ms": 2.0, "total_ms": 40.0},
+                    {"case": "new-case", "ttft_ms": 999.0},
+                ]
+            }
+            regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+            self.assertEqual(
+                [(r["case"], r["metric"]) for r in regressions],
+                [("burst-1024", "ttft_ms")],
+            )
+            self.assertEqual(regressions[0]["ratio"], 2.0)
+
+else:
+    if not TYPE_CHECKING:
+
+        class StreamingBenchmarkTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
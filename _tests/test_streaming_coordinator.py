@@ -17,7 +17,9 @@ if bootstrap is not None:
         canvas_view_from_snapshot,
         current_streaming_snapshot,
         record_streaming_snapshot,
+        record_streaming_chunk,
         current_streaming_gating_summary,
+        subscribe_streaming_deltas,
     )
 
     from talon_user.lib.modelState import GPTState
@@ -43,6 +45,46 @@ if bootstrap is not None:
             self.assertFalse(snap["errored"])
             self.assertEqual(snap["error_message"], "")
 
+        def test_text_view_is_cached_and_versioned(self) -> None:
+            run = new_streaming_run("req-version")
+            self.assertEqual(run.version, 0)
+            self.assertEqual(run.length, 0)
+
+            run.on_chunk("hello ")
+            first = run.text
+            self.assertIs(run.text, first)
+            self.assertEqual(run.version, 1)
+
+            run.on_chunk("   ")  # whitespace-only chunks are ignored
+            self.assertEqual(run.version, 1)
+
+            run.on_chunk("world")
+            self.assertEqual(run.text, "hello world")
+            self.assertEqual(run.version, 2)
+            self.assertEqual(run.length, len("hello world"))
+            self.assertEqual(run.text_since(1), "world")
+            self.assertEqual(run.text_since(2), "")
+            self.assertEqual(run.text_since(0), "hello world")
+
+            snap = run.snapshot()
+            self.assertEqual(snap["version"], 2)
+            self.assertEqual(snap["length"], len("hello world"))
+
+        def test_text_view_rebuilds_when_chunks_are_replaced(self) -> None:
+            run = StreamingRun("req-replace", chunks=["a", "b"])
+            self.assertEqual(run.length, 2)
+            self.assertEqual(run.text, "ab")
+            run.chunks = ["c"]
+            self.assertEqual(run.text, "c")
+            run.chunks = ["d", "e"]
+            self.assertEqual(run.text, "de")
+            run.chunks = ["f", "g", "h"]
+            self.assertEqual(run.text, "fgh")
+            run.chunks[-1] = "i"
+            self.assertEqual(run.text, "fgi")
+            run.on_chunk("j")
+            self.assertEqual(run.text, "fgij")
+
         def test_error_preserves_chunks_and_blocks_further_appends(self) -> None:
             run = StreamingRun("req-2")
             run.axes = {"method": ["rigor"]}
@@ -159,6 +201,79 @@ if bootstrap is not None:
                 snap,
             )
 
+        def test_record_streaming_chunk_skips_rebuild_without_mutating(self) -> None:
+            session = new_streaming_session("req-inplace")
+            session.record_gating_drop(reason="in_flight", source="test")
+            session.record_snapshot()
+            before = GPTState.last_streaming_snapshot
+
+            with patch(
+                "talon_user.lib.streamingCoordinator.record_streaming_snapshot",
+                side_effect=AssertionError("chunks should not rebuild snapshots"),
+            ):
+                first = record_streaming_chunk(session.run, "hello ")
+                second = record_streaming_chunk(session.run, "world")
+
+            self.assertIs(GPTState.last_streaming_snapshot, second)
+            self.assertEqual(second["text"], "hello world")
+            self.assertEqual(second["version"], 2)
+            self.assertEqual(second["gating_drop_counts"], {"in_flight": 1})
+            # Earlier snapshots are left as they were published.
+            self.assertEqual((first["text"], first["version"]), ("hello ", 1))
+            self.assertEqual(before.get("version"), 0)
+
+        def test_record_streaming_chunk_rebuilds_when_snapshot_is_stale(self) -> None:
+            run = new_streaming_run("req-stale")
+            GPTState.last_streaming_snapshot = {}
+            snap = record_streaming_chunk(run, "hello")
+            self.assertEqual(snap["text"], "hello")
+            self.assertEqual(snap["version"], 1)
+            self.assertIs(GPTState.last_streaming_snapshot, snap)
+
+        def test_streaming_deltas_are_published_to_subscribers(self) -> None:
+            received = []
+            unsubscribe = subscribe_streaming_deltas(received.append)
+            try:
+                session = new_streaming_session("req-delta")
+                session.record_snapshot()
+                session.record_chunk("hello ")
+                session.record_chunk("   ")
+                session.record_chunk("world")
+            finally:
+                unsubscribe()
+            session.record_chunk("!")
+
+            self.assertEqual(
+                [(d.request_id, d.version, d.text, d.length) for d in received],
+                [("req-delta", 1, "hello ", 6), ("req-delta", 2, "world", 11)],
+            )
+
+        def test_failing_delta_subscriber_does_not_break_streaming(self) -> None:
+            def boom(_delta):
+                raise RuntimeError("listener failed")
+
+            unsubscribe = subscribe_streaming_deltas(boom)
+            try:
+                session = new_streaming_session("req-delta-error")
+                snap = session.record_chunk("hello")
+            finally:
+                unsubscribe()
+            self.assertEqual(snap["text"], "hello")
+
+        def test_record_prompt_prefix_sets_hash_and_event(self) -> None:
+            session = new_streaming_session("req-prefix")
+            session.record_prompt_prefix(prefix_hash="abc123", messages=2)
+            self.assertEqual(session.prompt_prefix_hash, "abc123")
+            self.assertEqual(
+                session.events[-1],
+                {
+                    "kind": "prompt_prefix",
+                    "request_id": "req-prefix",
+                    "prefix_hash": "abc123",
+                    "messages": 2,
+                },
+            )
+
         def test_new_streaming_session_resets_gating_summary(self) -> None:
             GPTState.last_streaming_snapshot = {
                 "request_id": "req-old",
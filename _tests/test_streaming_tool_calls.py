@@ -0,0 +1,194 @@
+import os
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers
+    from talon_user.lib.modelState import GPTState
+    from talon_user.lib.streamingToolCalls import StreamingToolCallAssembler
+    from scripts.tools.mock_openai_sse import (
+        MockResponseConfig,
+        MockSSEServer,
+        http_post,
+        response_text,
+    )
+
+    def _fragment(index, *, call_id=None, name=None, arguments=None):
+        fragment = {"index": index, "function": {}}
+        if call_id:
+            fragment["id"] = call_id
+        if name:
+            fragment["function"]["name"] = name
+        if arguments is not None:
+            fragment["function"]["arguments"] = arguments
+        return fragment
+
+    class StreamingToolCallAssemblerTests(unittest.TestCase):
+        def test_completes_when_arguments_parse(self) -> None:
+            assembler = StreamingToolCallAssembler()
+            self.assertEqual(
+                assembler.feed([_fragment(0, call_id="a", name="lookup", arguments="")]),
+                [],
+            )
+            self.assertEqual(assembler.feed([_fragment(0, arguments='{"q": "x}')]), [])
+            done = assembler.feed([_fragment(0, arguments='"}')])
+            self.assertEqual([call.arguments for call in done], ['{"q": "x}"}'])
+            # Completed calls are reported once, even at the end of the stream.
+            self.assertEqual(assembler.finish(), [])
+
+        def test_new_index_and_finish_close_open_calls(self) -> None:
+            assembler = StreamingToolCallAssembler()
+            assembler.feed([_fragment(0, call_id="a", name="first", arguments="{")])
+            done = assembler.feed([_fragment(1, call_id="b", name="second", arguments="")])
+            self.assertEqual([call.name for call in done], ["first"])
+            self.assertEqual([call.name for call in assembler.finish()], ["second"])
+            message = assembler.assistant_message()
+            self.assertEqual(message["role"], "assistant")
+            self.assertIsNone(message["content"])
+            self.assertEqual([c["id"] for c in message["tool_calls"]], ["a", "b"])
+
+    class StreamingToolCallTurnTests(unittest.TestCase):
+        def setUp(self) -> None:
+            os.environ["OPENAI_API_KEY"] = "test-key"
+            GPTState.text_to_confirm = ""
+            modelHelpers.context.total_tool_calls = 0
+            self.addCleanup(setattr, modelHelpers.context, "total_tool_calls", 0)
+            self.server = MockSSEServer(
+                MockResponseConfig(
+                    text="final answer",
+                    meta=None,
+                    chunk_chars=5,
+                    tool_calls=(("lookup", '{"query": "talon voice"}'), ("clock", "{}")),
+                )
+            ).start()
+            self.addCleanup(self.server.stop)
+
+        def _send(self, **kwargs) -> str:
+            def fake_get(key, default=None):
+                if key == "user.model_endpoint":
+                    return self.server.url
+                if key == "user.model_request_timeout_seconds":
+                    return 10
+                return default
+
+            request = self.request = {
+                "model": "gpt-test",
+                "messages": [{"role": "user", "content": "hi"}],
+                "tools": [{"type": "function", "function": {"name": "lookup"}}],
+            }
+            with (
+                patch.object(modelHelpers.settings, "get", side_effect=fake_get),
+                patch.object(modelHelpers.requests, "post", side_effect=http_post),
+                patch.object(
+                    modelHelpers, "_should_show_response_canvas", return_value=False
+                ),
+                patch.object(modelHelpers, "notify"),
+                patch.object(
+                    modelHelpers.actions.user,
+                    "gpt_call_tool",
+                    create=True,
+                    side_effect=lambda name, arguments: f"{name}:{arguments}",
+                ) as tool,
+            ):
+                text = modelHelpers._send_request_streaming(
+                    request, "tool-stream", **kwargs
+                )
+            self.tool = tool
+            return text
+
+        def test_tool_turn_continues_as_streamed_answer(self) -> None:
+            text = self._send()
+            self.assertEqual(text, response_text(self.server.config))
+            self.assertEqual(len(self.server.requests), 2)
+            self.assertEqual(
+                [call.args for call in self.tool.call_args_list],
+                [("lookup", '{"query": "talon voice"}'), ("clock", "{}")],
+            )
+            follow_up = self.server.requests[1]["messages"]
+            assistant, first, second = follow_up[-3:]
+            self.assertEqual(
+                assistant["tool_calls"][0]["function"]["arguments"],
+                '{"query": "talon voice"}',
+            )
+            self.assertEqual(
+                [(m["role"], m["tool_call_id"]) for m in (first, second)],
+                [("tool", "call_0"), ("tool", "call_1")],
+            )
+            self.assertEqual(second["content"], "clock:{}")
+            self.assertTrue(self.server.requests[1]["stream"])
+
+        def test_follow_up_turns_continue_one_session(self) -> None:
+            self.server.configure(tool_turns=2, tool_preamble="Checking.")
+            with (
+                patch.object(
+                    modelHelpers,
+                    "new_streaming_session",
+                    wraps=modelHelpers.new_streaming_session,
+                ) as new_session,
+                patch.object(modelHelpers, "emit_begin_stream") as begin,
+            ):
+                text = self._send()
+
+            self.assertEqual(new_session.call_count, 1)
+            self.assertEqual(begin.call_count, 1)
+            self.assertEqual(
+                text, "Checking.\n\nChecking.\n\n" + response_text(self.server.config)
+            )
+            self.assertEqual(len(self.server.requests), 3)
+            # Both tool turns are recorded on the originating request.
+            messages = self.request["messages"]
+            self.assertEqual(
+                [m["role"] for m in messages],
+                ["user"] + ["assistant", "tool", "tool"] * 2,
+            )
+            self.assertEqual(messages[1]["content"], "Checking.")
+            self.assertEqual(messages[4]["content"], "Checking.")
+            self.assertEqual(
+                [m["tool_call_id"] for m in messages[5:]], ["call_1_0", "call_1_1"]
+            )
+            self.assertEqual(self.server.requests[2]["messages"], messages)
+
+        def test_exhausted_budget_requests_final_answer(self) -> None:
+            with patch.object(modelHelpers, "MAX_TOTAL_CALLS", 1):
+                self._send()
+            self.assertEqual(self.server.requests[1].get("tool_choice"), "none")
+            self.assertEqual(self.tool.call_count, 1)
+
+        def test_spent_turn_budget_starts_no_tool_calls(self) -> None:
+            self._send(tool_turn=modelHelpers.MAX_TOTAL_CALLS + 1)
+            self.assertEqual(self.tool.call_count, 0)
+            self.assertEqual(len(self.server.requests), 1)
+
+        def test_tool_runner_is_closed_when_the_stream_fails(self) -> None:
+            with (
+                patch.object(
+                    modelHelpers.ToolCallRunner,
+                    "close",
+                    autospec=True,
+                    side_effect=modelHelpers.ToolCallRunner.close,
+                ) as close,
+                patch.object(
+                    modelHelpers.StreamingToolCallAssembler,
+                    "finish",
+                    side_effect=RuntimeError("boom"),
+                ),
+            ):
+                with self.assertRaises(RuntimeError):
+                    self._send()
+            self.assertEqual(close.call_count, 1)
+
+else:
+    if not TYPE_CHECKING:
+
+        class StreamingToolCallTurnTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
@@ -59,6 +59,16 @@ if bootstrap is not None:
             self.assertEqual(GPTState.system_prompt.directional, "DIR")
             self.assertNotIn("\nDIR", result)
 
+        def test_model_prompt_prewarms_provider_connection(self):
+            m = SimpleNamespace(staticPrompt="fix", directionalModifier="DIR")
+
+            with patch.object(
+                talon_settings, "prewarm_provider_connection"
+            ) as prewarm:
+                modelPrompt(m)
+
+            prewarm.assert_called_once_with()
+
         def test_explicit_completeness_modifier_is_used_as_is(self):
             m = SimpleNamespace(
                 staticPrompt="fix",
@@ -320,7 +330,7 @@ if bootstrap is not None:
 
         def test_ambiguous_token_uses_priority_order(self):
             """When a token is valid for multiple axes, the hierarchy should pick the higher-priority axis."""
-            from talon_user.lib import axisMappings
+            from talon_user.lib import axisCatalog, axisMappings
 
             scope_map = axisMappings.AXIS_VALUE_TO_KEY_MAPS["scope"]
             method_map = axisMappings.AXIS_VALUE_TO_KEY_MAPS["method"]
@@ -329,6 +339,7 @@ if bootstrap is not None:
             try:
                 scope_map["ambig"] = "ambig"
                 method_map["ambig"] = "ambig"
+                axisCatalog.invalidate_axis_catalog()
 
                 m = SimpleNamespace(
                     staticPrompt="fix",
@@ -360,6 +371,7 @@ if bootstrap is not None:
                     method_map.pop("ambig", None)
                 else:
                     method_map["ambig"] = original_method
+                axisCatalog.invalidate_axis_catalog()
 
         def test_clear_all_resets_last_recipe_and_response(self):
             # Exercise the lifecycle: after a prompt, clear_all should drop
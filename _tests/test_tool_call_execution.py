@@ -0,0 +1,187 @@
+import json
+import threading
+import time
+import unittest
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+try:
+    from bootstrap import bootstrap
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+if bootstrap is not None:
+    from talon_user.lib import modelHelpers, requestTracing
+    from talon_user.lib.modelState import GPTState
+    from talon_user.lib.requestTracing import request_trace, reset_request_traces
+
+    def _tool_calls(count: int):
+        return [
+            {
+                "id": f"call-{index}",
+                "type": "function",
+                "function": {"name": f"tool_{index}", "arguments": str(index)},
+            }
+            for index in range(count)
+        ]
+
+    class ToolCallExecutionTests(unittest.TestCase):
+        def setUp(self) -> None:
+            modelHelpers.context.total_tool_calls = 0
+            self.addCleanup(setattr, modelHelpers.context, "total_tool_calls", 0)
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def _slow_tool(self, name: str, arguments: str) -> str:
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            # Later calls finish first, so ordering comes from the executor.
+            time.sleep(0.05 - 0.01 * int(arguments))
+            with self.lock:
+                self.active -= 1
+            return f"{name} done"
+
+        def _run(self, count: int, *, concurrency: int = 4, limit: int = 10):
+            with (
+                patch.object(modelHelpers, "MAX_TOTAL_CALLS", limit),
+                patch.object(
+                    modelHelpers, "_tool_call_concurrency", return_value=concurrency
+                ),
+                patch.object(modelHelpers, "notify"),
+                patch.object(
+                    modelHelpers.actions.user,
+                    "gpt_call_tool",
+                    create=True,
+                    side_effect=self._slow_tool,
+                ),
+            ):
+                return modelHelpers.run_tool_calls(_tool_calls(count), "tool-req")
+
+        def test_runs_concurrently_and_preserves_order(self) -> None:
+            results = self._run(4)
+            self.assertEqual(
+                [r["tool_call_id"] for r in results],
+                ["call-0", "call-1", "call-2", "call-3"],
+            )
+            self.assertEqual(results[2]["content"], "tool_2 done")
+            self.assertGreater(self.peak, 1)
+
+        def test_concurrency_of_one_runs_sequentially(self) -> None:
+            results = self._run(3, concurrency=1)
+            self.assertEqual(len(results), 3)
+            self.assertEqual(self.peak, 1)
+
+        def test_close_cancels_calls_that_have_not_started(self) -> None:
+            release = threading.Event()
+            started = []
+
+            def _blocking_tool(name: str, arguments: str) -> str:
+                started.append(name)
+                release.wait(5)
+                return name
+
+            with (
+                patch.object(modelHelpers, "MAX_TOTAL_CALLS", 10),
+                patch.object(modelHelpers, "notify"),
+                patch.object(
+                    modelHelpers.actions.user,
+                    "gpt_call_tool",
+                    create=True,
+                    side_effect=_blocking_tool,
+                ),
+            ):
+                runner = modelHelpers.ToolCallRunner("tool-req", max_workers=2)
+                for call in _tool_calls(4):
+                    runner.submit(call["id"], call["function"]["name"], "0")
+                runner.close()
+                release.set()
+                runner.close()
+            futures = runner._futures
+            self.assertTrue(all(future.cancelled() for future in futures[2:]))
+            for future in futures[:2]:
+                future.result(timeout=5)
+            self.assertEqual(sorted(started), ["tool_0", "tool_1"])
+
+        def test_concurrent_nested_calls_can_all_be_cancelled(self) -> None:
+            reading = threading.Semaphore(0)
+            responses = []
+            sentinel = {"messages": []}
+            GPTState.last_raw_request = sentinel
+
+            class _Response:
+                status_code = 200
+
+                def __init__(self) -> None:
+                    self.closed = threading.Event()
+
+                def json(self):
+                    reading.release()
+                    self.closed.wait(5)
+                    return {"choices": [{"message": {"content": "cut short"}}]}
+
+                def close(self) -> None:
+                    self.closed.set()
+
+            def _post(*_args, **_kwargs):
+                response = _Response()
+                responses.append(response)
+                return response
+
+            def _get(key, default=None):
+                if key == "user.model_endpoint":
+                    return "http://example.com"
+                return default
+
+            calls = [
+                (f"call-{index}", "chatgpt_call", json.dumps({"prompt": "q"}))
+                for index in range(2)
+            ]
+            with (
+                patch.object(modelHelpers, "MAX_TOTAL_CALLS", 10),
+                patch.object(modelHelpers, "notify"),
+                patch.object(modelHelpers.settings, "get", side_effect=_get),
+                patch.object(modelHelpers.requests, "post", side_effect=_post),
+                patch.object(modelHelpers, "get_token", return_value="token"),
+            ):
+                runner = modelHelpers.ToolCallRunner("tool-req", max_workers=2)
+                for call in calls:
+                    runner.submit(*call)
+                for _ in calls:
+                    self.assertTrue(reading.acquire(timeout=5))
+                modelHelpers.cancel_active_request()
+                results = runner.results()
+
+            self.assertEqual(
+                [r["content"][0]["text"] for r in results], ["cut short"] * 2
+            )
+            self.assertTrue(all(response.closed.is_set() for response in responses))
+            self.assertEqual(modelHelpers._detached_responses, set())
+            self.assertIs(GPTState.last_raw_request, sentinel)
+
+        def test_budget_is_atomic_across_workers(self) -> None:
+            results = self._run(6, limit=3)
+            tool_results = [r for r in results if r.get("role") == "tool"]
+            self.assertEqual(len(tool_results), 3)
+            self.assertEqual(modelHelpers.context.total_tool_calls, 3)
+            self.assertEqual(len(results), 6)
+
+        def test_tool_spans_are_traced(self) -> None:
+            reset_request_traces()
+            self.addCleanup(reset_request_traces)
+            with patch.object(requestTracing, "tracing_enabled", return_value=True):
+                self._run(2)
+            spans = [s for s in request_trace("tool-req") if s["name"] == "tool_call"]
+            self.assertEqual(sorted(s["attrs"]["tool"] for s in spans), ["tool_0", "tool_1"])
+            self.assertTrue(all(s["duration_ms"] is not None for s in spans))
+
+else:
+    if not TYPE_CHECKING:
+
+        class ToolCallExecutionTests(unittest.TestCase):
+            @unittest.skip("Test harness unavailable outside unittest runs")
+            def test_placeholder(self) -> None:
+                pass
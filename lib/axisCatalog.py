@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import threading
+import time
 from importlib import reload
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 from . import axisConfig
+from . import metaPromptConfig as _meta_prompt_config_module
+from . import personaConfig as _persona_config_module
+from . import staticPromptConfig as _static_prompt_config_module
 from .staticPromptConfig import (
     STATIC_PROMPT_CONFIG,
     get_static_prompt_axes as _get_static_prompt_axes,
@@ -161,11 +165,11 @@ def static_prompt_description_overrides() -> dict[str, str]:
     return _static_prompt_description_overrides()
 
 
-def axis_catalog(
+def _build_axis_catalog(
     lists_dir: str | Path | None = None,
     static_prompt_list_path: str | Path | None = None,
 ) -> dict[str, object]:
-    """Return a consolidated view of axis tokens, Talon lists, and static prompts.
+    """Build a consolidated view of axis tokens, Talon lists, and static prompts.
 
     - axes: raw axis token map from axisConfig.
     - axis_list_tokens: Talon list tokens for axes with mapped list files (SSOT
@@ -173,6 +177,8 @@ def axis_catalog(
     - static_prompts: catalog view from staticPromptConfig.
     - static_prompt_descriptions: description overrides for docs/help consumers.
     - static_prompt_profiles: raw profiles for callers that need direct access.
+    - axis_token_sets / axis_list_token_sets: per-axis token frozensets for
+      membership checks on per-request paths.
     """
 
     axis_map = _axis_config_map()
@@ -199,6 +205,12 @@ def axis_catalog(
     return {
         "axes": axis_map,
         "axis_list_tokens": axis_lists,
+        "axis_token_sets": {
+            axis: frozenset((tokens or {}).keys()) for axis, tokens in axis_map.items()
+        },
+        "axis_list_token_sets": {
+            axis: frozenset(tokens) for axis, tokens in axis_lists.items()
+        },
         "axis_labels": {
             axis: axisConfig.axis_key_to_label_map(axis) for axis in axis_map
         },
@@ -238,6 +250,114 @@ def axis_catalog(
     }
 
 
+# Process-wide catalog snapshot for the default (catalog-only) view. Callers on
+# per-request paths share it instead of rebuilding the nested maps; it is
+# rebuilt (and the generation bumped) only when axisConfig, staticPromptConfig,
+# personaConfig or metaPromptConfig change (on disk or via reload) or after
+# `invalidate_axis_catalog()`.
+# Source files are stat()ed at most once per recheck interval.
+_CATALOG_RECHECK_SECONDS = 1.0
+
+_catalog_snapshot: Dict[str, object] | None = None
+_catalog_generation = 0
+_catalog_signature: tuple | None = None
+_catalog_checked_at: float | None = None
+_catalog_lock = threading.Lock()
+
+
+def _module_mtime(module: object) -> float | None:
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return None
+    try:
+        return Path(module_file).stat().st_mtime
+    except OSError:
+        return None
+
+
+def _catalog_source_signature() -> tuple:
+    return (
+        _module_mtime(axisConfig),
+        _module_mtime(_static_prompt_config_module),
+        _module_mtime(_persona_config_module),
+        _module_mtime(_meta_prompt_config_module),
+        id(getattr(axisConfig, "AXIS_KEY_TO_VALUE", None)),
+        id(getattr(_static_prompt_config_module, "STATIC_PROMPT_CONFIG", None)),
+        id(getattr(_persona_config_module, "PERSONA_KEY_TO_VALUE", None)),
+        id(getattr(_meta_prompt_config_module, "PROMPT_REFERENCE_KEY", None)),
+    )
+
+
+def _current_catalog_snapshot() -> Dict[str, object]:
+    global _catalog_snapshot, _catalog_generation, _catalog_signature
+    global _catalog_checked_at
+
+    now = time.monotonic()
+    snapshot = _catalog_snapshot
+    checked_at = _catalog_checked_at
+    if (
+        snapshot is not None
+        and checked_at is not None
+        and now - checked_at < _CATALOG_RECHECK_SECONDS
+    ):
+        return snapshot
+
+    with _catalog_lock:
+        signature = _catalog_source_signature()
+        if _catalog_snapshot is None or signature != _catalog_signature:
+            _catalog_snapshot = _build_axis_catalog()
+            _catalog_generation += 1
+            # axisConfig may have been reloaded while building; record the
+            # post-build identity so the next check does not rebuild again.
+            _catalog_signature = _catalog_source_signature()
+        _catalog_checked_at = now
+        return _catalog_snapshot
+
+
+def axis_catalog(
+    lists_dir: str | Path | None = None,
+    static_prompt_list_path: str | Path | None = None,
+) -> dict[str, object]:
+    """Return a consolidated view of axis tokens, Talon lists, and static prompts.
+
+    The default view (no `lists_dir`/`static_prompt_list_path`) is a shared,
+    process-wide snapshot: treat it as read-only. Passing either argument reads
+    Talon list files from disk and builds a fresh catalog. See
+    `_build_axis_catalog` for the keys.
+    """
+
+    if lists_dir or static_prompt_list_path:
+        return _build_axis_catalog(lists_dir, static_prompt_list_path)
+    return _current_catalog_snapshot()
+
+
+def axis_catalog_generation() -> int:
+    """Return the generation of the current catalog snapshot.
+
+    The generation increases whenever the snapshot is rebuilt, so callers can
+    key derived caches on it.
+    """
+
+    _current_catalog_snapshot()
+    return _catalog_generation
+
+
+def axis_token_set(axis: str) -> FrozenSet[str]:
+    """Return the catalog tokens for an axis as a frozenset."""
+
+    token_sets = _current_catalog_snapshot().get("axis_token_sets") or {}
+    return token_sets.get(axis, frozenset())  # type: ignore[union-attr]
+
+
+def invalidate_axis_catalog() -> None:
+    """Drop the shared snapshot so the next call rebuilds it (hot reload/tests)."""
+
+    global _catalog_snapshot, _catalog_checked_at
+    with _catalog_lock:
+        _catalog_snapshot = None
+        _catalog_checked_at = None
+
+
 def serialize_axis_config(
     lists_dir: str | Path | None = None,
     include_axis_lists: bool = True,
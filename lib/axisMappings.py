@@ -11,6 +11,7 @@ from .axisConfig import (
     axis_key_to_value_map,
     get_cross_axis_composition,  # ADR-0153: re-exported for façade callers
 )
+from .axisCatalog import invalidate_axis_catalog
 
 
 def _ensure_not_style_axis(axis: str) -> None:
@@ -23,6 +24,9 @@ AXIS_KEY_TO_VALUE_MAPS = AXIS_KEY_TO_VALUE
 AXIS_VALUE_TO_KEY_MAPS = {
     axis: {token: token for token in mapping} for axis, mapping in AXIS_KEY_TO_VALUE.items()
 }
+# Caches derived from these maps key on the catalog generation; a reload of
+# this module must move it on.
+invalidate_axis_catalog()
 
 # Store axis defaults as tokens so state remains token-based.
 DEFAULT_COMPLETENESS_TOKEN = "full"
@@ -0,0 +1,187 @@
+"""Compiled axis-token index for spoken recipe parsing.
+
+Every utterance runs tokens through axis resolution (which axis does `focus`
+belong to?), conflict/cap normalisation, and filtering against the catalog.
+Doing that against the raw value→key maps means rebuilding sets and scanning
+every axis per token. `AxisTokenIndex` compiles those tables once:
+
+- `resolve` is a single dict lookup mapping a bare token to the
+  highest-priority (axis, canonical token) pair, with a second precomputed
+  table for explicit `axis:token` prefixes.
+- Incompatibilities become per-axis bitmasks so last-wins conflict checks are
+  an integer AND instead of set arithmetic.
+- Soft caps and per-axis known-token sets are frozen alongside.
+
+Callers own the cache: they rebuild the index when the axis catalog
+generation (or the underlying maps) change.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Order in which recipe segments are matched against catalog tokens when a
+# pattern recipe is parsed (completeness outranks scope, and so on).
+RECIPE_AXIS_ORDER: Tuple[str, ...] = (
+    "completeness",
+    "scope",
+    "method",
+    "form",
+    "channel",
+)
+
+
+class AxisTokenIndex:
+    """Immutable lookup tables compiled from axis maps and constraint tables."""
+
+    def __init__(
+        self,
+        priority: Sequence[str],
+        value_maps: Mapping[str, Mapping[str, str]],
+        catalog_token_sets: Mapping[str, AbstractSet[str]],
+        soft_caps: Mapping[str, int],
+        incompatibilities: Mapping[str, Mapping[str, AbstractSet[str]]],
+    ) -> None:
+        self.priority: Tuple[str, ...] = tuple(priority)
+        self.soft_caps: Dict[str, int] = dict(soft_caps)
+
+        # Bare token -> (axis, canonical); walk priority in reverse so the
+        # highest-priority axis is written last and wins.
+        token_axis: Dict[str, Tuple[str, str]] = {}
+        for axis in reversed(self.priority):
+            for token, mapped in (value_maps.get(axis) or {}).items():
+                if mapped:
+                    token_axis[token] = (axis, mapped)
+        self._token_axis = token_axis
+
+        self._value_maps: Dict[str, Dict[str, str]] = {
+            axis: dict(value_maps.get(axis) or {}) for axis in self.priority
+        }
+        prefixed: Dict[str, Tuple[str, str]] = {}
+        for axis, mapping in self._value_maps.items():
+            for token, mapped in mapping.items():
+                prefixed[f"{axis}:{token}"] = (axis, mapped)
+        self._prefixed = prefixed
+
+        self._mapped_tokens: Dict[str, FrozenSet[str]] = {
+            axis: frozenset(mapping) for axis, mapping in value_maps.items()
+        }
+        self._known_tokens: Dict[str, FrozenSet[str]] = {}
+        for axis in set(value_maps) | set(catalog_token_sets):
+            self._known_tokens[axis] = frozenset(
+                value_maps.get(axis) or ()
+            ) | frozenset(catalog_token_sets.get(axis) or ())
+
+        recipe_axis: Dict[str, str] = {}
+        for axis in reversed(RECIPE_AXIS_ORDER):
+            for token in catalog_token_sets.get(axis) or ():
+                recipe_axis[token] = axis
+        self._recipe_axis = recipe_axis
+
+        # Assign one bit per token that takes part in any conflict, then store
+        # the union of conflicting bits per token.
+        self._token_bits: Dict[str, Dict[str, int]] = {}
+        self._conflict_masks: Dict[str, Dict[str, int]] = {}
+        for axis, token_map in incompatibilities.items():
+            bits: Dict[str, int] = {}
+            for token, conflicts in token_map.items():
+                for name in (token, *conflicts):
+                    if name not in bits:
+                        bits[name] = 1 << len(bits)
+            masks: Dict[str, int] = {}
+            for token, conflicts in token_map.items():
+                mask = 0
+                for name in conflicts:
+                    mask |= bits[name]
+                if mask:
+                    masks[token] = mask
+            self._token_bits[axis] = bits
+            self._conflict_masks[axis] = masks
+
+    def resolve(
+        self, token: str, hint_axis: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return (axis, canonical token) for a spoken token.
+
+        Prefixed tokens (`scope:focus`) go to the named axis; bare tokens go to
+        the highest-priority axis that knows them; unknown tokens stay on the
+        hint axis so user input is not dropped silently.
+        """
+
+        raw = token.strip()
+        if not raw:
+            return None, None
+        if ":" in raw:
+            hit = self._prefixed.get(raw)
+            if hit is not None:
+                return hit
+            prefix, remainder = raw.split(":", 1)
+            axis = prefix.strip().lower()
+            if axis in self._value_maps:
+                value = remainder.strip()
+                return axis, self._value_maps[axis].get(value, value)
+        hit = self._token_axis.get(raw)
+        if hit is not None:
+            return hit
+        if hint_axis:
+            return hint_axis, raw
+        return None, None
+
+    def recipe_axis(self, token: str) -> Optional[str]:
+        """Return the axis a pattern recipe token belongs to, if any."""
+
+        return self._recipe_axis.get(token)
+
+    def is_mapped(self, axis: str, token: str) -> bool:
+        return token in self._mapped_tokens.get(axis, ())
+
+    def is_known(self, axis: str, token: str) -> bool:
+        return token in self._known_tokens.get(axis, ())
+
+    def dedupe(self, axis: str, tokens: Iterable[str]) -> List[str]:
+        """Trim, dedupe and apply last-wins conflicts, keeping input order."""
+
+        raw = [t.strip() for t in tokens if t and t.strip()]
+        if not raw:
+            return []
+        bits = self._token_bits.get(axis) or {}
+        masks = self._conflict_masks.get(axis) or {}
+        seen: set[str] = set()
+        seen_mask = 0
+        ordered: List[str] = []
+        for token in raw:
+            mask = masks.get(token, 0)
+            if mask & seen_mask:
+                # Drop any conflicting tokens that were accepted earlier.
+                ordered = [t for t in ordered if not bits.get(t, 0) & mask]
+                seen = set(ordered)
+                seen_mask &= ~mask
+            if token in seen:
+                continue
+            ordered.append(token)
+            seen.add(token)
+            seen_mask |= bits.get(token, 0)
+        return ordered
+
+    def canonicalise(self, axis: str, tokens: Iterable[str]) -> List[str]:
+        """Dedupe, apply conflicts and the soft cap, then sort tokens."""
+
+        ordered = self.dedupe(axis, tokens)
+        cap = self.soft_caps.get(axis)
+        if cap is not None and cap > 0 and len(ordered) > cap:
+            # Enforce soft cap with last-wins semantics: keep the most recent.
+            ordered = ordered[-cap:]
+        return sorted(ordered)
+
+
+__all__ = ["AxisTokenIndex", "RECIPE_AXIS_ORDER"]
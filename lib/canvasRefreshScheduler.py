@@ -0,0 +1,260 @@
+"""Adaptive, frame-budgeted refresh scheduling for streaming canvases.
+
+The streaming read loop used to call `model_response_canvas_refresh()` inline
+behind a fixed 250ms throttle, so a slow redraw stalled network reads and a fast
+stream still queued a redraw per throttle window regardless of draw cost.
+
+`CanvasRefreshScheduler` splits the work across threads:
+
+- The streaming thread only calls `request()`, which marks the canvas dirty and
+  dispatches at most one pending refresh to the UI thread. Requests that arrive
+  while a refresh is pending are coalesced into it.
+- The UI thread runs the refresh, measures its cost, and adapts the minimum
+  interval between draws to the smoothed draw cost (so redraws stay within a
+  fraction of the UI thread's time) and to the chunk arrival rate (slow streams
+  draw each chunk immediately; fast streams batch chunks into frames).
+- `flush()` guarantees one final draw of the latest state once the stream ends.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .uiDispatch import run_on_ui_thread, ui_dispatch_fallback_active
+
+# ~30fps: never redraw faster than this, however cheap the draw is.
+MIN_REFRESH_INTERVAL_MS = 33.0
+# Upper bound so very slow draws still show progress regularly.
+MAX_REFRESH_INTERVAL_MS = 1000.0
+# Keep redraws to at most 1/DRAW_BUDGET_FACTOR of the UI thread's time.
+DRAW_BUDGET_FACTOR = 4.0
+# Weight of the newest sample in the draw-cost and chunk-gap moving averages.
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class _RefreshStats:
+    requests: int = 0
+    coalesced: int = 0
+    dispatched: int = 0
+    superseded: int = 0
+    draws: int = 0
+    draw_errors: int = 0
+    flushes: int = 0
+
+
+class CanvasRefreshScheduler:
+    """Coalesce refresh requests and run them on the UI thread at an adaptive rate.
+
+    `refresh` performs the actual redraw. `should_refresh` is consulted on both
+    threads so a canvas closed mid-stream is not reopened. `on_requested` and
+    `on_executed` receive the same keyword arguments as the streaming session's
+    `record_ui_refresh_requested`/`record_ui_refresh_executed` hooks.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], None],
+        *,
+        should_refresh: Optional[Callable[[], bool]] = None,
+        dispatch: Callable[..., None] = run_on_ui_thread,
+        on_requested: Optional[Callable[..., None]] = None,
+        on_executed: Optional[Callable[..., None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        min_interval_ms: float = MIN_REFRESH_INTERVAL_MS,
+        max_interval_ms: float = MAX_REFRESH_INTERVAL_MS,
+    ) -> None:
+        self._refresh = refresh
+        self._should_refresh = should_refresh or (lambda: True)
+        self._dispatch = dispatch
+        self._on_requested = on_requested
+        self._on_executed = on_executed
+        self._clock = clock
+        self._min_interval_ms = float(min_interval_ms)
+        self._max_interval_ms = max(float(max_interval_ms), self._min_interval_ms)
+        self._lock = threading.Lock()
+        self._pending_token: Optional[int] = None
+        self._next_token = 0
+        self._dirty = False
+        self._last_draw_at: Optional[float] = None
+        self._last_request_at: Optional[float] = None
+        self._draw_ms_avg: Optional[float] = None
+        self._chunk_gap_ms_avg: Optional[float] = None
+        self._stats = _RefreshStats()
+
+    # -- streaming thread -------------------------------------------------
+
+    def request(self, *, force: bool = False) -> None:
+        """Mark the canvas dirty and make sure a refresh is scheduled."""
+
+        if not self._safe_should_refresh():
+            return
+        now = self._clock()
+        with self._lock:
+            self._stats.requests += 1
+            if self._last_request_at is not None:
+                self._chunk_gap_ms_avg = _ewma(
+                    self._chunk_gap_ms_avg, (now - self._last_request_at) * 1000.0
+                )
+            self._last_request_at = now
+            self._dirty = True
+            delay_ms = 0 if force else self._delay_ms_locked(now)
+            if self._pending_token is not None and (not force or delay_ms > 0):
+                self._stats.coalesced += 1
+                coalesced = True
+            elif delay_ms > 0 and ui_dispatch_fallback_active():
+                # Inline fallback would sleep on this thread; leave the canvas
+                # dirty for the next request or the final flush instead.
+                self._stats.coalesced += 1
+                coalesced = True
+            else:
+                if self._pending_token is not None:
+                    self._stats.superseded += 1
+                token = self._claim_token_locked()
+                coalesced = False
+        if coalesced:
+            self._notify(self._on_requested, forced=force, reason="coalesced")
+            return
+        self._notify(self._on_requested, forced=force, reason="canvas_refresh")
+        self._schedule(token, delay_ms, force)
+
+    def flush(self) -> bool:
+        """Draw the latest state now if anything changed since the last draw.
+
+        Supersedes any delayed refresh so the final frame is not held back by
+        the adaptive interval. Returns True when a refresh was dispatched.
+        """
+
+        if not self._safe_should_refresh():
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._stats.flushes += 1
+            if self._pending_token is not None:
+                self._stats.superseded += 1
+            token = self._claim_token_locked()
+        self._notify(self._on_requested, forced=True, reason="final_flush")
+        self._schedule(token, 0, True)
+        return True
+
+    # -- UI thread --------------------------------------------------------
+
+    def _run(self, token: int, forced: bool) -> None:
+        with self._lock:
+            if token != self._pending_token:
+                # A forced request or flush replaced this dispatch.
+                return
+            self._pending_token = None
+            self._dirty = False
+        if not self._safe_should_refresh():
+            return
+        started = self._clock()
+        error = ""
+        try:
+            self._refresh()
+        except Exception as e:
+            error = str(e)
+        finished = self._clock()
+        with self._lock:
+            self._last_draw_at = finished
+            self._draw_ms_avg = _ewma(self._draw_ms_avg, (finished - started) * 1000.0)
+            if error:
+                self._stats.draw_errors += 1
+            else:
+                self._stats.draws += 1
+        self._notify(
+            self._on_executed,
+            forced=forced,
+            reason="canvas_refresh",
+            success=not error,
+            error=error,
+        )
+
+    # -- helpers ----------------------------------------------------------
+
+    def interval_ms(self) -> float:
+        """Return the current minimum spacing between redraws."""
+
+        with self._lock:
+            return self._interval_ms_locked()
+
+    def _interval_ms_locked(self) -> float:
+        interval = self._min_interval_ms
+        if self._draw_ms_avg is not None:
+            interval = max(interval, self._draw_ms_avg * DRAW_BUDGET_FACTOR)
+        return min(interval, self._max_interval_ms)
+
+    def _delay_ms_locked(self, now: float) -> int:
+        if self._last_draw_at is None:
+            return 0
+        interval = self._interval_ms_locked()
+        # Chunks arriving slower than the frame interval are drawn as they come.
+        if self._chunk_gap_ms_avg is not None and self._chunk_gap_ms_avg >= interval:
+            return 0
+        elapsed_ms = (now - self._last_draw_at) * 1000.0
+        return max(0, int(round(interval - elapsed_ms)))
+
+    def _claim_token_locked(self) -> int:
+        self._next_token += 1
+        self._pending_token = self._next_token
+        self._stats.dispatched += 1
+        return self._next_token
+
+    def _schedule(self, token: int, delay_ms: int, forced: bool) -> None:
+        try:
+            self._dispatch(lambda: self._run(token, forced), delay_ms)
+        except Exception as e:
+            with self._lock:
+                if self._pending_token == token:
+                    self._pending_token = None
+            self._notify(
+                self._on_executed,
+                forced=forced,
+                reason="canvas_refresh",
+                success=False,
+                error=str(e),
+            )
+
+    def _safe_should_refresh(self) -> bool:
+        try:
+            return bool(self._should_refresh())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _notify(hook: Optional[Callable[..., None]], **kwargs: Any) -> None:
+        if hook is None:
+            return
+        try:
+            hook(**kwargs)
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = asdict(self._stats)
+            payload["pending"] = self._pending_token is not None
+            payload["interval_ms"] = round(self._interval_ms_locked(), 3)
+            payload["draw_ms_avg"] = (
+                round(self._draw_ms_avg, 3) if self._draw_ms_avg is not None else None
+            )
+            payload["chunk_gap_ms_avg"] = (
+                round(self._chunk_gap_ms_avg, 3)
+                if self._chunk_gap_ms_avg is not None
+                else None
+            )
+        return payload
+
+
+def _ewma(previous: Optional[float], sample: float) -> float:
+    sample = max(0.0, float(sample))
+    if previous is None:
+        return sample
+    return previous + EWMA_ALPHA * (sample - previous)
+
+
+__all__ = ["CanvasRefreshScheduler"]
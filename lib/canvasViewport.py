@@ -0,0 +1,114 @@
+"""Virtualized row viewports for scrollable canvases.
+
+Canvas draw handlers run on every scroll, hover and refresh. Scrollable bodies
+(the response viewer, help hub results, pattern and suggestion lists) should
+only lay out and draw the rows that intersect the visible region. These
+indexes answer "which rows are visible at this scroll offset?" without walking
+every row:
+
+- `UniformRowIndex` covers fixed-height rows (wrapped text lines) in O(1).
+- `RowHeightIndex` keeps prefix sums over variable row heights and
+  binary-searches the first visible row in O(log n).
+
+Both use the same visibility rule the canvases already relied on: a row is
+drawn when its bottom is below the top edge of the viewport and its top is at
+or above the bottom edge (text is drawn on a baseline at the row top, so a row
+starting exactly at the bottom edge still shows).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from typing import Iterable, Iterator, List, Tuple
+
+
+class UniformRowIndex:
+    """Viewport math for `count` rows of identical height."""
+
+    def __init__(self, count: int, row_height: float) -> None:
+        self._count = max(int(count), 0)
+        height = float(row_height or 0)
+        self._row_height = height if height > 0 else 1.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def total_height(self) -> float:
+        return self._count * self._row_height
+
+    def row_top(self, index: int) -> float:
+        return index * self._row_height
+
+    def row_height(self, index: int) -> float:
+        return self._row_height
+
+    def first_visible(self, scroll_y: float) -> int:
+        if scroll_y <= 0:
+            return 0
+        return min(int(scroll_y // self._row_height), self._count)
+
+    def visible_range(self, scroll_y: float, viewport_height: float) -> Tuple[int, int]:
+        start = self.first_visible(scroll_y)
+        bottom = scroll_y + max(viewport_height, 0.0)
+        stop = min(int(math.floor(bottom / self._row_height)) + 1, self._count)
+        return start, max(start, stop)
+
+    def visible_rows(
+        self, scroll_y: float, viewport_height: float
+    ) -> Iterator[Tuple[int, float]]:
+        """Yield (index, top relative to the viewport) for each visible row."""
+
+        start, stop = self.visible_range(scroll_y, viewport_height)
+        for index in range(start, stop):
+            yield index, index * self._row_height - scroll_y
+
+
+class RowHeightIndex:
+    """Prefix-sum index over variable row heights."""
+
+    def __init__(self, heights: Iterable[float]) -> None:
+        self._heights: List[float] = [max(float(h), 0.0) for h in heights]
+        offsets = [0.0]
+        for height in self._heights:
+            offsets.append(offsets[-1] + height)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    @property
+    def total_height(self) -> float:
+        return self._offsets[-1]
+
+    def row_top(self, index: int) -> float:
+        return self._offsets[index]
+
+    def row_height(self, index: int) -> float:
+        return self._heights[index]
+
+    def first_visible(self, scroll_y: float) -> int:
+        """Return the first row whose bottom edge is below `scroll_y`."""
+
+        # Row i spans [offsets[i], offsets[i + 1]); find the first bottom
+        # strictly greater than scroll_y.
+        return min(bisect.bisect_right(self._offsets, scroll_y, 1) - 1, len(self))
+
+    def visible_range(self, scroll_y: float, viewport_height: float) -> Tuple[int, int]:
+        start = self.first_visible(scroll_y)
+        bottom = scroll_y + max(viewport_height, 0.0)
+        stop = min(bisect.bisect_right(self._offsets, bottom), len(self))
+        return start, max(start, stop)
+
+    def visible_rows(
+        self, scroll_y: float, viewport_height: float
+    ) -> Iterator[Tuple[int, float]]:
+        """Yield (index, top relative to the viewport) for each visible row."""
+
+        start, stop = self.visible_range(scroll_y, viewport_height)
+        for index in range(start, stop):
+            yield index, self._offsets[index] - scroll_y
+
+
+__all__ = ["RowHeightIndex", "UniformRowIndex"]
@@ -12,6 +12,7 @@ from talon import skia
 from .axisCatalog import axis_catalog
 
 from .canvasFont import apply_canvas_typeface
+from .canvasViewport import RowHeightIndex
 from .overlayHelpers import apply_scroll_delta, clamp_scroll, scroll_fraction
 from .modelState import GPTState
 from .suggestionCoordinator import last_recipe_snapshot, suggestion_grammar_phrase
@@ -140,6 +141,7 @@ _PADDING_Y = 18
 _BUTTON_HEIGHT = 64
 _BUTTON_SPACING = 10
 _SEARCH_ITEM_HEIGHT = 32
+_SEARCH_ITEM_SPACING = 6
 _SCROLL_GUTTER = 20
 _panel_height_px = _PANEL_HEIGHT
 
@@ -148,6 +150,14 @@ def _rgba(r: int, g: int, b: int, a: int = 255) -> int:
     return (r << 24) | (g << 16) | (b << 8) | a
 
 
+def _result_row_height(res: HubButton) -> int:
+    """Height consumed by a search result row, including trailing spacing."""
+    height = _SEARCH_ITEM_HEIGHT
+    if res.voice_hint.strip() or res.description.strip():
+        height += 16
+    return height + _SEARCH_ITEM_SPACING
+
+
 _BACKGROUND_COLOR = _rgba(30, 30, 30, 255)
 _BORDER_COLOR = _rgba(74, 74, 74, 255)
 _BUTTON_COLOR = _rgba(46, 46, 46, 255)
@@ -429,13 +439,11 @@ def _ensure_canvas() -> None:
             ) -> float:
                 """Draw a filtered result row; return the total height consumed."""
                 label = res.label if len(res.label) <= 70 else res.label[:70] + "..."
-                rect_height = _SEARCH_ITEM_HEIGHT
                 hint = res.voice_hint.strip()
                 desc = res.description.strip()
                 has_hint = bool(hint)
                 has_desc = bool(desc)
-                if has_hint or has_desc:
-                    rect_height += 16
+                rect_height = _result_row_height(res) - _SEARCH_ITEM_SPACING
                 rect = skia.Rect(start_x, start_y, content_width, rect_height)
                 _search_bounds[res.label] = rect
                 is_hover = HelpHubState.hover_label == f"res:{res.label}"
@@ -464,14 +472,21 @@ def _ensure_canvas() -> None:
                     ):
                         c.draw_text(wrapped, rect.x + 10, detail_y, detail_paint)
                         detail_y += 16
-                return rect.height + 6
+                return rect.height + _SEARCH_ITEM_SPACING
 
             if filter_query:
                 # Filtered mode: focus on search results only.
                 c.draw_text(f"Filter: {filter_query}", x, y + 40, text_paint)
-                list_y = y + 60
-                for res in _search_results:
-                    list_y += _draw_result_row(res, x, list_y)
+                list_top = y + 60
+                # Only lay out the result rows that intersect the panel.
+                rows = RowHeightIndex(
+                    _result_row_height(res) for res in _search_results
+                )
+                for idx, row_offset in rows.visible_rows(
+                    c.rect.y - list_top, _panel_height_px
+                ):
+                    _draw_result_row(_search_results[idx], x, c.rect.y + row_offset)
+                list_y = list_top + rows.total_height
                 if filter_query and not _search_results:
                     c.draw_text("No results", x, list_y + 16, text_paint)
                 content_bottom = list_y + 10
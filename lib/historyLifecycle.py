@@ -20,6 +20,8 @@ from .requestLog import (
     last_drop_reason as requestlog_last_drop_reason,
     latest as requestlog_latest,
     nth_from_latest as requestlog_nth_from_latest,
+    recent_entries as requestlog_recent_entries,
+    search_history as requestlog_search_history,
     record_gating_drop as requestlog_record_gating_drop,
     set_drop_reason as requestlog_set_drop_reason,
     all_entries as requestlog_all_entries,
@@ -297,6 +299,14 @@ def nth_from_latest(offset: int):
     return requestlog_nth_from_latest(offset)
 
 
+def recent_entries(limit: int, offset: int = 0):
+    return requestlog_recent_entries(limit, offset)
+
+
+def search_history(query: str, *, limit: int = 20, offset: int = 0):
+    return requestlog_search_history(query, limit=limit, offset=offset)
+
+
 def all_entries():
     entries = requestlog_all_entries()
     if isinstance(entries, list):
@@ -312,7 +322,7 @@ def append_entry(*args, **kwargs):
 
 
 def append_history_entry(entry: object) -> None:
-    requestlog_module._history.append(entry)  # type: ignore[attr-defined]
+    requestlog_module.append_history_entry(entry)
 
 
 def append_entry_from_request(**kwargs):
@@ -518,6 +528,8 @@ __all__ = [
     "persona_summary_fragments",
     "latest",
     "nth_from_latest",
+    "recent_entries",
+    "search_history",
     "all_entries",
     "append_entry",
     "append_history_entry",
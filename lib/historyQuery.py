@@ -15,7 +15,6 @@ from .historyLifecycle import (
     KNOWN_AXIS_KEYS,
     HistorySnapshotEntry,
     axes_snapshot_from_axes as _axis_snapshot_from_axes_impl,
-    coerce_history_snapshot_entry as _coerce_history_snapshot_entry,
     history_axes_for as _history_axes_for_impl,
     persona_summary_fragments as _persona_summary_fragments_impl,
 )
@@ -28,18 +27,26 @@ _ALLOWED_HISTORY_AXIS_KEYS = frozenset(KNOWN_AXIS_KEYS)
 class _HistoryEntryView:
     __slots__ = ("_entry", "axes", "persona")
 
-    def __init__(self, entry: object, snapshot: HistorySnapshotEntry) -> None:
+    def __init__(
+        self, entry: object, axes: dict[str, list[str]], persona: dict
+    ) -> None:
         self._entry = entry
-        self.axes = snapshot.axes
-        self.persona = snapshot.persona
+        self.axes = axes
+        self.persona = persona
 
     def __getattr__(self, name: str):
         return getattr(self._entry, name)
 
 
 def _normalise_entry(entry: object) -> _HistoryEntryView:
-    snapshot = _coerce_history_snapshot_entry(entry)
-    return _HistoryEntryView(entry, snapshot)
+    if isinstance(entry, HistorySnapshotEntry):
+        return _HistoryEntryView(entry, entry.axes, entry.persona)
+    # Only axes/persona are normalised here; prompt/response stay on the
+    # wrapped entry so lazily-decoded bodies are not read for summary rows.
+    snapshot = _axis_snapshot_from_axes_impl(getattr(entry, "axes", {}) or {})
+    axes = {key: list(values) for key, values in snapshot.known_axes().items()}
+    persona = dict(getattr(entry, "persona", {}) or {})
+    return _HistoryEntryView(entry, axes, persona)
 
 
 def _ensure_known_axis_keys(entries: Sequence[object]) -> None:
@@ -100,7 +107,11 @@ def history_drawer_entries_from(entries: Sequence[object]) -> List[Tuple[str, st
         if isinstance(axes, dict) and dir_tokens:
             axes = dict(axes)
             axes["directional"] = dir_tokens
-        prompt = (getattr(entry, "prompt", "") or "").strip().splitlines()[0]
+        # Summary rows only need the first prompt line; entries from a
+        # compressed store expose it without decompressing the body.
+        prompt = getattr(entry, "prompt_preview", None)
+        if prompt is None:
+            prompt = (getattr(entry, "prompt", "") or "").strip().splitlines()[0]
         snippet = prompt[:80] + ("…" if len(prompt) > 80 else "")
         duration_ms = getattr(entry, "duration_ms", None)
         dur = f"{duration_ms}ms" if duration_ms is not None else ""
@@ -0,0 +1,320 @@
+"""Full-text and faceted search over request history.
+
+`HistorySearchIndex` keeps an inverted index over entry prompt, response,
+meta and recipe text alongside facet postings (static prompt, axis tokens,
+persona/intent, provider). Queries intersect posting sets instead of scanning
+every entry, rank text matches with a tf-idf score, and page the results.
+
+Document ids mirror history positions: the index is fed entries oldest to
+newest, and history backends only evict from the oldest end, so an entry's
+offset from the latest is `newest_id - doc_id`. `requestLog` keeps the index
+in step with `add` on append and `trim_to(len(history))` after evictions.
+This index serves the in-memory history; the SQLite store answers the same
+queries from its own FTS5 index (`SQLiteRequestHistory.search`).
+
+Query strings accept free text plus `field:value` filters, for example
+`retry budget provider:gemini scope:act since:2025-01-01`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+_WORD_RE = re.compile(r"[0-9a-z]+")
+
+# Facet names accepted in queries -> persona snapshot keys.
+PERSONA_FACETS: Dict[str, str] = {
+    "persona": "persona_preset_key",
+    "voice": "persona_voice",
+    "audience": "persona_audience",
+    "tone": "persona_tone",
+    "intent": "intent_preset_key",
+}
+AXIS_FACETS: Tuple[str, ...] = (
+    "completeness",
+    "scope",
+    "method",
+    "form",
+    "channel",
+    "directional",
+)
+FACET_NAMES: Tuple[str, ...] = ("static", "provider", *AXIS_FACETS, *PERSONA_FACETS)
+# Facets reported with counts alongside results.
+SUMMARY_FACETS: Tuple[str, ...] = ("static", "provider", *AXIS_FACETS)
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(str(text or "").lower())
+
+
+def _static_prompt(entry: object) -> str:
+    recipe = str(getattr(entry, "recipe", "") or "").strip()
+    if not recipe:
+        return ""
+    return recipe.split("·", 1)[0].strip()
+
+
+def entry_facets(entry: object) -> Set[Tuple[str, str]]:
+    """Return the (facet, value) pairs an entry is filed under."""
+    facets: Set[Tuple[str, str]] = set()
+    static_prompt = _static_prompt(entry)
+    if static_prompt:
+        facets.add(("static", static_prompt.lower()))
+    provider = str(getattr(entry, "provider_id", "") or "").strip()
+    if provider:
+        facets.add(("provider", provider.lower()))
+    axes = getattr(entry, "axes", None) or {}
+    if isinstance(axes, Mapping):
+        for axis in AXIS_FACETS:
+            tokens = axes.get(axis) or []
+            if isinstance(tokens, str):
+                tokens = [tokens]
+            for token in tokens:
+                if str(token).strip():
+                    facets.add((axis, str(token).strip().lower()))
+    persona = getattr(entry, "persona", None) or {}
+    if isinstance(persona, Mapping):
+        for name, key in PERSONA_FACETS.items():
+            value = str(persona.get(key) or "").strip()
+            if value:
+                facets.add((name, value.lower()))
+    return facets
+
+
+def _date_ms(value: str, *, end_of_day: bool) -> Optional[int]:
+    try:
+        day = datetime.date.fromisoformat(value)
+    except ValueError:
+        return None
+    moment = datetime.datetime.combine(
+        day, datetime.time.max if end_of_day else datetime.time.min
+    )
+    return int(moment.timestamp() * 1000)
+
+
+@dataclass
+class HistorySearchQuery:
+    text: str = ""
+    facets: Dict[str, str] = field(default_factory=dict)
+    since_ms: Optional[int] = None
+    until_ms: Optional[int] = None
+
+    @classmethod
+    def parse(cls, raw: str) -> "HistorySearchQuery":
+        """Split `field:value` filters (and since:/until: dates) from free text."""
+        words: List[str] = []
+        query = cls()
+        for part in str(raw or "").split():
+            name, sep, value = part.partition(":")
+            name = name.lower()
+            if sep and value:
+                if name in FACET_NAMES:
+                    query.facets[name] = value.lower()
+                    continue
+                if name == "since":
+                    query.since_ms = _date_ms(value, end_of_day=False)
+                    continue
+                if name == "until":
+                    query.until_ms = _date_ms(value, end_of_day=True)
+                    continue
+            words.append(part)
+        query.text = " ".join(words)
+        return query
+
+
+@dataclass(frozen=True)
+class HistorySearchHit:
+    entry: Any
+    offset: int
+    score: float
+
+
+@dataclass(frozen=True)
+class HistorySearchPage:
+    hits: List[HistorySearchHit]
+    total: int
+    offset: int
+    limit: int
+    facet_counts: Dict[str, List[Tuple[str, int]]]
+
+
+class HistorySearchIndex:
+    """Inverted text index plus facet postings over history entries."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._next_id = 0
+        self._oldest_id = 0
+        self._entries: Dict[int, Any] = {}
+        self._lengths: Dict[int, int] = {}
+        self._started: Dict[int, Optional[int]] = {}
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_facets: Dict[int, Set[Tuple[str, str]]] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._facet_postings: Dict[Tuple[str, str], Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def newest_id(self) -> int:
+        return self._next_id - 1
+
+    def latest(self) -> Optional[Any]:
+        return self._entries.get(self.newest_id)
+
+    def rebuild(self, entries: Iterable[object]) -> None:
+        """Index `entries` from oldest to newest, replacing current content."""
+        self.clear()
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: object) -> int:
+        doc_id = self._next_id
+        self._next_id += 1
+        text = " ".join(
+            str(getattr(entry, name, "") or "")
+            for name in ("prompt", "response", "meta", "recipe")
+        )
+        terms = Counter(tokenize(text))
+        facets = entry_facets(entry)
+        self._entries[doc_id] = entry
+        self._lengths[doc_id] = sum(terms.values())
+        started = getattr(entry, "started_at_ms", None)
+        self._started[doc_id] = started if isinstance(started, int) else None
+        self._doc_terms[doc_id] = terms
+        self._doc_facets[doc_id] = facets
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = count
+        for facet in facets:
+            self._facet_postings.setdefault(facet, set()).add(doc_id)
+        return doc_id
+
+    def trim_to(self, size: int) -> None:
+        """Drop the oldest documents so at most `size` remain."""
+        cutoff = self._next_id - max(size, 0)
+        while self._oldest_id < cutoff:
+            self._remove(self._oldest_id)
+            self._oldest_id += 1
+
+    def _remove(self, doc_id: int) -> None:
+        if self._entries.pop(doc_id, None) is None:
+            return
+        self._lengths.pop(doc_id, None)
+        self._started.pop(doc_id, None)
+        for term in self._doc_terms.pop(doc_id, {}):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        for facet in self._doc_facets.pop(doc_id, set()):
+            docs = self._facet_postings.get(facet)
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del self._facet_postings[facet]
+
+    def search(
+        self, query: "HistorySearchQuery | str", *, limit: int = 20, offset: int = 0
+    ) -> HistorySearchPage:
+        if isinstance(query, str):
+            query = HistorySearchQuery.parse(query)
+        terms = list(dict.fromkeys(tokenize(query.text)))
+
+        # Walk the smallest posting list and probe the others in place, so
+        # no posting collection is copied per query.
+        postings: List[Collection[int]] = []
+        for name, value in query.facets.items():
+            postings.append(self._facet_postings.get((name, value), ()))
+        for term in terms:
+            postings.append(self._postings.get(term, {}))
+        if postings:
+            postings.sort(key=len)
+            smallest, rest = postings[0], postings[1:]
+            candidates: Iterable[int] = [
+                doc_id
+                for doc_id in smallest
+                if all(doc_id in docs for docs in rest)
+            ]
+        else:
+            candidates = self._entries
+
+        if query.since_ms is not None or query.until_ms is not None:
+            low = query.since_ms if query.since_ms is not None else -math.inf
+            high = query.until_ms if query.until_ms is not None else math.inf
+            candidates = [
+                doc_id
+                for doc_id in candidates
+                if self._started.get(doc_id) is not None
+                and low <= self._started[doc_id] <= high  # type: ignore[operator]
+            ]
+
+        scored: List[Tuple[float, int]] = []
+        total_docs = max(len(self._entries), 1)
+        for doc_id in candidates:
+            score = 0.0
+            for term in terms:
+                postings = self._postings[term]
+                tf = postings[doc_id]
+                idf = math.log(1.0 + total_docs / len(postings))
+                score += (1.0 + math.log(tf)) * idf
+            if terms:
+                score /= math.sqrt(max(self._lengths.get(doc_id, 1), 1))
+            scored.append((score, doc_id))
+        # Best score first; newest first among ties (and for filter-only queries).
+        scored.sort(key=lambda item: (-item[0], -item[1]))
+
+        counts: Dict[str, Counter] = {name: Counter() for name in SUMMARY_FACETS}
+        for _, doc_id in scored:
+            for name, value in self._doc_facets.get(doc_id, ()):
+                if name in counts:
+                    counts[name][value] += 1
+
+        start = max(offset, 0)
+        page = scored[start : start + max(limit, 0)]
+        hits = [
+            HistorySearchHit(
+                entry=self._entries[doc_id],
+                offset=self.newest_id - doc_id,
+                score=score,
+            )
+            for score, doc_id in page
+        ]
+        return HistorySearchPage(
+            hits=hits,
+            total=len(scored),
+            offset=start,
+            limit=limit,
+            facet_counts={
+                name: counter.most_common() for name, counter in counts.items() if counter
+            },
+        )
+
+
+__all__ = [
+    "FACET_NAMES",
+    "HistorySearchHit",
+    "HistorySearchIndex",
+    "HistorySearchPage",
+    "HistorySearchQuery",
+    "entry_facets",
+    "tokenize",
+]
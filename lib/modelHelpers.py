@@ -5,12 +5,14 @@ All functions in this file have impure dependencies on either the model or the T
 """
 
 import base64
+import hashlib
 import json
 import os
 import re
 import traceback
 import time
 import codecs
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Literal, List, Sequence, Optional, Union
 
 import requests
@@ -43,6 +45,7 @@ from .historyLifecycle import (
     reduce_request_state,
 )
 from .uiDispatch import run_on_ui_thread
+from .canvasRefreshScheduler import CanvasRefreshScheduler
 from .streamingCoordinator import (
     new_streaming_session,
     StreamingSession,
@@ -56,6 +59,21 @@ from .providerRegistry import (
     provider_tokens_setting,
 )
 from .providerCanvas import show_provider_canvas
+from .providerTransport import provider_transport
+from .responseCache import (
+    lookup_cached_response,
+    response_cache_key_for,
+    store_cached_response,
+)
+from .modelLog import DEBUG, get_logger
+from .streamingToolCalls import StreamingToolCallAssembler
+from .requestTracing import (
+    bind_pending_spans,
+    end_span,
+    start_span,
+    trace_event,
+    trace_span,
+)
 from .axisCatalog import axis_catalog
 import threading
 
@@ -78,28 +96,48 @@ def _set_active_response(resp):
         _active_response = resp
 
 
+# Responses of detached sends (fan-out delegates) in flight. They never touch
+# the single active-response slot, but cancel closes them too.
+_detached_responses: set = set()
+
+
 def cancel_active_request():
-    """Best-effort: close any in-flight HTTP response."""
+    """Best-effort: close any in-flight HTTP response, detached ones included."""
     global _active_response
     with _active_response_lock:
         resp = _active_response
         _active_response = None
-    try:
-        if resp is not None:
-            resp.close()
-    except Exception:
-        pass
+        detached = list(_detached_responses)
+        _detached_responses.clear()
+    for response in [resp, *detached]:
+        try:
+            if response is not None:
+                response.close()
+        except Exception:
+            pass
 
 
 # --- Context class for tool call control ---
 class ModelHelpersContext:
     def __init__(self):
         self.total_tool_calls = 0
+        self._tool_call_lock = threading.Lock()
+
+    def reserve_tool_call(self, limit: int) -> bool:
+        """Atomically claim one slot of the per-request tool call budget."""
+        with self._tool_call_lock:
+            if self.total_tool_calls >= limit:
+                return False
+            self.total_tool_calls += 1
+            return True
+
+
+_logger = get_logger("modelHelpers")
 
 
 def _log(message: str):
     """Simple logger for debug and error messages."""
-    print(f"[modelHelpers] {message}")
+    _logger.info(message)
 
 
 MAX_TOTAL_CALLS = settings.get("user.gpt_max_total_calls", 3)
@@ -288,6 +326,64 @@ def _refresh_response_canvas() -> None:
     run_on_ui_thread(_open_and_refresh)
 
 
+def _meta_update_throttled(
+    meta_throttle_ms: Optional[int], last_meta_update_ms: Optional[list[int]]
+) -> bool:
+    """Return True when a meta update ran within the throttle window."""
+
+    if meta_throttle_ms is None or last_meta_update_ms is None:
+        return False
+    last = last_meta_update_ms[0] if last_meta_update_ms else 0
+    if not last:
+        return False
+    now_ms = int(time.time() * 1000)
+    return now_ms - last < meta_throttle_ms
+
+
+def _apply_stream_split(
+    answer: str,
+    meta: str,
+    meta_throttle_ms: Optional[int] = None,
+    last_meta_update_ms: Optional[list[int]] = None,
+) -> None:
+    GPTState.text_to_confirm = answer
+
+    # Keep the streaming snapshot text aligned with the meta-stripped
+    # answer so any canvas using the snapshot (for example, the response
+    # viewer's inflight progress path) does not briefly render the meta
+    # section as part of the main response.
+    try:
+        snap = getattr(GPTState, "last_streaming_snapshot", None)
+    except Exception:
+        snap = None
+    if isinstance(snap, dict):
+        # Publish a new dict rather than editing the shared snapshot, so
+        # callers holding the previous one do not see it change under them.
+        updated = dict(snap)
+        if answer:
+            updated["text"] = answer
+        else:
+            # Preserve whatever text was already present when we don't have
+            # a better split (for example, when the buffer is empty).
+            updated["text"] = str(updated.get("text", ""))
+        try:
+            GPTState.last_streaming_snapshot = updated
+        except Exception:
+            pass
+
+    if meta:
+        if meta_throttle_ms is not None and last_meta_update_ms is not None:
+            now_ms = int(time.time() * 1000)
+            last = last_meta_update_ms[0] if last_meta_update_ms else 0
+            if last and now_ms - last < meta_throttle_ms:
+                return
+            if last_meta_update_ms:
+                last_meta_update_ms[0] = now_ms
+            else:
+                last_meta_update_ms.append(now_ms)
+        GPTState.last_meta = meta
+
+
 def _update_stream_state_from_text(
     full_text: str,
     meta_throttle_ms: Optional[int] = None,
@@ -307,53 +403,36 @@ def _update_stream_state_from_text(
         # When meta updates are throttled and we've updated recently, skip the
         # split entirely to avoid redundant parsing work while the answer is
         # stable and only meta is streaming in.
-        if meta_throttle_ms is not None and last_meta_update_ms is not None:
-            last = last_meta_update_ms[0] if last_meta_update_ms else 0
-            if last:
-                now_ms = int(time.time() * 1000)
-                if now_ms - last < meta_throttle_ms:
-                    return
-
+        if _meta_update_throttled(meta_throttle_ms, last_meta_update_ms):
+            return
         answer, meta = split_answer_and_meta(full_text)
-        GPTState.text_to_confirm = answer
-
-        # Keep the streaming snapshot text aligned with the meta-stripped
-        # answer so any canvas using the snapshot (for example, the response
-        # viewer's inflight progress path) does not briefly render the meta
-        # section as part of the main response.
-        try:
-            snap = getattr(GPTState, "last_streaming_snapshot", None)
-        except Exception:
-            snap = None
-        if isinstance(snap, dict):
-            updated = dict(snap)
-            if answer:
-                updated["text"] = answer
-            else:
-                # Preserve whatever text was already present when we don't have
-                # a better split (for example, when the buffer is empty).
-                updated["text"] = str(updated.get("text", ""))
-            try:
-                GPTState.last_streaming_snapshot = updated
-            except Exception:
-                pass
-
-        if meta:
-            if meta_throttle_ms is not None and last_meta_update_ms is not None:
-                now_ms = int(time.time() * 1000)
-                last = last_meta_update_ms[0] if last_meta_update_ms else 0
-                if last and now_ms - last < meta_throttle_ms:
-                    return
-                if last_meta_update_ms:
-                    last_meta_update_ms[0] = now_ms
-                else:
-                    last_meta_update_ms.append(now_ms)
-            GPTState.last_meta = meta
+        _apply_stream_split(answer, meta, meta_throttle_ms, last_meta_update_ms)
     except Exception:
         # Fall back to the raw text if splitting fails so we still surface progress.
         GPTState.text_to_confirm = full_text
 
 
+def _update_stream_state_from_splitter(
+    splitter: "StreamingAnswerMetaSplitter",
+    chunks: Sequence[str],
+    meta_throttle_ms: Optional[int] = None,
+    last_meta_update_ms: Optional[list[int]] = None,
+) -> None:
+    """Incremental variant of `_update_stream_state_from_text` for live streams.
+
+    Only chunks the splitter has not yet consumed are scanned, so the per-chunk
+    cost stays flat as the response grows.
+    """
+    try:
+        if _meta_update_throttled(meta_throttle_ms, last_meta_update_ms):
+            return
+        splitter.sync(chunks)
+        answer, meta = splitter.split()
+        _apply_stream_split(answer, meta, meta_throttle_ms, last_meta_update_ms)
+    except Exception:
+        GPTState.text_to_confirm = splitter.text
+
+
 def messages_to_string(
     messages: Sequence[Union[GPTTextItem, GPTImageItem]],
 ) -> str:
@@ -367,6 +446,14 @@ def messages_to_string(
     return "\n\n".join(formatted_messages)
 
 
+# Match a 'Model interpretation' heading whether or not Markdown '#' markers
+# are still present (some callers strip Markdown before splitting).
+_META_HEADING_PATTERN = re.compile(r"(?:#+\s*)?model interpretation\b", re.IGNORECASE)
+# The heading text without optional markers; any full heading match contains it.
+_META_HEADING_CORE_PATTERN = re.compile(r"model interpretation\b", re.IGNORECASE)
+_META_HEADING_CORE_LEN = len("model interpretation")
+
+
 def split_answer_and_meta(text: str) -> tuple[str, str]:
     """
     Split a raw assistant response into primary answer text and an optional
@@ -389,11 +476,8 @@ def split_answer_and_meta(text: str) -> tuple[str, str]:
     split_line_idx: int | None = None
     split_col: int | None = None
 
-    # Match a 'Model interpretation' heading whether or not Markdown '#' markers
-    # are still present (some callers strip Markdown before splitting).
-    heading_pattern = re.compile(r"(?:#+\s*)?model interpretation\b", re.IGNORECASE)
     for idx, line in enumerate(lines):
-        match = heading_pattern.search(line)
+        match = _META_HEADING_PATTERN.search(line)
         if match:
             split_line_idx = idx
             split_col = match.start()
@@ -422,6 +506,110 @@ def split_answer_and_meta(text: str) -> tuple[str, str]:
     return answer, meta
 
 
+class _TextBuffer:
+    """A string grown from appended deltas.
+
+    `append` only records the delta. Reading `text` appends the deltas that
+    arrived since the previous read to the cached string and returns it, so
+    nothing already read is joined again.
+    """
+
+    __slots__ = ("_text", "_pending")
+
+    def __init__(self, text: str = "") -> None:
+        self._text = text
+        self._pending: list[str] = []
+
+    def append(self, delta: str) -> None:
+        self._pending.append(delta)
+
+    @property
+    def text(self) -> str:
+        if self._pending:
+            pending = self._pending
+            self._text += pending[0] if len(pending) == 1 else "".join(pending)
+            pending.clear()
+        return self._text
+
+
+class StreamingAnswerMetaSplitter:
+    """Incremental `split_answer_and_meta` for streamed responses.
+
+    The text and, once found, the meta section are `_TextBuffer`s: feeding a
+    chunk never copies the text received so far, and reading the split only
+    appends the chunks that arrived since the previous read. Each delta is
+    scanned together with a carry-over window of the last few characters, so
+    a heading split across chunks is still detected. Once the 'Model
+    interpretation' heading is confirmed (its trailing word boundary has
+    arrived), the answer is frozen and later deltas go to the meta buffer.
+    Results always match `split_answer_and_meta` over the full text.
+    """
+
+    def __init__(self) -> None:
+        self._text = _TextBuffer()
+        # Last `_META_HEADING_CORE_LEN` characters, for cross-chunk matches.
+        self._tail = ""
+        self._answer = ""
+        self._meta: Optional[_TextBuffer] = None
+        self._has_content = False
+        self._chunks_consumed = 0
+        self._provisional: Optional[tuple[str, str]] = None
+
+    @property
+    def text(self) -> str:
+        return self._text.text
+
+    @property
+    def split_found(self) -> bool:
+        return self._meta is not None
+
+    def feed(self, delta: str) -> None:
+        if not delta:
+            return
+        self._text.append(delta)
+        self._provisional = None
+        if self._meta is not None:
+            self._meta.append(delta)
+            return
+        if not self._has_content and delta.strip():
+            self._has_content = True
+        window = self._tail + delta
+        self._tail = window[-_META_HEADING_CORE_LEN:]
+        match = _META_HEADING_CORE_PATTERN.search(window)
+        if match is None:
+            return
+        if match.end() == len(window):
+            # The word boundary after the heading is not confirmed yet (for
+            # example, 'interpretation' may still become 'interpretations'),
+            # so report the split provisionally without freezing the answer.
+            # The heading stays inside the carry-over window for the next
+            # delta to confirm.
+            self._provisional = split_answer_and_meta(self.text)
+            return
+        # Resolve the exact boundary (including any '#' markers) once.
+        self._answer, meta = split_answer_and_meta(self.text)
+        self._meta = _TextBuffer(meta)
+
+    def sync(self, chunks: Sequence[str]) -> "StreamingAnswerMetaSplitter":
+        """Feed any chunks appended since the last sync."""
+
+        total = len(chunks)
+        if total > self._chunks_consumed:
+            for chunk in chunks[self._chunks_consumed :]:
+                self.feed(chunk)
+            self._chunks_consumed = total
+        return self
+
+    def split(self) -> tuple[str, str]:
+        if self._meta is not None:
+            return self._answer, self._meta.text
+        if self._provisional is not None:
+            return self._provisional
+        if not self._has_content:
+            return "", ""
+        return self.text, ""
+
+
 def chats_to_string(chats: Sequence[Union[GPTMessage, GPTTool]]) -> str:
     """Format thread as a string"""
     formatted_messages = []
@@ -624,6 +812,28 @@ def provider_endpoint(provider: ProviderConfig) -> str:
     return provider.endpoint or OPENAI_ENDPOINT
 
 
+def prewarm_provider_connection() -> bool:
+    """Opt-in: warm the pooled connection to the active provider in the background.
+
+    Called as soon as a spoken prompt starts resolving so the TCP+TLS handshake
+    overlaps with prompt assembly (`build_request`, source formatting) rather
+    than adding to time-to-first-token.
+    """
+
+    try:
+        if not int(settings.get("user.model_http_prewarm", 0) or 0):
+            return False
+    except Exception:
+        return False
+    try:
+        provider = provider_registry().active_provider()
+        url = provider_endpoint(provider)
+        return provider_transport().prewarm(provider.id, url) is not None
+    except Exception as error:
+        _log(f"provider prewarm failed: {error}")
+        return False
+
+
 def _show_provider_error(
     message: str, provider_id: str, api_key_env: str, *, hint: Optional[str] = None
 ) -> None:
@@ -779,6 +989,64 @@ def _build_timeout_context() -> Optional[str]:
     )
 
 
+def _prompt_cache_layout_enabled() -> bool:
+    try:
+        return bool(settings.get("user.model_prompt_cache_layout", 0))
+    except Exception:
+        return False
+
+
+def prompt_prefix_hash(request: GPTRequest, prefix_len: int) -> str:
+    """Hash the model, tools and leading messages a provider can cache."""
+    payload = {
+        "model": request.get("model", ""),
+        "tools": request.get("tools") or [],
+        "messages": list(request.get("messages", []))[: max(prefix_len, 0)],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def apply_prompt_cache_layout() -> None:
+    """Lay out GPTState.request with a stable, cacheable prefix (opt-in).
+
+    With `user.model_prompt_cache_layout` enabled, `build_request` holds back
+    the per-request context (focused app, language, timeout, stored context).
+    Here system prompt messages move to the front, thread/query history keeps
+    its order, and the held-back context is inserted just before the current
+    user turn. Repeat commands then share a byte-identical prefix that
+    providers with prefix caching can reuse. The prefix hash is stored on
+    GPTState.request_prompt_prefix so the streaming session can record it.
+
+    If the setting was turned off after `build_request` held the context
+    back, the context goes back in front, where the legacy layout puts it.
+    """
+    enabled = _prompt_cache_layout_enabled()
+    volatile = [line for line in (GPTState.request_volatile_context or []) if line]
+    GPTState.request_volatile_context = []
+    request = GPTState.request
+    volatile_messages = (
+        [{"role": "system", "content": "\n\n".join(volatile)}] if volatile else []
+    )
+    if not enabled:
+        if volatile_messages:
+            request["messages"] = volatile_messages + list(request.get("messages", []))
+        GPTState.request_prompt_prefix = {}
+        return
+    messages = list(request.get("messages", []))
+    system_messages = [m for m in messages if m.get("role") == "system"]
+    history = [m for m in messages if m.get("role") != "system"]
+    current_turn = []
+    if history and history[-1].get("role") == "user":
+        current_turn = [history.pop()]
+    prefix = system_messages + history
+    request["messages"] = prefix + volatile_messages + current_turn
+    GPTState.request_prompt_prefix = {
+        "hash": prompt_prefix_hash(request, len(prefix)),
+        "messages": len(prefix),
+    }
+
+
 def _build_request_context(destination: object) -> list[str]:
     """Build the list of system messages for the request context."""
     destination_str = destination if isinstance(destination, str) else ""
@@ -867,41 +1135,37 @@ BUILTIN_ASK_CHATGPT_TOOL = {
 
 def build_request(destination: object):
     """Orchestrate the GPT request build process."""
+    with trace_span("build_request") as span:
+        _build_request(destination)
+        if span is not None:
+            span.attrs["destination_kind"] = GPTState.current_destination_kind
+
+
+def _build_request(destination: object) -> None:
     notify(_build_request_notification())
     surface = prepare_destination_surface(destination)
     kind = surface.get("kind") or _destination_kind(destination)
-    try:
-        print(f"[modelHelpers] build_request destination kind={kind}")
-    except Exception:
-        pass
+    _logger.debug("build_request destination kind=%s", kind)
     try:
         debug_enabled = bool(getattr(GPTState, "debug_enabled", False))
     except Exception:
         debug_enabled = False
     if debug_enabled:
-        try:
-            print(
-                "[modelHelpers] inside_textarea check "
-                f"kind={surface.get('original_kind')} "
-                f"result={surface.get('inside_textarea')}"
-            )
-            print(
-                "[modelHelpers] destination surface"
-                f" kind={surface.get('original_kind')} "
-                f"inside_textarea={surface.get('inside_textarea')} "
-                f"canvas_open={surface.get('canvas_open')} "
-                f"promoted={surface.get('promoted_to_window')}"
-            )
-        except Exception:
-            pass
+        _logger.info(
+            "inside_textarea check kind=%s result=%s",
+            surface.get("original_kind"),
+            surface.get("inside_textarea"),
+        )
+        _logger.info(
+            "destination surface kind=%s inside_textarea=%s canvas_open=%s "
+            "promoted=%s",
+            surface.get("original_kind"),
+            surface.get("inside_textarea"),
+            surface.get("canvas_open"),
+            surface.get("promoted_to_window"),
+        )
     if surface.get("promoted_to_window"):
-        try:
-            print(
-                "[modelHelpers] promotion: using response canvas instead of paste "
-                f"(kind={kind})"
-            )
-        except Exception:
-            pass
+        _logger.debug("promotion: using response canvas instead of paste (kind=%s)", kind)
     try:
         GPTState.current_destination_kind = kind
     except Exception:
@@ -921,6 +1185,13 @@ def build_request(destination: object):
     GPTState.tools = all_tools
     provider = active_provider()
     GPTState.request_provider = provider
+    if _prompt_cache_layout_enabled():
+        # Volatile context goes after the stable prefix; see
+        # apply_prompt_cache_layout.
+        GPTState.request_volatile_context = full_system_messages
+        full_system_messages = []
+    else:
+        GPTState.request_volatile_context = []
     GPTState.request = build_chatgpt_request(
         user_messages=GPTState.thread or [],
         system_messages=full_system_messages,
@@ -937,7 +1208,7 @@ def call_tool(
     tool_id: str, function_name: str, arguments: str
 ) -> Union[GPTMessage, GPTTool]:
     """Call a tool and return a valid response message (tool or assistant)"""
-    if context.total_tool_calls >= MAX_TOTAL_CALLS:
+    if not context.reserve_tool_call(MAX_TOTAL_CALLS):
         content = "Error: total tool call limit exceeded."
         notify(content)
         return format_messages("assistant", [format_message(content)])
@@ -963,7 +1234,7 @@ def call_tool(
             )
             user_message = [format_messages("user", [format_message(prompt)])]
             nested_request = build_chatgpt_request(user_message, [system_msg])
-            response = send_request_internal(nested_request)
+            response = send_request_internal(nested_request, detached=True)
 
             message_response = response["choices"][0]["message"]
             message_content = message_response.get("content", "")
@@ -988,8 +1259,94 @@ def call_tool(
     except Exception as e:
         notify(f"Error in call_tool for {function_name}: {e}\n{traceback.format_exc()}")
         return format_messages("assistant", [format_message(f"Tool call error: {e}")])
-    finally:
-        context.total_tool_calls += 1
+
+
+def _tool_call_concurrency() -> int:
+    try:
+        return max(1, int(settings.get("user.model_tool_call_concurrency", 4)))
+    except Exception:
+        return 1
+
+
+class ToolCallRunner:
+    """Runs tool calls on a bounded pool as they become ready.
+
+    `submit` starts a call immediately (inline when the pool size is 1);
+    `results` waits for all of them and returns their messages in submission
+    order. `call_tool` claims the MAX_TOTAL_CALLS budget atomically, so the
+    limit holds across workers.
+    """
+
+    def __init__(self, request_id: Optional[str] = None, max_workers: int = 0):
+        self._request_id = request_id
+        self._max_workers = max_workers or _tool_call_concurrency()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def _run(
+        self, index: int, tool_id: str, function_name: str, arguments: str
+    ) -> Union[GPTMessage, GPTTool]:
+        with trace_span(
+            "tool_call", self._request_id, tool=function_name, index=index
+        ):
+            return call_tool(tool_id, function_name, arguments)
+
+    def submit(self, tool_id: str, function_name: str, arguments: str) -> None:
+        notify(f"Calling the tool {function_name} with arguments {arguments}")
+        index = len(self._futures)
+        if self._max_workers <= 1:
+            future: Future = Future()
+            try:
+                future.set_result(self._run(index, tool_id, function_name, arguments))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="model-tool"
+                )
+            future = self._pool.submit(
+                self._run, index, tool_id, function_name, arguments
+            )
+        self._futures.append(future)
+
+    def results(self) -> List[Union[GPTMessage, GPTTool]]:
+        try:
+            return [future.result() for future in self._futures]
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Cancel calls that have not started and release the pool.
+
+        Safe to call more than once; `results` calls it when it is done.
+        """
+        for future in self._futures:
+            future.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def run_tool_calls(
+    tool_calls: Sequence[dict], request_id: Optional[str] = None
+) -> List[Union[GPTMessage, GPTTool]]:
+    """Run one model turn's tool calls concurrently; messages keep call order."""
+    calls = list(tool_calls or [])
+    runner = ToolCallRunner(
+        request_id, max_workers=min(_tool_call_concurrency(), len(calls))
+    )
+    for tool_call in calls:
+        function = tool_call.get("function") or {}
+        runner.submit(
+            tool_call.get("id", ""),
+            function.get("name", ""),
+            function.get("arguments", ""),
+        )
+    return runner.results()
 
 
 class CancelledRequest(RuntimeError):
@@ -1007,12 +1364,18 @@ class UnsupportedProviderCapability(ProviderError):
         self.feature = feature
 
 
-def _send_request_streaming(request, request_id: str) -> str:
-    """Stream a response and append deltas into GPTState.text_to_confirm."""
-    try:
-        print("[modelHelpers] streaming entry")
-    except Exception:
-        pass
+def _send_request_streaming(request, request_id: str, *, tool_turn: int = 0) -> str:
+    """Stream a response and append deltas into GPTState.text_to_confirm.
+
+    Tool calls in the stream are assembled from `delta.tool_calls` fragments
+    and started as soon as each one is complete; their results are sent back
+    as a follow-up turn (`tool_turn` counts those turns). Follow-up turns
+    stream into the same session, so the canvas and the returned answer carry
+    on from the previous turn's text after a blank line. Each turn's
+    assistant and tool messages are appended to `request`. Once the turn
+    budget is spent, further calls are not started.
+    """
+    _logger.debug("streaming entry")
 
     managed_externally = False
     lifecycle = RequestLifecycleState()
@@ -1043,10 +1406,17 @@ def _send_request_streaming(request, request_id: str) -> str:
     provider = bound_provider()
     _ensure_request_supported(provider, request)
     try:
-        TOKEN = get_token(provider)
-    except MissingAPIKeyError:
-        _show_provider_error("Missing API key", provider.id, provider.api_key_env)
-        raise
+        cache_key = response_cache_key_for(provider, request)
+        cached_chunks = lookup_cached_response(cache_key)
+    except Exception:
+        cache_key, cached_chunks = None, None
+    TOKEN = ""
+    if cached_chunks is None:
+        try:
+            TOKEN = get_token(provider)
+        except MissingAPIKeyError:
+            _show_provider_error("Missing API key", provider.id, provider.api_key_env)
+            raise
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {TOKEN}",
@@ -1054,22 +1424,34 @@ def _send_request_streaming(request, request_id: str) -> str:
     url: str = provider_endpoint(provider)  # type: ignore
     timeout_seconds: int = settings.get("user.model_request_timeout_seconds", 120)  # type: ignore
 
-    decoder = codecs.getincrementaldecoder("utf-8")()
     session: StreamingSession = new_streaming_session(request_id)
     streaming_run: StreamingRun = session.run
     try:
         session.set_axes_from_request(request)
     except Exception:
         pass
+    try:
+        prompt_prefix = getattr(GPTState, "request_prompt_prefix", None) or {}
+        if prompt_prefix.get("hash"):
+            session.record_prompt_prefix(
+                prefix_hash=str(prompt_prefix["hash"]),
+                messages=int(prompt_prefix.get("messages") or 0),
+            )
+    except Exception:
+        pass
     parts: list[str] = streaming_run.chunks
 
     def _update_streaming_snapshot() -> None:
         session.record_snapshot()
 
     session.record_snapshot()
+    splitter = StreamingAnswerMetaSplitter()
     first_chunk = True
-    refresh_interval_ms = 250
-    last_canvas_refresh_ms = 0
+    # Where the current turn's text starts in the run's text, and whether a
+    # blank line is still owed between it and the previous turn's text.
+    turn_offset = 0
+    separator_pending = False
+    meta_throttle_ms = 250
     last_meta_refresh_ms = [0]
     emit_begin_stream(request_id=request_id)
     # Seed the meta section at the top of the response so the layout stays
@@ -1086,21 +1468,12 @@ def _send_request_streaming(request, request_id: str) -> str:
         except Exception:
             pass
 
-    try:
-        print(
-            f"[modelHelpers] streaming path engaged url={url} "
-            f"timeout={timeout_seconds}s"
-        )
-    except Exception:
-        pass
+    _logger.debug("streaming path engaged url=%s timeout=%ss", url, timeout_seconds)
 
     def _handle_streaming_error(exc: Exception) -> None:
         _update_lifecycle("error")
         emit_fail(str(exc), request_id=request_id)
-        try:
-            print(f"[modelHelpers] streaming error; falling back: {exc!r}")
-        except Exception:
-            pass
+        _logger.warning("streaming error; falling back: %r", exc)
 
     def _raise_cancel(*, source: str, emit_cancel_event: bool) -> None:
         """Record cancel state, clean up, and raise CancelledRequest."""
@@ -1126,319 +1499,425 @@ def _send_request_streaming(request, request_id: str) -> str:
         _update_lifecycle("cancel")
         raise CancelledRequest()
 
-    # Explicitly request streaming from the API; some endpoints require the
-    # `stream` flag in the JSON payload as well as an HTTP streaming response.
-    request_with_stream = dict(request)
-    request_with_stream["stream"] = True
+    def _refresh_canvas_on_ui_thread() -> None:
+        with trace_span("canvas_refresh", request_id):
+            actions.user.model_response_canvas_refresh()
 
-    try:
-        raw_response = requests.post(
-            url,
-            headers=headers,
-            json=request_with_stream,
-            timeout=timeout_seconds,
-            stream=True,
-        )
-        _set_active_response(raw_response)
-        raw_response_closed = False
+    refresh_scheduler = CanvasRefreshScheduler(
+        _refresh_canvas_on_ui_thread,
+        should_refresh=_should_refresh_canvas_now,
+        dispatch=run_on_ui_thread,
+        on_requested=session.record_ui_refresh_requested,
+        on_executed=session.record_ui_refresh_executed,
+    )
 
-        def _close_raw_response() -> None:
-            nonlocal raw_response_closed
-            if raw_response_closed:
-                return
-            raw_response_closed = True
-            try:
-                raw_response.close()
-            except Exception:
-                pass
+    def _with_turn_separator(text_piece: str) -> str:
+        nonlocal separator_pending, turn_offset
+        if not separator_pending or not text_piece.strip():
+            return text_piece
+        separator_pending = False
+        turn_offset = streaming_run.length + 2
+        return "\n\n" + text_piece
 
-        try:
-            print("[modelHelpers] streaming request started")
-            content_type = raw_response.headers.get("content-type", "")
-            if content_type and "text/event-stream" not in content_type.lower():
-                print(
-                    f"[modelHelpers] streaming requested but content-type='{content_type}'; "
-                    "response may be buffered"
-                )
-                # If the server ignored streaming, parse the full JSON body once
-                # and return immediately to avoid consuming the stream iterator.
-                try:
-                    parsed_full = raw_response.json()
-                    if raw_response.status_code != 200:
-                        error_info = parsed_full or raw_response.text
-                        session.record_error(f"HTTP {raw_response.status_code}")
-                        session.record_snapshot()
-                        notify(
-                            f"GPT Failure: HTTP {raw_response.status_code} | {error_info}"
-                        )
-                        raise GPTRequestError(raw_response.status_code, error_info)
-                    text_piece = (
-                        parsed_full.get("choices", [{}])[0]
-                        .get("message", {})
-                        .get("content", "")
-                    )
-                    if text_piece:
-                        session.record_chunk(text_piece)
-                    full_text = streaming_run.text
-                    _update_stream_state_from_text(
-                        full_text,
-                        meta_throttle_ms=refresh_interval_ms,
-                        last_meta_update_ms=last_meta_refresh_ms,
-                    )
-                    _update_lifecycle("stream_start")
-                    _update_lifecycle("stream_end")
-                    if _should_refresh_canvas_now():
-                        try:
-                            session.record_ui_refresh_requested(
-                                forced=True, reason="canvas_refresh"
-                            )
-                        except Exception:
-                            pass
-                        _refresh_response_canvas()
-                    try:
-                        print(
-                            "[modelHelpers] non-stream response parsed via json(), "
-                            f"len={len(text_piece or '')}"
-                        )
-                    except Exception:
-                        pass
-                    session.record_complete()
-                    answer_text = full_text
-                    GPTState.last_raw_response = parsed_full
-                    _set_active_response(None)
-                    _close_raw_response()
-                    return answer_text
-                except Exception as e:
-                    print(f"[modelHelpers] non-stream parse failed: {e!r}")
-                    traceback.print_exc()
-        except Exception:
-            pass
-    except requests.exceptions.Timeout:
-        error_msg = f"Request timed out after {timeout_seconds} seconds"
-        notify(f"GPT Failure: {error_msg}")
-        err = GPTRequestError(408, error_msg)
-        session.record_error(error_msg)
-        _handle_streaming_error(err)
-        raise err
-    except Exception as e:
-        print(f"[modelHelpers] streaming requests.post failed: {e!r}")
-        traceback.print_exc()
-        session.record_error(str(e))
-        _handle_streaming_error(e)
-        raise
-    if raw_response.status_code != 200:
-        error_info = None
-        try:
-            error_info = raw_response.json()
-        except Exception:
-            error_info = raw_response.text
-        session.record_error(f"HTTP {raw_response.status_code}")
-        notify(f"GPT Failure: HTTP {raw_response.status_code} | {error_info}")
-        _close_raw_response()
-        raise GPTRequestError(raw_response.status_code, error_info)
-
-    def _maybe_refresh_canvas(force: bool = False) -> None:
-        nonlocal last_canvas_refresh_ms
-        if not _should_refresh_canvas_now():
-            return
-        now_ms = int(time.time() * 1000)
-        throttled = (
-            not force
-            and last_canvas_refresh_ms
-            and now_ms - last_canvas_refresh_ms < refresh_interval_ms
-        )
-        if throttled:
-            try:
-                session.record_ui_refresh_requested(forced=force, reason="throttled")
-            except Exception:
-                pass
-            return
-        try:
-            session.record_ui_refresh_requested(forced=force, reason="canvas_refresh")
-        except Exception:
-            pass
-        try:
-            actions.user.model_response_canvas_refresh()
-            last_canvas_refresh_ms = now_ms
-            try:
-                session.record_ui_refresh_executed(
-                    forced=force, reason="canvas_refresh", success=True
-                )
-            except Exception:
-                pass
-        except Exception as e:
-            try:
-                session.record_ui_refresh_executed(
-                    forced=force, reason="canvas_refresh", success=False, error=str(e)
-                )
-            except Exception:
-                pass
+    def _turn_chunks() -> tuple[str, ...]:
+        if not turn_offset:
+            return tuple(streaming_run.chunks)
+        return (streaming_run.text[turn_offset:],)
 
     def _append_text(text_piece: str):
         nonlocal first_chunk
+        text_piece = _with_turn_separator(text_piece)
         try:
             emit_append(text_piece, request_id=request_id)
         except Exception:
             pass
         session.record_chunk(text_piece)
-        full_text = streaming_run.text
-        _update_stream_state_from_text(
-            full_text,
-            meta_throttle_ms=refresh_interval_ms,
+        _update_stream_state_from_splitter(
+            splitter,
+            streaming_run.chunks,
+            meta_throttle_ms=meta_throttle_ms,
             last_meta_update_ms=last_meta_refresh_ms,
         )
         if first_chunk:
             first_chunk = False
+            trace_event("first_token", request_id, chars=len(text_piece))
             _update_lifecycle("stream_start")
             if _should_show_response_canvas():
                 try:
                     actions.user.model_response_canvas_open()
                 except Exception:
                     pass
-                _maybe_refresh_canvas(force=True)
+                refresh_scheduler.request(force=True)
                 return
-        _maybe_refresh_canvas()
-
-    try:
-        for raw_line in raw_response.iter_lines():
+        refresh_scheduler.request()
+
+    def _complete_stream(*, replayed: bool = False) -> str:
+        session.record_complete()
+        answer_text = streaming_run.text
+        trace_event(
+            "stream_complete",
+            request_id,
+            chunks=len(streaming_run.chunks),
+            chars=len(answer_text),
+            replayed=replayed,
+        )
+        emit_complete(request_id=request_id)
+        _logger.debug(
+            "streaming complete parts=%d answer_len=%d meta_present=%s cached=%s",
+            len(streaming_run.chunks),
+            len(answer_text),
+            bool(GPTState.last_meta),
+            replayed,
+        )
+        _update_lifecycle("stream_end")
+        GPTState.last_raw_response = {"choices": [{"message": {"content": answer_text}}]}
+        _set_active_response(None)
+        if not replayed:
             try:
-                state = current_state()
+                store_cached_response(cache_key, _turn_chunks())
             except Exception:
-                state = RequestState()
-            if session.cancel_requested(state, source="iter_lines"):
-                try:
-                    print("[modelHelpers] streaming cancel detected; closing stream")
+                pass
+        return answer_text
+
+    # Follow-up tool turns stream into the same session and answer; the loop
+    # runs once per model turn.
+    turn_request = request
+    while True:
+        turn_offset = streaming_run.length
+        separator_pending = bool(turn_offset)
+        if cached_chunks is not None:
+            # Replay the cached chunks through the same session/canvas path a
+            # live stream takes, minus the network round-trip.
+            session.record_response_cache_hit(
+                cache_key=cache_key or "", chunks=len(cached_chunks)
+            )
+            try:
+                for text_piece in cached_chunks:
                     try:
-                        phase = getattr(state, "phase", None)
-                        print(f"[modelHelpers] streaming cancel state phase={phase}")
+                        state = current_state()
                     except Exception:
-                        pass
+                        state = RequestState()
+                    if session.cancel_requested(state, source="cache_replay"):
+                        _raise_cancel(source="cache_replay", emit_cancel_event=True)
+                    _append_text(text_piece)
+            finally:
+                refresh_scheduler.flush()
+            return _complete_stream(replayed=True)
+
+        # Explicitly request streaming from the API; some endpoints require
+        # the `stream` flag in the JSON payload as well as an HTTP streaming
+        # response.
+        request_with_stream = dict(turn_request)
+        request_with_stream["stream"] = True
+
+        connect_span = start_span(
+            "connect", request_id, provider=provider.id, stream=True
+        )
+        try:
+            raw_response = provider_transport().post(
+                provider.id,
+                url,
+                headers=headers,
+                json=request_with_stream,
+                timeout=timeout_seconds,
+                stream=True,
+            )
+            end_span(connect_span, status=getattr(raw_response, "status_code", None))
+            _set_active_response(raw_response)
+            raw_response_closed = False
+
+            def _close_raw_response() -> None:
+                nonlocal raw_response_closed
+                if raw_response_closed:
+                    return
+                raw_response_closed = True
+                try:
+                    raw_response.close()
                 except Exception:
                     pass
-                _raise_cancel(source="iter_lines", emit_cancel_event=True)
-            if not raw_line:
-                continue
-            if raw_line.startswith(b":"):
-                continue
-            line = decoder.decode(raw_line)
-            if not line:
-                continue
-            if line.startswith("data:"):
-                line = line[len("data:") :].strip()
-            if line == "[DONE]":
-                break
+                provider_transport().release(provider.id, url)
+
             try:
-                parsed = json.loads(line)
+                _logger.debug("streaming request started")
+                content_type = raw_response.headers.get("content-type", "")
+                if content_type and "text/event-stream" not in content_type.lower():
+                    _logger.info(
+                        "streaming requested but content-type='%s'; response may be buffered",
+                        content_type,
+                    )
+                    # If the server ignored streaming, parse the full JSON body once
+                    # and return immediately to avoid consuming the stream iterator.
+                    try:
+                        parsed_full = raw_response.json()
+                        if raw_response.status_code != 200:
+                            error_info = parsed_full or raw_response.text
+                            session.record_error(f"HTTP {raw_response.status_code}")
+                            session.record_snapshot()
+                            notify(
+                                f"GPT Failure: HTTP {raw_response.status_code} | {error_info}"
+                            )
+                            raise GPTRequestError(raw_response.status_code, error_info)
+                        text_piece = (
+                            parsed_full.get("choices", [{}])[0]
+                            .get("message", {})
+                            .get("content", "")
+                        )
+                        if text_piece:
+                            text_piece = _with_turn_separator(text_piece)
+                            session.record_chunk(text_piece)
+                        full_text = streaming_run.text
+                        _update_stream_state_from_text(
+                            full_text,
+                            meta_throttle_ms=meta_throttle_ms,
+                            last_meta_update_ms=last_meta_refresh_ms,
+                        )
+                        _update_lifecycle("stream_start")
+                        _update_lifecycle("stream_end")
+                        if _should_refresh_canvas_now():
+                            try:
+                                session.record_ui_refresh_requested(
+                                    forced=True, reason="canvas_refresh"
+                                )
+                            except Exception:
+                                pass
+                            _refresh_response_canvas()
+                        _logger.debug(
+                            "non-stream response parsed via json(), len=%d",
+                            len(text_piece or ""),
+                        )
+                        session.record_complete()
+                        answer_text = full_text
+                        GPTState.last_raw_response = parsed_full
+                        try:
+                            store_cached_response(cache_key, _turn_chunks())
+                        except Exception:
+                            pass
+                        _set_active_response(None)
+                        _close_raw_response()
+                        return answer_text
+                    except Exception as e:
+                        _logger.warning(
+                            "non-stream parse failed: %r\n%s", e, traceback.format_exc()
+                        )
             except Exception:
-                continue
+                pass
+        except requests.exceptions.Timeout:
+            error_msg = f"Request timed out after {timeout_seconds} seconds"
+            notify(f"GPT Failure: {error_msg}")
+            err = GPTRequestError(408, error_msg)
+            end_span(connect_span, error="timeout")
+            session.record_error(error_msg)
+            _handle_streaming_error(err)
+            raise err
+        except Exception as e:
+            end_span(connect_span, error=type(e).__name__)
+            _logger.warning(
+                "streaming requests.post failed: %r\n%s", e, traceback.format_exc()
+            )
+            session.record_error(str(e))
+            _handle_streaming_error(e)
+            raise
+        if raw_response.status_code != 200:
+            error_info = None
             try:
-                delta = parsed["choices"][0].get("delta", {})
-                text_piece = delta.get("content")
+                error_info = raw_response.json()
             except Exception:
-                text_piece = None
-            if text_piece:
-                _append_text(text_piece)
+                error_info = raw_response.text
+            session.record_error(f"HTTP {raw_response.status_code}")
+            notify(f"GPT Failure: HTTP {raw_response.status_code} | {error_info}")
+            _close_raw_response()
+            raise GPTRequestError(raw_response.status_code, error_info)
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        tool_assembler = StreamingToolCallAssembler()
+        tool_runner = ToolCallRunner(request_id)
+        tools_allowed = tool_turn <= MAX_TOTAL_CALLS
+
+        def _start_tool_calls(calls) -> None:
+            if not tools_allowed:
+                return
+            for call in calls:
+                tool_runner.submit(call.id, call.name, call.arguments)
+
+        # Pending tool calls must not outlive this turn, whether it ends in an
+        # answer, a cancel or an error.
         try:
-            state_after_stream = current_state()
-        except Exception:
-            state_after_stream = RequestState()
-        if session.cancel_requested(state_after_stream, source="after_stream"):
+            first_byte = True
             try:
-                print("[modelHelpers] streaming ended; cancel requested, aborting")
-            except Exception:
-                pass
-            _raise_cancel(source="after_stream", emit_cancel_event=True)
-        tail = decoder.decode(b"", final=True)
-        if tail:
-            _append_text(tail)
-        # Fallback: if no chunks were received, try parsing a full JSON body
-        # (some endpoints may ignore the stream flag and return a single JSON).
-        if not streaming_run.chunks:
-            try:
-                parsed_full = raw_response.json()
-                text_piece = (
-                    parsed_full.get("choices", [{}])[0]
-                    .get("message", {})
-                    .get("content", "")
-                )
-                if text_piece:
-                    session.record_chunk(text_piece)
-                    full_text = streaming_run.text
-                    _update_stream_state_from_text(
-                        full_text,
-                        meta_throttle_ms=refresh_interval_ms,
-                        last_meta_update_ms=last_meta_refresh_ms,
-                    )
-                    if _should_refresh_canvas_now():
-                        try:
-                            session.record_ui_refresh_requested(
-                                forced=True, reason="canvas_refresh"
+                for raw_line in raw_response.iter_lines():
+                    if first_byte:
+                        first_byte = False
+                        trace_event("first_byte", request_id)
+                    try:
+                        state = current_state()
+                    except Exception:
+                        state = RequestState()
+                    if session.cancel_requested(state, source="iter_lines"):
+                        _logger.info(
+                            "streaming cancel detected; closing stream phase=%s",
+                            getattr(state, "phase", None),
+                        )
+                        _raise_cancel(source="iter_lines", emit_cancel_event=True)
+                    if not raw_line:
+                        continue
+                    if raw_line.startswith(b":"):
+                        continue
+                    line = decoder.decode(raw_line)
+                    if not line:
+                        continue
+                    if line.startswith("data:"):
+                        line = line[len("data:") :].strip()
+                    if line == "[DONE]":
+                        break
+                    try:
+                        parsed = json.loads(line)
+                    except Exception:
+                        continue
+                    try:
+                        delta = parsed["choices"][0].get("delta", {})
+                        text_piece = delta.get("content")
+                        tool_fragments = delta.get("tool_calls")
+                    except Exception:
+                        text_piece = None
+                        tool_fragments = None
+                    if text_piece:
+                        _append_text(text_piece)
+                    if tool_fragments:
+                        _start_tool_calls(tool_assembler.feed(tool_fragments))
+                try:
+                    state_after_stream = current_state()
+                except Exception:
+                    state_after_stream = RequestState()
+                if session.cancel_requested(state_after_stream, source="after_stream"):
+                    _logger.info("streaming ended; cancel requested, aborting")
+                    _raise_cancel(source="after_stream", emit_cancel_event=True)
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    _append_text(tail)
+                _start_tool_calls(tool_assembler.finish())
+                # Fallback: if no chunks were received, try parsing a full JSON body
+                # (some endpoints may ignore the stream flag and return a single JSON).
+                if not streaming_run.chunks and not tool_assembler:
+                    try:
+                        parsed_full = raw_response.json()
+                        text_piece = (
+                            parsed_full.get("choices", [{}])[0]
+                            .get("message", {})
+                            .get("content", "")
+                        )
+                        if text_piece:
+                            text_piece = _with_turn_separator(text_piece)
+                            session.record_chunk(text_piece)
+                            full_text = streaming_run.text
+                            _update_stream_state_from_text(
+                                full_text,
+                                meta_throttle_ms=meta_throttle_ms,
+                                last_meta_update_ms=last_meta_refresh_ms,
                             )
-                        except Exception:
-                            pass
-                        _refresh_response_canvas()
-                    print(
-                        "[modelHelpers] streaming fallback parsed full JSON, "
-                        f"len={len(text_piece)} total_len={len(GPTState.text_to_confirm)}"
+                            if _should_refresh_canvas_now():
+                                try:
+                                    session.record_ui_refresh_requested(
+                                        forced=True, reason="canvas_refresh"
+                                    )
+                                except Exception:
+                                    pass
+                                _refresh_response_canvas()
+                            _logger.debug(
+                                "streaming fallback parsed full JSON, len=%d total_len=%d",
+                                len(text_piece),
+                                len(GPTState.text_to_confirm),
+                            )
+                    except Exception as e:
+                        _logger.warning("streaming fallback parse failed: %s", e)
+                else:
+                    _logger.debug(
+                        "streaming completed with %d chunks", len(streaming_run.chunks)
                     )
+            except CancelledRequest:
+                raise
             except Exception as e:
-                print(f"[modelHelpers] streaming fallback parse failed: {e}")
-        else:
+                # If cancel was requested (regardless of exception type), treat as
+                # cancel.
+                try:
+                    state = current_state()
+                except Exception:
+                    state = RequestState()
+                if session.cancel_requested(state, source="exception", detail=str(e)):
+                    _logger.info("streaming exception during cancel: %r", e)
+                    _raise_cancel(source="exception", emit_cancel_event=False)
+                # Some transports surface cancellation as AttributeError on the
+                # underlying stream; treat those as cancels to avoid noisy
+                # tracebacks.
+                if isinstance(e, AttributeError):
+
+                    class _AttributeErrorCancelState:
+                        cancel_requested = True
+                        phase = ""
+
+                    session.cancel_requested(
+                        _AttributeErrorCancelState(),
+                        source="attribute_error",
+                        detail=str(e),
+                    )
+                    _raise_cancel(source="attribute_error", emit_cancel_event=False)
+                session.record_error(str(e))
+                _handle_streaming_error(e)
+                raise
+
+            finally:
+                _close_raw_response()
+                # Coalesced or delayed redraws must not leave the canvas behind the
+                # final text, however the stream ended.
+                refresh_scheduler.flush()
+
+            if not (tool_assembler and tools_allowed):
+                return _complete_stream()
+            tool_messages = tool_runner.results()
             try:
-                print(
-                    f"[modelHelpers] streaming completed with {len(streaming_run.chunks)} chunks"
-                )
+                state_after_tools = current_state()
             except Exception:
-                pass
-    except CancelledRequest:
-        raise
-    except Exception as e:
-        # If cancel was requested (regardless of exception type), treat as cancel.
+                state_after_tools = RequestState()
+            if session.cancel_requested(state_after_tools, source="tool_calls"):
+                _raise_cancel(source="tool_calls", emit_cancel_event=True)
+            turn_text = streaming_run.text[turn_offset:]
+            turn_messages = [tool_assembler.assistant_message(turn_text)] + [
+                _as_tool_result(call.id, message)
+                for call, message in zip(tool_assembler.calls, tool_messages)
+            ]
+            # Every turn is recorded on the originating request, so history and
+            # replay see the whole exchange.
+            request["messages"] = list(request.get("messages") or []) + turn_messages
+            turn_request = dict(request)
+            if (
+                tool_turn + 1 >= MAX_TOTAL_CALLS
+                or context.total_tool_calls >= MAX_TOTAL_CALLS
+            ):
+                # Out of tool budget: ask for a final answer instead of more calls.
+                turn_request["tool_choice"] = "none"
+            trace_event(
+                "tool_turn", request_id, turn=tool_turn, calls=len(tool_messages)
+            )
+            tool_turn += 1
+            _set_active_response(None)
+        finally:
+            tool_runner.close()
+
         try:
-            state = current_state()
+            cache_key = response_cache_key_for(provider, turn_request)
+            cached_chunks = lookup_cached_response(cache_key)
         except Exception:
-            state = RequestState()
-        if session.cancel_requested(state, source="exception", detail=str(e)):
-            try:
-                print(f"[modelHelpers] streaming exception during cancel: {e!r}")
-            except Exception:
-                pass
-            _raise_cancel(source="exception", emit_cancel_event=False)
-        # Some transports surface cancellation as AttributeError on the underlying
-        # stream; treat those as cancels to avoid noisy tracebacks.
-        if isinstance(e, AttributeError):
-
-            class _AttributeErrorCancelState:
-                cancel_requested = True
-                phase = ""
-
-            session.cancel_requested(
-                _AttributeErrorCancelState(),
-                source="attribute_error",
-                detail=str(e),
-            )
-            _raise_cancel(source="attribute_error", emit_cancel_event=False)
-        session.record_error(str(e))
-        _handle_streaming_error(e)
-        raise
+            cache_key, cached_chunks = None, None
 
-    finally:
-        _close_raw_response()
 
-    session.record_complete()
-    answer_text = streaming_run.text
-    emit_complete(request_id=request_id)
-    try:
-        print(
-            f"[modelHelpers] streaming complete parts={len(streaming_run.chunks)} answer_len={len(answer_text)} "
-            f"meta_present={bool(GPTState.last_meta)}"
-        )
-    except Exception:
-        pass
-    _update_lifecycle("stream_end")
-    GPTState.last_raw_response = {"choices": [{"message": {"content": answer_text}}]}
-    _set_active_response(None)
-    return answer_text
+def _as_tool_result(tool_id: str, message: dict) -> dict:
+    """Coerce a `call_tool` message into the `tool` reply the API expects."""
+    if message.get("role") == "tool":
+        return message
+    return {
+        "role": "tool",
+        "tool_call_id": tool_id,
+        "content": message.get("content") or "",
+    }
 
 
 def _append_history_entry(
@@ -1455,13 +1934,11 @@ def _append_history_entry(
     skip_history: bool,
 ) -> str:
     if skip_history:
-        try:
-            print(
-                "[modelHelpers] history append skipped",
-                f"request_id={request_id} answer_len={len(answer_text)}",
-            )
-        except Exception:
-            pass
+        _logger.debug(
+            "history append skipped request_id=%s answer_len=%d",
+            request_id,
+            len(answer_text),
+        )
         return ""
 
     request_payload = getattr(GPTState, "request", None)
@@ -1497,18 +1974,13 @@ def _append_history_entry(
                 axes=axes,
                 provider_id=provider_id,
             )
-        try:
-            print(
-                "[modelHelpers] append_entry_from_request succeeded ",
-                f"prompt_len={len(prompt_text or '')} answer_len={len(answer_text)}",
-            )
-        except Exception:
-            pass
+        _logger.debug(
+            "append_entry_from_request succeeded prompt_len=%d answer_len=%d",
+            len(prompt_text or ""),
+            len(answer_text),
+        )
     except Exception as e:  # noqa: BLE001
-        try:
-            print(f"[modelHelpers] append_entry_from_request failed: {e}")
-        except Exception:
-            pass
+        _logger.warning("append_entry_from_request failed: %s", e)
         prompt_text = ""
     return prompt_text
 
@@ -1516,6 +1988,7 @@ def _append_history_entry(
 def send_request(max_attempts: int = 10, *, skip_history: bool = False):
     """Generate run a GPT request and return the response, with a limit to prevent infinite loops"""
     context.total_tool_calls = 0
+    apply_prompt_cache_layout()
 
     message_content = None
     attempts = 0
@@ -1535,6 +2008,7 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
         GPTState.last_request_id = request_id
     except Exception:
         pass
+    bind_pending_spans(request_id)
     try:
         GPTState.suppress_inflight_notify_request_id = request_id
     except Exception:
@@ -1587,18 +2061,16 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
         raise RuntimeError("GPT request failed after max attempts.")
 
     started_at_ms = int(time.time() * 1000)
-    try:
-        print(
-            f"[modelHelpers] send_request destination_kind={getattr(GPTState, 'current_destination_kind', '')} "
-            f"prefer_canvas_progress={_prefer_canvas_progress()}"
-        )
+    if _logger.enabled_for(DEBUG):
         try:
-            phase = getattr(current_state(), "phase", None)
-            print(f"[modelHelpers] initial request phase={phase}")
+            _logger.debug(
+                "send_request destination_kind=%s prefer_canvas_progress=%s phase=%s",
+                getattr(GPTState, "current_destination_kind", ""),
+                _prefer_canvas_progress(),
+                getattr(current_state(), "phase", None),
+            )
         except Exception:
             pass
-    except Exception:
-        pass
     if not _prefer_canvas_progress():
         try:
             from .pillCanvas import show_pill
@@ -1616,16 +2088,15 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
     try:
         if not provider.features.get("streaming", True):
             use_stream = False
-            print(
-                f"[modelHelpers] provider '{provider.id}' disables streaming; using sync path"
+            _logger.info(
+                "provider '%s' disables streaming; using sync path", provider.id
             )
             _warn_streaming_disabled(provider)
     except Exception:
         provider = None
-    print(f"[modelHelpers] streaming_enabled={use_stream}")
+    _logger.debug("streaming_enabled=%s", use_stream)
     if use_stream:
         try:
-            print("[modelHelpers] invoking streaming request")
             # Logical lifecycle: first chunk observed.
             lifecycle = reduce_request_state(lifecycle, "stream_start")
             try:
@@ -1647,25 +2118,22 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
             except Exception:
                 pass
             try:
-                print(
-                    "[modelHelpers] send_request: streaming cancelled, aborting without fallback"
+                _logger.info(
+                    "send_request: streaming cancelled, aborting without fallback "
+                    "phase=%s",
+                    getattr(current_state(), "phase", None),
                 )
-                try:
-                    phase = getattr(current_state(), "phase", None)
-                    print(f"[modelHelpers] after streaming cancel phase={phase}")
-                except Exception:
-                    pass
             except Exception:
                 pass
             try:
                 set_controller(RequestUIController())
                 emit_cancel(request_id=request_id)
                 emit_reset()
-                try:
-                    phase_after_reset = getattr(current_state(), "phase", None)
-                    print(f"[modelHelpers] after emit_reset phase={phase_after_reset}")
-                except Exception:
-                    pass
+                if _logger.enabled_for(DEBUG):
+                    _logger.debug(
+                        "after emit_reset phase=%s",
+                        getattr(current_state(), "phase", None),
+                    )
             except Exception:
                 pass
             try:
@@ -1684,25 +2152,18 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
             _clear_notify_suppress()
             return format_message("")
         except Exception as e:
-            try:
-                print(
-                    f"[modelHelpers] streaming failed; retrying without stream ({e!r})"
-                )
-                traceback.print_exc()
-            except Exception:
-                pass
+            _logger.warning(
+                "streaming failed; retrying without stream (%r)\n%s",
+                e,
+                traceback.format_exc(),
+            )
             try:
                 emit_retry(request_id=request_id)
             except Exception:
                 pass
             message_content = None
         if message_content is None:
-            try:
-                print(
-                    "[modelHelpers] streaming branch returned None (skipped or failed)"
-                )
-            except Exception:
-                pass
+            _logger.debug("streaming branch returned None (skipped or failed)")
 
     while message_content is None and attempts < max_attempts:
         try:
@@ -1710,15 +2171,10 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
         except Exception:
             state = RequestState()
         if getattr(state, "cancel_requested", False):
-            try:
-                print("[modelHelpers] cancel detected before non-stream send; aborting")
-                try:
-                    phase = getattr(state, "phase", None)
-                    print(f"[modelHelpers] fallback cancel state phase={phase}")
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            _logger.info(
+                "cancel detected before non-stream send; aborting phase=%s",
+                getattr(state, "phase", None),
+            )
             return _handle_cancelled_request()
 
         try:
@@ -1732,7 +2188,8 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
                     GPTState.last_lifecycle = lifecycle
                 except Exception:
                     pass
-            json_response = send_request_internal(GPTState.request)
+            with trace_span("connect", request_id, stream=False, attempt=attempts):
+                json_response = _send_request_internal_cached(GPTState.request)
         except GPTRequestError as e:
             _handle_request_error(e)
             raise
@@ -1745,15 +2202,9 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
         message_response = json_response["choices"][0]["message"]
         message_content = message_response.get("content")
 
-        for tool_call in message_response.get("tool_calls", []):
-            tool_id = tool_call["id"]
-            function_name = tool_call["function"]["name"]
-            arguments = tool_call["function"]["arguments"]
-
-            notify(f"Calling the tool {function_name} with arguments {arguments}")
-
-            tool_response = call_tool(tool_id, function_name, arguments)
-            append_request_messages([tool_response])
+        tool_calls = message_response.get("tool_calls") or []
+        if tool_calls:
+            append_request_messages(run_tool_calls(tool_calls, request_id))
 
         attempts += 1
 
@@ -1772,13 +2223,12 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
     if message_content is None:
         _handle_max_attempts_exceeded()
 
-    try:
-        print(
-            f"[modelHelpers] message_content_len={len(message_content)} "
-            f"preview='{message_content[:120].replace(chr(10), ' ')}'"
+    if _logger.enabled_for(DEBUG):
+        _logger.debug(
+            "message_content_len=%d preview='%s'",
+            len(message_content),
+            message_content[:120].replace("\n", " "),
         )
-    except Exception:
-        pass
     # Non-stream completion path.
     lifecycle = reduce_request_state(lifecycle, "complete")
     try:
@@ -1795,10 +2245,7 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
     GPTState.last_response = answer_text
     GPTState.last_meta = meta_text
     last_recipe = getattr(GPTState, "last_recipe", "") or ""
-    try:
-        print(f"[modelHelpers] logging recipe={last_recipe!r}")
-    except Exception:
-        pass
+    _logger.debug("logging recipe=%r", last_recipe)
     # Keep the streaming buffer aligned with the final answer so inflight views
     # or immediate redraws have content even if the stream was sparse.
     GPTState.text_to_confirm = answer_text
@@ -1828,23 +2275,47 @@ def send_request(max_attempts: int = 10, *, skip_history: bool = False):
     ).lower()
     skip_history_flag = skip_history or destination_kind == "suggest"
 
-    _append_history_entry(
-        session=session,
-        request_id=request_id,
-        answer_text=answer_text,
-        meta_text=meta_text,
-        last_recipe=last_recipe,
-        started_at_ms=started_at_ms,
-        duration_ms=duration_ms,
-        axes=axes,
-        provider=provider,
-        skip_history=skip_history_flag,
-    )
+    with trace_span("history_append", request_id, skipped=skip_history_flag):
+        _append_history_entry(
+            session=session,
+            request_id=request_id,
+            answer_text=answer_text,
+            meta_text=meta_text,
+            last_recipe=last_recipe,
+            started_at_ms=started_at_ms,
+            duration_ms=duration_ms,
+            axes=axes,
+            provider=provider,
+            skip_history=skip_history_flag,
+        )
 
     _clear_notify_suppress()
     return response
 
 
+def send_request_detached(
+    request: dict, *, timeout_seconds: Optional[float] = None
+) -> GPTTextItem:
+    """Send a self-contained request without the shared request lifecycle.
+
+    Unlike send_request this leaves GPTState (request, raw request/response,
+    active response), the streaming session, the request bus and history
+    alone, so several detached requests can be in flight at once (fan-out
+    delegates); `cancel_active_request` still closes them. `timeout_seconds`
+    overrides the transport timeout. Tools are not offered, and like the
+    chatgpt_call tool only the answer text (without meta) is returned.
+    """
+    payload = dict(request)
+    payload.pop("tools", None)
+    payload.pop("tool_choice", None)
+    json_response = send_request_internal(
+        payload, timeout_seconds=timeout_seconds, detached=True
+    )
+    content = json_response["choices"][0]["message"].get("content") or ""
+    answer_text, _meta_text = split_answer_and_meta(strip_markdown(content.strip()))
+    return format_message(answer_text)
+
+
 def send_request_async(*, skip_history: bool = False):
     """Run send_request in a background thread and return a handle."""
     return start_async(send_request, skip_history=skip_history)
@@ -1869,7 +2340,36 @@ class GPTRequestError(ProviderError):
         self.error_info = error_info
 
 
-def send_request_internal(request):
+def _send_request_internal_cached(request):
+    """Non-stream send that consults the opt-in response cache first."""
+    try:
+        cache_key = response_cache_key_for(bound_provider(), request)
+        cached_chunks = lookup_cached_response(cache_key)
+    except Exception:
+        cache_key, cached_chunks = None, None
+    if cached_chunks is not None:
+        return {"choices": [{"message": {"content": "".join(cached_chunks)}}]}
+    json_response = send_request_internal(request)
+    try:
+        message = json_response["choices"][0]["message"]
+        content = message.get("content")
+        # Tool-call turns depend on side effects, so only final answers are kept.
+        if content and not message.get("tool_calls"):
+            store_cached_response(cache_key, (content,))
+    except Exception:
+        pass
+    return json_response
+
+
+def send_request_internal(
+    request, *, timeout_seconds: Optional[float] = None, detached: bool = False
+):
+    """Send `request` without streaming and return the parsed JSON response.
+
+    `timeout_seconds` defaults to `user.model_request_timeout_seconds`. A
+    `detached` send records nothing on GPTState and tracks its response in
+    its own set instead of the shared active-response slot.
+    """
     provider = bound_provider()
     _ensure_request_supported(provider, request)
     try:
@@ -1884,40 +2384,56 @@ def send_request_internal(request):
 
     # Capture the raw request for debugging so it can be inspected or copied
     # after the fact, regardless of whether stdout is visible.
-    GPTState.last_raw_request = request
+    if not detached:
+        GPTState.last_raw_request = request
 
     if GPTState.debug_enabled:
         print(request)
 
     url: str = provider_endpoint(provider)  # type: ignore
-    timeout_seconds: int = settings.get("user.model_request_timeout_seconds", 120)  # type: ignore
+    if timeout_seconds is None:
+        timeout_seconds = settings.get("user.model_request_timeout_seconds", 120)  # type: ignore
     notify("GPT Sending Request")
     try:
-        raw_response = requests.post(
-            url, headers=headers, data=json.dumps(request), timeout=timeout_seconds
+        raw_response = provider_transport().post(
+            provider.id,
+            url,
+            headers=headers,
+            data=json.dumps(request),
+            timeout=timeout_seconds,
         )
-        _set_active_response(raw_response)
+        if detached:
+            with _active_response_lock:
+                _detached_responses.add(raw_response)
+        else:
+            _set_active_response(raw_response)
     except requests.exceptions.Timeout:
         error_msg = f"Request timed out after {timeout_seconds} seconds"
         notify(f"GPT Failure: {error_msg}")
         raise GPTRequestError(408, error_msg)
-    if raw_response.status_code == 200:
-        notify("GPT Request Completed")
-    else:
-        error_info = None
-        try:
-            error_info = raw_response.json()
-        except Exception:
-            error_info = raw_response.text
-        notify(f"GPT Failure: HTTP {raw_response.status_code} | {error_info}")
-        raise GPTRequestError(raw_response.status_code, error_info)
+    try:
+        if raw_response.status_code == 200:
+            notify("GPT Request Completed")
+        else:
+            error_info = None
+            try:
+                error_info = raw_response.json()
+            except Exception:
+                error_info = raw_response.text
+            notify(f"GPT Failure: HTTP {raw_response.status_code} | {error_info}")
+            raise GPTRequestError(raw_response.status_code, error_info)
 
-    json_response = raw_response.json()
-    # Capture the raw JSON response alongside the request for debugging.
-    GPTState.last_raw_response = json_response
+        json_response = raw_response.json()
+    finally:
+        if detached:
+            with _active_response_lock:
+                _detached_responses.discard(raw_response)
     if GPTState.debug_enabled:
         print(json_response)
-    _set_active_response(None)
+    if not detached:
+        # Capture the raw JSON response alongside the request for debugging.
+        GPTState.last_raw_response = json_response
+        _set_active_response(None)
     return json_response
 
 
@@ -0,0 +1,251 @@
+"""Leveled logging with lazy formatting and a ring buffer of recent records.
+
+Hot paths (the request loop, history reads/writes, UI dispatch, canvases) log
+through `get_logger(name)` instead of calling `print` directly:
+
+    _log = get_logger("modelHelpers")
+    _log.debug("streaming complete parts=%d answer_len=%d", parts, len(text))
+
+Messages use %-style arguments and are only formatted when a record is
+actually printed or read back from the buffer, so a disabled level costs one
+integer comparison and no string building.
+
+Two thresholds apply:
+- `user.model_log_level` (default "info") decides what is printed to the
+  Talon log;
+- `user.model_log_buffer_level` (default "info") decides what is kept in the
+  in-memory ring buffer (`recent_log_records`) for after-the-fact inspection.
+Either can be "off". Records below both thresholds are dropped immediately,
+so debug records cost nothing until one of them is set to "debug".
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVELS: Dict[str, int] = {
+    "debug": DEBUG,
+    "info": INFO,
+    "warning": WARNING,
+    "error": ERROR,
+    "off": OFF,
+}
+_LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+DEFAULT_CONSOLE_LEVEL = INFO
+DEFAULT_BUFFER_LEVEL = INFO
+DEFAULT_BUFFER_SIZE = 1000
+
+
+def parse_level(value: object, default: int) -> int:
+    if isinstance(value, bool):
+        return default
+    if isinstance(value, int):
+        return value
+    return LEVELS.get(str(value or "").strip().lower(), default)
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    monotonic: float
+    wall_time: float
+    level: int
+    name: str
+    message: str
+    args: Tuple[Any, ...]
+
+    @property
+    def level_name(self) -> str:
+        return _LEVEL_NAMES.get(self.level, str(self.level))
+
+    def formatted(self) -> str:
+        if not self.args:
+            return self.message
+        try:
+            return self.message % self.args
+        except Exception:
+            return f"{self.message} {self.args!r}"
+
+
+class _LogState:
+    def __init__(self) -> None:
+        self.console_level = DEFAULT_CONSOLE_LEVEL
+        self.buffer_level = DEFAULT_BUFFER_LEVEL
+        # Lowest level anything listens at; the only check on the fast path.
+        self.min_level = min(self.console_level, self.buffer_level)
+        self.buffer: Deque[LogRecord] = deque(maxlen=DEFAULT_BUFFER_SIZE)
+        self.counts: Dict[str, int] = {name: 0 for name in LEVELS if name != "off"}
+        self.lock = Lock()
+        self.settings_loaded = False
+
+
+_state = _LogState()
+
+
+def configure_logging(
+    *,
+    console_level: Optional[object] = None,
+    buffer_level: Optional[object] = None,
+    buffer_size: Optional[int] = None,
+) -> None:
+    """Set thresholds (names like "debug" or numeric levels) and buffer size."""
+
+    with _state.lock:
+        if console_level is not None:
+            _state.console_level = parse_level(console_level, DEFAULT_CONSOLE_LEVEL)
+        if buffer_level is not None:
+            _state.buffer_level = parse_level(buffer_level, DEFAULT_BUFFER_LEVEL)
+        if buffer_size is not None and buffer_size != _state.buffer.maxlen:
+            _state.buffer = deque(_state.buffer, maxlen=max(1, int(buffer_size)))
+        _state.min_level = min(_state.console_level, _state.buffer_level)
+        _state.settings_loaded = True
+
+
+def _load_settings() -> None:
+    try:
+        from talon import settings
+
+        console = settings.get("user.model_log_level", "info")
+        buffered = settings.get("user.model_log_buffer_level", "info")
+    except Exception:
+        console, buffered = None, None
+    configure_logging(console_level=console, buffer_level=buffered)
+
+
+def _ensure_settings() -> None:
+    """Read the level settings on first use and follow later changes."""
+
+    _state.settings_loaded = True
+    _load_settings()
+    try:
+        from talon import settings
+
+        for key in ("user.model_log_level", "user.model_log_buffer_level"):
+            settings.register(key, lambda _value: _load_settings())
+    except Exception:
+        pass
+
+
+class Logger:
+    """Named logger; cheap to call when its level is disabled."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def enabled_for(self, level: int) -> bool:
+        if not _state.settings_loaded:
+            _ensure_settings()
+        return level >= _state.min_level
+
+    def log(self, level: int, message: str, *args: Any) -> None:
+        if not _state.settings_loaded:
+            _ensure_settings()
+        if level < _state.min_level:
+            return
+        record = LogRecord(time.monotonic(), time.time(), level, self.name, message, args)
+        level_name = record.level_name
+        with _state.lock:
+            if level_name in _state.counts:
+                _state.counts[level_name] += 1
+            if level >= _state.buffer_level:
+                _state.buffer.append(record)
+        if level >= _state.console_level:
+            prefix = f"[{self.name}]"
+            if level >= WARNING:
+                prefix = f"{prefix} {level_name.upper()}:"
+            try:
+                print(f"{prefix} {record.formatted()}")
+            except Exception:
+                pass
+
+    def debug(self, message: str, *args: Any) -> None:
+        if DEBUG >= _state.min_level or not _state.settings_loaded:
+            self.log(DEBUG, message, *args)
+
+    def info(self, message: str, *args: Any) -> None:
+        self.log(INFO, message, *args)
+
+    def warning(self, message: str, *args: Any) -> None:
+        self.log(WARNING, message, *args)
+
+    def error(self, message: str, *args: Any) -> None:
+        self.log(ERROR, message, *args)
+
+
+_loggers: Dict[str, Logger] = {}
+
+
+def get_logger(name: str) -> Logger:
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, Logger(name))
+    return logger
+
+
+def recent_log_records(
+    limit: int = 100, *, min_level: int = DEBUG, name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Return up to `limit` buffered records, newest last, formatted."""
+
+    with _state.lock:
+        records = list(_state.buffer)
+    selected = [
+        record
+        for record in records
+        if record.level >= min_level and (name is None or record.name == name)
+    ]
+    return [
+        {
+            "monotonic": round(record.monotonic, 6),
+            "wall_time": record.wall_time,
+            "level": record.level_name,
+            "name": record.name,
+            "message": record.formatted(),
+        }
+        for record in selected[-max(limit, 0) :]
+    ]
+
+
+def log_stats() -> Dict[str, Any]:
+    with _state.lock:
+        payload: Dict[str, Any] = dict(_state.counts)
+        payload["buffered"] = len(_state.buffer)
+        payload["buffer_size"] = _state.buffer.maxlen
+        payload["console_level"] = _LEVEL_NAMES.get(_state.console_level, "")
+        payload["buffer_level"] = _LEVEL_NAMES.get(_state.buffer_level, "")
+    return payload
+
+
+def reset_log_buffer() -> None:
+    with _state.lock:
+        _state.buffer.clear()
+        for name in _state.counts:
+            _state.counts[name] = 0
+
+
+__all__ = [
+    "DEBUG",
+    "ERROR",
+    "INFO",
+    "LEVELS",
+    "Logger",
+    "OFF",
+    "WARNING",
+    "configure_logging",
+    "get_logger",
+    "log_stats",
+    "recent_log_records",
+    "reset_log_buffer",
+]
@@ -5,6 +5,7 @@ from typing import Dict, Literal, Optional, Tuple
 from talon import Context, Module, actions, canvas, settings, ui
 
 from .canvasFont import apply_canvas_typeface
+from .canvasViewport import UniformRowIndex
 from .overlayHelpers import clamp_scroll
 
 from .modelDestination import create_model_destination
@@ -1111,11 +1112,13 @@ def _draw_pattern_canvas(c: canvas.Canvas) -> None:  # pragma: no cover - visual
     offset_rows = int(clamp_scroll(offset_rows, max_offset))
     PatternCanvasState.scroll_y = float(offset_rows)
 
-    for idx in range(offset_rows, len(patterns)):
+    # Scroll offsets are whole rows; draw only the rows inside the body.
+    viewport = UniformRowIndex(len(patterns), row_height)
+    for idx, row_offset in viewport.visible_rows(
+        offset_rows * row_height, body_bottom - body_top
+    ):
         pattern = patterns[idx]
-        row_y = body_top + (idx - offset_rows) * row_height
-        if row_y > body_bottom:
-            break
+        row_y = body_top + row_offset
 
         label = f"[{pattern.name}]"
         draw_text(label, x, row_y)
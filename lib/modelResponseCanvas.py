@@ -6,6 +6,7 @@ import time
 
 from .axisJoin import axis_join
 from .canvasFont import apply_canvas_typeface, draw_text_with_emoji_fallback
+from .canvasViewport import UniformRowIndex
 
 from .modelState import GPTState
 from .modelDestination import _parse_meta
@@ -58,6 +59,7 @@ def close_common_overlays(
 
 from .personaOrchestrator import get_persona_intent_orchestrator
 from . import personaConfig as _persona_config_module
+from .modelLog import get_logger
 
 mod = Module()
 ctx = Context()
@@ -71,17 +73,15 @@ class ResponseCanvasState:
 
     The scroll implementation for the answer body does a fair amount of
     line-wrapping work on each draw. To keep scroll and scrollbar updates
-    responsive for long responses, we cache the wrapped lines keyed by the
-    answer text and an approximate character width.
+    responsive for long responses, the module-level `AnswerLineLayout` caches
+    the wrapped lines keyed by the answer text, character width and font
+    metrics, and extends them incrementally as streamed text is appended.
     """
 
     showing: bool = False
     scroll_y: float = 0.0
     meta_expanded: bool = False
     max_scroll: float = 1e9
-    # Cache for wrapped answer lines so scroll draws stay lightweight.
-    lines_cache_key: tuple[str, int] | None = None
-    lines_cache: list[str] | None = None
     # Request id the user pinned when expanding meta; used to avoid collapsing
     # within the same request even if ids firm up mid-stream.
     meta_pinned_request_id: str = ""
@@ -369,11 +369,11 @@ def _coerce_text(value) -> str:
         return ""
 
 
-def _debug(msg: str) -> None:
-    try:
-        print(f"GPT response canvas: {msg}")
-    except Exception:
-        pass
+_log = get_logger("responseCanvas")
+
+
+def _debug(msg: str, *args: Any) -> None:
+    _log.debug(msg, *args)
 
 
 def _trace_canvas_event(event: str, **data) -> None:
@@ -428,7 +428,13 @@ def _log_canvas_close(reason: str) -> None:
         showing = getattr(ResponseCanvasState, "showing", False)
     except Exception:
         showing = False
-    _debug(f"close reason={reason} showing={showing} phase={phase} surface={surface}")
+    _debug(
+        "close reason=%s showing=%s phase=%s surface=%s",
+        reason,
+        showing,
+        phase,
+        surface,
+    )
     _trace_canvas_event(
         "canvas_close",
         reason=reason,
@@ -462,8 +468,7 @@ def _ensure_response_canvas() -> canvas.Canvas:
             ResponseCanvasState.showing = False
             ResponseCanvasState.scroll_y = 0.0
             ResponseCanvasState.max_scroll = 1e9
-            ResponseCanvasState.lines_cache_key = None
-            ResponseCanvasState.lines_cache = None
+            _answer_layout.clear()
         except Exception:
             pass
 
@@ -563,7 +568,7 @@ def _ensure_response_canvas() -> canvas.Canvas:
                 # Log the first error per draw; suppress repeats until next draw.
                 if _last_draw_error != str(e):
                     try:
-                        _debug(f"response canvas draw handler error: {e}")
+                        _debug("response canvas draw handler error: %s", e)
                     except Exception:
                         pass
                     _last_draw_error = str(e)
@@ -900,6 +905,71 @@ def unregister_response_draw_handler(handler: Callable) -> None:
         pass
 
 
+def _format_answer_line(
+    raw: str, max_chars: int, lines: list[str], last_blank: bool
+) -> bool:
+    """Append the display lines for one raw answer line; return the blank state.
+
+    `last_blank` is whether the previous raw line was blank, so runs of blank
+    lines collapse into one.
+    """
+    line = raw.rstrip()
+    stripped = line.lstrip()
+    if not stripped:
+        if not last_blank and lines:
+            lines.append("")
+        return True
+    # Bullet detection: optional indent + '- ' or '* '.
+    if stripped.startswith("- ") or stripped.startswith("* "):
+        content = stripped[2:].lstrip()
+        bullet_prefix = "  • "
+        content = content or ""
+        # Wrap bullet content with indentation.
+        while content:
+            available = max_chars - len(bullet_prefix)
+            if available <= 8:
+                # Fallback: avoid infinite loops on tiny widths.
+                lines.append(bullet_prefix + content)
+                content = ""
+                break
+            # If the remaining content fits on this line, keep it intact
+            # instead of forcing a wrap that leaves a short trailing
+            # fragment (for example, moving a single word like "truth)"
+            # onto its own line).
+            if len(content) <= available:
+                lines.append(bullet_prefix + content)
+                content = ""
+                break
+            piece = content[:available]
+            # Try to break at the last space inside the window.
+            break_at = piece.rfind(" ")
+            if break_at <= 0:
+                chunk = content[:available]
+                content = content[available:].lstrip()
+            else:
+                chunk = content[:break_at]
+                content = content[break_at + 1 :].lstrip()
+            lines.append(bullet_prefix + chunk)
+            bullet_prefix = "    "  # Subsequent lines align under text.
+        return False
+
+    # Non-bullet line wrapping.
+    text = line
+    while text:
+        if len(text) <= max_chars:
+            lines.append(text)
+            break
+        piece = text[:max_chars]
+        break_at = piece.rfind(" ")
+        if break_at <= 0:
+            lines.append(text[:max_chars])
+            text = text[max_chars:].lstrip()
+        else:
+            lines.append(text[:break_at])
+            text = text[break_at + 1 :].lstrip()
+    return False
+
+
 def _format_answer_lines(answer: str, max_chars: int) -> list[str]:
     """Normalise answer text into display lines.
 
@@ -910,66 +980,78 @@ def _format_answer_lines(answer: str, max_chars: int) -> list[str]:
     lines: list[str] = []
     last_blank = False
     for raw in raw_lines:
-        line = raw.rstrip()
-        stripped = line.lstrip()
-        if not stripped:
-            if not last_blank and lines:
-                lines.append("")
-            last_blank = True
-            continue
-        last_blank = False
-        # Bullet detection: optional indent + '- ' or '* '.
-        if stripped.startswith("- ") or stripped.startswith("* "):
-            content = stripped[2:].lstrip()
-            bullet_prefix = "  • "
-            content = content or ""
-            # Wrap bullet content with indentation.
-            while content:
-                available = max_chars - len(bullet_prefix)
-                if available <= 8:
-                    # Fallback: avoid infinite loops on tiny widths.
-                    lines.append(bullet_prefix + content)
-                    content = ""
-                    break
-                # If the remaining content fits on this line, keep it intact
-                # instead of forcing a wrap that leaves a short trailing
-                # fragment (for example, moving a single word like "truth)"
-                # onto its own line).
-                if len(content) <= available:
-                    lines.append(bullet_prefix + content)
-                    content = ""
-                    break
-                piece = content[:available]
-                # Try to break at the last space inside the window.
-                break_at = piece.rfind(" ")
-                if break_at <= 0:
-                    chunk = content[:available]
-                    content = content[available:].lstrip()
-                else:
-                    chunk = content[:break_at]
-                    content = content[break_at + 1 :].lstrip()
-                lines.append(bullet_prefix + chunk)
-                bullet_prefix = "    "  # Subsequent lines align under text.
-            continue
-
-        # Non-bullet line wrapping.
-        text = line
-        while text:
-            if len(text) <= max_chars:
-                lines.append(text)
-                break
-            piece = text[:max_chars]
-            break_at = piece.rfind(" ")
-            if break_at <= 0:
-                lines.append(text[:max_chars])
-                text = text[max_chars:].lstrip()
-            else:
-                lines.append(text[:break_at])
-                text = text[break_at + 1 :].lstrip()
-
+        last_blank = _format_answer_line(raw, max_chars, lines, last_blank)
     return lines or [answer]
 
 
+class AnswerLineLayout:
+    """Incrementally maintained display lines for the response body.
+
+    Layouts are keyed by the answer text, `max_chars` and the font metrics used
+    to derive it. Redraws with the same key (scrolling, hover) reuse the lines
+    as-is. When the text only grew (streaming appends), layout resumes from
+    the last raw line of the previous text, since that line may have been
+    incomplete, instead of re-wrapping the whole answer.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.key: Optional[tuple] = None
+        self.text = ""
+        self.lines: list[str] = []
+        # Checkpoint at the start of the last raw line laid out.
+        self._tail_offset = 0
+        self._tail_index = 0
+        self._tail_last_blank = False
+
+    def layout(
+        self, text: str, max_chars: int, metrics: tuple = ()
+    ) -> tuple[list[str], str]:
+        """Return (lines, mode) where mode is "hit", "append" or "full"."""
+
+        key = (max_chars, metrics)
+        if key == self.key and (text is self.text or text == self.text):
+            return self._result(text), "hit"
+        if (
+            key == self.key
+            and self.text
+            and len(text) > len(self.text)
+            and text.startswith(self.text)
+        ):
+            mode = "append"
+            start = self._tail_offset
+            del self.lines[self._tail_index :]
+            last_blank = self._tail_last_blank
+        else:
+            mode = "full"
+            start = 0
+            self.lines = []
+            last_blank = False
+            self._tail_offset = 0
+            self._tail_index = 0
+            self._tail_last_blank = False
+        offset = start
+        for raw in text[start:].splitlines(keepends=True):
+            self._tail_offset = offset
+            self._tail_index = len(self.lines)
+            self._tail_last_blank = last_blank
+            # rstrip inside the formatter also drops the line terminator.
+            last_blank = _format_answer_line(raw, max_chars, self.lines, last_blank)
+            offset += len(raw)
+        self.key = key
+        self.text = text
+        return self._result(text), mode
+
+    def _result(self, text: str) -> list[str]:
+        return self.lines or [text]
+
+
+# Shared by every draw of the response canvas; cleared when it hides or resets.
+_answer_layout = AnswerLineLayout()
+
+
 def _default_draw_response(c: canvas.Canvas) -> None:  # pragma: no cover - visual only
     rect = getattr(c, "rect", None)
     draw_text = getattr(c, "draw_text", None)
@@ -1090,7 +1172,7 @@ def _default_draw_response(c: canvas.Canvas) -> None:  # pragma: no cover - visu
                         else:
                             c.draw_rect(underline_rect)
                 except Exception as e:
-                    _debug(f"response close underline draw failed: {e}")
+                    _debug("response close underline draw failed: %s", e)
         right_cursor -= approx_char * 2
 
     status_label = ""
@@ -1565,10 +1647,14 @@ def _default_draw_response(c: canvas.Canvas) -> None:  # pragma: no cover - visu
                 )
                 if snapshot != _last_recap_log:
                     _debug(
-                        "recap state "
-                        f"task={static_prompt!r} C={last_completeness!r} "
-                        f"S={last_scope!r} M={last_method!r} "
-                        f"F={last_form!r} Ch={last_channel!r} D={directional!r}"
+                        "recap state task=%r C=%r S=%r M=%r F=%r Ch=%r D=%r",
+                        static_prompt,
+                        last_completeness,
+                        last_scope,
+                        last_method,
+                        last_form,
+                        last_channel,
+                        directional,
                     )
                     _last_recap_log = snapshot
         except Exception:
@@ -1954,37 +2040,27 @@ def _default_draw_response(c: canvas.Canvas) -> None:  # pragma: no cover - visu
     approx_char_width = 8
     max_chars = max(int((rect.width - 80) // approx_char_width), 40) if rect else 80
 
-    cache_key = (answer, max_chars)
-    lines_cache_key = getattr(ResponseCanvasState, "lines_cache_key", None)
-    cached_lines = getattr(ResponseCanvasState, "lines_cache", None)
-    cache_miss = lines_cache_key != cache_key or not cached_lines
-    wrap_duration_ms = 0.0
     wrap_started = time.perf_counter()
-    if cache_miss:
-        lines = _format_answer_lines(answer, max_chars)
-        ResponseCanvasState.lines_cache_key = cache_key
-        ResponseCanvasState.lines_cache = list(lines)
-        wrap_duration_ms = (time.perf_counter() - wrap_started) * 1000.0
-    else:
-        lines = cached_lines or []
+    lines, layout_mode = _answer_layout.layout(
+        answer, max_chars, (approx_char_width,)
+    )
+    cache_miss = layout_mode != "hit"
+    wrap_duration_ms = (time.perf_counter() - wrap_started) * 1000.0
     if not lines:
         lines = [""]
 
     # Compute content height and clamp scroll offset so we cannot scroll past
     # the end of the content.
-    content_height = len(lines) * line_h
+    viewport = UniformRowIndex(len(lines), line_h)
+    content_height = viewport.total_height
     max_scroll = max(content_height - visible_height, 0)
     scroll_y = clamp_scroll(ResponseCanvasState.scroll_y, max_scroll)
     ResponseCanvasState.scroll_y = scroll_y
-    start_index = int(scroll_y // line_h)
-    offset_y = body_top - (scroll_y % line_h)
 
     draw_started = time.perf_counter()
     drawn_lines = 0
-    for idx in range(start_index, len(lines)):
-        ly = offset_y + (idx - start_index) * line_h
-        if ly > body_bottom:
-            break
+    for idx, row_offset in viewport.visible_rows(scroll_y, visible_height):
+        ly = body_top + row_offset
         line_text = lines[idx] or " "
         drawn_lines += 1
         # Prefer an emoji-aware draw helper so runs containing emoji can use
@@ -2047,6 +2123,7 @@ def _default_draw_response(c: canvas.Canvas) -> None:  # pragma: no cover - visu
         scroll_y=f"{round(float(scroll_y), 2)}",
         max_scroll=f"{round(float(max_scroll), 2)}",
         cache_miss=f"{cache_miss}",
+        layout=layout_mode,
         wrap_ms=f"{round(wrap_duration_ms, 3)}",
         draw_ms=f"{round(draw_duration_ms, 3)}",
     )
@@ -2172,8 +2249,7 @@ class UserActions:
             pass
         ResponseCanvasState.scroll_y = 0.0
         ResponseCanvasState.max_scroll = 1e9
-        ResponseCanvasState.lines_cache_key = None
-        ResponseCanvasState.lines_cache = None
+        _answer_layout.clear()
         # Always start with meta collapsed; the band still shows a short
         # summary so the initial view is response-first.
         ResponseCanvasState.meta_expanded = False
@@ -2208,8 +2284,7 @@ class UserActions:
                 pass
             ResponseCanvasState.scroll_y = 0.0
             ResponseCanvasState.max_scroll = 1e9
-            ResponseCanvasState.lines_cache_key = None
-            ResponseCanvasState.lines_cache = None
+            _answer_layout.clear()
             ResponseCanvasState.meta_expanded = False
             ResponseCanvasState.meta_pinned_request_id = ""
             try:
@@ -2260,8 +2335,7 @@ class UserActions:
                 pass
             ResponseCanvasState.scroll_y = 0.0
             ResponseCanvasState.max_scroll = 1e9
-            ResponseCanvasState.lines_cache_key = None
-            ResponseCanvasState.lines_cache = None
+            _answer_layout.clear()
             ResponseCanvasState.meta_expanded = False
             ResponseCanvasState.meta_pinned_request_id = ""
             canvas_obj.show()
@@ -2324,8 +2398,7 @@ class UserActions:
             pass
         ResponseCanvasState.scroll_y = 0.0
         ResponseCanvasState.max_scroll = 1e9
-        ResponseCanvasState.lines_cache_key = None
-        ResponseCanvasState.lines_cache = None
+        _answer_layout.clear()
         ResponseCanvasState.meta_expanded = False
         ResponseCanvasState.meta_pinned_request_id = ""
         try:
@@ -12,6 +12,7 @@ from ..lib.modelHelpers import (
     notify,
 )
 from ..lib.metaPromptConfig import PLANNING_DIRECTIVE, SUBJECT_FRAMING
+from ..lib.requestTracing import trace_span
 
 
 GPTItem = Union[GPTImageItem, GPTTextItem]
@@ -33,10 +34,14 @@ def format_source_messages(
     prompt: str, source: ModelSource, additional_source: Optional[ModelSource] = None
 ):
     prompt_chunks = prompt.split("{additional_source}")
-    source_messages = source.format_messages()
+    with trace_span("source_read", source=type(source).__name__):
+        source_messages = source.format_messages()
     additional_source_messages: List[GPTItem] = []
     if additional_source is not None:
-        additional_source_messages = additional_source.format_messages()
+        with trace_span(
+            "source_read", source=type(additional_source).__name__, additional=True
+        ):
+            additional_source_messages = additional_source.format_messages()
         if len(prompt_chunks) == 1:
             additional_source_messages = [
                 format_message(
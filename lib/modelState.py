@@ -90,6 +90,11 @@ class GPTState:
         "tool_choice": "auto",
         "verbosity": "",
     }
+    # Per-request system context (focused app, language, timeout, stored
+    # context) held back by the stable-prefix layout until send time, plus the
+    # hash of the cacheable prefix that layout produced.
+    request_volatile_context: ClassVar[List[str]] = []
+    request_prompt_prefix: ClassVar[Dict[str, object]] = {}
     # Track whether the user has intentionally overridden per-axis defaults via
     # settings so that per-prompt profiles do not compete with user intent.
     user_overrode_completeness: ClassVar[bool] = False
@@ -183,6 +188,8 @@ class GPTState:
             "directional": [],
         }
         cls.request["messages"] = []
+        cls.request_volatile_context = []
+        cls.request_prompt_prefix = {}
         cls.request_provider = None
         cls.current_provider_id = "openai"
         actions.app.notify("Cleared all state")
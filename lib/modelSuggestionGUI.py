@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Tuple
 from talon import Context, Module, actions, canvas, settings, ui
 
 from .canvasFont import apply_canvas_typeface
+from .canvasViewport import RowHeightIndex
 from .modelDestination import create_model_destination
 from .modelSource import create_model_source
 from .modelState import GPTState
@@ -368,6 +369,41 @@ def _measure_suggestion_height(
     return h
 
 
+# Row heights for the current suggestions, shared by draw and scroll handlers
+# so scrolling does not re-measure every row. Holds the suggestion objects so
+# their ids stay valid for the identity comparison.
+_row_index_cache: Optional[tuple[tuple, list[Suggestion], RowHeightIndex]] = None
+
+
+def _suggestion_row_index(
+    suggestions: list[Suggestion],
+    x_pos: int,
+    rect: Optional["canvas.Rect"],
+    approx_char: int,
+    line_h: int,
+) -> RowHeightIndex:
+    """Return a prefix-sum height index for the suggestion rows."""
+    global _row_index_cache
+    key = (
+        tuple(id(s) for s in suggestions),
+        x_pos,
+        getattr(rect, "x", None),
+        getattr(rect, "width", None),
+        approx_char,
+        line_h,
+        getattr(GPTState, "last_suggest_source", ""),
+    )
+    cached = _row_index_cache
+    if cached is not None and cached[0] == key:
+        return cached[2]
+    index = RowHeightIndex(
+        _measure_suggestion_height(s, x_pos, rect, approx_char, line_h)
+        for s in suggestions
+    )
+    _row_index_cache = (key, list(suggestions), index)
+    return index
+
+
 def _request_is_in_flight() -> bool:
     """Return True when a GPT request is currently running."""
 
@@ -1035,11 +1071,9 @@ def _scroll_suggestions(raw_delta: float) -> None:  # pragma: no cover - visual
                 body_top += line_h // 2
         body_bottom = rect.y + rect.height - line_h * 4
         visible_height = max(body_bottom - body_top, line_h * 4)
-        measured_heights = [
-            _measure_suggestion_height(s, rect.x + 40, rect, approx_char, line_h)
-            for s in SuggestionGUIState.suggestions
-        ]
-        total_content_height = sum(measured_heights)
+        total_content_height = _suggestion_row_index(
+            SuggestionGUIState.suggestions, rect.x + 40, rect, approx_char, line_h
+        ).total_height
         # Match the draw path slack so the handler and renderer share bounds.
         max_scroll = max(total_content_height - visible_height + line_h * 6, 0)
         # Further slow the scroll sensitivity so wheel/trackpad deltas move the
@@ -1068,9 +1102,12 @@ def _scroll_suggestions(raw_delta: float) -> None:  # pragma: no cover - visual
 
 
 def _open_suggestion_canvas() -> None:
+    global _row_index_cache
     canvas_obj = _ensure_suggestion_canvas()
     SuggestionCanvasState.showing = True
     SuggestionCanvasState.scroll_y = 0.0
+    # Stance display can change between openings; re-measure rows.
+    _row_index_cache = None
     canvas_obj.show()
 
 
@@ -1079,9 +1116,11 @@ def _close_suggestion_canvas() -> None:
         _suggestion_canvas, \
         _suggestion_hover_close, \
         _suggestion_hover_index, \
-        _suggestion_drag_offset
+        _suggestion_drag_offset, \
+        _row_index_cache
     SuggestionCanvasState.showing = False
     SuggestionCanvasState.scroll_y = 0.0
+    _row_index_cache = None
     _suggestion_hover_close = False
     _suggestion_hover_index = None
     _suggestion_drag_offset = None
@@ -1287,11 +1326,8 @@ def _draw_suggestions(c: canvas.Canvas) -> None:  # pragma: no cover - visual on
         body_bottom = body_top + 1_000_000
     visible_height = max(body_bottom - body_top, line_h * 4)
 
-    measured_heights = [
-        _measure_suggestion_height(suggestion, x, rect, approx_char, line_h)
-        for suggestion in suggestions
-    ]
-    total_content_height = sum(measured_heights)
+    row_index = _suggestion_row_index(suggestions, x, rect, approx_char, line_h)
+    total_content_height = row_index.total_height
     # Add a slack buffer so final rows can fully clear the visible area even
     # when rounding/measurement errors accumulate or line measurement
     # underestimates wrap. A few lines of slack avoids clipping the last row.
@@ -1299,25 +1335,12 @@ def _draw_suggestions(c: canvas.Canvas) -> None:  # pragma: no cover - visual on
     scroll_y = clamp_scroll(SuggestionCanvasState.scroll_y, max_scroll)
     SuggestionCanvasState.scroll_y = scroll_y
 
-    current_y = body_top - scroll_y
-    # Render each visible suggestion as a clickable row.
-    for index, suggestion in enumerate(suggestions):
-        row_height = (
-            measured_heights[index] if index < len(measured_heights) else line_h * 6
-        )
-        row_start = current_y
-        row_end = current_y + row_height
-        # Skip rows that are fully above the visible body area.
-        if row_end < body_top:
-            current_y += row_height
-            continue
-        if row_start >= body_bottom:
-            break
-
-        row_draw_start = row_start
-        row_draw_end = row_draw_start + row_height
-
-        label_y = row_draw_start
+    # Render only the suggestion rows that intersect the visible body.
+    for index, row_offset in row_index.visible_rows(
+        scroll_y, body_bottom - body_top
+    ):
+        suggestion = suggestions[index]
+        label_y = body_top + row_offset
         label = f"[{suggestion.name}]"
         label_width = len(label) * approx_char
         row_top = label_y - line_h
@@ -1548,7 +1571,6 @@ def _draw_suggestions(c: canvas.Canvas) -> None:  # pragma: no cover - visual on
                     if old_color is not None:
                         paint.color = old_color
             row_y += line_h // 3
-        current_y = row_draw_end
         if stop_rendering:
             break
 
@@ -12,9 +12,12 @@ from .personaConfig import (
     persona_key_to_kanji_map,
 )
 
+from .axisCatalog import axis_catalog_generation
 from .metaPromptConfig import META_INTERPRETATION_GUIDANCE, PROMPT_REFERENCE_KEY, prompt_reference_key_as_text
-from dataclasses import dataclass, field
-from typing import Any, List, Literal, TypedDict, Union
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Literal, Optional, Tuple, TypedDict, Union
 
 
 class GPTTextItem(TypedDict):
@@ -51,6 +54,75 @@ class GPTRequest(TypedDict):
     verbosity: str
 
 
+SYSTEM_PROMPT_CACHE_SIZE = 64
+
+
+@dataclass
+class _SystemPromptCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class _SystemPromptCache:
+    """Bounded LRU of rendered system-prompt lines.
+
+    Keys are the resolved stance/axis tuple plus the axis catalog generation,
+    so an axisConfig reload naturally misses instead of serving stale text.
+    """
+
+    def __init__(self, max_entries: int = SYSTEM_PROMPT_CACHE_SIZE) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, Tuple[str, ...]]" = OrderedDict()
+        self._lock = Lock()
+        self._stats = _SystemPromptCacheStats()
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, ...]]:
+        with self._lock:
+            lines = self._entries.get(key)
+            if lines is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return lines
+
+    def put(self, key: Hashable, lines: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._entries[key] = lines
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = _SystemPromptCacheStats()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            payload = asdict(self._stats)
+            payload["entries"] = len(self._entries)
+            payload["max_entries"] = self._max_entries
+            return payload
+
+
+_system_prompt_cache = _SystemPromptCache()
+
+
+def system_prompt_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/eviction counters for rendered system prompts."""
+
+    return _system_prompt_cache.stats()
+
+
+def reset_system_prompt_cache() -> None:
+    """Drop cached system prompts and zero the counters."""
+
+    _system_prompt_cache.clear()
+
+
 @dataclass
 class GPTSystemPrompt:
     voice: str = field(default="")
@@ -228,7 +300,34 @@ class GPTSystemPrompt:
         return " ".join(mapped)
 
     def format_as_array(self) -> list[str]:
-        # Formats the instance variables as an array of strings
+        # Formats the instance variables as an array of strings. Rendering is
+        # memoised on the resolved stance/axis tuple (see
+        # `system_prompt_cache_stats`); callers get a fresh list each time.
+        # The catalog generation also covers persona/meta prompt config:
+        # the catalog signature tracks personaConfig and metaPromptConfig.
+        completeness_explicit = bool(self.completeness)
+        key = (
+            self.get_voice(),
+            self.get_tone(),
+            self.get_audience(),
+            self.get_intent(),
+            self.get_completeness(),
+            self.get_scope(),
+            self.get_method(),
+            self.get_form(),
+            self.get_channel(),
+            self.get_directional(),
+            completeness_explicit,
+            axis_catalog_generation(),
+        )
+        cached = _system_prompt_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        lines = self._render_lines(completeness_explicit)
+        _system_prompt_cache.put(key, tuple(lines))
+        return lines
+
+    def _render_lines(self, completeness_explicit: bool) -> list[str]:
         def _tokens_for_axis(axis: str, value) -> list[str]:
             if isinstance(value, (list, tuple)):
                 return [str(t).strip() for t in value if str(t).strip()]
@@ -323,7 +422,6 @@ class GPTSystemPrompt:
         # has not set completeness explicitly and a form token with a structural
         # brevity constraint is active.
         form_token_raw = self.get_form().split()[0] if self.get_form() else ""
-        completeness_explicit = bool(self.completeness)
         effective_completeness = self.get_completeness()
         if not completeness_explicit and form_token_raw:
             override = FORM_DEFAULT_COMPLETENESS.get(form_token_raw, "")
@@ -5,6 +5,10 @@ from __future__ import annotations
 from typing import Callable, Iterable, Optional, Set, Sequence
 import traceback
 
+from .modelLog import DEBUG, get_logger
+
+_log = get_logger("overlayLifecycle")
+
 COMMON_OVERLAY_CLOSERS: Sequence[str] = (
     "model_pattern_gui_close",
     "prompt_pattern_gui_close",
@@ -24,10 +28,10 @@ def close_overlays(closers: Iterable[Optional[Callable[[], None]]]) -> None:
             name = getattr(closer, "__name__", str(closer))
         except Exception:
             name = str(closer)
-        if "model_response_canvas_close" in name:
+        if "model_response_canvas_close" in name and _log.enabled_for(DEBUG):
             try:
                 stack = "".join(traceback.format_stack(limit=6))
-                print(f"[overlayLifecycle] closing response canvas via {name}\n{stack}")
+                _log.debug("closing response canvas via %s\n%s", name, stack)
             except Exception:
                 pass
         try:
@@ -9,8 +9,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
 
-from .axisCatalog import axis_catalog
-from .talonSettings import _canonicalise_axis_tokens
+from .talonSettings import _axis_token_index, _canonicalise_axis_tokens
 
 
 def _default_patterns():
@@ -26,11 +25,7 @@ def _default_patterns():
 def _axes_from_pattern(pattern) -> tuple[str, Dict[str, Any]]:
     """Parse a pattern's recipe/axes into a unified axes dict."""
 
-    catalog = axis_catalog()
-    axis_tokens = {
-        axis: set((tokens or {}).keys())
-        for axis, tokens in (catalog.get("axes") or {}).items()
-    }
+    index = _axis_token_index()
 
     recipe = getattr(pattern, "recipe", "") or ""
     tokens = [t.strip() for t in recipe.split("·") if t.strip()]
@@ -45,18 +40,19 @@ def _axes_from_pattern(pattern) -> tuple[str, Dict[str, Any]]:
 
     for segment in tokens[1:-1]:
         for token in segment.split():
-            if token in axis_tokens.get("completeness", set()):
+            axis = index.recipe_axis(token)
+            if axis == "completeness":
                 completeness = token
-            elif token in axis_tokens.get("scope", set()):
+            elif axis == "scope":
                 if token not in scope_tokens:
                     scope_tokens.append(token)
-            elif token in axis_tokens.get("method", set()):
+            elif axis == "method":
                 if token not in method_tokens:
                     method_tokens.append(token)
-            elif token in axis_tokens.get("form", set()):
+            elif axis == "form":
                 if token not in form_tokens:
                     form_tokens.append(token)
-            elif token in axis_tokens.get("channel", set()):
+            elif axis == "channel":
                 if token not in channel_tokens:
                     channel_tokens.append(token)
 
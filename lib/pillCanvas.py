@@ -13,6 +13,7 @@ from talon import Module, actions, app, canvas, ui, settings
 from .historyLifecycle import RequestPhase
 from .uiDispatch import run_on_ui_thread
 from .overlayHelpers import apply_canvas_blocking
+from .modelLog import DEBUG, INFO, get_logger
 
 mod = Module()
 
@@ -46,8 +47,15 @@ def _default_rect() -> ui.Rect:
         x = origin_x + _MARGIN
         y = origin_y + _MARGIN
         _debug(
-            f"default rect screen=({origin_x},{origin_y},{width},{height}) "
-            f"rect=({x},{y},{_DEFAULT_WIDTH},{_DEFAULT_HEIGHT})"
+            "default rect screen=(%s,%s,%s,%s) rect=(%s,%s,%s,%s)",
+            origin_x,
+            origin_y,
+            width,
+            height,
+            x,
+            y,
+            _DEFAULT_WIDTH,
+            _DEFAULT_HEIGHT,
         )
         return ui.Rect(x, y, _DEFAULT_WIDTH, _DEFAULT_HEIGHT)
     except Exception:
@@ -66,17 +74,15 @@ def _pill_color_for_phase(phase: RequestPhase) -> str:
     return "9B9B9B"  # default gray
 
 
-def _debug(msg: str) -> None:
+_log = get_logger("pill")
+
+
+def _debug(msg: str, *args: object) -> None:
     try:
         enabled = settings.get("user.model_debug_pill", True)
     except Exception:
         enabled = False
-    if not enabled:
-        return
-    try:
-        print(f"[pill] {msg}")
-    except Exception:
-        pass
+    _log.log(INFO if enabled else DEBUG, msg, *args)
 
 
 def _release_pill_canvas() -> None:
@@ -109,10 +115,14 @@ def _ensure_pill_canvas() -> canvas.Canvas:
         _pill_canvas = canvas.Canvas.from_rect(_pill_rect)
         created = True
         _debug(
-            f"pill canvas created from rect ({_pill_rect.x},{_pill_rect.y},{_pill_rect.width},{_pill_rect.height})"
+            "pill canvas created from rect (%s,%s,%s,%s)",
+            _pill_rect.x,
+            _pill_rect.y,
+            _pill_rect.width,
+            _pill_rect.height,
         )
     except Exception as e:
-        _debug(f"pill canvas from_rect failed: {e}")
+        _debug("pill canvas from_rect failed: %s", e)
         _pill_canvas = None
     if _pill_canvas is None:
         try:
@@ -120,7 +130,7 @@ def _ensure_pill_canvas() -> canvas.Canvas:
             created = True
             _debug("created pill canvas from screen fallback")
         except Exception as e:
-            _debug(f"pill canvas from_screen failed: {e}")
+            _debug("pill canvas from_screen failed: %s", e)
             _pill_canvas = None
     if _pill_canvas is None:
         _debug("failed to create pill canvas")
@@ -238,7 +248,7 @@ def _show_canvas(
         else:
             _debug("pill canvas unavailable")
     except Exception as e:
-        _debug(f"pill canvas show failed: {e}")
+        _debug("pill canvas show failed: %s", e)
 
 
 def _apply_rect(rect: ui.Rect) -> None:
@@ -308,11 +318,17 @@ def show_pill(text: str, phase: RequestPhase) -> None:
                 return
             rect = _default_rect()
             _debug(
-                f"Show pill: '{display_text}' phase={phase.name} rect=({rect.x}, {rect.y}, {rect.width}, {rect.height})"
+                "Show pill: '%s' phase=%s rect=(%s, %s, %s, %s)",
+                display_text,
+                phase.name,
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
             )
             _show_canvas(display_text, phase, rect)
         except Exception as e:
-            _debug(f"pill canvas show failed: {e}")
+            _debug("pill canvas show failed: %s", e)
 
     run_on_ui_thread(_try_show, delay_ms=0)
     run_on_ui_thread(_try_show, delay_ms=50)
@@ -337,12 +353,12 @@ def handle_pill_click(phase: RequestPhase, action: Optional[str] = None) -> None
             and phase in (RequestPhase.DONE, RequestPhase.ERROR, RequestPhase.CANCELLED)
         ):
             actions.user.model_response_canvas_open()
-            _debug(f"Pill click: open response (phase={phase.name})")
+            _debug("Pill click: open response (phase=%s)", phase.name)
         elif action == "cancel" or (
             action is None and phase in (RequestPhase.SENDING, RequestPhase.STREAMING)
         ):
             actions.user.gpt_cancel_request()
-            _debug(f"Pill click: cancel (phase={phase.name})")
+            _debug("Pill click: cancel (phase=%s)", phase.name)
     except Exception:
         # Swallow to avoid breaking the pill overlay on click.
         pass
@@ -80,6 +80,30 @@ class PromptPipeline:
         """Prepare and execute a prompt in a background thread; returns a handle."""
         return start_async(self.run, prompt, source, destination, additional_source)
 
+    def prepare_detached(
+        self,
+        prompt: str,
+        source: ModelSource,
+        destination,
+        additional_source: Optional[ModelSource] = None,
+    ) -> PromptSession:
+        """Prepare a prompt and snapshot its request for `complete_detached`.
+
+        Preparation goes through the shared GPTState request, so call this from
+        one thread; the returned sessions can then complete concurrently.
+        """
+        session = self._session_cls(destination)
+        session.prepare_prompt(prompt, source, additional_source)
+        session.detach()
+        return session
+
+    def complete_detached(
+        self, session: PromptSession, timeout_seconds: Optional[float] = None
+    ) -> PromptResult:
+        """Send a detached session's request; safe to run several at once."""
+        response = session.execute_detached(timeout_seconds=timeout_seconds)
+        return PromptResult.from_response(response, session=session)
+
     def complete(self, session: PromptSession) -> PromptResult:
         response = session.execute()
         session.append_thread(response)
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+import copy
+from typing import Any, Dict, List, Optional, Union
 
 from ..lib.modelHelpers import (
     append_request_messages,
+    apply_prompt_cache_layout,
     build_system_prompt_messages,
     build_request,
     format_messages,
     send_request,
     send_request_async,
+    send_request_detached,
 )
 from ..lib.modelSource import ModelSource, format_source_messages
 from ..lib.modelState import GPTState
 from ..lib.modelTypes import GPTMessage, GPTTextItem, GPTTool
+from ..lib.requestTracing import discard_pending_spans, trace_span
 
 
 class PromptSession:
@@ -23,6 +27,7 @@ class PromptSession:
     def __init__(self, destination: Union[str, object]):
         self._destination = destination
         self._prepared = False
+        self._detached_request: Optional[Dict[str, Any]] = None
         self.skip_history = False
 
     @property
@@ -36,19 +41,24 @@ class PromptSession:
         additional_source: Optional[ModelSource] = None,
     ) -> None:
         """Populate the request with system prompts, query backlog, and user input."""
-        self.begin()
+        # Spans from an earlier preparation that never reached send_request
+        # (failed build, delegate or sequence step) must not be adopted by
+        # this request.
+        discard_pending_spans()
+        with trace_span("prompt_resolution", prompt_chars=len(prompt or "")):
+            self.begin()
 
-        current_messages = format_source_messages(prompt, source, additional_source)
+            current_messages = format_source_messages(prompt, source, additional_source)
 
-        self.add_system_prompt()
+            self.add_system_prompt()
 
-        if GPTState.query:
-            append_request_messages(GPTState.query)
+            if GPTState.query:
+                append_request_messages(GPTState.query)
 
-        current_request = format_messages("user", current_messages)
-        if GPTState.thread_enabled:
-            GPTState.push_thread(current_request)
-        append_request_messages([current_request])
+            current_request = format_messages("user", current_messages)
+            if GPTState.thread_enabled:
+                GPTState.push_thread(current_request)
+            append_request_messages([current_request])
 
     def add_messages(self, messages: List[Union[GPTMessage, GPTTool]]) -> None:
         """Append additional messages or tool responses to the request."""
@@ -77,6 +87,24 @@ class PromptSession:
         self._ensure_prepared()
         return send_request(skip_history=self.skip_history)
 
+    def detach(self) -> None:
+        """Snapshot the prepared request so later prepares cannot overwrite it.
+
+        The prompt cache layout is applied first, so context that
+        build_request held back is part of the snapshot.
+        """
+        self._ensure_prepared()
+        apply_prompt_cache_layout()
+        self._detached_request = copy.deepcopy(GPTState.request)
+
+    def execute_detached(self, timeout_seconds: Optional[float] = None):
+        """Send the detached snapshot outside the shared request lifecycle."""
+        if self._detached_request is None:
+            self.detach()
+        return send_request_detached(
+            self._detached_request or {}, timeout_seconds=timeout_seconds
+        )
+
     def execute_async(self):
         """Send the request asynchronously and return a handle."""
         self._ensure_prepared()
@@ -16,12 +16,11 @@ from .requestGating import request_is_in_flight
 from .historyLifecycle import last_drop_reason, set_drop_reason
 
 from .modelHelpers import notify
+from .modelLog import get_logger
 from .surfaceGuidance import guard_surface_request
 
-try:
-    print(f"[debug] providerCommands loaded from {__file__}")
-except Exception:
-    pass
+_log = get_logger("providerCommands")
+_log.debug("loaded from %s", __file__)
 mod = Module()
 ctx = Context()
 
@@ -187,10 +186,7 @@ def _set_provider_model(provider_id: str, model: str) -> None:
     if provider_id == "openai":
         settings.set("user.openai_model", model)
         assert settings.get("user.openai_model") == model
-        try:
-            print(f"[debug] set openai_model -> {model}")
-        except Exception:
-            pass
+        _log.debug("set openai_model -> %s", model)
         provider_registry().set_default_model(provider_id, model)
     elif provider_id == "gemini":
         settings.set("user.model_provider_model_gemini", model)
@@ -0,0 +1,337 @@
+"""Pooled, keep-alive HTTP transport for provider requests.
+
+Every provider call used to go through the module-level `requests.post`, which
+opens a fresh TCP+TLS connection per request. This module keeps one persistent
+`requests.Session` per provider/endpoint origin so back-to-back voice commands
+(and nested `chatgpt_call` tool requests) reuse warm connections.
+
+Idle sessions are reaped lazily whenever the pool is touched, and pool stats
+are exposed via `provider_transport_stats()` for telemetry export. Callers that
+know the target provider early (for example, when a spoken prompt starts
+resolving) can `prewarm()` the connection so the handshake overlaps with prompt
+assembly instead of adding to time-to-first-token.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from talon import settings
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 90.0
+# A pooled connection used within this window is still warm; skip re-warming.
+WARM_FRESH_SECONDS = 15.0
+DEFAULT_WARM_TIMEOUT_SECONDS = 5.0
+
+TransportKey = Tuple[str, str]
+
+
+def _endpoint_origin(url: str) -> str:
+    """Return the scheme://host[:port] origin for a URL (connection-pool key)."""
+
+    try:
+        parts = urlsplit(str(url or ""))
+    except Exception:
+        return str(url or "")
+    if not parts.scheme or not parts.netloc:
+        return str(url or "")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def transport_key(provider_id: str, url: str) -> TransportKey:
+    return (str(provider_id or ""), _endpoint_origin(url))
+
+
+def _idle_timeout_setting() -> float:
+    try:
+        raw = settings.get(
+            "user.model_http_keepalive_idle_seconds", DEFAULT_IDLE_TIMEOUT_SECONDS
+        )
+    except Exception:
+        return DEFAULT_IDLE_TIMEOUT_SECONDS
+    try:
+        return float(raw)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return DEFAULT_IDLE_TIMEOUT_SECONDS
+
+
+@dataclass
+class _PooledSession:
+    key: TransportKey
+    session: Any
+    created_at: float
+    last_used: float
+    requests_served: int = 0
+    in_flight: int = 0
+
+
+@dataclass
+class _TransportStats:
+    sessions_created: int = 0
+    sessions_reused: int = 0
+    sessions_reaped: int = 0
+    sessions_closed: int = 0
+    requests_sent: int = 0
+    requests_unpooled: int = 0
+    request_errors: int = 0
+    warmups: int = 0
+    warmups_skipped: int = 0
+
+
+def _default_session_factory() -> Any:
+    return requests.Session()
+
+
+class ProviderTransport:
+    """Connection pool keyed by provider id and endpoint origin.
+
+    Sessions are created on first use and reused until they sit idle for longer
+    than the keep-alive window. Sessions with requests still in flight (for
+    example, a long streaming response) are never reaped.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout_seconds: Optional[float] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._idle_timeout_override = idle_timeout_seconds
+        self._session_factory = session_factory or _default_session_factory
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: Dict[TransportKey, _PooledSession] = {}
+        self._stats = _TransportStats()
+        self._warming: set[TransportKey] = set()
+
+    def idle_timeout_seconds(self) -> float:
+        if self._idle_timeout_override is not None:
+            return float(self._idle_timeout_override)
+        return _idle_timeout_setting()
+
+    def pooling_enabled(self) -> bool:
+        return self.idle_timeout_seconds() > 0
+
+    def _acquire(self, provider_id: str, url: str) -> _PooledSession:
+        key = transport_key(provider_id, url)
+        now = self._clock()
+        with self._lock:
+            self._reap_locked(now)
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = _PooledSession(
+                    key=key,
+                    session=self._session_factory(),
+                    created_at=now,
+                    last_used=now,
+                )
+                self._sessions[key] = entry
+                self._stats.sessions_created += 1
+            else:
+                self._stats.sessions_reused += 1
+            entry.in_flight += 1
+            entry.last_used = now
+            return entry
+
+    def post(self, provider_id: str, url: str, **kwargs: Any) -> Any:
+        """POST through the pooled session for this provider/endpoint."""
+
+        if not self.pooling_enabled():
+            with self._lock:
+                self._stats.requests_unpooled += 1
+            return requests.post(url, **kwargs)
+
+        entry = self._acquire(provider_id, url)
+        try:
+            response = entry.session.post(url, **kwargs)
+        except Exception:
+            with self._lock:
+                self._stats.request_errors += 1
+                entry.in_flight = max(0, entry.in_flight - 1)
+                entry.last_used = self._clock()
+            raise
+        with self._lock:
+            entry.requests_served += 1
+            self._stats.requests_sent += 1
+            if not kwargs.get("stream"):
+                # Non-streaming bodies are fully read by the time post returns.
+                entry.in_flight = max(0, entry.in_flight - 1)
+        return response
+
+    def release(self, provider_id: str, url: str) -> None:
+        """Mark a streaming response as finished so its session can idle out."""
+
+        key = transport_key(provider_id, url)
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return
+            entry.in_flight = max(0, entry.in_flight - 1)
+            entry.last_used = self._clock()
+
+    def warm(
+        self,
+        provider_id: str,
+        url: str,
+        *,
+        timeout: float = DEFAULT_WARM_TIMEOUT_SECONDS,
+    ) -> bool:
+        """Open (or refresh) the pooled connection for an endpoint.
+
+        Sends a HEAD request so the TCP+TLS handshake completes ahead of the
+        real request. The status code is irrelevant: any HTTP answer leaves a
+        live connection in the pool. Returns True when a warm-up request ran.
+        """
+
+        if not self.pooling_enabled():
+            return False
+        key = transport_key(provider_id, url)
+        now = self._clock()
+        with self._lock:
+            entry = self._sessions.get(key)
+            fresh = (
+                entry is not None
+                and entry.requests_served > 0
+                and now - entry.last_used < WARM_FRESH_SECONDS
+            )
+            if fresh or key in self._warming:
+                self._stats.warmups_skipped += 1
+                return False
+            self._warming.add(key)
+        try:
+            entry = self._acquire(provider_id, url)
+            try:
+                response = entry.session.head(url, timeout=timeout)
+                try:
+                    response.close()
+                except Exception:
+                    pass
+            except Exception:
+                with self._lock:
+                    self._stats.request_errors += 1
+                return False
+            finally:
+                with self._lock:
+                    entry.in_flight = max(0, entry.in_flight - 1)
+                    entry.last_used = self._clock()
+            with self._lock:
+                entry.requests_served += 1
+                self._stats.warmups += 1
+            return True
+        finally:
+            with self._lock:
+                self._warming.discard(key)
+
+    def prewarm(self, provider_id: str, url: str) -> Optional[threading.Thread]:
+        """Warm the endpoint on a daemon thread; returns the thread when started."""
+
+        if not self.pooling_enabled() or not url:
+            return None
+        thread = threading.Thread(
+            target=self.warm,
+            args=(provider_id, url),
+            name="provider-transport-prewarm",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _reap_locked(self, now: float) -> int:
+        timeout = self.idle_timeout_seconds()
+        if timeout <= 0:
+            expired = [key for key, e in self._sessions.items() if not e.in_flight]
+        else:
+            expired = [
+                key
+                for key, entry in self._sessions.items()
+                if not entry.in_flight and now - entry.last_used >= timeout
+            ]
+        for key in expired:
+            entry = self._sessions.pop(key)
+            try:
+                entry.session.close()
+            except Exception:
+                pass
+        self._stats.sessions_reaped += len(expired)
+        return len(expired)
+
+    def reap_idle(self) -> int:
+        """Close sessions that have been idle past the keep-alive window."""
+
+        with self._lock:
+            return self._reap_locked(self._clock())
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+            self._stats.sessions_closed += len(entries)
+        for entry in entries:
+            try:
+                entry.session.close()
+            except Exception:
+                pass
+
+    def stats(self, *, reset: bool = False) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            payload: Dict[str, Any] = asdict(self._stats)
+            payload["active_sessions"] = len(self._sessions)
+            payload["idle_timeout_seconds"] = self.idle_timeout_seconds()
+            payload["pools"] = [
+                {
+                    "provider_id": entry.key[0],
+                    "origin": entry.key[1],
+                    "requests_served": entry.requests_served,
+                    "in_flight": entry.in_flight,
+                    "idle_seconds": round(max(0.0, now - entry.last_used), 3),
+                    "age_seconds": round(max(0.0, now - entry.created_at), 3),
+                }
+                for entry in self._sessions.values()
+            ]
+            if reset:
+                self._stats = _TransportStats()
+        return payload
+
+
+_TRANSPORT: Optional[ProviderTransport] = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def provider_transport() -> ProviderTransport:
+    global _TRANSPORT
+    with _TRANSPORT_LOCK:
+        if _TRANSPORT is None:
+            _TRANSPORT = ProviderTransport()
+        return _TRANSPORT
+
+
+def reset_provider_transport() -> None:
+    """Close pooled sessions and start a fresh transport (primarily for tests)."""
+
+    global _TRANSPORT
+    with _TRANSPORT_LOCK:
+        previous = _TRANSPORT
+        _TRANSPORT = ProviderTransport()
+    if previous is not None:
+        previous.close_all()
+
+
+def provider_transport_stats(*, reset: bool = False) -> Dict[str, Any]:
+    return provider_transport().stats(reset=reset)
+
+
+__all__ = [
+    "ProviderTransport",
+    "provider_transport",
+    "provider_transport_stats",
+    "reset_provider_transport",
+    "transport_key",
+]
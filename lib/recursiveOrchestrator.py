@@ -1,31 +1,78 @@
-"""Recursive orchestration helpers built on top of PromptPipeline."""
+"""Recursive orchestration helpers built on top of PromptPipeline.
+
+The controller prompt may answer with a JSON directive. A single delegate:
+
+    {"action": "delegate", "prompt": "...", "response_destination": "paste"}
+
+runs one more prompt through the pipeline, as before. A fan-out directive:
+
+    {"action": "delegate",
+     "delegates": ["prompt a", {"prompt": "prompt b", "timeout_seconds": 30}],
+     "merge": "Combine the perspectives above into one answer.",
+     "timeout_seconds": 60}
+
+prepares every delegate prompt in turn, sends them concurrently on a bounded
+worker pool, and joins their answers in directive order. As for a single
+delegate, a delegate's `response_destination` is the destination its
+request is prepared for (for example `snip` asks for snippet syntax); the
+answers themselves are joined. `merge` (a prompt string, or
+`{"prompt": ..., "response_destination": ...}`) runs one final pipeline
+prompt over the joined answers; without it the joined answers are the
+result. A delegate that exceeds its timeout (counted from when the fan-out
+starts) or fails is reported inline instead of failing the run; the timeout
+is also the transport timeout of its HTTP call, since the pool cannot stop a
+call that is already running.
+"""
 
 from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from .modelHelpers import format_message
 from .promptPipeline import PromptPipeline, PromptResult
 from .modelSource import ModelSource
 from .requestAsync import start_async
+from .requestTracing import trace_span
 
 
 _CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
 
+DEFAULT_MAX_DELEGATE_WORKERS = 4
+
 
 @dataclass
 class _DelegateDirective:
     prompt: str
     destination: Optional[str]
+    timeout_seconds: Optional[float] = None
+
+
+@dataclass
+class _FanOutDirective:
+    delegates: List[_DelegateDirective]
+    merge_prompt: Optional[str] = None
+    merge_destination: Optional[str] = None
 
 
 class RecursiveOrchestrator:
     """Interpret controller directives and spawn delegated PromptPipeline runs."""
 
-    def __init__(self, pipeline: Optional[PromptPipeline] = None) -> None:
+    def __init__(
+        self,
+        pipeline: Optional[PromptPipeline] = None,
+        *,
+        max_workers: int = DEFAULT_MAX_DELEGATE_WORKERS,
+        delegate_timeout_seconds: Optional[float] = None,
+    ) -> None:
         self._pipeline = pipeline or PromptPipeline()
+        self._max_workers = max(1, int(max_workers))
+        self._delegate_timeout_seconds = delegate_timeout_seconds
 
     def run(
         self,
@@ -41,6 +88,10 @@ class RecursiveOrchestrator:
             additional_source,
         )
 
+        fan_out = self._parse_fan_out_directive(controller_result.text)
+        if fan_out is not None:
+            return self._run_fan_out(fan_out, source, destination, additional_source)
+
         directive = self._parse_delegate_directive(controller_result.text)
         if directive is None:
             return controller_result
@@ -65,6 +116,121 @@ class RecursiveOrchestrator:
         """Run `run` in a background thread and return a handle."""
         return start_async(self.run, prompt, source, destination, additional_source)
 
+    def _run_fan_out(
+        self,
+        directive: _FanOutDirective,
+        source: ModelSource,
+        destination,
+        additional_source: Optional[ModelSource],
+    ) -> PromptResult:
+        # Preparation shares GPTState.request, so it stays on this thread; only
+        # the detached sends run on the pool.
+        sessions = [
+            self._pipeline.prepare_detached(
+                delegate.prompt,
+                source,
+                delegate.destination or destination,
+                additional_source,
+            )
+            for delegate in directive.delegates
+        ]
+        texts: List[str] = []
+        pool = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(sessions)),
+            thread_name_prefix="delegate",
+        )
+        timeouts = [
+            delegate.timeout_seconds
+            if delegate.timeout_seconds is not None
+            else self._delegate_timeout_seconds
+            for delegate in directive.delegates
+        ]
+        with trace_span("delegate_fan_out", delegates=len(sessions)):
+            started = time.monotonic()
+            try:
+                futures = [
+                    pool.submit(
+                        self._pipeline.complete_detached,
+                        session,
+                        timeout_seconds=timeout,
+                    )
+                    for session, timeout in zip(sessions, timeouts)
+                ]
+                for number, (timeout, future) in enumerate(
+                    zip(timeouts, futures), start=1
+                ):
+                    remaining = (
+                        None
+                        if timeout is None
+                        else max(0.0, started + timeout - time.monotonic())
+                    )
+                    try:
+                        texts.append(future.result(timeout=remaining).text)
+                    except FutureTimeoutError:
+                        future.cancel()
+                        texts.append(
+                            f"(delegate {number} timed out after {timeout:g}s)"
+                        )
+                    except Exception as exc:
+                        texts.append(f"(delegate {number} failed: {exc})")
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        joined = "\n\n".join(
+            f"## Delegate {number}: {delegate.prompt}\n{text}"
+            for number, (delegate, text) in enumerate(
+                zip(directive.delegates, texts), start=1
+            )
+        )
+        if not directive.merge_prompt:
+            return PromptResult.from_messages([format_message(joined)])
+
+        return self._pipeline.run(
+            f"{directive.merge_prompt}\n\n{joined}",
+            source,
+            directive.merge_destination or destination,
+            additional_source,
+        )
+
+    def _parse_fan_out_directive(self, text: str) -> Optional[_FanOutDirective]:
+        payload = self._extract_json_dict(text)
+        if not payload or payload.get("action") not in {"delegate", "call_self"}:
+            return None
+
+        raw_delegates = payload.get("delegates")
+        if not isinstance(raw_delegates, list):
+            return None
+
+        default_timeout = _coerce_timeout(payload.get("timeout_seconds"))
+        delegates: List[_DelegateDirective] = []
+        for item in raw_delegates:
+            if isinstance(item, str):
+                item = {"prompt": item}
+            if not isinstance(item, dict) or not item.get("prompt"):
+                continue
+            timeout = _coerce_timeout(item.get("timeout_seconds"))
+            delegates.append(
+                _DelegateDirective(
+                    prompt=str(item["prompt"]),
+                    destination=item.get("response_destination"),
+                    timeout_seconds=timeout if timeout is not None else default_timeout,
+                )
+            )
+        if not delegates:
+            return None
+
+        merge = payload.get("merge")
+        if isinstance(merge, dict):
+            merge_prompt = merge.get("prompt")
+            merge_destination = merge.get("response_destination")
+        else:
+            merge_prompt, merge_destination = merge, None
+        return _FanOutDirective(
+            delegates=delegates,
+            merge_prompt=str(merge_prompt) if merge_prompt else None,
+            merge_destination=merge_destination,
+        )
+
     def _parse_delegate_directive(
         self, text: str
     ) -> Optional[_DelegateDirective]:
@@ -96,3 +262,13 @@ class RecursiveOrchestrator:
             if isinstance(payload, dict):
                 return payload
         return None
+
+
+def _coerce_timeout(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
@@ -7,8 +7,15 @@ GPTState. Intended to power the request log drawer and back/forward recall.
 from __future__ import annotations
 
 from collections import deque
-from dataclasses import dataclass, field
-from typing import Deque, Iterable, List, Optional, Dict
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional
+
+from .modelLog import get_logger
+
+_log = get_logger("requestHistory")
+
+# Enough of the prompt's first line for drawer/summary rows (which clip at 80).
+PROMPT_PREVIEW_CHARS = 120
 
 
 @dataclass(frozen=True)
@@ -25,6 +32,87 @@ class RequestLogEntry:
     provider_id: str = ""
     persona: Dict[str, str] = field(default_factory=dict)
 
+    @property
+    def prompt_preview(self) -> str:
+        """First line of the prompt, clipped for summary rows."""
+        return prompt_preview_for(self.prompt)
+
+
+def prompt_preview_for(prompt: str) -> str:
+    lines = str(prompt or "").strip().splitlines()
+    return lines[0][:PROMPT_PREVIEW_CHARS] if lines else ""
+
+
+_BODY_FIELDS = ("prompt", "response", "meta")
+
+
+class _LazyBody:
+    """Data descriptor that decodes a body field on first access."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        values = obj.__dict__
+        if self.name not in values:
+            loader = values.get("_pending_bodies", {}).pop(self.name, None)
+            values[self.name] = loader() if loader is not None else ""
+        return values[self.name]
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+class LazyRequestLogEntry(RequestLogEntry):
+    """RequestLogEntry whose prompt/response/meta are decoded on first access.
+
+    History stores that keep bodies compressed hand these out so listing rows
+    (drawer, summaries) never pays for decompressing bodies nobody reads.
+    Equality and repr match a plain entry with the same field values.
+    """
+
+    prompt = _LazyBody("prompt")  # type: ignore[assignment]
+    response = _LazyBody("response")  # type: ignore[assignment]
+    meta = _LazyBody("meta")  # type: ignore[assignment]
+
+    @classmethod
+    def deferred(
+        cls,
+        bodies: Mapping[str, Callable[[], str]],
+        *,
+        preview: Optional[str] = None,
+        **fields: Any,
+    ) -> "LazyRequestLogEntry":
+        entry = cls.__new__(cls)
+        entry.__dict__.update(fields)
+        entry.__dict__["_pending_bodies"] = {
+            name: loader for name, loader in bodies.items() if name in _BODY_FIELDS
+        }
+        entry.__dict__["_preview"] = preview
+        return entry
+
+    @property
+    def prompt_preview(self) -> str:
+        if "prompt" in self.__dict__:
+            return prompt_preview_for(self.__dict__["prompt"])
+        preview = self.__dict__.get("_preview")
+        if preview is not None:
+            return preview
+        return prompt_preview_for(self.prompt)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RequestLogEntry):
+            return NotImplemented
+        return _entry_values(self) == _entry_values(other)
+
+    __hash__ = RequestLogEntry.__hash__
+
+
+def _entry_values(entry: RequestLogEntry) -> tuple:
+    return tuple(getattr(entry, f.name) for f in fields(RequestLogEntry))
+
 
 class RequestHistory:
     """Fixed-size ring buffer of request entries."""
@@ -36,12 +124,12 @@ class RequestHistory:
     def append(self, entry: RequestLogEntry) -> None:
         """Add a new entry, evicting the oldest when at capacity."""
         self._entries.append(entry)
-        try:
-            print(
-                f"[requestHistory] append on {id(self)} len={len(self._entries)} newest_id={entry.request_id}"
-            )
-        except Exception:
-            pass
+        _log.debug(
+            "append on %d len=%d newest_id=%s",
+            id(self),
+            len(self._entries),
+            entry.request_id,
+        )
 
     def latest(self) -> Optional[RequestLogEntry]:
         """Return the most recent entry, if any."""
@@ -55,19 +143,36 @@ class RequestHistory:
             return None
         if offset >= len(self._entries):
             return None
-        # deque does not support reversed index directly; convert to list once.
-        return list(self._entries)[-(offset + 1)]
+        return self._entries[-(offset + 1)]
+
+    def recent(self, limit: int, offset: int = 0) -> List[RequestLogEntry]:
+        """Return up to `limit` entries newest-first, starting `offset` back."""
+        if limit <= 0 or offset < 0:
+            return []
+        count = len(self._entries)
+        stop = min(offset + limit, count)
+        return [self._entries[count - 1 - index] for index in range(offset, stop)]
 
     def all(self) -> List[RequestLogEntry]:
         """Return a copy of all entries from oldest to newest."""
-        try:
-            print(f"[requestHistory] all on {id(self)} len={len(self._entries)}")
-        except Exception:
-            pass
+        _log.debug("all on %d len=%d", id(self), len(self._entries))
         return list(self._entries)
 
+    def replace(self, entries: Iterable[RequestLogEntry]) -> None:
+        """Swap in `entries` (oldest to newest), keeping the newest on overflow."""
+        self._entries = deque(entries, maxlen=self._max)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
     def __len__(self) -> int:
         return len(self._entries)
 
 
-__all__ = ["RequestLogEntry", "RequestHistory"]
+__all__ = [
+    "LazyRequestLogEntry",
+    "PROMPT_PREVIEW_CHARS",
+    "RequestLogEntry",
+    "RequestHistory",
+    "prompt_preview_for",
+]
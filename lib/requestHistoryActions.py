@@ -235,11 +235,13 @@ def history_summary_lines(entries: Sequence[object]) -> list[str]:
         if isinstance(axes, dict) and dir_tokens:
             axes = dict(axes)
             axes["directional"] = dir_tokens
-        prompt = (
-            (getattr(entry, "prompt", "") or "").strip().splitlines()[0]
-            if getattr(entry, "prompt", None)
-            else ""
-        )
+        prompt = getattr(entry, "prompt_preview", None)
+        if prompt is None:
+            prompt = (
+                (getattr(entry, "prompt", "") or "").strip().splitlines()[0]
+                if getattr(entry, "prompt", None)
+                else ""
+            )
         prompt_snippet = prompt[:60] + ("…" if len(prompt) > 60 else "")
         duration_ms = getattr(entry, "duration_ms", None)
         dur = f"{duration_ms}ms" if duration_ms is not None else ""
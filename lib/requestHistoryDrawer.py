@@ -8,16 +8,18 @@ from collections.abc import Sequence
 from talon import Module, actions, canvas, ui
 
 from .historyLifecycle import (
-    all_entries,
     consume_last_drop_reason_record,
     drop_reason_message,
     last_drop_reason as lifecycle_last_drop_reason,
+    recent_entries,
+    search_history,
     set_drop_reason,
     try_begin_request as lifecycle_try_begin_request,
 )
 from .historyQuery import history_drawer_entries_from
 
 from .modelHelpers import notify
+from .modelLog import get_logger
 from .requestGating import request_is_in_flight
 from .surfaceGuidance import guard_surface_request
 from .overlayHelpers import apply_canvas_blocking
@@ -28,6 +30,11 @@ try_begin_request = lifecycle_try_begin_request
 last_drop_reason = lifecycle_last_drop_reason
 
 mod = Module()
+_log = get_logger("requestHistoryDrawer")
+
+# The drawer lists the newest entries only; persistent history can hold far
+# more than is useful to render at once.
+HISTORY_DRAWER_MAX_ENTRIES = 200
 
 
 class HistoryDrawerState:
@@ -37,6 +44,19 @@ class HistoryDrawerState:
     ] = []  # (request_id, prompt_snippet + recipe + provider)
     selected_index: int = 0
     last_message: str = ""
+    # Search mode: active query, total match count, and each row's offset from
+    # the latest entry (None outside search mode, where row index == offset).
+    search_query: str = ""
+    search_total: int = 0
+    entry_offsets: Optional[List[int]] = None
+
+
+def _selected_offset() -> int:
+    idx = HistoryDrawerState.selected_index
+    offsets = HistoryDrawerState.entry_offsets
+    if offsets is not None and 0 <= idx < len(offsets):
+        return offsets[idx]
+    return idx
 
 
 _history_canvas: Optional[canvas.Canvas] = None
@@ -184,6 +204,14 @@ def _ensure_canvas() -> canvas.Canvas:
         line_h = 18
         draw_text("Model request history", x, y)
         y += line_h
+        if HistoryDrawerState.search_query:
+            draw_text(
+                f"Search: {HistoryDrawerState.search_query} "
+                f"({HistoryDrawerState.search_total} matches)",
+                x,
+                y,
+            )
+            y += line_h
         if not HistoryDrawerState.entries:
             message = HistoryDrawerState.last_message or "No history yet."
             for line in message.splitlines() or [message]:
@@ -195,7 +223,13 @@ def _ensure_canvas() -> canvas.Canvas:
             draw_text("Press s to save latest source.", x, y)
             return
 
-        draw_text("Newest first (click to open):", x, y)
+        draw_text(
+            "Best match first (click to open):"
+            if HistoryDrawerState.search_query
+            else "Newest first (click to open):",
+            x,
+            y,
+        )
         y += line_h
         for idx, (req_id, snippet) in enumerate(HistoryDrawerState.entries):
             text = f"{idx}: {req_id} | {snippet}"
@@ -262,7 +296,7 @@ def _ensure_canvas() -> canvas.Canvas:
             HistoryDrawerState.showing = False
 
     def _open_selected():
-        idx = HistoryDrawerState.selected_index
+        idx = _selected_offset()
         try:
             actions.user.gpt_request_history_show_previous(idx)
         except Exception:
@@ -284,22 +318,47 @@ def _ensure_canvas() -> canvas.Canvas:
     return _history_canvas
 
 
-def _refresh_entries() -> None:
+def _refresh_search_entries() -> None:
+    query = HistoryDrawerState.search_query
     try:
-        entries = list(reversed(all_entries()))
+        page = search_history(query, limit=HISTORY_DRAWER_MAX_ENTRIES)
     except Exception as e:
+        _log.warning("search failed: %s", e)
+        page = None
+    rows: List[Tuple[str, str]] = []
+    offsets: List[int] = []
+    for hit in getattr(page, "hits", []):
         try:
-            print(f"[requestHistoryDrawer] failed to load entries: {e}")
-        except Exception:
-            pass
+            rendered = history_drawer_entries_from([hit.entry])
+        except ValueError:
+            continue
+        if rendered:
+            rows.append(rendered[0])
+            offsets.append(hit.offset)
+    HistoryDrawerState.entries = rows
+    HistoryDrawerState.entry_offsets = offsets
+    HistoryDrawerState.search_total = int(getattr(page, "total", 0) or 0)
+    HistoryDrawerState.selected_index = 0
+    HistoryDrawerState.last_message = (
+        "" if rows else f"No history entries match '{query}'."
+    )
+
+
+def _refresh_entries() -> None:
+    if HistoryDrawerState.search_query:
+        _refresh_search_entries()
+        return
+    HistoryDrawerState.entry_offsets = None
+    HistoryDrawerState.search_total = 0
+    try:
+        entries = recent_entries(HISTORY_DRAWER_MAX_ENTRIES)
+    except Exception as e:
+        _log.warning("failed to load entries: %s", e)
         HistoryDrawerState.entries = []
         HistoryDrawerState.selected_index = 0
         HistoryDrawerState.last_message = ""
         return
-    try:
-        print(f"[requestHistoryDrawer] refresh entries={len(entries)}")
-    except Exception:
-        pass
+    _log.debug("refresh entries=%d", len(entries))
     try:
         HistoryDrawerState.entries = history_drawer_entries_from(entries)
     except ValueError as exc:
@@ -378,6 +437,7 @@ class UserActions:
         if _reject_if_request_in_flight(allow_inflight=True):
             return
         HistoryDrawerState.showing = False
+        HistoryDrawerState.search_query = ""
         if _history_canvas is None:
             return
         _release_history_canvas()
@@ -418,7 +478,7 @@ class UserActions:
             return
         if not HistoryDrawerState.entries:
             return
-        idx = HistoryDrawerState.selected_index
+        idx = _selected_offset()
         try:
             actions.user.gpt_request_history_show_previous(idx)
         except Exception:
@@ -447,6 +507,19 @@ class UserActions:
             pass
         return result
 
+    def request_history_drawer_search(query: str):
+        """Open the history drawer filtered by a search query (text plus field:value facets)"""
+        if _reject_if_request_in_flight():
+            return
+        HistoryDrawerState.search_query = str(query or "").strip()
+        actions.user.request_history_drawer_open()
+
+    def request_history_drawer_clear_search():
+        """Return the history drawer to the newest-first listing"""
+        HistoryDrawerState.search_query = ""
+        if HistoryDrawerState.showing:
+            refresh_history_drawer()
+
     def request_history_drawer_refresh():
         """Refresh entries when the drawer is showing (e.g., after a history save)."""
         if not HistoryDrawerState.showing:
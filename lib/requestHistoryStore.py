@@ -0,0 +1,662 @@
+"""Persistent, append-only request history backed by SQLite.
+
+`SQLiteRequestHistory` mirrors the `RequestHistory` ring API (`append`,
+`latest`, `nth_from_latest`, `all`, `len`) so `requestLog` can swap it in
+without touching callers, and survives Talon restarts.
+
+Layout notes:
+- Entries get contiguous sequence numbers (the SQLite rowid). Retention only
+  ever trims the oldest rows, so `nth_from_latest(offset)` is a single primary
+  key lookup of `tail - offset` no matter how large the history grows.
+- Secondary indexes cover request_id, started_at_ms, provider_id and
+  (axis, token) pairs for lookups that should not scan the table.
+- A small decoded-entry cache keeps drawer navigation over recent rows from
+  re-reading SQLite.
+- Prompt/response/meta bodies above `COMPRESS_MIN_BYTES` are stored as zlib
+  blobs. Once `DICTIONARY_TRAIN_ENTRIES` entries exist, a preset dictionary is
+  trained from lines that recur across recent bodies (shared system prompt
+  and context scaffolding) and used for later rows. Rows come back as
+  `LazyRequestLogEntry`, which only decompresses a body when it is read; a
+  stored prompt preview lets summary rows render without any body at all.
+- `search` is answered inside SQLite: a contentless FTS5 table keyed by seq
+  holds the body text, and `entry_axes` also files the static prompt,
+  provider and persona facets. Queries never decode bodies beyond the page
+  they return. Files written before the index existed are backfilled once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .historySearch import (
+    AXIS_FACETS,
+    FACET_NAMES,
+    SUMMARY_FACETS,
+    HistorySearchHit,
+    HistorySearchPage,
+    HistorySearchQuery,
+    entry_facets,
+)
+from .requestHistory import LazyRequestLogEntry, RequestLogEntry, prompt_preview_for
+
+DEFAULT_MAX_ENTRIES = 5000
+_DECODED_CACHE_SIZE = 64
+# Bodies shorter than this are stored as plain text.
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 6
+# Train a preset dictionary once this many entries exist.
+DICTIONARY_TRAIN_ENTRIES = 64
+# zlib only looks back 32 KiB, so a larger dictionary would be wasted.
+DICTIONARY_MAX_BYTES = 32 * 1024
+_DICTIONARY_MIN_LINE = 8
+# Stored in PRAGMA user_version; older files are re-indexed on open.
+SEARCH_INDEX_VERSION = 1
+# Facets filed in `entry_axes` next to the axis tokens themselves.
+_EXTRA_FACETS = tuple(name for name in FACET_NAMES if name not in AXIS_FACETS)
+# Matches the words FTS5's unicode61 tokenizer keeps.
+_FTS_WORD_RE = re.compile(r"[^\W_]+")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        seq INTEGER PRIMARY KEY,
+        request_id TEXT NOT NULL,
+        started_at_ms INTEGER,
+        duration_ms INTEGER,
+        provider_id TEXT NOT NULL DEFAULT '',
+        recipe TEXT NOT NULL DEFAULT '',
+        prompt TEXT NOT NULL DEFAULT '',
+        response TEXT NOT NULL DEFAULT '',
+        meta TEXT NOT NULL DEFAULT '',
+        axes TEXT NOT NULL DEFAULT '{}',
+        persona TEXT NOT NULL DEFAULT '{}',
+        dict_id INTEGER NOT NULL DEFAULT 0,
+        prompt_preview TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_request_id ON entries(request_id)",
+    "CREATE INDEX IF NOT EXISTS entries_started_at ON entries(started_at_ms)",
+    "CREATE INDEX IF NOT EXISTS entries_provider ON entries(provider_id, seq)",
+    """
+    CREATE TABLE IF NOT EXISTS entry_axes (
+        seq INTEGER NOT NULL,
+        axis TEXT NOT NULL,
+        token TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entry_axes_token ON entry_axes(axis, token, seq)",
+    "CREATE INDEX IF NOT EXISTS entry_axes_seq ON entry_axes(seq)",
+    """
+    CREATE TABLE IF NOT EXISTS body_dictionaries (
+        id INTEGER PRIMARY KEY,
+        data BLOB NOT NULL
+    )
+    """,
+)
+
+# Contentless: the bodies already live (compressed) in `entries`.
+_SEARCH_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(body, content='')"
+)
+
+# Columns added after the first release of the store; older files get them
+# via ALTER TABLE on open (their rows keep plain-text bodies).
+_ADDED_COLUMNS = (
+    ("dict_id", "INTEGER NOT NULL DEFAULT 0"),
+    ("prompt_preview", "TEXT"),
+)
+
+_ENTRY_COLUMNS = (
+    "seq, request_id, started_at_ms, duration_ms, provider_id, recipe, "
+    "prompt, response, meta, axes, persona, dict_id, prompt_preview"
+)
+
+_Body = Union[str, bytes]
+
+
+def _json_dict(raw: object) -> dict:
+    try:
+        value = json.loads(str(raw or "{}"))
+    except Exception:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _axes_of(entry: object) -> dict[str, list[str]]:
+    axes = getattr(entry, "axes", None) or {}
+    if not isinstance(axes, dict):
+        return {}
+    payload: dict[str, list[str]] = {}
+    for axis, tokens in axes.items():
+        if isinstance(tokens, (list, tuple)):
+            payload[str(axis)] = [str(t) for t in tokens]
+        elif tokens:
+            payload[str(axis)] = [str(tokens)]
+    return payload
+
+
+def _optional_int(value: object) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def _search_text(prompt: str, response: str, meta: str, recipe: str) -> str:
+    return " ".join((prompt, response, meta, recipe))
+
+
+def _facet_rows(seq: int, entry: object) -> List[tuple]:
+    return [
+        (seq, name, value)
+        for name, value in sorted(entry_facets(entry))
+        if name in _EXTRA_FACETS
+    ]
+
+
+def compress_body(text: str, zdict: Optional[bytes] = None) -> _Body:
+    """Return a zlib blob for `text`, or `text` itself when that is smaller."""
+    raw = str(text or "").encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return str(text or "")
+    if zdict:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(COMPRESS_LEVEL)
+    data = compressor.compress(raw) + compressor.flush()
+    return data if len(data) < len(raw) else str(text or "")
+
+
+def decompress_body(value: object, zdict: Optional[bytes] = None) -> str:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        if zdict:
+            decompressor = zlib.decompressobj(zdict=zdict)
+        else:
+            decompressor = zlib.decompressobj()
+        raw = decompressor.decompress(bytes(value)) + decompressor.flush()
+        return raw.decode("utf-8", errors="replace")
+    return str(value or "")
+
+
+def train_body_dictionary(
+    samples: Iterable[str], max_bytes: int = DICTIONARY_MAX_BYTES
+) -> bytes:
+    """Build a zlib preset dictionary from lines shared across samples.
+
+    zlib favours matches close to the data, so the most widely shared lines
+    go at the end of the dictionary.
+    """
+    counts: Counter = Counter()
+    for sample in samples:
+        for line in set(str(sample or "").splitlines()):
+            if len(line.strip()) >= _DICTIONARY_MIN_LINE:
+                counts[line] += 1
+    shared = [line for line, count in counts.items() if count >= 2]
+    shared.sort(key=lambda line: (counts[line], len(line)), reverse=True)
+    chosen: List[bytes] = []
+    size = 0
+    for line in shared:
+        encoded = line.encode("utf-8") + b"\n"
+        if size + len(encoded) > max_bytes:
+            continue
+        chosen.append(encoded)
+        size += len(encoded)
+    return b"".join(reversed(chosen))
+
+
+class SQLiteRequestHistory:
+    """Append-only request history persisted to a SQLite file."""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._path = path
+        self._max = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError:
+            pass
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            existing = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(entries)")
+            }
+            for name, decl in _ADDED_COLUMNS:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE entries ADD COLUMN {name} {decl}")
+        self._decoded: "OrderedDict[int, RequestLogEntry]" = OrderedDict()
+        self._dictionaries: Dict[int, bytes] = {
+            int(row[0]): bytes(row[1])
+            for row in self._conn.execute("SELECT id, data FROM body_dictionaries")
+        }
+        self._dict_id = max(self._dictionaries, default=0)
+        # Appends to skip before retrying a training attempt that found nothing.
+        self._train_backoff = 0
+        self._fts = self._create_search_index()
+        self._backfill_search_index()
+        self._load_bounds()
+        self._enforce_retention()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_entries(self) -> int:
+        return self._max
+
+    @property
+    def supports_search(self) -> bool:
+        """True when this SQLite build has FTS5 and `search` can be used."""
+        return self._fts
+
+    def _create_search_index(self) -> bool:
+        try:
+            with self._conn:
+                self._conn.execute(_SEARCH_SCHEMA)
+        except sqlite3.DatabaseError:
+            return False
+        return True
+
+    def _backfill_search_index(self) -> None:
+        """Index rows written before the search index existed (one pass)."""
+        if not self._fts:
+            return
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if int(version or 0) >= SEARCH_INDEX_VERSION:
+            return
+        marks = ",".join("?" * len(_EXTRA_FACETS))
+        with self._conn:
+            self._conn.execute(
+                f"DELETE FROM entry_axes WHERE axis IN ({marks})", _EXTRA_FACETS
+            )
+            self._conn.execute(
+                "INSERT INTO entries_fts(entries_fts) VALUES('delete-all')"
+            )
+            rows = self._conn.cursor().execute(f"SELECT {_ENTRY_COLUMNS} FROM entries")
+            for row in rows:
+                entry = self._decode(row)
+                self._index_row(
+                    int(row[0]), entry, entry.prompt, entry.response, entry.meta
+                )
+            self._conn.execute(f"PRAGMA user_version = {SEARCH_INDEX_VERSION}")
+
+    def _load_bounds(self) -> None:
+        row = self._conn.execute("SELECT MIN(seq), MAX(seq) FROM entries").fetchone()
+        if row is None or row[1] is None:
+            self._head, self._tail = 1, 0
+        else:
+            self._head, self._tail = int(row[0]), int(row[1])
+
+    def _enforce_retention(self) -> None:
+        cutoff = self._tail - self._max + 1
+        if self._head >= cutoff:
+            return
+        with self._conn:
+            self._unindex_before(cutoff)
+            self._conn.execute("DELETE FROM entry_axes WHERE seq < ?", (cutoff,))
+            self._conn.execute("DELETE FROM entries WHERE seq < ?", (cutoff,))
+        self._head = cutoff
+        for seq in [s for s in self._decoded if s < cutoff]:
+            del self._decoded[seq]
+
+    def _index_row(
+        self, seq: int, entry: object, prompt: str, response: str, meta: str
+    ) -> None:
+        self._conn.executemany(
+            "INSERT INTO entry_axes (seq, axis, token) VALUES (?,?,?)",
+            _facet_rows(seq, entry),
+        )
+        if self._fts:
+            recipe = str(getattr(entry, "recipe", "") or "")
+            self._conn.execute(
+                "INSERT INTO entries_fts (rowid, body) VALUES (?, ?)",
+                (seq, _search_text(prompt, response, meta, recipe)),
+            )
+
+    def _unindex_before(self, cutoff: int) -> None:
+        if not self._fts:
+            return
+        # A contentless table can only drop a row given the text it indexed.
+        rows = self._conn.execute(
+            "SELECT seq, recipe, prompt, response, meta, dict_id FROM entries "
+            "WHERE seq < ?",
+            (cutoff,),
+        ).fetchall()
+        for seq, recipe, *bodies, dict_id in rows:
+            zdict = self._dictionaries.get(int(dict_id or 0))
+            prompt, response, meta = (decompress_body(b, zdict) for b in bodies)
+            self._conn.execute(
+                "INSERT INTO entries_fts (entries_fts, rowid, body) "
+                "VALUES ('delete', ?, ?)",
+                (seq, _search_text(prompt, response, meta, str(recipe or ""))),
+            )
+
+    def _insert(self, seq: int, entry: object) -> None:
+        axes = _axes_of(entry)
+        persona = getattr(entry, "persona", None) or {}
+        prompt = str(getattr(entry, "prompt", "") or "")
+        response = str(getattr(entry, "response", "") or "")
+        meta = str(getattr(entry, "meta", "") or "")
+        zdict = self._dictionaries.get(self._dict_id)
+        self._conn.execute(
+            f"INSERT INTO entries ({_ENTRY_COLUMNS}) "
+            "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
+            (
+                seq,
+                str(getattr(entry, "request_id", "") or ""),
+                _optional_int(getattr(entry, "started_at_ms", None)),
+                _optional_int(getattr(entry, "duration_ms", None)),
+                str(getattr(entry, "provider_id", "") or ""),
+                str(getattr(entry, "recipe", "") or ""),
+                compress_body(prompt, zdict),
+                compress_body(response, zdict),
+                compress_body(meta, zdict),
+                json.dumps(axes, sort_keys=True),
+                json.dumps(dict(persona) if isinstance(persona, dict) else {}),
+                self._dict_id if zdict else 0,
+                prompt_preview_for(prompt),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT INTO entry_axes (seq, axis, token) VALUES (?,?,?)",
+            [(seq, axis, token) for axis, tokens in axes.items() for token in tokens],
+        )
+        self._index_row(seq, entry, prompt, response, meta)
+
+    def _decode(self, row: Sequence[Any]) -> RequestLogEntry:
+        zdict = self._dictionaries.get(int(row[11] or 0))
+
+        def body(value: object):
+            return lambda: decompress_body(value, zdict)
+
+        return LazyRequestLogEntry.deferred(
+            {"prompt": body(row[6]), "response": body(row[7]), "meta": body(row[8])},
+            preview=row[12],
+            request_id=row[1],
+            recipe=row[5],
+            started_at_ms=row[2],
+            duration_ms=row[3],
+            axes=_json_dict(row[9]),
+            provider_id=row[4],
+            persona=_json_dict(row[10]),
+        )
+
+    def _maybe_train_dictionary(self) -> None:
+        """Train the preset body dictionary once enough history exists.
+
+        A failed attempt (no shared lines yet) is retried only after another
+        `DICTIONARY_TRAIN_ENTRIES` appends, not on every append.
+        """
+        if self._dict_id or len(self) < DICTIONARY_TRAIN_ENTRIES:
+            return
+        if self._train_backoff:
+            self._train_backoff -= 1
+            return
+        self._train_backoff = DICTIONARY_TRAIN_ENTRIES
+        rows = self._conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM entries ORDER BY seq DESC LIMIT ?",
+            (DICTIONARY_TRAIN_ENTRIES,),
+        ).fetchall()
+        samples: List[str] = []
+        for row in rows:
+            entry = self._decode(row)
+            samples.extend((entry.prompt, entry.response, entry.meta))
+        data = train_body_dictionary(samples)
+        if not data:
+            return
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO body_dictionaries (data) VALUES (?)", (data,)
+            )
+        dict_id = int(cursor.lastrowid or 0)
+        if dict_id:
+            self._dictionaries[dict_id] = data
+            self._dict_id = dict_id
+
+    def _remember(self, seq: int, entry: RequestLogEntry) -> RequestLogEntry:
+        self._decoded[seq] = entry
+        self._decoded.move_to_end(seq)
+        while len(self._decoded) > _DECODED_CACHE_SIZE:
+            self._decoded.popitem(last=False)
+        return entry
+
+    def _entry_at(self, seq: int) -> Optional[RequestLogEntry]:
+        cached = self._decoded.get(seq)
+        if cached is not None:
+            self._decoded.move_to_end(seq)
+            return cached
+        row = self._conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM entries WHERE seq = ?", (seq,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._remember(seq, self._decode(row))
+
+    def _select(self, where: str, params: Sequence[Any], limit: Optional[int]):
+        sql = f"SELECT {_ENTRY_COLUMNS} FROM entries {where} ORDER BY seq DESC"
+        args = list(params)
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(max(int(limit), 0))
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def append(self, entry: object) -> None:
+        """Persist a new entry, trimming the oldest beyond the retention size."""
+        with self._lock:
+            seq = self._tail + 1
+            with self._conn:
+                self._insert(seq, entry)
+            self._tail = seq
+            if self._head > self._tail:
+                self._head = seq
+            if isinstance(entry, RequestLogEntry):
+                self._remember(seq, entry)
+            self._enforce_retention()
+            self._maybe_train_dictionary()
+
+    def latest(self) -> Optional[RequestLogEntry]:
+        return self.nth_from_latest(0)
+
+    def nth_from_latest(self, offset: int) -> Optional[RequestLogEntry]:
+        """Return the entry offset steps back from the latest (offset=0 is latest)."""
+        if offset < 0:
+            return None
+        with self._lock:
+            seq = self._tail - offset
+            if seq < self._head:
+                return None
+            return self._entry_at(seq)
+
+    def recent(self, limit: int, offset: int = 0) -> List[RequestLogEntry]:
+        """Return up to `limit` entries newest-first, starting `offset` back."""
+        if limit <= 0 or offset < 0:
+            return []
+        with self._lock:
+            top = self._tail - offset
+            bottom = max(self._head, top - limit + 1)
+            if top < bottom:
+                return []
+        return self._select("WHERE seq BETWEEN ? AND ?", (bottom, top), None)
+
+    def all(self) -> List[RequestLogEntry]:
+        """Return all entries from oldest to newest."""
+        return list(reversed(self._select("", (), None)))
+
+    def find(self, request_id: str) -> Optional[RequestLogEntry]:
+        """Return the newest entry recorded for `request_id`, if any."""
+        matches = self._select("WHERE request_id = ?", (request_id,), 1)
+        return matches[0] if matches else None
+
+    def entries_for_provider(
+        self, provider_id: str, limit: Optional[int] = None
+    ) -> List[RequestLogEntry]:
+        return self._select("WHERE provider_id = ?", (provider_id,), limit)
+
+    def entries_between(
+        self, start_ms: int, end_ms: int, limit: Optional[int] = None
+    ) -> List[RequestLogEntry]:
+        return self._select(
+            "WHERE started_at_ms BETWEEN ? AND ?", (int(start_ms), int(end_ms)), limit
+        )
+
+    def entries_with_axis_token(
+        self, axis: str, token: str, limit: Optional[int] = None
+    ) -> List[RequestLogEntry]:
+        return self._select(
+            "WHERE seq IN (SELECT seq FROM entry_axes WHERE axis = ? AND token = ?)",
+            (axis, token),
+            limit,
+        )
+
+    def search(
+        self, query: "HistorySearchQuery | str", *, limit: int = 20, offset: int = 0
+    ) -> HistorySearchPage:
+        """Rank and page matching entries without decoding the rest.
+
+        Text terms must all match (FTS5, bm25 ranking); facets filter through
+        `entry_axes` and dates through `started_at_ms`. Only the entries on
+        the returned page are loaded.
+        """
+        if isinstance(query, str):
+            query = HistorySearchQuery.parse(query)
+        terms = list(dict.fromkeys(_FTS_WORD_RE.findall(query.text.lower())))
+        if terms:
+            source = "entries_fts WHERE entries_fts MATCH ?"
+            key, score = "rowid", "bm25(entries_fts)"
+            params: List[Any] = [" ".join(f'"{term}"' for term in terms)]
+        else:
+            source, key, score = "entries", "seq", "0.0"
+            params = []
+        # `+seq` keeps SQLite from pushing each IN list into FTS5 as one rowid
+        # lookup per value; the filters probe the materialized sets instead.
+        clauses: List[str] = []
+        for name, value in query.facets.items():
+            clauses.append(
+                "+seq IN (SELECT seq FROM entry_axes WHERE axis = ? AND lower(token) = ?)"
+            )
+            params.extend((name, value))
+        if query.since_ms is not None:
+            clauses.append("+seq IN (SELECT seq FROM entries WHERE started_at_ms >= ?)")
+            params.append(query.since_ms)
+        if query.until_ms is not None:
+            clauses.append("+seq IN (SELECT seq FROM entries WHERE started_at_ms <= ?)")
+            params.append(query.until_ms)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        matched = (
+            f"SELECT seq, score FROM "
+            f"(SELECT {key} AS seq, {score} AS score FROM {source}){where}"
+        )
+        # Facet counts only need the matching set, not bm25 for every row.
+        matched_seqs = f"SELECT seq FROM (SELECT {key} AS seq FROM {source}){where}"
+        summary_marks = ",".join("?" * len(SUMMARY_FACETS))
+
+        start = max(offset, 0)
+        with self._lock:
+            # bm25 is lower-is-better; newest first among ties.
+            ranked = self._conn.execute(
+                f"{matched} ORDER BY score, seq DESC", params
+            ).fetchall()
+            rows = self._conn.execute(
+                f"SELECT axis, token, COUNT(*) FROM entry_axes "
+                f"WHERE axis IN ({summary_marks}) AND seq IN ({matched_seqs}) "
+                "GROUP BY axis, token",
+                (*SUMMARY_FACETS, *params),
+            ).fetchall()
+            hits = []
+            for seq, rank in ranked[start : start + max(limit, 0)]:
+                entry = self._entry_at(int(seq))
+                if entry is not None:
+                    hits.append(
+                        HistorySearchHit(
+                            entry=entry, offset=self._tail - int(seq), score=-rank
+                        )
+                    )
+        counts: Dict[str, Counter] = {}
+        for name, token, count in rows:
+            value = str(token).strip().lower()
+            if value:
+                counts.setdefault(name, Counter())[value] += int(count)
+        return HistorySearchPage(
+            hits=hits,
+            total=len(ranked),
+            offset=start,
+            limit=limit,
+            facet_counts={
+                name: counter.most_common() for name, counter in counts.items()
+            },
+        )
+
+    def replace(self, entries: Iterable[object]) -> None:
+        """Rewrite the store with `entries` (oldest to newest)."""
+        items = list(entries)[-self._max :]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM entry_axes")
+                self._conn.execute("DELETE FROM entries")
+                if self._fts:
+                    self._conn.execute(
+                        "INSERT INTO entries_fts(entries_fts) VALUES('delete-all')"
+                    )
+                for seq, entry in enumerate(items, start=1):
+                    self._insert(seq, entry)
+            self._decoded.clear()
+            self._load_bounds()
+
+    def clear(self) -> None:
+        self.replace(())
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    def __len__(self) -> int:
+        with self._lock:
+            return max(self._tail - self._head + 1, 0)
+
+    def storage_stats(self) -> dict[str, int]:
+        """Return stored vs. compressed body sizes, for diagnostics."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), "
+                "SUM(LENGTH(CAST(prompt AS BLOB)) + LENGTH(CAST(response AS BLOB)) "
+                "+ LENGTH(CAST(meta AS BLOB))), "
+                "SUM((typeof(prompt) = 'blob') + (typeof(response) = 'blob') "
+                "+ (typeof(meta) = 'blob')) FROM entries"
+            ).fetchone()
+        return {
+            "entries": int(row[0] or 0),
+            "body_bytes": int(row[1] or 0),
+            "compressed_bodies": int(row[2] or 0),
+            "dictionary_id": self._dict_id,
+        }
+
+
+__all__ = [
+    "COMPRESS_MIN_BYTES",
+    "SEARCH_INDEX_VERSION",
+    "DEFAULT_MAX_ENTRIES",
+    "SQLiteRequestHistory",
+    "compress_body",
+    "decompress_body",
+    "train_body_dictionary",
+]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from collections import Counter, deque
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Iterable, Mapping, Optional, Tuple, cast
+from typing import AbstractSet, Iterable, Mapping, Optional, Tuple, cast
 from copy import deepcopy
 
 from .requestState import RequestDropReason
@@ -19,12 +20,79 @@ except Exception:  # pragma: no cover - defensive fallback for stubs
 
 
 from .axisMappings import axis_registry_tokens, axis_value_to_key_map_for
-from .axisCatalog import axis_catalog
+from .axisCatalog import axis_catalog, axis_catalog_generation
 from .personaConfig import canonical_persona_token, persona_intent_maps
 from .personaOrchestrator import get_persona_intent_orchestrator
+from .historySearch import HistorySearchIndex, HistorySearchPage
 from .requestHistory import RequestHistory, RequestLogEntry
+from .requestHistoryStore import DEFAULT_MAX_ENTRIES, SQLiteRequestHistory
+from .modelLog import DEBUG, get_logger
 
-_history = RequestHistory()
+HISTORY_STORE_FILENAME = "request-history.sqlite3"
+
+_log = get_logger("requestLog")
+
+_history: RequestHistory | SQLiteRequestHistory = RequestHistory()
+# (path, max_entries) of the persistent store in use, or None for the
+# in-memory ring.
+_history_backend_config: Optional[Tuple[str, int]] = None
+# In-memory history only (the SQLite store searches its own FTS index). Built
+# lazily on the first search, then kept in step with appends/evictions.
+_search_index: Optional[HistorySearchIndex] = None
+# Incremental validation stats; rebuilt when the axis catalog generation moves.
+_validation_tracker: Optional["_HistoryValidationTracker"] = None
+
+
+def _history_store_config() -> Optional[Tuple[str, int]]:
+    """Return (path, max_entries) when persistent history is enabled."""
+    try:
+        from talon import settings
+
+        if not int(settings.get("user.model_request_history_persist", 0) or 0):
+            return None
+        base = settings.get("user.model_source_save_directory")
+        max_entries = int(
+            settings.get("user.model_request_history_max_entries", DEFAULT_MAX_ENTRIES)
+            or DEFAULT_MAX_ENTRIES
+        )
+    except Exception:
+        return None
+    if isinstance(base, str) and base.strip():
+        base_dir = os.path.expanduser(base)
+    else:
+        base_dir = os.path.join(os.path.expanduser("~"), "talon-ai-model-sources")
+    return os.path.join(base_dir, HISTORY_STORE_FILENAME), max(1, max_entries)
+
+
+def _sync_history_backend() -> RequestHistory | SQLiteRequestHistory:
+    """Swap between the in-memory ring and the SQLite store per settings.
+
+    Entries recorded in memory before persistence was enabled are carried over
+    into the store so switching mid-session does not lose them.
+    """
+    global _history, _history_backend_config
+    config = _history_store_config()
+    if config == _history_backend_config:
+        return _history
+    previous = _history
+    _history_backend_config = config
+    _reset_history_mirrors()
+    if config is None:
+        _history = RequestHistory()
+    else:
+        try:
+            store = SQLiteRequestHistory(*config)
+            if isinstance(previous, RequestHistory):
+                for entry in previous.all():
+                    store.append(entry)
+            _history = store
+        except Exception as exc:
+            _log.warning("persistent history unavailable: %s", exc)
+            _history = RequestHistory()
+    close = getattr(previous, "close", None)
+    if callable(close):
+        close()
+    return _history
 
 
 @dataclass(frozen=True)
@@ -205,24 +273,32 @@ def _filter_axes_payload(
             return tokens
 
     catalog = axis_catalog()
-    raw_axis_catalog = catalog.get("axes", {}) if isinstance(catalog, dict) else {}
-    axis_tokens: dict[str, set[str]] = {}
-    if isinstance(raw_axis_catalog, Mapping):
+    if not isinstance(catalog, dict):
+        catalog = {}
+    # Prefer the snapshot's precomputed frozensets; build sets only for
+    # catalogs that lack them.
+    axis_tokens: Mapping[str, AbstractSet[str]] = catalog.get("axis_token_sets") or {}
+    raw_axis_catalog = catalog.get("axes", {})
+    if not axis_tokens and isinstance(raw_axis_catalog, Mapping):
+        built_tokens: dict[str, AbstractSet[str]] = {}
         for axis, tokens in raw_axis_catalog.items():
             try:
-                axis_tokens[str(axis)] = set((tokens or {}).keys())  # type: ignore[attr-defined]
+                built_tokens[str(axis)] = set((tokens or {}).keys())  # type: ignore[attr-defined]
             except AttributeError:
-                axis_tokens[str(axis)] = set()
-    raw_axis_lists = (
-        catalog.get("axis_list_tokens", {}) if isinstance(catalog, dict) else {}
+                built_tokens[str(axis)] = set()
+        axis_tokens = built_tokens
+    axis_list_tokens: Mapping[str, AbstractSet[str]] = (
+        catalog.get("axis_list_token_sets") or {}
     )
-    axis_list_tokens: dict[str, set[str]] = {}
-    if isinstance(raw_axis_lists, Mapping):
+    raw_axis_lists = catalog.get("axis_list_tokens", {})
+    if not axis_list_tokens and isinstance(raw_axis_lists, Mapping):
+        built_lists: dict[str, AbstractSet[str]] = {}
         for axis, tokens in raw_axis_lists.items():
             values: set[str] = set()
             if isinstance(tokens, (list, tuple, set)):
                 values = {str(token) for token in tokens if str(token)}
-            axis_list_tokens[str(axis)] = values
+            built_lists[str(axis)] = values
+        axis_list_tokens = built_lists
 
     filtered: dict[str, list[str]] = {}
 
@@ -533,6 +609,48 @@ def axis_snapshot_from_axes(axes: Optional[dict[str, list[str]]]) -> AxisSnapsho
     return AxisSnapshot(axes=known_axes)
 
 
+def _reset_history_mirrors() -> None:
+    """Drop derived views (search index, validation stats) of the history."""
+    global _search_index, _validation_tracker
+    _search_index = None
+    _validation_tracker = None
+
+
+def append_history_entry(entry: object) -> None:
+    """Store an already-built entry, keeping the search index in step."""
+    history = _sync_history_backend()
+    history.append(entry)  # type: ignore[arg-type]
+    for mirror in (_search_index, _validation_tracker):
+        if mirror is not None:
+            mirror.add(entry)  # type: ignore[arg-type]
+            mirror.trim_to(len(history))
+
+
+def _history_search_index() -> HistorySearchIndex:
+    global _search_index
+    history = _sync_history_backend()
+    index = _search_index
+    if index is not None and _mirrors_history(index, history):
+        return index
+    index = HistorySearchIndex()
+    index.rebuild(history.all())
+    _search_index = index
+    return index
+
+
+def search_history(query: str, *, limit: int = 20, offset: int = 0) -> HistorySearchPage:
+    """Search history text with optional `field:value` facet filters.
+
+    Results are ranked (best match first, newest first among ties) and
+    paginated; each hit carries its offset from the latest entry so callers
+    can reuse `nth_from_latest`-based navigation.
+    """
+    history = _sync_history_backend()
+    if isinstance(history, SQLiteRequestHistory) and history.supports_search:
+        return history.search(query, limit=limit, offset=offset)
+    return _history_search_index().search(query, limit=limit, offset=offset)
+
+
 def append_entry(
     request_id: str,
     prompt: str,
@@ -562,24 +680,25 @@ def append_entry(
             pass
         set_drop_reason("missing_request_id")
         return
-    try:
-        print(
-            f"[requestLog] append id={request_id!r} prompt_len={len(prompt or '')} "
-            f"response_len={len(response or '')} recipe={recipe!r} duration_ms={duration_ms} "
-            f"axes_keys={list((axes or {}).keys())} provider_id={provider_id}"
+    if _log.enabled_for(DEBUG):
+        _log.debug(
+            "append id=%r prompt_len=%d response_len=%d recipe=%r duration_ms=%s "
+            "axes_keys=%s provider_id=%s",
+            request_id,
+            len(prompt or ""),
+            len(response or ""),
+            recipe,
+            duration_ms,
+            list((axes or {}).keys()),
+            provider_id,
         )
-    except Exception:
-        pass
     axes_payload = _filter_axes_payload(axes)
     if (
         not axes_payload
         or not isinstance(axes_payload, dict)
         or not axes_payload.get("directional")
     ):
-        try:
-            print(f"[requestLog] drop id={request_id!r} missing directional")
-        except Exception:
-            pass
+        _log.debug("drop id=%r missing directional", request_id)
         message = drop_reason_message("missing_directional")
         try:
             notify(message)
@@ -593,7 +712,7 @@ def append_entry(
         pending_message = ""
     if not pending_message or pending_message.strip().lower() != "pending":
         set_drop_reason("")
-    _history.append(
+    append_history_entry(
         RequestLogEntry(
             request_id=request_id,
             prompt=prompt,
@@ -607,14 +726,19 @@ def append_entry(
             persona=persona_payload,
         )
     )
-    try:
-        latest_entry = _history.latest() if hasattr(_history, "latest") else None
-        latest_id = latest_entry.request_id if latest_entry else "?"
-        print(
-            f"[requestLog] stored entries={len(_history)} latest_id={latest_id} hist_id={id(_history)}"
-        )
-    except Exception:
-        pass
+    # len()/latest() can hit SQLite, so only pay for them when someone listens.
+    if _log.enabled_for(DEBUG):
+        try:
+            latest_entry = _history.latest() if hasattr(_history, "latest") else None
+            latest_id = latest_entry.request_id if latest_entry else "?"
+            _log.debug(
+                "stored entries=%d latest_id=%s hist_id=%d",
+                len(_history),
+                latest_id,
+                id(_history),
+            )
+        except Exception:
+            pass
 
 
 def append_entry_from_request(
@@ -679,29 +803,35 @@ def append_entry_from_request(
 
 
 def latest() -> Optional[RequestLogEntry]:
-    return _history.latest()
+    return _sync_history_backend().latest()
 
 
 def nth_from_latest(offset: int) -> Optional[RequestLogEntry]:
-    return _history.nth_from_latest(offset)
+    return _sync_history_backend().nth_from_latest(offset)
+
+
+def recent_entries(limit: int, offset: int = 0) -> list[RequestLogEntry]:
+    """Return up to `limit` entries newest-first without loading the rest."""
+    try:
+        return list(_sync_history_backend().recent(limit, offset))
+    except Exception as e:
+        _log.warning("recent_entries failed: %s", e)
+        return []
 
 
 def all_entries():
     try:
-        entries = _history.all()
-        print(f"[requestLog] all_entries len={len(entries)} hist_id={id(_history)}")
+        entries = _sync_history_backend().all()
+        _log.debug("all_entries len=%d hist_id=%d", len(entries), id(_history))
         return entries
     except Exception as e:
-        try:
-            print(f"[requestLog] all_entries failed: {e}")
-        except Exception:
-            pass
+        _log.warning("all_entries failed: %s", e)
         return []
 
 
 def clear_history() -> None:
-    while len(_history):
-        _history._entries.popleft()  # type: ignore[attr-defined]
+    _sync_history_backend().clear()
+    _reset_history_mirrors()
     set_drop_reason("")
 
 
@@ -761,157 +891,278 @@ def render_drop_reason(reason: RequestDropReason) -> str:
     return f"GPT: Request blocked; reason={reason_text}."
 
 
-def _scan_history_entries(raise_on_failure: bool) -> dict[str, int]:
+_VALIDATION_COUNTERS = (
+    "entries_missing_directional",
+    "entries_with_unsupported_axes",
+    "entries_with_persona_snapshot",
+    "entries_missing_persona_headers",
+    "persona_preset_missing_say_hint",
+    "persona_preset_missing_descriptor",
+    "intent_preset_missing_say_hint",
+    "intent_preset_missing_descriptor",
+    "intent_invalid_tokens",
+    "unexpected_persona_header",
+)
+
+
+@dataclass
+class _EntryValidation:
+    """One entry's contribution to the history validation stats."""
+
+    counts: Counter = field(default_factory=Counter)
+    persona_alias_pairs: list[Tuple[str, str]] = field(default_factory=list)
+    intent_display_pairs: list[Tuple[str, str]] = field(default_factory=list)
+    # First guardrail failure, raised by `validate_history_axes`.
+    error: str = ""
+
+    def fail(self, message: str) -> None:
+        if not self.error:
+            self.error = message
+
+
+def _validate_history_entry(entry: RequestLogEntry) -> _EntryValidation:
     from .historyLifecycle import (
-        coerce_history_snapshot_entry,
+        axes_snapshot_from_axes,
         parse_persona_summary_line,
         persona_header_lines,
     )
 
-    stats = {
-        "total_entries": 0,
-        "entries_missing_directional": 0,
-        "entries_with_unsupported_axes": 0,
-        "entries_with_persona_snapshot": 0,
-        "entries_missing_persona_headers": 0,
-        "persona_preset_missing_say_hint": 0,
-        "persona_preset_missing_descriptor": 0,
-        "intent_preset_missing_say_hint": 0,
-        "intent_preset_missing_descriptor": 0,
-        "intent_invalid_tokens": 0,
-        "unexpected_persona_header": 0,
-        "persona_alias_pairs": {},
-        "intent_display_pairs": {},
-    }
+    result = _EntryValidation()
+    counts = result.counts
 
-    persona_alias_pairs = stats["persona_alias_pairs"]
-    intent_display_pairs = stats["intent_display_pairs"]
+    persona_snapshot = entry.persona or {}
+    invalid_intent = persona_snapshot.get("_invalid_intent_token")
+    if invalid_intent:
+        counts["intent_invalid_tokens"] += 1
+        counts["intent_preset_missing_descriptor"] += 1
 
-    for entry in _history.all():
-        stats["total_entries"] += 1
+    axes = entry.axes or {}
+    if not isinstance(axes, dict):
+        try:
+            axes = dict(axes)
+        except Exception:
+            axes = {}
+
+    request_id = entry.request_id or "?"
+    unknown = sorted(key for key in axes.keys() if key not in KNOWN_AXIS_KEYS)
+    if unknown:
+        counts["entries_with_unsupported_axes"] += 1
+        keys = ", ".join(unknown)
+        result.fail(
+            f"History entry {request_id!r} includes unsupported axis keys: {keys}"
+        )
 
-        persona_snapshot = entry.persona or {}
-        invalid_intent = persona_snapshot.get("_invalid_intent_token")
-        if invalid_intent:
-            stats["intent_invalid_tokens"] += 1
-            stats["intent_preset_missing_descriptor"] += 1
+    # Normalise axes/persona only; bodies are not needed (and may be stored
+    # compressed) so they are left untouched.
+    snapshot = axes_snapshot_from_axes(axes)
+    directional_tokens = snapshot.known_axes().get("directional", []) or []
+    if not directional_tokens:
+        counts["entries_missing_directional"] += 1
+        result.fail(
+            f"History entry {request_id!r} is missing a directional lens; Concordance requires one."
+        )
 
-        axes = entry.axes or {}
-        if not isinstance(axes, dict):
-            try:
-                axes = dict(axes)
-            except Exception:
-                axes = {}
-
-        unknown = sorted(key for key in axes.keys() if key not in KNOWN_AXIS_KEYS)
-        if unknown:
-            stats["entries_with_unsupported_axes"] += 1
-            if raise_on_failure:
-                keys = ", ".join(unknown)
-                request_id = entry.request_id or "?"
-                raise ValueError(
-                    f"History entry {request_id!r} includes unsupported axis keys: {keys}"
+    persona_snapshot = dict(entry.persona or {})
+    if not persona_snapshot:
+        return result
+    counts["entries_with_persona_snapshot"] += 1
+    persona_lines = persona_header_lines(entry)
+    if not persona_lines:
+        counts["entries_missing_persona_headers"] += 1
+        result.fail(
+            "History persona metadata missing required catalog-backed header lines; "
+            f"entry {request_id!r} has persona snapshot without persona/intent headers."
+        )
+        return result
+    for line in persona_lines:
+        lower = line.lower()
+        if line.startswith("persona_preset: "):
+            descriptor, details = parse_persona_summary_line(line, "persona_preset: ")
+            canonical = descriptor.strip()
+            if not canonical:
+                counts["persona_preset_missing_descriptor"] += 1
+                result.fail(
+                    "History persona preset entry missing descriptor; "
+                    f"entry {request_id!r} header: {line}"
                 )
+            alias = ""
+            for part in details:
+                part_lower = part.lower()
+                if part_lower.startswith("say: persona "):
+                    alias = part[len("say: persona ") :].strip()
+                    break
+            if not alias:
+                counts["persona_preset_missing_say_hint"] += 1
+                result.fail(
+                    "History persona preset entry missing say hint; "
+                    f"entry {request_id!r} header: {line}"
+                )
+            if canonical and alias:
+                result.persona_alias_pairs.append((canonical, alias))
+        elif line.startswith("intent_preset: "):
+            descriptor, details = parse_persona_summary_line(line, "intent_preset: ")
+            canonical_intent = descriptor.strip()
+            if not canonical_intent:
+                counts["intent_preset_missing_descriptor"] += 1
+                result.fail(
+                    "History intent preset entry missing descriptor; "
+                    f"entry {request_id!r} header: {line}"
+                )
+            display_value = ""
+            spoken_alias = ""
+            for part in details:
+                part_lower = part.lower()
+                if part_lower.startswith("display="):
+                    display_value = part.split("=", 1)[1].strip()
+                elif part_lower.startswith("say: intent "):
+                    spoken_alias = part[len("say: intent ") :].strip()
+                elif part_lower.startswith("label=") and not display_value:
+                    display_value = part.split("=", 1)[1].strip()
+            if "say: intent " not in lower:
+                counts["intent_preset_missing_say_hint"] += 1
+                result.fail(
+                    "History intent preset entry missing say hint; "
+                    f"entry {request_id!r} header: {line}"
+                )
+            alias_value = display_value or spoken_alias
+            if canonical_intent and alias_value:
+                result.intent_display_pairs.append((canonical_intent, alias_value))
+        else:
+            counts["unexpected_persona_header"] += 1
+            result.fail(
+                "History persona metadata included unexpected header line; "
+                f"entry {request_id!r} header: {line}"
+            )
+    return result
 
-        normalized_entry = coerce_history_snapshot_entry(entry)
-        axes = normalized_entry.axes or {}
 
-        directional_tokens = axes.get("directional", []) or []
-        if not directional_tokens:
-            stats["entries_missing_directional"] += 1
-            if raise_on_failure:
-                request_id = normalized_entry.request_id or entry.request_id or "?"
-                raise ValueError(
-                    f"History entry {request_id!r} is missing a directional lens; Concordance requires one."
-                )
+def _bump_pairs(
+    pairs: dict[str, dict[str, int]], items: Iterable[Tuple[str, str]], delta: int
+) -> None:
+    for canonical, alias in items:
+        aliases = pairs.setdefault(canonical, {})
+        aliases[alias] = aliases.get(alias, 0) + delta
+        if aliases[alias] <= 0:
+            del aliases[alias]
+        if not aliases:
+            del pairs[canonical]
+
+
+class _HistoryValidationTracker:
+    """Running validation totals that mirror history position by position.
+
+    Like the search index, contributions are appended newest-last and only
+    trimmed from the oldest end, so stats reads never rescan history. Rows
+    keep only (request_id, started_at_ms, result), plus the newest entry for
+    `_mirrors_history`, so lazily decoded SQLite rows are not pinned.
+    """
 
-        persona_snapshot = normalized_entry.persona or {}
-        if persona_snapshot:
-            stats["entries_with_persona_snapshot"] += 1
-            persona_lines = persona_header_lines(normalized_entry)
-            request_id = normalized_entry.request_id or entry.request_id or "?"
-            if not persona_lines:
-                stats["entries_missing_persona_headers"] += 1
-                if raise_on_failure:
-                    raise ValueError(
-                        "History persona metadata missing required catalog-backed header lines; "
-                        f"entry {request_id!r} has persona snapshot without persona/intent headers."
-                    )
-                else:
-                    continue
-            for line in persona_lines:
-                lower = line.lower()
-                if line.startswith("persona_preset: "):
-                    descriptor, details = parse_persona_summary_line(
-                        line, "persona_preset: "
-                    )
-                    canonical = descriptor.strip()
-                    if not canonical:
-                        stats["persona_preset_missing_descriptor"] += 1
-                        if raise_on_failure:
-                            raise ValueError(
-                                "History persona preset entry missing descriptor; "
-                                f"entry {request_id!r} header: {line}"
-                            )
-                    alias = ""
-                    for part in details:
-                        part_lower = part.lower()
-                        if part_lower.startswith("say: persona "):
-                            alias = part[len("say: persona ") :].strip()
-                            break
-                    if not alias:
-                        stats["persona_preset_missing_say_hint"] += 1
-                        if raise_on_failure:
-                            raise ValueError(
-                                "History persona preset entry missing say hint; "
-                                f"entry {request_id!r} header: {line}"
-                            )
-                    if canonical and alias:
-                        canon_map = persona_alias_pairs.setdefault(canonical, {})
-                        canon_map[alias] = canon_map.get(alias, 0) + 1
-                elif line.startswith("intent_preset: "):
-                    descriptor, details = parse_persona_summary_line(
-                        line, "intent_preset: "
-                    )
-                    canonical_intent = descriptor.strip()
-                    if not canonical_intent:
-                        stats["intent_preset_missing_descriptor"] += 1
-                        if raise_on_failure:
-                            raise ValueError(
-                                "History intent preset entry missing descriptor; "
-                                f"entry {request_id!r} header: {line}"
-                            )
-                    display_value = ""
-                    spoken_alias = ""
-                    for part in details:
-                        part_lower = part.lower()
-                        if part_lower.startswith("display="):
-                            display_value = part.split("=", 1)[1].strip()
-                        elif part_lower.startswith("say: intent "):
-                            spoken_alias = part[len("say: intent ") :].strip()
-                        elif part_lower.startswith("label=") and not display_value:
-                            display_value = part.split("=", 1)[1].strip()
-                    if "say: intent " not in lower:
-                        stats["intent_preset_missing_say_hint"] += 1
-                        if raise_on_failure:
-                            raise ValueError(
-                                "History intent preset entry missing say hint; "
-                                f"entry {request_id!r} header: {line}"
-                            )
-                    alias_value = display_value or spoken_alias
-                    if canonical_intent and alias_value:
-                        canon_map = intent_display_pairs.setdefault(
-                            canonical_intent, {}
-                        )
-                        canon_map[alias_value] = canon_map.get(alias_value, 0) + 1
-                else:
-                    stats["unexpected_persona_header"] += 1
-                    if raise_on_failure:
-                        raise ValueError(
-                            "History persona metadata included unexpected header line; "
-                            f"entry {request_id!r} header: {line}"
-                        )
-    return stats
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self._entries: deque[Tuple[object, object, _EntryValidation]] = deque()
+        self._latest: Optional[object] = None
+        self._counts: Counter = Counter()
+        self._persona_alias_pairs: dict[str, dict[str, int]] = {}
+        self._intent_display_pairs: dict[str, dict[str, int]] = {}
+        self._errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def latest(self) -> Optional[object]:
+        return self._latest
+
+    def add(self, entry: RequestLogEntry) -> None:
+        result = _validate_history_entry(entry)
+        self._entries.append((entry.request_id, entry.started_at_ms, result))
+        self._latest = entry
+        self._counts.update(result.counts)
+        _bump_pairs(self._persona_alias_pairs, result.persona_alias_pairs, 1)
+        _bump_pairs(self._intent_display_pairs, result.intent_display_pairs, 1)
+        if result.error:
+            self._errors += 1
+
+    def trim_to(self, size: int) -> None:
+        while len(self._entries) > max(size, 0):
+            _, _, result = self._entries.popleft()
+            self._counts.subtract(result.counts)
+            _bump_pairs(self._persona_alias_pairs, result.persona_alias_pairs, -1)
+            _bump_pairs(self._intent_display_pairs, result.intent_display_pairs, -1)
+            if result.error:
+                self._errors -= 1
+        if not self._entries:
+            self._latest = None
+
+    def first_error(self) -> str:
+        if not self._errors:
+            return ""
+        for _, _, result in self._entries:
+            if result.error:
+                return result.error
+        return ""
+
+    def stats(self) -> dict[str, object]:
+        stats: dict[str, object] = {"total_entries": len(self._entries)}
+        for name in _VALIDATION_COUNTERS:
+            stats[name] = self._counts.get(name, 0)
+        stats["persona_alias_pairs"] = {
+            key: dict(value) for key, value in self._persona_alias_pairs.items()
+        }
+        stats["intent_display_pairs"] = {
+            key: dict(value) for key, value in self._intent_display_pairs.items()
+        }
+        return stats
+
+
+def _mirrors_history(
+    mirror: HistorySearchIndex | _HistoryValidationTracker,
+    history: RequestHistory | SQLiteRequestHistory,
+) -> bool:
+    """Return True when `mirror` still tracks `history` entry for entry."""
+    if len(mirror) != len(history):
+        return False
+    newest = history.latest()
+    if newest is None:
+        return True
+    indexed = mirror.latest()
+    if indexed is newest:
+        return True
+    # The SQLite store decodes fresh objects once its row cache rolls over;
+    # rows only change through replace/clear, which reset the mirrors.
+    return (
+        isinstance(history, SQLiteRequestHistory)
+        and indexed is not None
+        and getattr(indexed, "request_id", None) == getattr(newest, "request_id", None)
+        and getattr(indexed, "started_at_ms", None)
+        == getattr(newest, "started_at_ms", None)
+    )
+
+
+def _history_validation_tracker() -> _HistoryValidationTracker:
+    global _validation_tracker
+    history = _sync_history_backend()
+    generation = axis_catalog_generation()
+    tracker = _validation_tracker
+    if (
+        tracker is not None
+        and tracker.generation == generation
+        and _mirrors_history(tracker, history)
+    ):
+        return tracker
+    tracker = _HistoryValidationTracker(generation)
+    for entry in history.all():
+        tracker.add(entry)
+    _validation_tracker = tracker
+    return tracker
+
+
+def _scan_history_entries(raise_on_failure: bool) -> dict[str, object]:
+    tracker = _history_validation_tracker()
+    if raise_on_failure:
+        error = tracker.first_error()
+        if error:
+            raise ValueError(error)
+    return tracker.stats()
 
 
 def validate_history_axes() -> None:
@@ -1120,7 +1371,7 @@ def remediate_history_axes(
     stats are computed without mutating the in-memory history ring.
     """
 
-    entries = list(_history.all())
+    entries = list(_sync_history_backend().all())
     stats = {"total": len(entries), "updated": 0, "dropped": 0, "unchanged": 0}
     new_entries = []
 
@@ -1157,7 +1408,8 @@ def remediate_history_axes(
             new_entries.append(entry)
 
     if not dry_run:
-        _history._entries = deque(new_entries, maxlen=_history._max)  # type: ignore[attr-defined]
+        _history.replace(new_entries)
+        _reset_history_mirrors()
         set_drop_reason("")
 
     return stats
@@ -1208,6 +1460,9 @@ __all__ = [
     "latest",
     "nth_from_latest",
     "all_entries",
+    "recent_entries",
+    "search_history",
+    "append_history_entry",
     "clear_history",
     "drop_reason_message",
     "set_drop_reason",
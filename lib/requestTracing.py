@@ -0,0 +1,372 @@
+"""Lightweight spans over the request lifecycle, keyed by request id.
+
+Spans carry monotonic start/end timestamps plus free-form attributes, so the
+phases of one request (prompt resolution, source read, build_request,
+connect, first byte, first token, canvas refreshes, destination insert,
+history append) can be lined up on one timeline. Instant events (first byte,
+first token) are zero-length spans.
+
+Work that happens before `send_request` allocates a request id (prompt
+resolution, source read, build_request) is recorded with `request_id=None`
+into a pending list; `bind_pending_spans(request_id)` adopts it once the id
+exists. Each prompt preparation starts by discarding whatever is still
+pending, so spans from a failed build or a delegate/sequence step that never
+bound them are not adopted by the next unrelated request.
+
+Tracing is opt-in via `user.model_request_tracing`; while it is off every
+helper returns immediately without allocating. The setting is cached and
+kept current by a settings listener, so hot paths (canvas refreshes) do not
+call `settings.get`. Recent traces are kept in a
+bounded buffer and exported by `telemetryExport` as JSON and in Chrome trace
+event format (load the `.chrome.json` file in chrome://tracing or Perfetto).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional
+
+MAX_TRACED_REQUESTS = 32
+MAX_SPANS_PER_REQUEST = 2000
+MAX_PENDING_SPANS = 256
+
+_EPOCH_NS = time.monotonic_ns()
+
+
+class Span:
+    """One timed phase of a request; `end_ns` is None while it is open."""
+
+    __slots__ = ("name", "request_id", "start_ns", "end_ns", "attrs", "thread", "instant")
+
+    def __init__(
+        self,
+        name: str,
+        request_id: Optional[str],
+        attrs: Dict[str, Any],
+        *,
+        instant: bool = False,
+    ) -> None:
+        self.name = name
+        self.request_id = request_id
+        self.start_ns = time.monotonic_ns()
+        self.end_ns: Optional[int] = self.start_ns if instant else None
+        self.attrs = attrs
+        self.thread = threading.current_thread().name
+        self.instant = instant
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "request_id": self.request_id,
+            "start_ms": round((self.start_ns - _EPOCH_NS) / 1_000_000, 3),
+            "duration_ms": (
+                round(self.duration_ms, 3) if self.duration_ms is not None else None
+            ),
+            "instant": self.instant,
+            "thread": self.thread,
+            "attrs": dict(self.attrs),
+        }
+
+
+@dataclass
+class _TracingStats:
+    spans: int = 0
+    dropped_spans: int = 0
+    evicted_requests: int = 0
+
+
+class RequestTracer:
+    """Bounded store of spans grouped by request id."""
+
+    def __init__(
+        self,
+        *,
+        max_requests: int = MAX_TRACED_REQUESTS,
+        max_spans: int = MAX_SPANS_PER_REQUEST,
+        max_pending: int = MAX_PENDING_SPANS,
+    ) -> None:
+        self._max_requests = max(1, int(max_requests))
+        self._max_spans = max(1, int(max_spans))
+        self._max_pending = max(1, int(max_pending))
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._pending: List[Span] = []
+        self._lock = Lock()
+        self._stats = _TracingStats()
+
+    def _bucket_locked(self, request_id: Optional[str]) -> Optional[List[Span]]:
+        if request_id is None:
+            if len(self._pending) >= self._max_pending:
+                return None
+            return self._pending
+        spans = self._traces.get(request_id)
+        if spans is None:
+            spans = self._traces[request_id] = []
+            while len(self._traces) > self._max_requests:
+                self._traces.popitem(last=False)
+                self._stats.evicted_requests += 1
+        if len(spans) >= self._max_spans:
+            return None
+        return spans
+
+    def record(self, span: Span) -> Span:
+        with self._lock:
+            bucket = self._bucket_locked(span.request_id)
+            if bucket is None:
+                self._stats.dropped_spans += 1
+            else:
+                bucket.append(span)
+                self._stats.spans += 1
+        return span
+
+    def start(self, name: str, request_id: Optional[str], attrs: Dict[str, Any]) -> Span:
+        return self.record(Span(name, request_id, attrs))
+
+    def event(self, name: str, request_id: Optional[str], attrs: Dict[str, Any]) -> Span:
+        return self.record(Span(name, request_id, attrs, instant=True))
+
+    def bind_pending(self, request_id: str) -> int:
+        """Move spans recorded without a request id into `request_id`'s trace."""
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            spans = self._bucket_locked(request_id)
+            if spans is None:
+                self._stats.dropped_spans += len(pending)
+                return 0
+            for span in pending:
+                span.request_id = request_id
+            spans[:0] = pending
+            return len(pending)
+
+    def discard_pending(self) -> int:
+        """Drop spans still waiting for a request id; counted as dropped."""
+
+        if not self._pending:
+            return 0
+        with self._lock:
+            count = len(self._pending)
+            self._pending = []
+            self._stats.dropped_spans += count
+            return count
+
+    def trace(self, request_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            spans = list(self._traces.get(request_id, ()))
+        return [span.to_dict() for span in spans]
+
+    def snapshot(self) -> "OrderedDict[str, List[Span]]":
+        with self._lock:
+            return OrderedDict(
+                (request_id, list(spans)) for request_id, spans in self._traces.items()
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+            self._pending = []
+            self._stats = _TracingStats()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            payload = asdict(self._stats)
+            payload["requests"] = len(self._traces)
+            payload["pending"] = len(self._pending)
+        return payload
+
+
+_tracer = RequestTracer()
+
+
+_TRACING_SETTING = "user.model_request_tracing"
+
+# None until first read; the settings listener below keeps it current.
+_tracing_enabled: Optional[bool] = None
+_tracing_listener_registered = False
+
+
+def _coerce_tracing_setting(value: Any) -> bool:
+    try:
+        return bool(int(value or 0))
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_tracing_setting() -> bool:
+    try:
+        from talon import settings
+
+        return _coerce_tracing_setting(settings.get(_TRACING_SETTING, 0))
+    except Exception:
+        return False
+
+
+def _on_tracing_setting_change(value: Any) -> None:
+    global _tracing_enabled
+    _tracing_enabled = _coerce_tracing_setting(value)
+
+
+def tracing_enabled() -> bool:
+    global _tracing_enabled
+    enabled = _tracing_enabled
+    if enabled is None:
+        enabled = _read_tracing_setting()
+        if _tracing_listener_registered:
+            _tracing_enabled = enabled
+    return enabled
+
+
+def start_span(
+    name: str, request_id: Optional[str] = None, **attrs: Any
+) -> Optional[Span]:
+    """Open a span; returns None (and records nothing) when tracing is off."""
+
+    if not tracing_enabled():
+        return None
+    return _tracer.start(name, request_id, attrs)
+
+
+def end_span(span: Optional[Span], **attrs: Any) -> None:
+    if span is None or span.end_ns is not None:
+        return
+    if attrs:
+        span.attrs.update(attrs)
+    span.end_ns = time.monotonic_ns()
+
+
+@contextlib.contextmanager
+def trace_span(
+    name: str, request_id: Optional[str] = None, **attrs: Any
+) -> Iterator[Optional[Span]]:
+    """Context manager around start_span/end_span; marks failures as `error`."""
+
+    span = start_span(name, request_id, **attrs)
+    if span is None:
+        yield None
+        return
+    try:
+        yield span
+    except BaseException as exc:
+        end_span(span, error=type(exc).__name__)
+        raise
+    end_span(span)
+
+
+def trace_event(name: str, request_id: Optional[str] = None, **attrs: Any) -> None:
+    """Record an instant (zero-length) event such as first byte or first token."""
+
+    if tracing_enabled():
+        _tracer.event(name, request_id, attrs)
+
+
+def bind_pending_spans(request_id: str) -> int:
+    if not request_id:
+        return 0
+    return _tracer.bind_pending(request_id)
+
+
+def discard_pending_spans() -> int:
+    """Drop unbound spans left over from an earlier prompt preparation."""
+
+    return _tracer.discard_pending()
+
+
+def request_trace(request_id: str) -> List[Dict[str, Any]]:
+    """Return the spans recorded for `request_id`, oldest first."""
+
+    return _tracer.trace(request_id)
+
+
+def export_traces_json() -> Dict[str, Any]:
+    """Return recent traces as `{request_id: [span, ...]}` plus counters."""
+
+    traces = _tracer.snapshot()
+    return {
+        "clock": "monotonic_ms_since_load",
+        "stats": _tracer.stats(),
+        "traces": {
+            request_id: [span.to_dict() for span in spans]
+            for request_id, spans in traces.items()
+        },
+    }
+
+
+def export_chrome_trace() -> Dict[str, Any]:
+    """Return recent traces in Chrome trace event format (one row per request)."""
+
+    events: List[Dict[str, Any]] = []
+    for tid, (request_id, spans) in enumerate(_tracer.snapshot().items(), start=1):
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": request_id},
+            }
+        )
+        for span in spans:
+            if span.end_ns is None:
+                continue
+            event: Dict[str, Any] = {
+                "name": span.name,
+                "cat": "request",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((span.start_ns - _EPOCH_NS) / 1000, 3),
+                "args": {"request_id": request_id, "thread": span.thread, **span.attrs},
+            }
+            if span.instant:
+                event.update(ph="i", s="t")
+            else:
+                event.update(ph="X", dur=round((span.end_ns - span.start_ns) / 1000, 3))
+            events.append(event)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def request_tracing_stats() -> Dict[str, int]:
+    return _tracer.stats()
+
+
+def reset_request_traces() -> None:
+    _tracer.clear()
+
+
+try:
+    from talon import settings as _settings
+
+    if hasattr(_settings, "register"):
+        _settings.register(_TRACING_SETTING, _on_tracing_setting_change)
+        _tracing_listener_registered = True
+except Exception:
+    pass
+
+
+__all__ = [
+    "RequestTracer",
+    "Span",
+    "bind_pending_spans",
+    "discard_pending_spans",
+    "end_span",
+    "export_chrome_trace",
+    "export_traces_json",
+    "request_trace",
+    "request_tracing_stats",
+    "reset_request_traces",
+    "start_span",
+    "trace_event",
+    "trace_span",
+    "tracing_enabled",
+]
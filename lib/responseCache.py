@@ -0,0 +1,205 @@
+"""Opt-in local cache of model responses keyed by the request payload.
+
+Re-running a recipe on the same source (rerun, replay, presets) builds the
+same GPTRequest, so the response can be served locally. Entries are keyed by
+a canonical SHA-256 of the provider id plus the request fields that shape the
+answer (model, messages, tools, reasoning_effort, verbosity), expire after a
+TTL, and are evicted least-recently-used beyond a size bound.
+
+Cached values keep the streamed chunk list so a hit can be replayed through
+`StreamingSession` with the same chunk boundaries as the original run.
+
+Settings (all read per request):
+- `user.model_response_cache` (0/1) turns the cache on.
+- `user.model_response_cache_ttl_seconds` and
+  `user.model_response_cache_max_entries` bound it.
+- `user.model_response_cache_providers` limits it to a comma-separated list
+  of provider ids (empty means every provider). Providers can also opt out
+  with `features: {"response_cache": false}` in their registry entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 64
+
+# Request fields that determine the response; everything else (stream flags,
+# transport options) is ignored when hashing.
+CACHE_KEY_FIELDS: Tuple[str, ...] = (
+    "model",
+    "messages",
+    "tools",
+    "reasoning_effort",
+    "verbosity",
+)
+
+
+def response_cache_key(provider_id: str, request: Mapping[str, Any]) -> str:
+    """Return the canonical hash for `request` sent to `provider_id`."""
+
+    payload = {"provider": str(provider_id or "")}
+    for name in CACHE_KEY_FIELDS:
+        value = request.get(name)
+        if value is not None:
+            payload[name] = value
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU map of request hash -> streamed chunks."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._ttl = float(ttl_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        self._lock = Lock()
+        self._stats = _ResponseCacheStats()
+
+    def configure(self, *, max_entries: int, ttl_seconds: float) -> None:
+        with self._lock:
+            self._max_entries = max(1, int(max_entries))
+            self._ttl = float(ttl_seconds)
+            self._evict_overflow()
+
+    def get(self, key: str) -> Optional[Tuple[str, ...]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._stats.misses += 1
+                return None
+            stored_at, chunks = item
+            if self._ttl > 0 and self._clock() - stored_at > self._ttl:
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return chunks
+
+    def put(self, key: str, chunks: Tuple[str, ...]) -> None:
+        if not chunks or not "".join(chunks):
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), tuple(chunks))
+            self._entries.move_to_end(key)
+            self._stats.stores += 1
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = _ResponseCacheStats()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            payload = asdict(self._stats)
+            payload["entries"] = len(self._entries)
+            payload["max_entries"] = self._max_entries
+            return payload
+
+
+_response_cache = ResponseCache()
+
+
+def _enabled_for(provider: object) -> bool:
+    try:
+        from talon import settings
+
+        if not int(settings.get("user.model_response_cache", 0) or 0):
+            return False
+        allowed = str(settings.get("user.model_response_cache_providers", "") or "")
+        ttl = int(
+            settings.get("user.model_response_cache_ttl_seconds", DEFAULT_TTL_SECONDS)
+            or 0
+        )
+        max_entries = int(
+            settings.get("user.model_response_cache_max_entries", DEFAULT_MAX_ENTRIES)
+            or DEFAULT_MAX_ENTRIES
+        )
+    except Exception:
+        return False
+    provider_id = str(getattr(provider, "id", "") or "")
+    features = getattr(provider, "features", None) or {}
+    if isinstance(features, Mapping) and not features.get("response_cache", True):
+        return False
+    allowed_ids = {part.strip() for part in allowed.split(",") if part.strip()}
+    if allowed_ids and provider_id not in allowed_ids:
+        return False
+    _response_cache.configure(max_entries=max_entries, ttl_seconds=ttl)
+    return True
+
+
+def response_cache_key_for(provider: object, request: object) -> Optional[str]:
+    """Return the cache key for this request, or None when caching is off."""
+
+    if not isinstance(request, Mapping) or not _enabled_for(provider):
+        return None
+    return response_cache_key(str(getattr(provider, "id", "") or ""), request)
+
+
+def lookup_cached_response(key: Optional[str]) -> Optional[Tuple[str, ...]]:
+    if not key:
+        return None
+    return _response_cache.get(key)
+
+
+def store_cached_response(key: Optional[str], chunks: Tuple[str, ...]) -> None:
+    if key:
+        _response_cache.put(key, tuple(chunks))
+
+
+def response_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/store/eviction counters for the response cache."""
+
+    return _response_cache.stats()
+
+
+def reset_response_cache() -> None:
+    """Drop cached responses and zero the counters."""
+
+    _response_cache.clear()
+
+
+__all__ = [
+    "CACHE_KEY_FIELDS",
+    "ResponseCache",
+    "lookup_cached_response",
+    "reset_response_cache",
+    "response_cache_key",
+    "response_cache_key_for",
+    "response_cache_stats",
+    "store_cached_response",
+]
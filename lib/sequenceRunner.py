@@ -0,0 +1,477 @@
+"""Run the named workflow sequences from `sequenceConfig.SEQUENCES`.
+
+Each model step runs through `PromptPipeline`. Its primary source is the
+previous step's output, and the original subject is the secondary source.
+Consecutive non-interactive steps run back to back, so each one starts as
+soon as the previous output is complete. The runner pauses only where the
+sequence needs the user:
+
+- after a step marked `requires_user_input` (the user acts on its output;
+  notes passed to `resume` are added to the next step's input);
+- at a `"type": "action"` step, whose output is what the user passes to
+  `resume` (for example experiment results).
+
+A step's `token` string is a recipe: a static prompt (`probe`, `task:probe`)
+plus axis tokens (`form:prep`, `verify`, `directional:dig`) and persona or
+intent tokens (`intent:orient`). `apply_step_recipe` resolves it through the
+static prompts and the axis catalog and applies it as `modelPrompt` would
+for a spoken command, so the step gets the real Task/Constraints text and
+system prompt axes. The runner restores the caller's system prompt after
+each step.
+
+After every step the run is checkpointed: completed outputs, the next step
+index and the status. `resume` continues from the checkpoint after a pause,
+a failure or a Talon restart without re-running completed steps.
+Checkpoints live in memory and, when a directory is configured, as one JSON
+file per run; a run's file is removed once it completes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields, replace
+from threading import Lock
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional
+
+from .axisCatalog import axis_catalog
+from .axisMappings import axis_hydrate_tokens
+from .modelHelpers import format_message
+from .modelSource import ModelSource
+from .modelState import GPTState
+from .personaConfig import canonical_persona_token
+from .promptPipeline import PromptPipeline, PromptResult
+from .requestAsync import start_async
+from .requestTracing import trace_span
+from .sequenceConfig import SEQUENCES
+from .staticPromptConfig import get_static_prompt_profile
+from .talonSettings import _resolve_axis_for_token, modelPrompt
+
+CHECKPOINT_DIRNAME = "sequence-checkpoints"
+
+STATUS_RUNNING = "running"
+STATUS_AWAITING_INPUT = "awaiting_input"
+STATUS_COMPLETE = "complete"
+STATUS_FAILED = "failed"
+
+
+class _TextSource(ModelSource):
+    def __init__(self, text: str):
+        self._text = text
+
+    def get_text(self):  # type: ignore[override]
+        return self._text
+
+
+@dataclass
+class SequenceCheckpoint:
+    run_id: str
+    sequence: str
+    source_text: str
+    outputs: List[str] = field(default_factory=list)
+    next_step: int = 0
+    status: str = STATUS_RUNNING
+    # Notes or action results supplied by `resume`, consumed by the next step.
+    pending_input: str = ""
+    error: str = ""
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "SequenceCheckpoint":
+        known = {f.name for f in fields(cls)}
+        data = {key: value for key, value in payload.items() if key in known}
+        data["outputs"] = [str(text) for text in data.get("outputs") or []]
+        return cls(**data)
+
+    def result(self) -> Optional[PromptResult]:
+        """The latest step output as a PromptResult, if any step has run."""
+        if not self.outputs:
+            return None
+        return PromptResult.from_messages([format_message(self.outputs[-1])])
+
+
+class SequenceCheckpointStore:
+    """In-memory checkpoints, mirrored to `<directory>/<run_id>.json` when set."""
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._directory = directory
+        self._checkpoints: Dict[str, SequenceCheckpoint] = {}
+        self._lock = Lock()
+
+    def _path(self, run_id: str) -> Optional[str]:
+        if not self._directory:
+            return None
+        return os.path.join(self._directory, f"{run_id}.json")
+
+    def save(self, checkpoint: SequenceCheckpoint) -> None:
+        checkpoint.updated_at = time.time()
+        with self._lock:
+            self._checkpoints[checkpoint.run_id] = checkpoint
+        path = self._path(checkpoint.run_id)
+        if path is None:
+            return
+        if checkpoint.status == STATUS_COMPLETE:
+            # Completed runs are never resumed from disk; keep the directory
+            # down to the runs that still can be.
+            self._remove_file(path)
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(checkpoint.to_dict(), handle, indent=2)
+            # Replace in one step so an interruption never leaves half a file.
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def load(self, run_id: str) -> Optional[SequenceCheckpoint]:
+        with self._lock:
+            checkpoint = self._checkpoints.get(run_id)
+        if checkpoint is not None:
+            return checkpoint
+        path = self._path(run_id)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as handle:
+                checkpoint = SequenceCheckpoint.from_dict(json.load(handle))
+        except (OSError, ValueError, TypeError):
+            return None
+        if checkpoint.status == STATUS_COMPLETE:
+            # Left behind before completed runs were pruned.
+            self._remove_file(path)
+        with self._lock:
+            self._checkpoints[run_id] = checkpoint
+        return checkpoint
+
+    def all(self) -> List[SequenceCheckpoint]:
+        """Every known checkpoint (memory and disk), oldest update first.
+
+        Files are read once per store; later calls reuse the loaded runs.
+        """
+        run_ids = set()
+        with self._lock:
+            run_ids.update(self._checkpoints)
+        if self._directory and os.path.isdir(self._directory):
+            run_ids.update(
+                name[: -len(".json")]
+                for name in os.listdir(self._directory)
+                if name.endswith(".json")
+            )
+        checkpoints = [self.load(run_id) for run_id in run_ids]
+        return sorted(
+            (c for c in checkpoints if c is not None), key=lambda c: c.updated_at
+        )
+
+    def latest_resumable(self) -> Optional[SequenceCheckpoint]:
+        resumable = [c for c in self.all() if c.status != STATUS_COMPLETE]
+        return resumable[-1] if resumable else None
+
+
+def default_checkpoint_directory() -> str:
+    try:
+        from talon import settings
+
+        base = settings.get("user.model_source_save_directory")
+    except Exception:
+        base = None
+    if isinstance(base, str) and base.strip():
+        base_dir = os.path.expanduser(base)
+    else:
+        base_dir = os.path.join(os.path.expanduser("~"), "talon-ai-model-sources")
+    return os.path.join(base_dir, CHECKPOINT_DIRNAME)
+
+
+_MODEL_PROMPT_AXES = ("completeness", "scope", "method", "form", "channel")
+_PERSONA_AXES = ("voice", "audience", "tone", "intent")
+
+
+@dataclass
+class StepRecipe:
+    """A step's `token` string resolved against the prompt and axis catalogs."""
+
+    static_prompt: str = "infer"
+    axes: Dict[str, List[str]] = field(default_factory=dict)
+    directional: str = ""
+    persona: Dict[str, str] = field(default_factory=dict)
+    # Tokens the catalogs do not know; passed on to the model as written.
+    unresolved: List[str] = field(default_factory=list)
+
+
+def _catalog_axis_token(axis: str, value: str) -> str:
+    tokens = (axis_catalog().get("axes") or {}).get(axis) or {}
+    # Multi-word keys ("fly ong") are written with hyphens in sequences.
+    for candidate in (value, value.replace("-", " ")):
+        if candidate in tokens:
+            return candidate
+    return ""
+
+
+def _persona_token(axis: str, value: str) -> str:
+    return canonical_persona_token(axis, value) or canonical_persona_token(
+        axis, value.replace("-", " ")
+    )
+
+
+def _any_persona_token(value: str) -> tuple[Optional[str], str]:
+    for axis in _PERSONA_AXES:
+        token = _persona_token(axis, value)
+        if token:
+            return axis, token
+    return None, ""
+
+
+def resolve_step_recipe(tokens: str) -> StepRecipe:
+    """Resolve a step's recipe tokens (`make form:prep verify`).
+
+    `axis:value` names the axis (`task` is the static prompt). A bare token, or
+    one its named axis does not know, is the static prompt when it is the first
+    static prompt name, otherwise the first axis that knows it (axis priority
+    order), then a directional lens, then a persona/intent token.
+    """
+    recipe = StepRecipe()
+    has_prompt = False
+    for raw in str(tokens or "").split():
+        prefix, sep, value = raw.partition(":")
+        if not sep:
+            prefix, value = "", raw
+        axis, token = None, ""
+        if prefix in _PERSONA_AXES:
+            axis, token = prefix, _persona_token(prefix, value)
+        elif prefix and prefix != "task":
+            token = _catalog_axis_token(prefix, value)
+            axis = prefix if token else None
+        if not token and (
+            prefix == "task"
+            or (not has_prompt and get_static_prompt_profile(value) is not None)
+        ):
+            # Older sequences spell static prompts as `method:plan`.
+            recipe.static_prompt, has_prompt = value, True
+            continue
+        if not token:
+            axis, token = _resolve_axis_for_token(value)
+        if not token:
+            token = _catalog_axis_token("directional", value)
+            axis = "directional" if token else None
+        if not token:
+            axis, token = _any_persona_token(value)
+        if not axis or not token:
+            recipe.unresolved.append(raw)
+        elif axis == "directional":
+            recipe.directional = token
+        elif axis in _PERSONA_AXES:
+            recipe.persona[axis] = token
+        else:
+            recipe.axes.setdefault(axis, []).append(token)
+    return recipe
+
+
+def apply_step_recipe(tokens: str) -> str:
+    """Apply a step's recipe to GPTState.system_prompt and return its prompt text.
+
+    The tokens go through `modelPrompt` as a spoken command would, so the
+    static prompt, axis defaults, caps and incompatibilities all apply.
+    Persona/intent tokens are set on the system prompt directly. The caller
+    owns restoring the system prompt afterwards.
+    """
+    recipe = resolve_step_recipe(tokens)
+    match = SimpleNamespace(staticPrompt=recipe.static_prompt)
+    completeness = recipe.axes.get("completeness")
+    if completeness:
+        match.completenessModifier = completeness[-1]
+    for axis in _MODEL_PROMPT_AXES[1:]:
+        if recipe.axes.get(axis):
+            setattr(match, f"{axis}Modifier_list", recipe.axes[axis])
+    if recipe.directional:
+        match.directionalModifier = recipe.directional
+    lines = [modelPrompt(match)]
+    for axis, token in recipe.persona.items():
+        setattr(GPTState.system_prompt, axis, token)
+    # Topology is not part of the system prompt contract; state it inline.
+    topology = recipe.axes.get("topology")
+    if topology:
+        hydrated = axis_hydrate_tokens("topology", topology) or topology
+        lines.append(f"  Topology: {' '.join(hydrated)}")
+    if recipe.unresolved:
+        lines.append(f"Also apply: {' '.join(recipe.unresolved)}")
+    return "\n".join(lines)
+
+
+def step_prompt(sequence_name: str, step: Mapping[str, Any], index: int) -> str:
+    """Prompt text for one model step of a sequence.
+
+    A step with a recipe applies it to GPTState.system_prompt (see
+    `apply_step_recipe`).
+    """
+    steps = SEQUENCES[sequence_name]["steps"]
+    lines = [
+        f"Workflow '{sequence_name}', step {index + 1} of {len(steps)}: "
+        f"{step.get('role', 'step')}."
+    ]
+    if step.get("token"):
+        lines.append(apply_step_recipe(str(step["token"])))
+    if step.get("prompt_hint"):
+        lines.append(str(step["prompt_hint"]))
+    if index > 0:
+        lines.append(
+            "The primary content is the output of the previous step; the "
+            "secondary content is the original subject."
+        )
+    return "\n".join(lines)
+
+
+def snapshot_source(source: ModelSource) -> ModelSource:
+    """Read `source` now and return a source that replays that text.
+
+    Sources read the selection or clipboard, so read them on the thread that
+    handles the command before a run moves to the background.
+    """
+    return _TextSource(str(source.get_text() or ""))
+
+
+class SequenceRunner:
+    """Execute sequences step by step with checkpoints between steps."""
+
+    def __init__(
+        self,
+        pipeline: Optional[PromptPipeline] = None,
+        store: Optional[SequenceCheckpointStore] = None,
+    ) -> None:
+        self._pipeline = pipeline or PromptPipeline()
+        self._store = store or SequenceCheckpointStore()
+
+    @property
+    def store(self) -> SequenceCheckpointStore:
+        return self._store
+
+    def start(
+        self,
+        sequence_name: str,
+        source: ModelSource,
+        destination,
+        *,
+        run_id: Optional[str] = None,
+    ) -> SequenceCheckpoint:
+        if sequence_name not in SEQUENCES:
+            raise KeyError(f"Unknown sequence: {sequence_name}")
+        checkpoint = SequenceCheckpoint(
+            run_id=run_id or uuid.uuid4().hex[:12],
+            sequence=sequence_name,
+            # Snapshot the subject so a resumed run sees the same input.
+            source_text=str(source.get_text() or ""),
+        )
+        self._store.save(checkpoint)
+        return self._advance(checkpoint, destination)
+
+    def resume(
+        self, run_id: str, destination, *, user_input: str = ""
+    ) -> SequenceCheckpoint:
+        checkpoint = self._store.load(run_id)
+        if checkpoint is None:
+            raise KeyError(f"No checkpoint for sequence run: {run_id}")
+        if checkpoint.status == STATUS_COMPLETE:
+            return checkpoint
+        if user_input:
+            checkpoint.pending_input = user_input
+        return self._advance(checkpoint, destination)
+
+    def start_async(self, sequence_name: str, source: ModelSource, destination):
+        """Run `start` in a background thread and return a handle.
+
+        The subject is read here, on the calling thread; see `snapshot_source`.
+        """
+        return start_async(
+            self.start, sequence_name, snapshot_source(source), destination
+        )
+
+    def resume_async(self, run_id: str, destination, *, user_input: str = ""):
+        """Run `resume` in a background thread and return a handle."""
+        return start_async(self.resume, run_id, destination, user_input=user_input)
+
+    def _step_input(self, checkpoint: SequenceCheckpoint) -> str:
+        text = checkpoint.outputs[-1] if checkpoint.outputs else checkpoint.source_text
+        if checkpoint.pending_input:
+            text = f"{text}\n\n## User notes\n{checkpoint.pending_input}"
+        return text
+
+    def _advance(self, checkpoint: SequenceCheckpoint, destination) -> SequenceCheckpoint:
+        steps = SEQUENCES[checkpoint.sequence]["steps"]
+        checkpoint.status = STATUS_RUNNING
+        checkpoint.error = ""
+        while checkpoint.next_step < len(steps):
+            index = checkpoint.next_step
+            step = steps[index]
+            if step.get("type") == "action":
+                if not checkpoint.pending_input:
+                    checkpoint.status = STATUS_AWAITING_INPUT
+                    self._store.save(checkpoint)
+                    return checkpoint
+                output = checkpoint.pending_input
+            else:
+                additional = (
+                    _TextSource(checkpoint.source_text) if checkpoint.outputs else None
+                )
+                # The step's recipe is applied to a copy of the caller's
+                # system prompt, which is put back once the step is sent.
+                system_prompt = GPTState.system_prompt
+                GPTState.system_prompt = replace(system_prompt)
+                try:
+                    with trace_span(
+                        "sequence_step", sequence=checkpoint.sequence, step=index
+                    ):
+                        result = self._pipeline.run(
+                            step_prompt(checkpoint.sequence, step, index),
+                            _TextSource(self._step_input(checkpoint)),
+                            destination,
+                            additional,
+                        )
+                except Exception as exc:
+                    checkpoint.status = STATUS_FAILED
+                    checkpoint.error = str(exc)
+                    self._store.save(checkpoint)
+                    raise
+                finally:
+                    GPTState.system_prompt = system_prompt
+                output = result.text
+            checkpoint.outputs.append(output)
+            checkpoint.next_step = index + 1
+            checkpoint.pending_input = ""
+            if (
+                step.get("requires_user_input")
+                and step.get("type") != "action"
+                and checkpoint.next_step < len(steps)
+            ):
+                checkpoint.status = STATUS_AWAITING_INPUT
+                self._store.save(checkpoint)
+                return checkpoint
+            self._store.save(checkpoint)
+        checkpoint.status = STATUS_COMPLETE
+        self._store.save(checkpoint)
+        return checkpoint
+
+
+__all__ = [
+    "SequenceCheckpoint",
+    "SequenceCheckpointStore",
+    "SequenceRunner",
+    "StepRecipe",
+    "apply_step_recipe",
+    "default_checkpoint_directory",
+    "resolve_step_recipe",
+    "snapshot_source",
+    "step_prompt",
+]
@@ -8,8 +8,9 @@ the response canvas) can consume snapshots via `canvas_view_from_snapshot`.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple, cast, Mapping
+from typing import Callable, List, Optional, Dict, Any, Tuple, cast, Mapping
 
 from .axisCatalog import axis_catalog
 from .historyLifecycle import append_entry_from_request
@@ -29,6 +30,49 @@ GATING_SNAPSHOT_KEYS = (
 )
 
 
+@dataclass(frozen=True)
+class StreamingDelta:
+    """Text appended to a streaming run at a given buffer version."""
+
+    request_id: str
+    version: int
+    text: str
+    length: int
+
+
+StreamingDeltaListener = Callable[[StreamingDelta], None]
+
+_DELTA_LISTENERS: List[StreamingDeltaListener] = []
+_DELTA_LISTENERS_LOCK = threading.Lock()
+
+
+def subscribe_streaming_deltas(listener: StreamingDeltaListener) -> Callable[[], None]:
+    """Register a listener for appended streaming text; returns an unsubscribe."""
+
+    with _DELTA_LISTENERS_LOCK:
+        _DELTA_LISTENERS.append(listener)
+
+    def _unsubscribe() -> None:
+        with _DELTA_LISTENERS_LOCK:
+            try:
+                _DELTA_LISTENERS.remove(listener)
+            except ValueError:
+                pass
+
+    return _unsubscribe
+
+
+def _publish_streaming_delta(delta: StreamingDelta) -> None:
+    with _DELTA_LISTENERS_LOCK:
+        listeners = list(_DELTA_LISTENERS)
+    for listener in listeners:
+        try:
+            listener(delta)
+        except Exception:
+            # Subscribers must never break the streaming loop.
+            pass
+
+
 def _coerce_int(value: Any) -> Optional[int]:
     try:
         if isinstance(value, bool):
@@ -58,6 +102,13 @@ class StreamingRun:
     This structure keeps streamed text chunks and high-level status flags in
     one place so tests can exercise streaming accumulation and error
     transitions without depending on UI or network layers.
+
+    `chunks` is append-only. `version` counts accepted chunks and `length`
+    tracks the total character count, so consumers can ask for
+    `text_since(version)` instead of copying the whole response. The joined
+    `text` view is cached per chunk list: reads with no new chunks return the
+    cached string, a read after appends joins the cached text with only the
+    new chunks (one copy), and a replaced or rewritten list is joined afresh.
     """
 
     request_id: str
@@ -66,6 +117,28 @@ class StreamingRun:
     errored: bool = False
     error_message: str = ""
     axes: Dict[str, List[str]] = field(default_factory=dict)
+    length: int = 0
+    _text_cache: str = field(default="", init=False, repr=False, compare=False)
+    _text_cache_version: int = field(default=0, init=False, repr=False, compare=False)
+    # The list the cache was built from and its last chunk at that version,
+    # compared by identity so a replaced or rewritten list is never mistaken
+    # for an appended one.
+    _text_cache_chunks: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _text_cache_last: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.chunks and not self.length:
+            self.length = sum(len(chunk) for chunk in self.chunks)
+
+    @property
+    def version(self) -> int:
+        """Monotonic version of the buffer (number of accepted chunks)."""
+
+        return len(self.chunks)
 
     def on_chunk(self, text: str) -> None:
         """Append a streamed text chunk.
@@ -84,6 +157,7 @@ class StreamingRun:
         if not text_str.strip():
             return
         self.chunks.append(text_str)
+        self.length += len(text_str)
 
     def on_complete(self) -> None:
         """Mark the stream as successfully completed."""
@@ -108,7 +182,37 @@ class StreamingRun:
     def text(self) -> str:
         """Return the concatenated streamed text so far."""
 
-        return "".join(self.chunks)
+        chunks = self.chunks
+        version = len(chunks)
+        cached = self._text_cache_version
+        extends_cache = (
+            self._text_cache_chunks is chunks
+            and cached <= version
+            and (cached == 0 or chunks[cached - 1] is self._text_cache_last)
+        )
+        if extends_cache and cached == version:
+            return self._text_cache
+        if extends_cache:
+            self._text_cache = "".join([self._text_cache, *chunks[cached:]])
+        else:
+            self._text_cache = "".join(chunks)
+        self._text_cache_chunks = chunks
+        self._text_cache_version = version
+        self._text_cache_last = chunks[-1] if chunks else None
+        return self._text_cache
+
+    def text_since(self, version: int) -> str:
+        """Return text appended after `version` without copying earlier chunks."""
+
+        try:
+            start = int(version)
+        except (TypeError, ValueError):
+            start = 0
+        if start <= 0:
+            return self.text
+        if start >= len(self.chunks):
+            return ""
+        return "".join(self.chunks[start:])
 
     def snapshot(self) -> Dict[str, Any]:
         """Return a serialisable snapshot of the streaming state.
@@ -120,6 +224,8 @@ class StreamingRun:
         return {
             "request_id": self.request_id,
             "text": self.text,
+            "version": self.version,
+            "length": self.length,
             "completed": self.completed,
             "errored": self.errored,
             "error_message": self.error_message,
@@ -173,6 +279,7 @@ def filtered_axes_from_request(request: Dict[str, Any]) -> Dict[str, List[str]]:
     axes_value = catalog_data.get("axes", {}) if catalog_data else {}
     if isinstance(axes_value, dict):
         axes_map = cast(Dict[str, Dict[str, Any]], axes_value or {})
+    token_sets = catalog_data.get("axis_token_sets") or {}
 
     filtered: Dict[str, List[str]] = {}
     for axis in (
@@ -188,7 +295,9 @@ def filtered_axes_from_request(request: Dict[str, Any]) -> Dict[str, List[str]]:
             tokens = [str(v) for v in vals if str(v)]
         else:
             tokens = [str(vals)] if vals else []
-        known = set((axes_map.get(axis) or {}).keys())
+        known = token_sets.get(axis)
+        if known is None:
+            known = set((axes_map.get(axis) or {}).keys())
         kept = [t for t in tokens if t in known]
         if kept:
             filtered[axis] = kept
@@ -215,6 +324,9 @@ class StreamingSession:
     gating_drop_sources: Dict[str, int] = field(default_factory=dict)
     gating_drop_last_message: str = ""
     gating_drop_last_code: str = ""
+    prompt_prefix_hash: str = ""
+    # Set when the response was replayed from the local response cache.
+    response_cache_key: str = ""
 
     @property
     def request_id(self) -> str:
@@ -224,6 +336,13 @@ class StreamingSession:
     def text(self) -> str:
         return self.run.text
 
+    @property
+    def version(self) -> int:
+        return self.run.version
+
+    def text_since(self, version: int) -> str:
+        return self.run.text_since(version)
+
     def _record_event(self, kind: str, **payload: Any) -> None:
         event = {"kind": kind, "request_id": self.request_id}
         event.update(payload)
@@ -482,6 +601,26 @@ class StreamingSession:
             error=str(error or ""),
         )
 
+    def record_prompt_prefix(self, *, prefix_hash: str, messages: int) -> None:
+        """Record the hash of the cacheable request prefix for this run."""
+
+        self.prompt_prefix_hash = str(prefix_hash or "")
+        self._record_event(
+            "prompt_prefix",
+            prefix_hash=self.prompt_prefix_hash,
+            messages=int(messages or 0),
+        )
+
+    def record_response_cache_hit(self, *, cache_key: str, chunks: int) -> None:
+        """Record that this run is replaying a cached response."""
+
+        self.response_cache_key = str(cache_key or "")
+        self._record_event(
+            "response_cache_hit",
+            cache_key=self.response_cache_key,
+            chunks=int(chunks or 0),
+        )
+
     def record_ui_refresh_requested(self, *, forced: bool, reason: str) -> None:
         """Record that a UI refresh was requested during streaming."""
 
@@ -980,10 +1119,66 @@ def record_streaming_snapshot(
 
 
 def record_streaming_chunk(run: StreamingRun, text: str) -> Dict[str, Any]:
-    """Append a chunk and persist the updated snapshot."""
+    """Append a chunk and persist the updated snapshot.
+
+    Chunks never change gating data, so when GPTState already holds the
+    snapshot for this run at the previous version, the new snapshot is a
+    shallow copy with only text/version/length replaced instead of a full
+    rebuild and gating re-merge. Snapshots are never mutated after they are
+    published, so callers holding an earlier one do not see it change.
+    Accepted chunks are published to delta subscribers.
+    """
 
+    previous_version = run.version
     run.on_chunk(text)
-    return record_streaming_snapshot(run)
+    if run.version == previous_version:
+        prior = _live_snapshot_for(run, version=previous_version)
+        return prior if prior is not None else record_streaming_snapshot(run)
+
+    prior = _live_snapshot_for(run, version=previous_version)
+    if prior is None:
+        snapshot = record_streaming_snapshot(run)
+    else:
+        snapshot = {
+            **prior,
+            "text": run.text,
+            "version": run.version,
+            "length": run.length,
+        }
+        try:
+            from .modelState import GPTState
+
+            GPTState.last_streaming_snapshot = snapshot
+        except Exception:
+            pass
+
+    _publish_streaming_delta(
+        StreamingDelta(
+            request_id=run.request_id,
+            version=run.version,
+            text=run.chunks[-1],
+            length=run.length,
+        )
+    )
+    return snapshot
+
+
+def _live_snapshot_for(run: StreamingRun, *, version: int) -> Optional[Dict[str, Any]]:
+    """Return GPTState's snapshot dict when it tracks `run` at `version`."""
+
+    try:
+        from .modelState import GPTState
+
+        snapshot = getattr(GPTState, "last_streaming_snapshot", None)
+    except Exception:
+        return None
+    if not isinstance(snapshot, dict):
+        return None
+    if snapshot.get("request_id") != run.request_id:
+        return None
+    if snapshot.get("version") != version:
+        return None
+    return snapshot
 
 
 def record_streaming_error(run: StreamingRun, message: str) -> Dict[str, Any]:
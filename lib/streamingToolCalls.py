@@ -0,0 +1,124 @@
+"""Assemble streamed `delta.tool_calls` fragments into complete tool calls.
+
+Chat-completions streams split each tool call across many deltas: the first
+fragment for an `index` carries the call `id` and function `name`, later
+fragments append pieces of the JSON `arguments` string. The assembler keeps
+one buffer per index and reports a call as complete as soon as it can no
+longer change:
+
+- its arguments already parse as a JSON value (checked only when the buffer
+  ends in `}` or `]`, so long arguments are not re-parsed on every delta);
+- a fragment for a later index arrives (providers stream calls in order);
+- the stream ends (`finish()`).
+
+Each call is reported exactly once, so callers can start running it while
+the rest of the turn is still streaming.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class StreamingToolCall:
+    index: int
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+    type: str = "function"
+    complete: bool = False
+
+    def arguments_ready(self) -> bool:
+        stripped = self.arguments.rstrip()
+        if not stripped or stripped[-1] not in "}]":
+            return False
+        try:
+            json.loads(stripped)
+        except ValueError:
+            return False
+        return True
+
+    def to_message_dict(self) -> Dict[str, Any]:
+        """Shape used in the assistant message's `tool_calls` list."""
+
+        return {
+            "id": self.id,
+            "type": self.type,
+            "function": {"name": self.name, "arguments": self.arguments},
+        }
+
+
+class StreamingToolCallAssembler:
+    """Per-turn buffer of tool-call fragments keyed by their stream index."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[int, StreamingToolCall] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._calls)
+
+    @property
+    def calls(self) -> List[StreamingToolCall]:
+        return [self._calls[index] for index in sorted(self._calls)]
+
+    def feed(self, fragments: Optional[Iterable[Any]]) -> List[StreamingToolCall]:
+        """Merge one delta's `tool_calls` list; return calls that just completed."""
+
+        completed: List[StreamingToolCall] = []
+        for fragment in fragments or ():
+            if not isinstance(fragment, dict):
+                continue
+            try:
+                index = int(fragment.get("index", len(self._calls)))
+            except (TypeError, ValueError):
+                continue
+            call = self._calls.get(index)
+            if call is None:
+                # A new index means every earlier call has finished streaming.
+                completed.extend(self._complete_before(index))
+                call = self._calls[index] = StreamingToolCall(index=index)
+            if call.complete:
+                continue
+            if fragment.get("id"):
+                call.id = str(fragment["id"])
+            if fragment.get("type"):
+                call.type = str(fragment["type"])
+            function = fragment.get("function") or {}
+            if function.get("name"):
+                call.name += str(function["name"])
+            if function.get("arguments"):
+                call.arguments += str(function["arguments"])
+            if call.name and call.arguments_ready():
+                call.complete = True
+                completed.append(call)
+        return completed
+
+    def finish(self) -> List[StreamingToolCall]:
+        """Complete every call still open at the end of the stream."""
+
+        return self._complete_before(None)
+
+    def assistant_message(self, content: str = "") -> Dict[str, Any]:
+        """The assistant turn to echo back before the tool results."""
+
+        return {
+            "role": "assistant",
+            "content": content or None,
+            "tool_calls": [call.to_message_dict() for call in self.calls],
+        }
+
+    def _complete_before(self, index: Optional[int]) -> List[StreamingToolCall]:
+        completed = []
+        for call in self.calls:
+            if index is not None and call.index >= index:
+                break
+            if not call.complete:
+                call.complete = True
+                completed.append(call)
+        return completed
+
+
+__all__ = ["StreamingToolCall", "StreamingToolCallAssembler"]
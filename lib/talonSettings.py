@@ -9,7 +9,8 @@ from .axisMappings import (
     axis_hydrate_tokens,
     axis_value_to_key_map_for,
 )
-from .axisCatalog import axis_catalog
+from .axisCatalog import axis_catalog, axis_catalog_generation
+from .axisTokenIndex import AxisTokenIndex
 from .personaConfig import persona_docs_map
 from .modelSource import CompoundSource, ModelSource, SourceStack, create_model_source
 from .modelDestination import (
@@ -17,7 +18,7 @@ from .modelDestination import (
     Stack,
     create_model_destination,
 )
-from .modelHelpers import notify
+from .modelHelpers import notify, prewarm_provider_connection
 from .modelState import GPTState
 from .metaPromptConfig import META_INTERPRETATION_GUIDANCE
 from talon import Context, Module, settings
@@ -186,32 +187,7 @@ def _canonicalise_axis_tokens(axis: str, tokens: list[str]) -> list[str]:
     - Returns tokens sorted by a stable key (currently the short token string)
       so equivalent sets have identical serialised forms.
     """
-    raw = [t.strip() for t in tokens if t and t.strip()]
-    if not raw:
-        return []
-
-    incompat_for_axis = _AXIS_INCOMPATIBILITIES.get(axis, {})
-    seen: set[str] = set()
-    ordered: list[str] = []
-
-    for token in raw:
-        conflicts = incompat_for_axis.get(token, set())
-        if conflicts:
-            # Drop any conflicting tokens that were accepted earlier.
-            ordered = [t for t in ordered if t not in conflicts]
-            seen -= conflicts
-        if token in seen:
-            continue
-        ordered.append(token)
-        seen.add(token)
-
-    cap = _AXIS_SOFT_CAPS.get(axis)
-    if cap is not None and cap > 0 and len(ordered) > cap:
-        # Enforce soft cap with last-wins semantics: keep the most recent.
-        ordered = ordered[-cap:]
-
-    # Canonicalise order so equivalent sets serialise identically.
-    return sorted(ordered)
+    return _axis_token_index().canonicalise(axis, tokens)
 
 
 def _axis_tokens_to_string(tokens: list[str]) -> str:
@@ -269,15 +245,34 @@ _AXIS_PRIORITY: tuple[str, ...] = (
 )
 
 
-def _axis_prefix(token: str) -> Tuple[Optional[str], Optional[str]]:
-    """Return (axis, stripped_value) if the token uses an explicit prefix."""
-    if ":" not in token:
-        return None, None
-    prefix, remainder = token.split(":", 1)
-    axis = prefix.strip().lower()
-    if axis in _AXIS_PRIORITY:
-        return axis, remainder.strip()
-    return None, None
+_axis_token_index_cache: Optional[tuple[int, AxisTokenIndex]] = None
+
+
+def _axis_token_index() -> AxisTokenIndex:
+    """Return the compiled axis token index for the current catalog."""
+
+    global _axis_token_index_cache
+    catalog = axis_catalog()
+    # axisMappings invalidates the catalog whenever it (re)builds the
+    # value→key maps, so the generation alone tracks them; code that edits
+    # the maps in place must call invalidate_axis_catalog() as well.
+    generation = axis_catalog_generation()
+    cached = _axis_token_index_cache
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    token_sets = catalog.get("axis_token_sets") or {
+        axis: set((tokens or {}).keys())
+        for axis, tokens in (catalog.get("axes") or {}).items()
+    }
+    index = AxisTokenIndex(
+        _AXIS_PRIORITY,
+        AXIS_VALUE_TO_KEY_MAPS,
+        token_sets,
+        _AXIS_SOFT_CAPS,
+        _AXIS_INCOMPATIBILITIES,
+    )
+    _axis_token_index_cache = (generation, index)
+    return index
 
 
 def _resolve_axis_for_token(
@@ -292,31 +287,7 @@ def _resolve_axis_for_token(
     - If no matches are found, fall back to the hint axis so user-provided
       tokens are not dropped silently.
     """
-    raw = token.strip()
-    if not raw:
-        return None, None
-
-    pref_axis, pref_value = _axis_prefix(raw)
-    if pref_axis:
-        axis_map = _axis_value_to_key_map_for(pref_axis)
-        mapped = axis_map.get(pref_value, pref_value)
-        return pref_axis, mapped
-
-    matches: list[tuple[str, str]] = []
-    for axis in _AXIS_PRIORITY:
-        axis_map = _axis_value_to_key_map_for(axis)
-        mapped = axis_map.get(raw)
-        if mapped:
-            matches.append((axis, mapped))
-    if matches:
-        # Highest-priority axis wins when multiple are possible.
-        matches.sort(key=lambda pair: _AXIS_PRIORITY.index(pair[0]))
-        return matches[0]
-
-    # Preserve the token on its hinted axis when unmapped.
-    if hint_axis:
-        return hint_axis, raw
-    return None, None
+    return _axis_token_index().resolve(token, hint_axis)
 
 
 def _apply_constraint_hierarchy(
@@ -328,11 +299,12 @@ def _apply_constraint_hierarchy(
     - Resolved axes keep ingestion order while applying caps/conflicts.
     - Canonical axes apply the same caps/conflicts but return sorted tokens for recipe serialisation.
     """
+    index = _axis_token_index()
     buckets: dict[str, list[str]] = {axis: [] for axis in _AXIS_PRIORITY}
 
     def _ingest(tokens: list[str], hint: str) -> None:
         for token in tokens:
-            target_axis, mapped = _resolve_axis_for_token(token, hint_axis=hint)
+            target_axis, mapped = index.resolve(token, hint_axis=hint)
             if target_axis and mapped:
                 buckets[target_axis].append(mapped)
 
@@ -345,34 +317,16 @@ def _apply_constraint_hierarchy(
     _ingest(axis_values.get("form", []), "form")
     _ingest(axis_values.get("channel", []), "channel")
 
-    def _preserve_order(axis: str, tokens: list[str]) -> list[str]:
-        """Apply conflicts while keeping ingestion order (no caps)."""
-        raw = [t.strip() for t in tokens if t and t.strip()]
-        if not raw:
-            return []
-        incompat_for_axis = _AXIS_INCOMPATIBILITIES.get(axis, {})
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for token in raw:
-            conflicts = incompat_for_axis.get(token, set())
-            if conflicts:
-                ordered = [t for t in ordered if t not in conflicts]
-                seen -= conflicts
-            if token in seen:
-                continue
-            ordered.append(token)
-            seen.add(token)
-        return ordered
-
-    resolved_scope = _preserve_order("scope", buckets["scope"])
-    resolved_method = _preserve_order("method", buckets["method"])
-    canonical_scope = _canonicalise_axis_tokens("scope", buckets["scope"])
-    canonical_method = _canonicalise_axis_tokens("method", buckets["method"])
+    # Resolved scope/method apply conflicts but keep ingestion order (no caps).
+    resolved_scope = index.dedupe("scope", buckets["scope"])
+    resolved_method = index.dedupe("method", buckets["method"])
+    canonical_scope = index.canonicalise("scope", buckets["scope"])
+    canonical_method = index.canonicalise("method", buckets["method"])
 
     # Form and channel must be singletons; reuse canonicalised values for both
     # resolved and canonical representations to enforce caps consistently.
-    canonical_form = _canonicalise_axis_tokens("form", buckets["form"])
-    canonical_channel = _canonicalise_axis_tokens("channel", buckets["channel"])
+    canonical_form = index.canonicalise("form", buckets["form"])
+    canonical_channel = index.canonicalise("channel", buckets["channel"])
     resolved_form = canonical_form
     resolved_channel = canonical_channel
 
@@ -409,24 +363,17 @@ def _filter_axis_tokens(
     as long instruction strings that start with 'Important:'.
     """
 
-    catalog = axis_catalog()
-    catalog_tokens = {
-        axis: set((tokens or {}).keys())
-        for axis, tokens in (catalog.get("axes") or {}).items()
-    }
+    index = _axis_token_index()
 
     def _filter(axis: str, tokens: list[str]) -> list[str]:
-        valid = axis_value_to_key_map_for(axis)
-        valid_tokens = set(valid.keys())
-        valid_tokens |= catalog_tokens.get(axis, set())
         filtered: list[str] = []
         for t in tokens:
-            if t in valid:
+            if index.is_mapped(axis, t):
                 filtered.append(t)
                 continue
             if str(t).strip().lower().startswith("important:"):
                 continue
-            if t in valid_tokens:
+            if index.is_known(axis, t):
                 filtered.append(t)
                 continue
             # Keep short/unknown tokens (for example, test sentinels) so spoken
@@ -660,6 +607,9 @@ def _spoken_axis_value(m, axis_name: str) -> str:
     "| {user.customPrompt}"
 )
 def modelPrompt(m) -> str:
+    # The provider is known before the recipe is resolved; open its connection
+    # now so the handshake overlaps with prompt/source assembly.
+    prewarm_provider_connection()
     if hasattr(m, "customPrompt"):
         return str(m.customPrompt)
     # Explicit guardrail: legacy style modifiers are no longer supported post
@@ -1215,6 +1165,69 @@ mod.setting(
     desc="The endpoint to send the model requests to",
 )
 
+mod.setting(
+    "model_http_prewarm",
+    type=int,
+    default=0,
+    desc="When set to 1, open the provider connection in the background as soon as a spoken prompt starts resolving.",
+)
+
+mod.setting(
+    "model_prompt_cache_layout",
+    type=int,
+    default=0,
+    desc="When set to 1, order requests as stable system prompt and history first, then per-request context (focused app, language, timeout), so providers with prefix caching can reuse the prompt prefix.",
+)
+
+mod.setting(
+    "model_response_cache",
+    type=int,
+    default=0,
+    desc="When set to 1, reuse the stored response for an identical request (same provider, model, messages, tools, reasoning effort and verbosity) instead of calling the provider again.",
+)
+
+mod.setting(
+    "model_response_cache_ttl_seconds",
+    type=int,
+    default=3600,
+    desc="Seconds a cached response stays valid; 0 keeps entries until they are evicted.",
+)
+
+mod.setting(
+    "model_response_cache_max_entries",
+    type=int,
+    default=64,
+    desc="Maximum number of cached responses; the least recently used are dropped first.",
+)
+
+mod.setting(
+    "model_response_cache_providers",
+    type=str,
+    default="",
+    desc="Optional comma-separated provider ids the response cache applies to (empty means all providers).",
+)
+
+mod.setting(
+    "model_request_tracing",
+    type=int,
+    default=0,
+    desc="When set to 1, record timing spans for each request phase (prompt resolution through history append); 'model export telemetry' writes them as JSON and Chrome trace files.",
+)
+
+mod.setting(
+    "model_log_level",
+    type=str,
+    default="info",
+    desc="Lowest log level printed to the Talon log by the model helpers: debug, info, warning, error, or off.",
+)
+
+mod.setting(
+    "model_log_buffer_level",
+    type=str,
+    default="info",
+    desc="Lowest log level kept in the in-memory ring of recent log records (exported with telemetry): debug, info, warning, error, or off.",
+)
+
 mod.setting(
     "model_request_timeout_seconds",
     type=int,
@@ -1222,6 +1235,13 @@ mod.setting(
     desc="Maximum time in seconds to wait for a single model HTTP request before timing out.",
 )
 
+mod.setting(
+    "model_http_keepalive_idle_seconds",
+    type=int,
+    default=90,
+    desc="Seconds a pooled provider HTTP connection may sit idle before it is closed. Set to 0 to open a fresh connection per request.",
+)
+
 mod.setting(
     "model_system_prompt",
     type=str,
@@ -1336,9 +1356,34 @@ mod.setting(
     ),
 )
 
+mod.setting(
+    "model_request_history_persist",
+    type=int,
+    default=0,
+    desc=(
+        "When set to 1, keep request history in a SQLite file "
+        "(request-history.sqlite3 under user.model_source_save_directory) so it "
+        "survives Talon restarts."
+    ),
+)
+
+mod.setting(
+    "model_request_history_max_entries",
+    type=int,
+    default=5000,
+    desc="Maximum number of entries kept in persistent request history; the oldest are dropped first.",
+)
+
 mod.setting(
     "gpt_max_total_calls",
     type=int,
     default=3,
     desc="The maximum number of tool calls allowed per GPT request. Increase if you want to allow more recursive or chained tool calls.",
 )
+
+mod.setting(
+    "model_tool_call_concurrency",
+    type=int,
+    default=4,
+    desc="How many tool calls from a single model turn may run at once. Set to 1 to run them one after another.",
+)
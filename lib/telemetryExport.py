@@ -28,6 +28,7 @@ except Exception:  # pragma: no cover - Talon runtime unavailable
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT_DIR = REPO_ROOT / "artifacts" / "telemetry"
 DEFAULT_TOP_N = 5
+RECENT_LOG_LIMIT = 500
 
 
 def _fetch_ui_dispatch_inline_stats() -> Dict[str, Any] | None:
@@ -110,6 +111,195 @@ def _fetch_ui_dispatch_inline_stats() -> Dict[str, Any] | None:
     return stats_payload
 
 
+def _fetch_provider_transport_stats() -> Dict[str, Any] | None:
+    try:
+        from . import providerTransport as transport_module  # type: ignore
+    except Exception:
+        return None
+
+    stats_fn = getattr(transport_module, "provider_transport_stats", None)
+    if not callable(stats_fn):
+        return None
+
+    try:
+        raw_stats = stats_fn()
+    except Exception:
+        return None
+    if not isinstance(raw_stats, Mapping):
+        return None
+
+    stats_payload: Dict[str, Any] = {}
+    for key in (
+        "sessions_created",
+        "sessions_reused",
+        "sessions_reaped",
+        "sessions_closed",
+        "requests_sent",
+        "requests_unpooled",
+        "request_errors",
+        "warmups",
+        "warmups_skipped",
+        "active_sessions",
+    ):
+        count_value = _coerce_int(raw_stats.get(key))
+        stats_payload[key] = count_value if count_value > 0 else 0
+
+    pools: List[Dict[str, Any]] = []
+    raw_pools = raw_stats.get("pools")
+    if isinstance(raw_pools, list):
+        for item in raw_pools:
+            if not isinstance(item, Mapping):
+                continue
+            pools.append(
+                {
+                    "provider_id": str(item.get("provider_id") or ""),
+                    "origin": str(item.get("origin") or ""),
+                    "requests_served": _coerce_int(item.get("requests_served")),
+                }
+            )
+    stats_payload["pools"] = pools
+    return stats_payload
+
+
+def _fetch_system_prompt_cache_stats() -> Dict[str, Any] | None:
+    try:
+        from . import modelTypes as model_types_module  # type: ignore
+    except Exception:
+        return None
+
+    stats_fn = getattr(model_types_module, "system_prompt_cache_stats", None)
+    if not callable(stats_fn):
+        return None
+
+    try:
+        raw_stats = stats_fn()
+    except Exception:
+        return None
+    if not isinstance(raw_stats, Mapping):
+        return None
+
+    return {
+        key: _coerce_int(raw_stats.get(key))
+        for key in ("hits", "misses", "evictions", "entries", "max_entries")
+    }
+
+
+def _fetch_response_cache_stats() -> Dict[str, Any] | None:
+    try:
+        from . import responseCache as response_cache_module  # type: ignore
+    except Exception:
+        return None
+
+    stats_fn = getattr(response_cache_module, "response_cache_stats", None)
+    if not callable(stats_fn):
+        return None
+
+    try:
+        raw_stats = stats_fn()
+    except Exception:
+        return None
+    if not isinstance(raw_stats, Mapping):
+        return None
+
+    return {
+        key: _coerce_int(raw_stats.get(key))
+        for key in (
+            "hits",
+            "misses",
+            "stores",
+            "evictions",
+            "expirations",
+            "entries",
+            "max_entries",
+        )
+    }
+
+
+def _fetch_log_stats() -> Dict[str, Any] | None:
+    try:
+        from . import modelLog as model_log_module  # type: ignore
+    except Exception:
+        return None
+
+    stats_fn = getattr(model_log_module, "log_stats", None)
+    if not callable(stats_fn):
+        return None
+
+    try:
+        raw_stats = stats_fn()
+    except Exception:
+        return None
+    if not isinstance(raw_stats, Mapping):
+        return None
+
+    payload: Dict[str, Any] = {
+        key: _coerce_int(raw_stats.get(key))
+        for key in ("debug", "info", "warning", "error", "buffered", "buffer_size")
+    }
+    for key in ("console_level", "buffer_level"):
+        payload[key] = str(raw_stats.get(key) or "")
+    return payload
+
+
+def _fetch_request_tracing_stats() -> Dict[str, Any] | None:
+    try:
+        from . import requestTracing as request_tracing_module  # type: ignore
+    except Exception:
+        return None
+
+    stats_fn = getattr(request_tracing_module, "request_tracing_stats", None)
+    if not callable(stats_fn):
+        return None
+
+    try:
+        raw_stats = stats_fn()
+    except Exception:
+        return None
+    if not isinstance(raw_stats, Mapping):
+        return None
+
+    return {
+        key: _coerce_int(raw_stats.get(key))
+        for key in ("requests", "spans", "dropped_spans", "evicted_requests", "pending")
+    }
+
+
+def _write_request_traces(base_dir: Path) -> Dict[str, Path]:
+    """Write recent request traces as JSON and Chrome trace-event files."""
+
+    try:
+        from . import requestTracing as request_tracing_module  # type: ignore
+    except Exception:
+        return {}
+
+    try:
+        traces = request_tracing_module.export_traces_json()
+        chrome = request_tracing_module.export_chrome_trace()
+    except Exception:
+        return {}
+
+    traces_path = base_dir / "request-traces.json"
+    traces_path.write_text(json.dumps(traces, sort_keys=True, indent=2))
+    chrome_path = base_dir / "request-traces.chrome.json"
+    chrome_path.write_text(json.dumps(chrome))
+    return {"traces": traces_path, "chrome_trace": chrome_path}
+
+
+def _write_recent_log(base_dir: Path) -> Dict[str, Path]:
+    """Write the in-memory ring of recent log records."""
+
+    try:
+        from . import modelLog as model_log_module  # type: ignore
+
+        records = model_log_module.recent_log_records(limit=RECENT_LOG_LIMIT)
+    except Exception:
+        return {}
+
+    log_path = base_dir / "recent-log.json"
+    log_path.write_text(json.dumps(records, indent=2))
+    return {"log": log_path}
+
+
 def _coerce_int(value: object) -> int:
     if isinstance(value, bool):
         return int(value)
@@ -342,6 +532,26 @@ def _build_telemetry_payload(
     if inline_stats is not None:
         payload["ui_dispatch_inline_fallback"] = inline_stats
 
+    transport_stats = _fetch_provider_transport_stats()
+    if transport_stats is not None:
+        payload["provider_transport"] = transport_stats
+
+    prompt_cache_stats = _fetch_system_prompt_cache_stats()
+    if prompt_cache_stats is not None:
+        payload["system_prompt_cache"] = prompt_cache_stats
+
+    response_cache_stats = _fetch_response_cache_stats()
+    if response_cache_stats is not None:
+        payload["response_cache"] = response_cache_stats
+
+    tracing_stats = _fetch_request_tracing_stats()
+    if tracing_stats is not None:
+        payload["request_tracing"] = tracing_stats
+
+    log_stats = _fetch_log_stats()
+    if log_stats is not None:
+        payload["log"] = log_stats
+
     return payload
 
 
@@ -437,6 +647,9 @@ def snapshot_telemetry(
     telemetry_path = base_dir / "history-validation-summary.telemetry.json"
     telemetry_path.write_text(json.dumps(telemetry_payload, sort_keys=True, indent=2))
 
+    trace_paths = _write_request_traces(base_dir)
+    log_paths = _write_recent_log(base_dir)
+
     if reset_gating:
         historyLifecycle.consume_gating_drop_stats()
 
@@ -445,6 +658,8 @@ def snapshot_telemetry(
         "streaming": streaming_path,
         "telemetry": telemetry_path,
         "suggestion_skip": skip_path,
+        **trace_paths,
+        **log_paths,
     }
 
 
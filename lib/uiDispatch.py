@@ -10,24 +10,26 @@ from typing import Callable, Dict
 
 from talon import cron, settings
 
+from .modelLog import DEBUG, INFO, get_logger
 
-def _debug(msg: str) -> None:
-    try:
-        if not settings.get("user.model_debug_pill", True):
-            return
-    except Exception:
-        return
+_log = get_logger("uiDispatch")
+
+
+def _debug(msg: str, *args: object) -> None:
+    # `user.model_debug_pill` promotes these to the console; otherwise they
+    # only land in the log ring buffer.
     try:
-        print(f"[uiDispatch] {msg}")
+        verbose = bool(settings.get("user.model_debug_pill", True))
     except Exception:
-        pass
+        verbose = False
+    _log.log(INFO if verbose else DEBUG, msg, *args)
 
 
 def _safe_run(fn: Callable[[], None]) -> None:
     try:
         fn()
     except Exception as e:
-        _debug(f"ui dispatch fn failed: {e}")
+        _debug("ui dispatch fn failed: %s", e)
         # Swallow to avoid breaking callers on UI dispatch failure.
         pass
 
@@ -145,7 +147,7 @@ def _schedule_drain() -> None:
         _fallback_notified = False
     except Exception as e:
         if not _schedule_failed and not _fallback_warned:
-            _debug(f"cron dispatch failed ({e}); draining UI work inline")
+            _debug("cron dispatch failed (%s); draining UI work inline", e)
             _notify_inline_fallback()
             _fallback_warned = True
         _schedule_failed = True
@@ -169,7 +171,7 @@ def _drain_queue() -> None:
                 try:
                     cron.after(f"{int(delay_ms)}ms", lambda fn=fn: _safe_run(fn))
                 except Exception as e:
-                    _debug(f"cron dispatch (delay) failed ({e}); running inline")
+                    _debug("cron dispatch (delay) failed (%s); running inline", e)
                     _safe_run(fn)
             else:
                 _safe_run(fn)
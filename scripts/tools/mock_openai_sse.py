@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible chat-completions server for offline streaming runs.
+
+Speaks the two response shapes `_send_request_streaming` parses:
+
+- `text/event-stream` bodies of `chat.completion.chunk` events terminated by
+  `data: [DONE]`, when the request sets `"stream": true`;
+- a single `chat.completion` JSON body otherwise (or when `json_fallback` is
+  set, to exercise the "server ignored the stream flag" path).
+
+Response shape is controlled by `MockResponseConfig`: total length, chunk
+size, inter-chunk delay, an optional `## Model interpretation` meta section,
+HTTP status/error injection, a mid-stream abort and streamed tool calls
+(`tool_calls` for `tool_turns` turns, then answered with text). Tests and benchmarks use
+`MockSSEServer` as a context manager and point `user.model_endpoint` at
+`server.url`; run this file directly to serve from the command line.
+
+`http_post` is a small stdlib client with the subset of the `requests`
+response API the streaming path uses (`status_code`, `headers`, `iter_lines`,
+`json`, `text`, `close`). It lets harnesses without `requests` installed
+route `modelHelpers.requests.post` to the mock over a real socket.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# `http_post` takes a `json=` keyword like requests.post, shadowing the module.
+_json_dumps = json.dumps
+
+DEFAULT_META = (
+    "## Model interpretation\n"
+    "Mock response generated locally; no provider was contacted."
+)
+_FILLER_WORDS = (
+    "stream",
+    "latency",
+    "token",
+    "canvas",
+    "refresh",
+    "chunk",
+    "buffer",
+    "session",
+    "answer",
+    "meta",
+)
+
+
+@dataclass(frozen=True)
+class MockResponseConfig:
+    # Characters of answer text (before any meta section).
+    total_chars: int = 2000
+    # Characters per streamed delta.
+    chunk_chars: int = 32
+    # Sleep between streamed deltas.
+    delay_ms: float = 0.0
+    # Appended after a blank line; None disables the meta section.
+    meta: Optional[str] = DEFAULT_META
+    # Exact answer text; overrides total_chars when set.
+    text: Optional[str] = None
+    # Non-200 statuses return `error_body` as JSON instead of a completion.
+    status: int = 200
+    error_body: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "error": {"message": "mock failure", "type": "server_error"}
+        }
+    )
+    # Answer with a plain JSON completion even when streaming was requested.
+    json_fallback: bool = False
+    # Drop the connection after this many deltas (simulates a broken stream).
+    abort_after_chunks: Optional[int] = None
+    model: str = "mock-model"
+    # (name, arguments-json) pairs streamed as `delta.tool_calls` fragments of
+    # `chunk_chars` characters while fewer than `tool_turns` tool turns have
+    # been answered in the request.
+    tool_calls: Tuple[Tuple[str, str], ...] = ()
+    tool_turns: int = 1
+    # Content streamed ahead of the tool calls on each tool turn.
+    tool_preamble: str = ""
+
+
+def filler_text(total_chars: int) -> str:
+    """Deterministic prose-like filler of exactly `total_chars` characters."""
+
+    if total_chars <= 0:
+        return ""
+    words: List[str] = []
+    size = 0
+    index = 0
+    while size < total_chars:
+        word = _FILLER_WORDS[index % len(_FILLER_WORDS)]
+        if index and index % 12 == 0:
+            word = word + ".\n"
+        words.append(word)
+        size += len(word) + 1
+        index += 1
+    return " ".join(words)[:total_chars]
+
+
+def response_text(config: MockResponseConfig) -> str:
+    answer = config.text if config.text is not None else filler_text(config.total_chars)
+    if config.meta:
+        return f"{answer}\n\n{config.meta}"
+    return answer
+
+
+def split_chunks(text: str, chunk_chars: int) -> List[str]:
+    size = max(1, int(chunk_chars))
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def completion_body(config: MockResponseConfig) -> Dict[str, Any]:
+    text = response_text(config)
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": config.model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(text) // 4},
+    }
+
+
+def tool_turns_answered(payload: Dict[str, Any]) -> int:
+    """Assistant tool-call turns already present in the request."""
+
+    return sum(
+        1
+        for message in payload.get("messages") or []
+        if isinstance(message, dict)
+        and message.get("role") == "assistant"
+        and message.get("tool_calls")
+    )
+
+
+def wants_tool_calls(config: MockResponseConfig, payload: Dict[str, Any]) -> bool:
+    """True while the conversation has not yet answered the configured tools."""
+
+    if not config.tool_calls:
+        return False
+    return tool_turns_answered(payload) < config.tool_turns
+
+
+def sse_events(
+    config: MockResponseConfig, *, tools: bool = False, turn: int = 0
+) -> Iterator[bytes]:
+    """Yield encoded SSE events for a streamed completion (without delays).
+
+    Tool call ids are `call_<index>` on the first tool turn and
+    `call_<turn>_<index>` after that.
+    """
+
+    created = int(time.time())
+
+    def event(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+        payload = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": config.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
+
+    yield event({"role": "assistant"})
+    if tools:
+        for piece in split_chunks(config.tool_preamble, config.chunk_chars):
+            yield event({"content": piece})
+        for index, (name, arguments) in enumerate(config.tool_calls):
+            call_id = f"call_{turn}_{index}" if turn else f"call_{index}"
+            head = {"index": index, "id": call_id, "type": "function"}
+            head["function"] = {"name": name, "arguments": ""}
+            yield event({"tool_calls": [head]})
+            for piece in split_chunks(arguments, config.chunk_chars):
+                yield event(
+                    {"tool_calls": [{"index": index, "function": {"arguments": piece}}]}
+                )
+        yield event({}, "tool_calls")
+        yield b"data: [DONE]\n\n"
+        return
+    for piece in split_chunks(response_text(config), config.chunk_chars):
+        yield event({"content": piece})
+    yield event({}, "stop")
+    yield b"data: [DONE]\n\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_MockHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            payload = {}
+        owner = self.server.owner
+        owner._record_request(payload)
+        config = owner.config
+
+        if config.status != 200:
+            self._send_json(config.status, config.error_body)
+            return
+        if not payload.get("stream") or config.json_fallback:
+            self._send_json(200, completion_body(config))
+            return
+        self._send_stream(
+            config,
+            tools=wants_tool_calls(config, payload),
+            turn=tool_turns_answered(payload),
+        )
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(
+        self, config: MockResponseConfig, *, tools: bool = False, turn: int = 0
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        delay = max(config.delay_ms, 0.0) / 1000.0
+        try:
+            for index, data in enumerate(sse_events(config, tools=tools, turn=turn)):
+                # Events 1..n carry content; event 0 is the role preamble.
+                if (
+                    config.abort_after_chunks is not None
+                    and index > config.abort_after_chunks
+                ):
+                    self.close_connection = True
+                    return
+                if delay and index > 1:
+                    time.sleep(delay)
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "MockSSEServer"
+
+
+class MockSSEServer:
+    """Threaded local server; use as a context manager or start()/stop()."""
+
+    def __init__(
+        self,
+        config: Optional[MockResponseConfig] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config = config or MockResponseConfig()
+        self._host = host
+        self._port = port
+        self._server: Optional[_MockHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.requests: List[Dict[str, Any]] = []
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("MockSSEServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def configure(self, **changes: Any) -> MockResponseConfig:
+        """Replace fields of the active response config; returns the new config."""
+
+        self.config = replace(self.config, **changes)
+        return self.config
+
+    def _record_request(self, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self.requests.append(payload)
+
+    def start(self) -> "MockSSEServer":
+        if self._server is not None:
+            return self
+        server = _MockHTTPServer((self._host, self._port), _Handler)
+        server.owner = self
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="mock-openai-sse", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockSSEServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+class MockHTTPResponse:
+    """Requests-like view over an `http.client` response."""
+
+    def __init__(
+        self, connection: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        self._connection = connection
+        self._response = response
+        self.status_code = response.status
+        self.headers = {key.lower(): value for key, value in response.getheaders()}
+        self._body: Optional[bytes] = None
+
+    @property
+    def content(self) -> bytes:
+        if self._body is None:
+            self._body = self._response.read()
+        return self._body
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content or b"null")
+
+    def iter_lines(self) -> Iterator[bytes]:
+        if self._body is not None:
+            yield from self._body.splitlines()
+            return
+        consumed: List[bytes] = []
+        while True:
+            line = self._response.readline()
+            if not line:
+                # A chunked body that ends without its terminating chunk was
+                # cut off; surface it the way requests does, as an error.
+                if self._response.chunked and self._response.chunk_left is not None:
+                    raise http.client.IncompleteRead(b"".join(consumed))
+                break
+            consumed.append(line)
+            yield line.rstrip(b"\r\n")
+        self._body = b"".join(consumed)
+
+    def close(self) -> None:
+        self._response.close()
+        self._connection.close()
+
+
+def http_post(
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    json: Any = None,  # noqa: A002 - mirrors requests.post
+    timeout: Optional[float] = None,
+    **_ignored: Any,
+) -> MockHTTPResponse:
+    """POST `json` to `url` and return a streaming, requests-like response."""
+
+    parts = urllib.parse.urlsplit(url)
+    connection = http.client.HTTPConnection(
+        parts.hostname or "127.0.0.1", parts.port or 80, timeout=timeout
+    )
+    body = _json_dumps(json).encode("utf-8")
+    request_headers = {"Content-Type": "application/json"}
+    request_headers.update(headers or {})
+    connection.request("POST", parts.path or "/", body=body, headers=request_headers)
+    return MockHTTPResponse(connection, connection.getresponse())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--chars", type=int, default=2000, help="answer length")
+    parser.add_argument("--chunk", type=int, default=32, help="characters per delta")
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    parser.add_argument("--no-meta", action="store_true")
+    parser.add_argument("--status", type=int, default=200)
+    parser.add_argument("--json-fallback", action="store_true")
+    parser.add_argument("--abort-after", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = MockResponseConfig(
+        total_chars=args.chars,
+        chunk_chars=args.chunk,
+        delay_ms=args.delay_ms,
+        meta=None if args.no_meta else DEFAULT_META,
+        status=args.status,
+        json_fallback=args.json_fallback,
+        abort_after_chunks=args.abort_after,
+    )
+    server = MockSSEServer(config, host=args.host, port=args.port).start()
+    print(f"Mock chat-completions endpoint: {server.url}")
+    print("Set user.model_endpoint to this URL; Ctrl-C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""End-to-end streaming latency benchmark against the local SSE mock.
+
+Runs `modelHelpers.send_request` under the Talon stubs from `bootstrap.py`
+with `user.model_endpoint` pointed at `mock_openai_sse.MockSSEServer`, and
+sweeps response sizes and chunk-rate profiles. For each case it reports:
+
+- `ttft_ms`: send_request entry to the first streamed delta reaching
+  `_append_text`, and `total_ms` for the whole call (median of repeats);
+- `per_chunk_us`: thread CPU time spent in `_append_text` per delta;
+- `cpu_ms`: thread CPU time (cumulative) and call counts for
+  `_append_text`, `record_streaming_snapshot` and `split_answer_and_meta`;
+- `alloc_peak_kib`/`alloc_net_kib`: tracemalloc peak and net growth;
+- `canvas`: refresh requests/executions recorded by the streaming session
+  and the number of `model_response_canvas_refresh` draws.
+
+It also times the live answer/meta split on its own (`splitter` rows):
+`per_chunk_us` is the cost of one `sync` + `split` of
+`StreamingAnswerMetaSplitter` once the response has reached each size.
+
+Timing, profiling and allocation tracking run as separate passes so the
+profiler does not inflate the latency numbers. `--out` writes the results as
+JSON; `--baseline` compares a run against a previous file and exits non-zero
+when a tracked metric regresses beyond `--tolerance`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+try:
+    from bootstrap import bootstrap  # type: ignore
+except ModuleNotFoundError:
+    bootstrap = None
+else:
+    bootstrap()
+
+from scripts.tools.mock_openai_sse import (  # noqa: E402
+    MockResponseConfig,
+    MockSSEServer,
+    http_post,
+    response_text,
+    split_chunks,
+)
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES: Tuple[int, ...] = (1024, 10 * 1024, 50 * 1024, 200 * 1024)
+
+
+@dataclass(frozen=True)
+class ChunkProfile:
+    name: str
+    chunk_chars: int
+    delay_ms: float
+
+
+DEFAULT_PROFILES: Tuple[ChunkProfile, ...] = (
+    # Large deltas with no pacing: parsing/bookkeeping throughput.
+    ChunkProfile("burst", 64, 0.0),
+    # Token-sized deltas with no pacing: per-chunk overhead dominates.
+    ChunkProfile("fine", 8, 0.0),
+    # Paced deltas, closer to a live provider; exercises refresh coalescing.
+    ChunkProfile("paced", 32, 1.0),
+)
+PROFILED_FUNCTIONS: Tuple[Tuple[str, str], ...] = (
+    ("modelHelpers.py", "_append_text"),
+    ("streamingCoordinator.py", "record_streaming_snapshot"),
+    ("modelHelpers.py", "split_answer_and_meta"),
+)
+# Metrics compared against a baseline (lower is better for all of them).
+TRACKED_METRICS: Tuple[str, ...] = (
+    "ttft_ms",
+    "total_ms",
+    "per_chunk_us",
+    "alloc_peak_kib",
+    "canvas_draws",
+)
+
+
+@dataclass
+class _RunCounters:
+    started_at: float = 0.0
+    first_chunk_at: Optional[float] = None
+    draws: int = 0
+
+
+def _case_id(size_bytes: int, profile: ChunkProfile) -> str:
+    return f"{profile.name}-{size_bytes}"
+
+
+@contextlib.contextmanager
+def _harness(server: MockSSEServer, counters: _RunCounters) -> Iterator[None]:
+    """Point send_request at the mock and count first chunk and canvas draws."""
+
+    from talon import actions, settings
+    from talon_user.lib import modelHelpers
+
+    original_emit_append = modelHelpers.emit_append
+
+    def timed_emit_append(*args: Any, **kwargs: Any) -> Any:
+        if counters.first_chunk_at is None:
+            counters.first_chunk_at = time.perf_counter()
+        return original_emit_append(*args, **kwargs)
+
+    def count_draw(*_args: Any, **_kwargs: Any) -> None:
+        counters.draws += 1
+
+    previous_endpoint = settings.get("user.model_endpoint")
+    settings.set("user.model_endpoint", server.url)
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+    try:
+        with (
+            patch.object(modelHelpers.requests, "post", side_effect=http_post),
+            patch.object(modelHelpers, "emit_append", side_effect=timed_emit_append),
+            patch.object(modelHelpers, "_should_show_response_canvas", return_value=True),
+            patch.object(modelHelpers, "notify", return_value=None),
+            patch.object(
+                actions.user,
+                "model_response_canvas_refresh",
+                side_effect=count_draw,
+                create=True,
+            ),
+            patch.object(
+                actions.user, "model_response_canvas_open", return_value=None, create=True
+            ),
+            contextlib.redirect_stdout(io.StringIO()),
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            yield
+    finally:
+        settings.set("user.model_endpoint", previous_endpoint)
+
+
+def _send_once(server: MockSSEServer, request_id: str) -> Tuple[_RunCounters, str]:
+    from talon_user.lib import modelHelpers
+    from talon_user.lib.modelState import GPTState
+
+    GPTState.request = {
+        "model": "mock-model",
+        "messages": [
+            {"role": "user", "content": [{"type": "text", "text": request_id}]}
+        ],
+    }
+    GPTState.text_to_confirm = ""
+    GPTState.last_streaming_events = []
+    # Measure the canvas path as if the user kept the response window open.
+    GPTState.response_canvas_manual_close = False
+    counters = _RunCounters()
+    with _harness(server, counters):
+        counters.started_at = time.perf_counter()
+        result = modelHelpers.send_request(max_attempts=1)
+    text = result.get("text", "") if isinstance(result, dict) else ""
+    return counters, str(text or "")
+
+
+def _streaming_event_counts() -> Dict[str, int]:
+    from talon_user.lib.modelState import GPTState
+
+    counts: Dict[str, int] = {}
+    for event in getattr(GPTState, "last_streaming_events", None) or []:
+        kind = str(event.get("kind") or "")
+        counts[kind] = counts.get(kind, 0) + 1
+    return counts
+
+
+def _profiled_cpu(server: MockSSEServer) -> Dict[str, Dict[str, float]]:
+    profiler = cProfile.Profile(time.thread_time)
+    profiler.enable()
+    try:
+        _send_once(server, "benchmark-profile")
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler)
+    cpu: Dict[str, Dict[str, float]] = {
+        name: {"ms": 0.0, "calls": 0} for _, name in PROFILED_FUNCTIONS
+    }
+    for (filename, _line, funcname), row in stats.stats.items():  # type: ignore[attr-defined]
+        for suffix, name in PROFILED_FUNCTIONS:
+            if funcname == name and filename.endswith(suffix):
+                _cc, ncalls, _tt, cumtime, _callers = row
+                cpu[name]["ms"] = round(cpu[name]["ms"] + cumtime * 1000.0, 3)
+                cpu[name]["calls"] += ncalls
+    return cpu
+
+
+def _allocations(server: MockSSEServer) -> Tuple[float, float]:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        _send_once(server, "benchmark-alloc")
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round((peak - before) / 1024.0, 1), round((after - before) / 1024.0, 1)
+
+
+def run_case(
+    server: MockSSEServer, size_bytes: int, profile: ChunkProfile, *, repeats: int = 3
+) -> Dict[str, Any]:
+    """Benchmark one size/profile combination and return its result row."""
+
+    config = server.configure(
+        total_chars=size_bytes,
+        chunk_chars=profile.chunk_chars,
+        delay_ms=profile.delay_ms,
+        text=None,
+        status=200,
+        json_fallback=False,
+        abort_after_chunks=None,
+    )
+    expected_chunks = len(split_chunks(response_text(config), config.chunk_chars))
+
+    ttfts: List[float] = []
+    totals: List[float] = []
+    draws = 0
+    events: Dict[str, int] = {}
+    for attempt in range(max(1, repeats)):
+        counters, _text = _send_once(server, f"benchmark-{attempt}")
+        finished = time.perf_counter()
+        events = _streaming_event_counts()
+        if counters.first_chunk_at is None or events.get("chunk", 0) != expected_chunks:
+            raise RuntimeError(
+                f"{_case_id(size_bytes, profile)}: stream did not complete "
+                f"({events.get('chunk', 0)} of {expected_chunks} chunks)"
+            )
+        ttfts.append((counters.first_chunk_at - counters.started_at) * 1000.0)
+        totals.append((finished - counters.started_at) * 1000.0)
+        draws = counters.draws
+
+    cpu = _profiled_cpu(server)
+    alloc_peak_kib, alloc_net_kib = _allocations(server)
+    chunks = events.get("chunk", 0)
+    append_ms = cpu["_append_text"]["ms"]
+    return {
+        "case": _case_id(size_bytes, profile),
+        "size_bytes": size_bytes,
+        "profile": profile.name,
+        "chunk_chars": profile.chunk_chars,
+        "delay_ms": profile.delay_ms,
+        "chunks": chunks,
+        "ttft_ms": round(statistics.median(ttfts), 3),
+        "total_ms": round(statistics.median(totals), 3),
+        "per_chunk_us": round(append_ms * 1000.0 / chunks, 3) if chunks else 0.0,
+        "cpu_ms": cpu,
+        "alloc_peak_kib": alloc_peak_kib,
+        "alloc_net_kib": alloc_net_kib,
+        "canvas": {
+            "refresh_requested": events.get("ui_refresh_requested", 0),
+            "refresh_executed": events.get("ui_refresh_executed", 0),
+            "draws": draws,
+        },
+        "canvas_draws": draws,
+    }
+
+
+def splitter_per_chunk_us(
+    size_bytes: int, *, chunk_chars: int = 8, samples: int = 500
+) -> float:
+    """Time the per-chunk `sync` + `split` path at a response of `size_bytes`."""
+
+    from talon_user.lib.modelHelpers import StreamingAnswerMetaSplitter
+
+    chunk = ("lorem ipsum dolor sit amet " * (chunk_chars // 27 + 1))[:chunk_chars]
+    chunks = [chunk] * max(1, size_bytes // chunk_chars)
+    splitter = StreamingAnswerMetaSplitter()
+    splitter.sync(chunks).split()
+    started = time.perf_counter()
+    for _ in range(samples):
+        chunks.append(chunk)
+        splitter.sync(chunks).split()
+    return round((time.perf_counter() - started) * 1e6 / samples, 3)
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    profiles: Sequence[ChunkProfile] = DEFAULT_PROFILES,
+    *,
+    repeats: int = 3,
+) -> Dict[str, Any]:
+    """Run the sweep and return a JSON-serialisable baseline document."""
+
+    results: List[Dict[str, Any]] = []
+    with MockSSEServer(MockResponseConfig()) as server:
+        for profile in profiles:
+            for size in sizes:
+                results.append(run_case(server, size, profile, repeats=repeats))
+    splitter = [
+        {"size_bytes": size, "per_chunk_us": splitter_per_chunk_us(size)}
+        for size in sizes
+    ]
+    return {
+        "schema": SCHEMA_VERSION,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "profiles": [asdict(profile) for profile in profiles],
+        "results": results,
+        "splitter": splitter,
+    }
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_delta: Dict[str, float] | None = None,
+) -> List[Dict[str, Any]]:
+    """Return tracked metrics that regressed by more than `tolerance`.
+
+    `min_delta` sets per-metric absolute floors so sub-millisecond jitter on
+    small cases is not reported as a regression.
+    """
+
+    floors = {"ttft_ms": 2.0, "total_ms": 5.0, "per_chunk_us": 5.0, "alloc_peak_kib": 16.0}
+    floors.update(min_delta or {})
+    previous = {row.get("case"): row for row in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+    for row in current.get("results", []):
+        base = previous.get(row.get("case"))
+        if not base:
+            continue
+        for metric in TRACKED_METRICS:
+            old = base.get(metric)
+            new = row.get(metric)
+            if not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+                continue
+            delta = new - old
+            if delta <= floors.get(metric, 0.0):
+                continue
+            if old > 0 and delta / old <= tolerance:
+                continue
+            regressions.append(
+                {
+                    "case": row["case"],
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "ratio": round(new / old, 3) if old else None,
+                }
+            )
+    return regressions
+
+
+def _format_table(document: Dict[str, Any]) -> str:
+    header = (
+        f"{'case':<16}{'chunks':>8}{'ttft ms':>10}{'total ms':>11}"
+        f"{'us/chunk':>10}{'append ms':>11}{'snap ms':>9}{'split ms':>10}"
+        f"{'peak KiB':>10}{'draws':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in document["results"]:
+        cpu = row["cpu_ms"]
+        lines.append(
+            f"{row['case']:<16}{row['chunks']:>8}{row['ttft_ms']:>10.2f}"
+            f"{row['total_ms']:>11.1f}{row['per_chunk_us']:>10.1f}"
+            f"{cpu['_append_text']['ms']:>11.1f}"
+            f"{cpu['record_streaming_snapshot']['ms']:>9.1f}"
+            f"{cpu['split_answer_and_meta']['ms']:>10.1f}"
+            f"{row['alloc_peak_kib']:>10.1f}{row['canvas_draws']:>7}"
+        )
+    for row in document.get("splitter", []):
+        lines.append(
+            f"split @{row['size_bytes']:<9}{row['per_chunk_us']:>38.1f} us/chunk"
+        )
+    return "\n".join(lines)
+
+
+def _parse_profile(raw: str) -> ChunkProfile:
+    name, _, rest = raw.partition("=")
+    chunk, _, delay = rest.partition(":")
+    if not name or not chunk:
+        raise argparse.ArgumentTypeError("profiles look like name=CHUNK_CHARS[:DELAY_MS]")
+    return ChunkProfile(name, int(chunk), float(delay or 0.0))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if bootstrap is None:
+        print("streaming benchmark needs the test bootstrap (run from the repo root)")
+        return 2
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="response sizes in bytes (default: 1 KiB..200 KiB)",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profiles",
+        type=_parse_profile,
+        action="append",
+        help="chunk profile name=CHUNK_CHARS[:DELAY_MS]; repeatable",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="compare against this JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    document = run_benchmark(
+        args.sizes, args.profiles or DEFAULT_PROFILES, repeats=args.repeats
+    )
+    print(_format_table(document))
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        print(f"Wrote {args.out}")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(document, baseline, tolerance=args.tolerance)
+        for item in regressions:
+            print(
+                f"REGRESSION {item['case']} {item['metric']}: "
+                f"{item['baseline']} -> {item['current']} (x{item['ratio']})"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())